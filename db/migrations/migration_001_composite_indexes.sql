@@ -0,0 +1,63 @@
+--
+-- Migration 001: composite indexes for the hot WHERE clauses
+--
+-- The skeleton only indexes the foreign keys, so the ordered reads of the
+-- lists, cards, notifications and activities had to sort every row of the
+-- parent they belong to. Each index below starts with the column of the
+-- foreign key it replaces, so the constraints keep a usable index.
+--
+-- Fresh databases: the file is copied next to the skeleton by the dockerfile
+-- (the "migration_" prefix sorts it after the skeleton).
+-- Existing databases: mariadb -u <user> -p < migration_001_composite_indexes.sql
+--
+-- The statements are idempotent, running the file twice is harmless.
+--
+
+USE `epitrello`;
+
+CREATE TABLE IF NOT EXISTS `schema_migrations` (
+  `version` varchar(20) NOT NULL,
+  `name` varchar(200) NOT NULL,
+  `applied_at` datetime NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`version`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Lists of a board and cards of a list, read in position order
+--
+
+CREATE INDEX IF NOT EXISTS `boards_lists_board_position_IDX` ON `boards_lists` (`board_id`, `position`);
+DROP INDEX IF EXISTS `board_list_board_FK` ON `boards_lists`;
+
+CREATE INDEX IF NOT EXISTS `lists_cards_list_position_IDX` ON `lists_cards` (`list_id`, `position`);
+DROP INDEX IF EXISTS `list_card_board_list_FK` ON `lists_cards`;
+
+--
+-- Notifications of a user and activities of a board, newest first
+-- (the id is the tie breaker of the keyset pagination)
+--
+
+CREATE INDEX IF NOT EXISTS `notifications_user_created_IDX` ON `notifications` (`user_id`, `created_at`, `id`);
+DROP INDEX IF EXISTS `notifications_users_FK` ON `notifications`;
+
+CREATE INDEX IF NOT EXISTS `boards_activities_board_created_IDX` ON `boards_activities` (`board_id`, `created_at`, `id`);
+DROP INDEX IF EXISTS `board_activity_board_FK` ON `boards_activities`;
+
+--
+-- Membership and invitation lookups by (workspace, user)
+--
+
+CREATE INDEX IF NOT EXISTS `workspaces_members_workspace_user_IDX` ON `workspaces_members` (`workspace_id`, `user_id`);
+DROP INDEX IF EXISTS `workspace_members_workspace_FK` ON `workspaces_members`;
+
+CREATE INDEX IF NOT EXISTS `workspaces_invitations_workspace_user_IDX` ON `workspaces_invitations` (`workspace_id`, `user_id`);
+DROP INDEX IF EXISTS `workspace_invitation_workspace_FK` ON `workspaces_invitations`;
+
+--
+-- Assignees of a card, checked by (card, user)
+--
+
+CREATE INDEX IF NOT EXISTS `cards_assignees_card_user_IDX` ON `cards_assignees` (`card_id`, `user_id`);
+DROP INDEX IF EXISTS `card_assignees_list_card_FK` ON `cards_assignees`;
+
+INSERT IGNORE INTO `schema_migrations` (`version`, `name`) VALUES ('001', 'composite_indexes');
@@ -0,0 +1,21 @@
+--
+-- Migration 002: per-board version counter
+--
+-- Every change made on the lists, cards, labels, assignees or activities of a
+-- board increases its version, so the clients can poll
+-- GET /api/v1/board/{board_id}/version (a primary key lookup) and only fetch
+-- the full board when the number has moved.
+--
+-- Fresh databases: the file is copied next to the skeleton by the dockerfile
+-- (the "migration_" prefix sorts it after the skeleton).
+-- Existing databases: mariadb -u <user> -p < migration_002_board_versions.sql
+-- The server refuses to start while the boards.version column is missing.
+--
+-- The statements are idempotent, running the file twice is harmless.
+--
+
+USE `epitrello`;
+
+ALTER TABLE `boards` ADD COLUMN IF NOT EXISTS `version` bigint(20) unsigned NOT NULL DEFAULT 0;
+
+INSERT IGNORE INTO `schema_migrations` (`version`, `name`) VALUES ('002', 'board_versions');
@@ -0,0 +1,23 @@
+--
+-- Migration 003: boards_activities.created_at is NOT NULL
+--
+-- The activities are paginated with a (created_at, id) keyset. A NULL date
+-- is never matched by the keyset condition, so the rows that had one could
+-- not be reached past the first page. They get the oldest possible date
+-- (they are listed last, as before) and new rows default to the insert time.
+--
+-- Fresh databases: the file is copied next to the skeleton by the dockerfile
+-- (the "migration_" prefix sorts it after the skeleton).
+-- Existing databases: mariadb -u <user> -p < migration_003_activities_created_at.sql
+-- The server refuses to start while the column accepts NULL.
+--
+-- The statements are idempotent, running the file twice is harmless.
+--
+
+USE `epitrello`;
+
+UPDATE `boards_activities` SET `created_at` = '1970-01-01 00:00:01' WHERE `created_at` IS NULL;
+
+ALTER TABLE `boards_activities` MODIFY `created_at` datetime NOT NULL DEFAULT current_timestamp();
+
+INSERT IGNORE INTO `schema_migrations` (`version`, `name`) VALUES ('003', 'activities_created_at');
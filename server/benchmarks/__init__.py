@@ -0,0 +1,7 @@
+"""
+The benchmark suite of the server.
+
+seed_database.py: fill a local MariaDB with a realistic volume of workspaces, boards, lists and cards.
+load_test.py: run the scripted scenarios against the application and compare the results with the stored baseline.
+bench_sql_boilerplates.py: measure the sql boilerplates (pytest-benchmark, see: make benchmark_sql).
+"""
@@ -0,0 +1,146 @@
+"""
+The micro-benchmarks of the sql boilerplate layer: the time spent building a query and formatting its rows around the database call.
+
+Usage (from the server folder, see: make benchmark_sql):
+    pytest benchmarks -o python_files="bench_*.py" --benchmark-only --benchmark-storage=benchmarks/results/sql --benchmark-autosave
+
+Each function is measured with inputs of increasing size (the amount of conditions, ordering columns or rows),
+the runs are stored in benchmarks/results/sql so that a later run can be compared with --benchmark-compare
+(add --benchmark-compare-fail=mean:20% to fail when a function got slower).
+"""
+
+import os
+import sys
+from typing import List, Tuple, Any
+
+import pytest
+
+SERVER_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(SERVER_DIR, "src"))
+
+from lib.sql import sql_constants as SCONST  # noqa: E402 (needs the src folder in the path)
+from lib.sql.sql_connections import SQLManageConnections  # noqa: E402
+from lib.sql.sql_query_boilerplates import SQLQueryBoilerplates  # noqa: E402
+from lib.sql.sql_sanitisation_functions import SQLSanitiseFunctions  # noqa: E402
+
+# The amount of conditions, ordering columns or rows given to the measured functions
+SIZES: Tuple[int, ...] = (1, 10, 100, 1000)
+
+# The amount of columns of the rows given to _format_rows
+TABLE_WIDTH: int = 8
+
+
+def _string_conditions(size: int) -> List[str]:
+    """ The conditions of a where clause written as strings (quoted values, numbers and a doubled quote) """
+    values = ["'42'", "7", "'O''Brien'", "'2025-02-14 10:00:00'"]
+    return [f"column_{i}={values[i % len(values)]}" for i in range(size)]
+
+
+def _tuple_conditions(size: int) -> List[Tuple[str, str, Any]]:
+    """ The conditions of a where clause written as (column, operator, value) tuples, like the endpoints do """
+    return [(f"column_{i}", "=", i) for i in range(size)]
+
+
+def _columns(size: int) -> List[str]:
+    """ The names of the columns a query is ordered by """
+    return [f"column_{i}" for i in range(size)]
+
+
+def _table(size: int) -> Tuple[List[Tuple[str, ...]], List[Tuple[Any, ...]]]:
+    """ The description (as given by the cursor) and the rows of a table """
+    description = [(f"column_{i}",) for i in range(TABLE_WIDTH)]
+    rows = [
+        tuple(i * TABLE_WIDTH + j for j in range(TABLE_WIDTH))
+        for i in range(size)
+    ]
+    return description, rows
+
+
+@pytest.fixture(scope="module")
+def sql_sanitise() -> SQLSanitiseFunctions:
+    """ The sanitising functions (built once, like in the server) """
+    return SQLSanitiseFunctions()
+
+
+@pytest.fixture(scope="module")
+def sql_query_boilerplates() -> SQLQueryBoilerplates:
+    """ The query builder (no pool is needed, nothing is sent to the database) """
+    return SQLQueryBoilerplates(sql_pool=None)
+
+
+@pytest.fixture(scope="module")
+def sql_connections() -> SQLManageConnections:
+    """ The connection manager (the pool is never initialised, only the row formatting is used) """
+    return SQLManageConnections("localhost", 3306, "user", "password", "database")
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build_where_clause_strings(benchmark: Any, sql_sanitise: SQLSanitiseFunctions, size: int) -> None:
+    """ Parse the string conditions of a where clause and bind their values """
+    conditions = _string_conditions(size)
+    benchmark.group = "build_where_clause (strings)"
+    clause, params = benchmark(sql_sanitise.build_where_clause, conditions)
+    assert clause.count(SCONST.PLACEHOLDER) == size and len(params) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build_where_clause_tuples(benchmark: Any, sql_sanitise: SQLSanitiseFunctions, size: int) -> None:
+    """ Bind the (column, operator, value) conditions of a where clause """
+    conditions = _tuple_conditions(size)
+    benchmark.group = "build_where_clause (tuples)"
+    clause, params = benchmark(sql_sanitise.build_where_clause, conditions)
+    assert clause.count(SCONST.PLACEHOLDER) == size and len(params) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_compile_where(benchmark: Any, sql_query_boilerplates: SQLQueryBoilerplates, size: int) -> None:
+    """ Append the where clause to an update """
+    conditions = _tuple_conditions(size)
+    benchmark.group = "_compile_where"
+    query, params = benchmark(
+        sql_query_boilerplates._compile_where, "UPDATE cards SET `name` = %s", conditions
+    )
+    assert " WHERE " in query and len(params) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_compile_ordering(benchmark: Any, sql_query_boilerplates: SQLQueryBoilerplates, size: int) -> None:
+    """ Append the keyset condition of the next page, the ORDER BY and the LIMIT of a paginated read """
+    columns = _columns(size)
+    benchmark.group = "_compile_ordering"
+    query, params = benchmark(
+        sql_query_boilerplates._compile_ordering,
+        "SELECT * FROM cards WHERE `list_id` = %s",
+        columns,
+        True,
+        50,
+        list(range(size))
+    )
+    assert query.endswith("LIMIT 50") and len(params) == size * (size + 1) // 2
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_compile_select(benchmark: Any, sql_query_boilerplates: SQLQueryBoilerplates, size: int) -> None:
+    """ Build a whole select (columns, where clause, ordering and limit), as get_data_from_table does """
+    conditions = _tuple_conditions(size)
+    benchmark.group = "_compile_select"
+    query, params = benchmark(
+        sql_query_boilerplates._compile_select,
+        "cards",
+        "*",
+        conditions,
+        ["position", "id"],
+        False,
+        50
+    )
+    assert query.startswith("SELECT * FROM cards") and len(params) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("row_mode", [SCONST.ROW_MODE_DICT, SCONST.ROW_MODE_ROW])
+def test_format_rows(benchmark: Any, sql_connections: SQLManageConnections, size: int, row_mode: str) -> None:
+    """ Convert the fetched rows to dictionaries or to SQLRow instances """
+    description, rows = _table(size)
+    benchmark.group = f"_format_rows ({row_mode})"
+    result = benchmark(sql_connections._format_rows, description, rows, row_mode)
+    assert len(result) == size
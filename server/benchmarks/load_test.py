@@ -0,0 +1,433 @@
+"""
+The load test of the server: it replays the scenarios with concurrent clients and reports the throughput and latency of each one.
+
+Usage (from the server folder, once the database is seeded with benchmarks.seed_database):
+    python3 -m benchmarks.load_test [--url=http://localhost:5000] [--scenarios=login,board_load] [--concurrency=16] ...
+
+Without --url, the application is built in this process and called through an ASGI transport (no network, no uvicorn),
+with --url, the requests are sent over http to a running server (i.e. with several workers).
+The results are written in benchmarks/results/ and compared with benchmarks/baseline.json when it exists.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+from datetime import datetime
+from typing import Union, Dict, List, Tuple, Any
+
+import httpx
+
+from .seed_layout import SeedLayout, LAYOUT_FILE
+from .scenarios import Scenarios
+
+BENCHMARKS_DIR: str = os.path.dirname(os.path.abspath(__file__))
+SERVER_DIR: str = os.path.dirname(BENCHMARKS_DIR)
+BASELINE_FILE: str = os.path.join(BENCHMARKS_DIR, "baseline.json")
+RESULTS_DIR: str = os.path.join(BENCHMARKS_DIR, "results")
+
+# The scenarios run when none are given (the upload needs the bucket, so it is opt-in)
+DEFAULT_SCENARIOS: Tuple[str, ...] = (
+    "login", "board_load", "card_move", "notification_poll"
+)
+
+# The percentiles reported for each scenario
+PERCENTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50", 0.5), ("p95", 0.95), ("p99", 0.99)
+)
+
+# The base url given to the in-process client (it is never resolved)
+ASGI_BASE_URL: str = "http://benchmark"
+
+
+def percentile(samples: List[float], quantile: float) -> float:
+    """
+        Compute a percentile of sorted samples (linear interpolation between the closest ranks).
+
+    Args:
+        samples (List[float]): The samples, sorted.
+        quantile (float): The quantile (0.5, 0.95, 0.99...)
+
+    Returns:
+        float: The value of the percentile, 0 without samples.
+    """
+    if len(samples) == 0:
+        return 0.0
+    rank = (len(samples) - 1) * min(1.0, max(0.0, quantile))
+    lower = int(rank)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (rank - lower)
+
+
+class ScenarioResult:
+    """
+    The latencies and statuses collected while running a scenario.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+            Constructor
+
+        Args:
+            name (str): The name of the scenario.
+        """
+        self.name: str = name
+        self.latencies: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.errors: int = 0
+        self.elapsed: float = 0.0
+
+    def record(self, latency: float, status: Union[int, str]) -> None:
+        """
+            Record a request.
+
+        Args:
+            latency (float): The time the request took (in seconds).
+            status (Union[int, str]): The status of the response, or the name of the exception raised.
+        """
+        self.latencies.append(latency)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if not isinstance(status, int) or status >= 400:
+            self.errors += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+            Summarise the scenario.
+
+        Returns:
+            Dict[str, Any]: The amount of requests and errors, the requests per second and the percentiles (in milliseconds).
+        """
+        samples = sorted(self.latencies)
+        node: Dict[str, Any] = {
+            "requests": len(samples),
+            "errors": self.errors,
+            "rps": len(samples) / self.elapsed if self.elapsed > 0 else 0.0,
+            "mean_ms": (sum(samples) / len(samples) * 1000) if samples else 0.0
+        }
+        for name, quantile in PERCENTILES:
+            node[f"{name}_ms"] = percentile(samples, quantile) * 1000
+        node["statuses"] = dict(sorted(self.statuses.items()))
+        return node
+
+
+class LoadTest:
+    """
+    The class running the scenarios with concurrent clients.
+    """
+
+    def __init__(self, layout: SeedLayout, url: Union[str, None] = None, concurrency: int = 16, duration: float = 30.0, max_requests: int = 0, warmup: int = 20, seed: int = 42) -> None:
+        """
+            Constructor
+
+        Args:
+            layout (SeedLayout): The seeded data.
+            url (Union[str, None], optional): . Defaults to None.: The url of a running server, None to build the application in this process.
+            concurrency (int, optional): . Defaults to 16.: The amount of clients sending requests at the same time.
+            duration (float, optional): . Defaults to 30.0.: The time (in seconds) each scenario runs.
+            max_requests (int, optional): . Defaults to 0.: Stop a scenario after this amount of requests (0 for no limit).
+            warmup (int, optional): . Defaults to 20.: The amount of requests sent (and not measured) before each scenario.
+            seed (int, optional): . Defaults to 42.: The seed of the random generator.
+        """
+        self.layout: SeedLayout = layout
+        self.url: Union[str, None] = url
+        self.concurrency: int = max(1, concurrency)
+        self.duration: float = max(0.1, duration)
+        self.max_requests: int = max(0, max_requests)
+        self.warmup: int = max(0, warmup)
+        self.scenarios: Scenarios = Scenarios(layout, random.Random(seed))
+        self._transport: Union[httpx.AsyncBaseTransport, None] = None
+
+    def _build_transport(self) -> httpx.AsyncBaseTransport:
+        """
+            Build the application in this process and wrap it in an ASGI transport.
+
+        Returns:
+            httpx.AsyncBaseTransport: The transport shared by the clients.
+        """
+        sys.path.insert(0, os.path.join(SERVER_DIR, "src"))
+        from lib import CONST, Server
+        server = Server(success=CONST.SUCCESS, error=CONST.ERROR)
+        return httpx.ASGITransport(app=server.build_app())
+
+    def _client(self) -> httpx.AsyncClient:
+        """
+            Create a client (one per simulated user, so that they do not share cookies).
+
+        Returns:
+            httpx.AsyncClient: The client.
+        """
+        if self.url is not None:
+            return httpx.AsyncClient(base_url=self.url, timeout=60)
+        if self._transport is None:
+            self._transport = self._build_transport()
+        return httpx.AsyncClient(
+            transport=self._transport, base_url=ASGI_BASE_URL, timeout=60
+        )
+
+    async def _worker(self, name: str, result: ScenarioResult, deadline: float, issued: List[int]) -> None:
+        """
+            Send the requests of a scenario until the deadline (or the request limit) is reached.
+
+        Args:
+            name (str): The name of the scenario.
+            result (ScenarioResult): Where the requests are recorded.
+            deadline (float): The perf_counter value at which the scenario stops.
+            issued (List[int]): The amount of requests sent by every worker (shared counter).
+        """
+        action = self.scenarios.actions[name]
+        async with self._client() as client:
+            while time.perf_counter() < deadline:
+                if self.max_requests > 0:
+                    if issued[0] >= self.max_requests:
+                        return
+                    issued[0] += 1
+                start = time.perf_counter()
+                try:
+                    response = await action(client)
+                    status: Union[int, str] = response.status_code
+                except httpx.HTTPError as e:
+                    status = e.__class__.__name__
+                result.record(time.perf_counter() - start, status)
+
+    async def run_scenario(self, name: str) -> ScenarioResult:
+        """
+            Warm a scenario up, then run it with every client.
+
+        Args:
+            name (str): The name of the scenario.
+
+        Returns:
+            ScenarioResult: The measures of the scenario.
+        """
+        if self.warmup > 0:
+            async with self._client() as client:
+                for _ in range(self.warmup):
+                    try:
+                        await self.scenarios.actions[name](client)
+                    except httpx.HTTPError:
+                        pass
+        result = ScenarioResult(name)
+        issued = [0]
+        start = time.perf_counter()
+        deadline = start + self.duration
+        await asyncio.gather(*[
+            self._worker(name, result, deadline, issued)
+            for _ in range(self.concurrency)
+        ])
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    async def run(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+            Run the scenarios one after the other.
+
+        Args:
+            names (List[str]): The scenarios to run.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The summary of each scenario.
+        """
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for name in names:
+            print(f"Running {name} ({self.concurrency} clients, {self.duration:g}s)")
+            summaries[name] = (await self.run_scenario(name)).summary()
+        return summaries
+
+
+def format_report(summaries: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+        Write the summaries as a table.
+
+    Args:
+        summaries (Dict[str, Dict[str, Any]]): The summary of each scenario.
+
+    Returns:
+        List[str]: The lines of the table.
+    """
+    lines = [
+        f"{'scenario':<20}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    ]
+    for name, node in summaries.items():
+        lines.append(
+            f"{name:<20}{node['requests']:>10}{node['errors']:>8}{node['rps']:>10.1f}"
+            f"{node['p50_ms']:>10.2f}{node['p95_ms']:>10.2f}{node['p99_ms']:>10.2f}"
+        )
+    return lines
+
+
+def compare_with_baseline(summaries: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> Tuple[List[str], bool]:
+    """
+        Compare the summaries with the baseline, a scenario regresses when its rps drops or its p95 grows by more than the tolerance.
+
+    Args:
+        summaries (Dict[str, Dict[str, Any]]): The summary of each scenario.
+        baseline (Dict[str, Dict[str, Any]]): The summaries of the baseline.
+        tolerance (float): The allowed change (0.2 for 20%).
+
+    Returns:
+        Tuple[List[str], bool]: The lines of the comparison and True if a scenario regressed.
+    """
+    lines = [
+        f"{'scenario':<20}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}  verdict"
+    ]
+    regressed = False
+    for name, node in summaries.items():
+        reference = baseline.get(name)
+        if reference is None:
+            lines.append(f"{name:<20}{'(not in the baseline)':>40}")
+            continue
+        changes: Dict[str, float] = {}
+        for key in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+            if reference.get(key, 0) > 0:
+                changes[key] = node[key] / reference[key] - 1
+            else:
+                changes[key] = 0.0
+        slower = changes["rps"] < -tolerance or changes["p95_ms"] > tolerance
+        regressed = regressed or slower
+        lines.append(
+            f"{name:<20}{changes['rps']:>+10.1%}{changes['p50_ms']:>+10.1%}"
+            f"{changes['p95_ms']:>+10.1%}{changes['p99_ms']:>+10.1%}  "
+            f"{'REGRESSION' if slower else 'ok'}"
+        )
+    return lines, regressed
+
+
+class Main:
+    """
+    The entry point of the load test.
+    """
+
+    def __init__(self, success: int = 0, error: int = 84) -> None:
+        self.success: int = success
+        self.error: int = error
+        self.url: Union[str, None] = None
+        self.scenarios: List[str] = list(DEFAULT_SCENARIOS)
+        self.concurrency: int = 16
+        self.duration: float = 30.0
+        self.max_requests: int = 0
+        self.warmup: int = 20
+        self.seed: int = 42
+        self.tolerance: float = 0.2
+        self.save_baseline: bool = False
+
+    def process_args(self, args: List[str]) -> bool:
+        """
+            Read the arguments.
+
+        Args:
+            args (List[str]): The arguments of the command line.
+
+        Returns:
+            bool: False if the program must stop (help shown or invalid argument).
+        """
+        for arg in args:
+            key, _, value = arg.partition("=")
+            if key in ("--help", "-h"):
+                print("Usage: python3 -m benchmarks.load_test [OPTIONS]")
+                print("Options:")
+                print("  --url=<url>                   Load a running server instead of the in-process application")
+                print(f"  --scenarios=<a,b>             The scenarios to run, among: {', '.join(Scenarios(SeedLayout(), random.Random()).actions)} (default: {','.join(DEFAULT_SCENARIOS)})")
+                print("  --concurrency=<n>             The amount of concurrent clients (default: 16)")
+                print("  --duration=<seconds>          The time each scenario runs (default: 30)")
+                print("  --requests=<n>                Stop each scenario after n requests (default: no limit)")
+                print("  --warmup=<n>                  The requests sent before measuring each scenario (default: 20)")
+                print("  --seed=<n>                    The seed of the random choices (default: 42)")
+                print("  --tolerance=<percent>         The change allowed before reporting a regression (default: 20)")
+                print("  --save-baseline               Store the results as the new baseline")
+                return False
+            try:
+                if key == "--url":
+                    self.url = value.rstrip("/")
+                elif key == "--scenarios":
+                    self.scenarios = [i.strip() for i in value.split(",") if i.strip() != ""]
+                elif key == "--concurrency":
+                    self.concurrency = int(value)
+                elif key == "--duration":
+                    self.duration = float(value)
+                elif key == "--requests":
+                    self.max_requests = int(value)
+                elif key == "--warmup":
+                    self.warmup = int(value)
+                elif key == "--seed":
+                    self.seed = int(value)
+                elif key == "--tolerance":
+                    self.tolerance = float(value) / 100
+                elif key == "--save-baseline":
+                    self.save_baseline = True
+                else:
+                    print(f"Unknown argument: {arg}")
+                    return False
+            except ValueError:
+                print(f"Invalid value: {arg}")
+                return False
+        return True
+
+    def main(self, args: List[str]) -> int:
+        """
+            Run the load test, write the results and compare them with the baseline.
+
+        Args:
+            args (List[str]): The arguments of the command line.
+
+        Returns:
+            int: self.success, or self.error if an argument is invalid or a scenario regressed.
+        """
+        if self.process_args(args) is False:
+            return self.success if "--help" in args or "-h" in args else self.error
+        if os.path.isfile(LAYOUT_FILE) is False:
+            print("No seeded data found, run: python3 -m benchmarks.seed_database")
+            return self.error
+        layout = SeedLayout.load()
+        load_test = LoadTest(
+            layout,
+            url=self.url,
+            concurrency=self.concurrency,
+            duration=self.duration,
+            max_requests=self.max_requests,
+            warmup=self.warmup,
+            seed=self.seed
+        )
+        unknown = [i for i in self.scenarios if i not in load_test.scenarios.actions]
+        if len(unknown) > 0:
+            print(f"Unknown scenario(s): {', '.join(unknown)}")
+            return self.error
+        summaries = asyncio.run(load_test.run(self.scenarios))
+        print("\n".join(format_report(summaries)))
+        # ----------------------------- The results -----------------------------
+        report = {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "target": self.url or "asgi",
+            "concurrency": self.concurrency,
+            "duration": self.duration,
+            "layout": layout.to_dict(),
+            "scenarios": summaries
+        }
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(
+            RESULTS_DIR, f"{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+        print(f"Results written to {os.path.relpath(path)}")
+        if self.save_baseline is True:
+            with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=4)
+            print(f"Baseline written to {os.path.relpath(BASELINE_FILE)}")
+            return self.success
+        if os.path.isfile(BASELINE_FILE) is False:
+            print("No baseline to compare with, store one with --save-baseline")
+            return self.success
+        with open(BASELINE_FILE, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        lines, regressed = compare_with_baseline(
+            summaries, baseline.get("scenarios", {}), self.tolerance
+        )
+        print(f"Compared with the baseline of {baseline.get('date', '?')} (tolerance: {self.tolerance:.0%})")
+        print("\n".join(lines))
+        return self.error if regressed is True else self.success
+
+
+if __name__ == "__main__":
+    sys.exit(Main(success=0, error=1).main(sys.argv[1:]))
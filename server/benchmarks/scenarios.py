@@ -0,0 +1,133 @@
+"""
+File containing the scripted scenarios of the load test, each one sends the requests of a user action to the server.
+"""
+
+import io
+import random
+from typing import Dict, List, Callable, Awaitable, Any
+
+from .seed_layout import SeedLayout, PASSWORD
+
+# The side (in pixels) of the image sent by the upload scenario
+IMAGE_SIZE: int = 256
+
+
+class Scenarios:
+    """
+    The user actions replayed by the load test, the data they target is picked at random in the seeded layout.
+    """
+
+    def __init__(self, layout: SeedLayout, rng: random.Random) -> None:
+        """
+            Constructor
+
+        Args:
+            layout (SeedLayout): The seeded data.
+            rng (random.Random): The random generator (seeded, so that two runs send the same requests).
+        """
+        self.layout: SeedLayout = layout
+        self.rng: random.Random = rng
+        # The cards moved by the drag and drop scenario (card id -> list id)
+        self.moved_cards: Dict[int, int] = {}
+        self.list_sizes: Dict[int, int] = {}
+        self._image: bytes = b""
+        self.actions: Dict[str, Callable[[Any], Awaitable[Any]]] = {
+            "login": self.login,
+            "board_load": self.board_load,
+            "card_move": self.card_move,
+            "notification_poll": self.notification_poll,
+            "image_upload": self.image_upload
+        }
+
+    def _user(self) -> int:
+        """ Pick a seeded account """
+        return self.rng.randrange(self.layout.users)
+
+    def _headers(self, user_index: int) -> Dict[str, str]:
+        """ The authorisation header of a seeded account """
+        return {"Authorization": f"Bearer {self.layout.user_token(user_index)}"}
+
+    def _list_cards(self, list_id: int) -> List[int]:
+        """ The cards currently in a list (the seeded ones, moved cards included) """
+        cards = [
+            i for i in self.layout.card_ids(list_id)
+            if self.moved_cards.get(i, list_id) == list_id
+        ]
+        cards.extend(
+            i for i, j in self.moved_cards.items()
+            if j == list_id and i not in cards
+        )
+        return cards
+
+    def _get_image(self) -> bytes:
+        """ The png sent by the upload scenario (drawn once) """
+        if self._image == b"":
+            from PIL import Image
+            image = Image.new(
+                "RGB", (IMAGE_SIZE, IMAGE_SIZE),
+                (self.rng.randrange(256), self.rng.randrange(256), self.rng.randrange(256))
+            )
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+            self._image = buffer.getvalue()
+        return self._image
+
+    async def login(self, client: Any) -> Any:
+        """ Log a seeded account in (the password check is part of the measure) """
+        user = self._user()
+        response = await client.post(
+            "/api/v1/login",
+            json={"email": self.layout.user_email(user), "password": PASSWORD}
+        )
+        # The session cookie would replace the bearer tokens of the other scenarios
+        client.cookies.clear()
+        return response
+
+    async def board_load(self, client: Any) -> Any:
+        """ Open a board (lists, cards, labels and assignees in one response) """
+        board = self.rng.randrange(self.layout.boards)
+        return await client.get(
+            f"/api/v1/board/{self.layout.board_id(board)}/full",
+            headers=self._headers(self.layout.board_owner(board))
+        )
+
+    async def card_move(self, client: Any) -> Any:
+        """ Drag a card to another position, in its list or in another list of the board """
+        board = self.rng.randrange(self.layout.boards)
+        lists = self.layout.list_ids(board)
+        source = self.rng.choice(lists)
+        cards = self._list_cards(source)
+        while len(cards) == 0:
+            source = self.rng.choice(lists)
+            cards = self._list_cards(source)
+        card = self.rng.choice(cards)
+        target = self.rng.choice(lists)
+        size = self.list_sizes.get(target, self.layout.cards_per_list)
+        position = self.rng.randint(1, size if target == source else size + 1)
+        response = await client.patch(
+            f"/api/v1/list/{source}/card/{card}/position",
+            json={"position": position, "new_list_id": target},
+            headers=self._headers(self.layout.board_owner(board))
+        )
+        if response.status_code < 400 and target != source:
+            self.moved_cards[card] = target
+            self.list_sizes[source] = self.list_sizes.get(
+                source, self.layout.cards_per_list
+            ) - 1
+            self.list_sizes[target] = size + 1
+        return response
+
+    async def notification_poll(self, client: Any) -> Any:
+        """ Fetch the notifications of a seeded account (the poll of the front end) """
+        return await client.get(
+            "/api/v1/my_notifications",
+            headers=self._headers(self._user())
+        )
+
+    async def image_upload(self, client: Any) -> Any:
+        """ Change the profile photo of a seeded account (needs the bucket) """
+        return await client.post(
+            "/api/v1/update_profile_photo",
+            files={"file": ("benchmark.png", self._get_image(), "image/png")},
+            headers=self._headers(self._user())
+        )
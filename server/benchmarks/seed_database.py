@@ -0,0 +1,384 @@
+"""
+The script filling a local MariaDB with the data used by the load test.
+
+Usage (from the server folder, with the .env of the database):
+    python3 -m benchmarks.seed_database [--reset] [--users=500] [--workspaces=2000] ...
+
+--reset drops every table and reloads the skeleton of db/data (and the migrations of db/migrations) before seeding,
+never use it on a database holding real data.
+"""
+
+import os
+import sys
+import glob
+from datetime import datetime, timedelta
+from typing import List, Tuple, Any, Iterator
+
+import mysql.connector
+
+from .seed_layout import SeedLayout, LAYOUT_FILE, EMAIL_DOMAIN, PASSWORD
+
+SERVER_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(SERVER_DIR, "src"))
+
+from lib import CONST, PasswordHandling  # noqa: E402 (needs the src folder in the path)
+
+# The skeleton and migrations of the database (loaded by --reset)
+DB_DIR: str = os.path.join(os.path.dirname(SERVER_DIR), "db")
+SKELETON_FILES: str = os.path.join(DB_DIR, "data", "*.sql")
+MIGRATION_FILES: str = os.path.join(DB_DIR, "migrations", "migration_*.sql")
+
+# The name of the database in the skeleton (replaced by DB_DATABASE)
+SKELETON_DATABASE: str = "`epitrello`"
+
+# The background colours given to the boards, in turn
+BOARD_COLOURS: Tuple[str, ...] = (
+    "#0079bf", "#d29034", "#519839", "#b04632", "#89609e"
+)
+
+
+class DatabaseSeeder:
+    """
+    The class inserting the accounts, workspaces, boards, lists, cards and notifications described by a SeedLayout.
+    """
+
+    def __init__(self, layout: SeedLayout, reset: bool = False, batch_size: int = 1000, error: int = 84, success: int = 0) -> None:
+        """
+            Constructor
+
+        Args:
+            layout (SeedLayout): The volumes to insert.
+            reset (bool, optional): . Defaults to False.: Reload the skeleton (and drop every row) before seeding.
+            batch_size (int, optional): . Defaults to 1000.: The amount of rows sent in a single insert.
+            error (int, optional): . Defaults to 84.
+            success (int, optional): . Defaults to 0.
+        """
+        self.layout: SeedLayout = layout
+        self.reset: bool = reset
+        self.batch_size: int = max(1, batch_size)
+        self.error: int = error
+        self.success: int = success
+
+    def _connect(self, database: bool = True) -> Any:
+        """
+            Open a connection to the server given in the .env file.
+
+        Args:
+            database (bool, optional): . Defaults to True.: Select DB_DATABASE (False to load the skeleton, which creates it).
+
+        Returns:
+            Any: The connection.
+        """
+        settings = {
+            "host": CONST.DB_HOST,
+            "port": CONST.DB_PORT,
+            "user": CONST.DB_USER,
+            "password": CONST.DB_PASSWORD
+        }
+        if database is True:
+            settings["database"] = CONST.DB_DATABASE
+        return mysql.connector.connect(**settings)
+
+    def _read_statements(self, path: str) -> Iterator[str]:
+        """
+            Split a dump (or a migration) in statements.
+
+        Args:
+            path (str): The sql file.
+
+        Yields:
+            Iterator[str]: The statements of the file, in order.
+        """
+        statement: List[str] = []
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                stripped = line.strip()
+                if stripped == "" or stripped.startswith("--"):
+                    continue
+                statement.append(
+                    line.replace(SKELETON_DATABASE, f"`{CONST.DB_DATABASE}`")
+                )
+                if stripped.endswith(";"):
+                    yield "".join(statement)
+                    statement = []
+        if len(statement) > 0:
+            yield "".join(statement)
+
+    def reset_database(self) -> int:
+        """
+            Reload the skeleton of the database and apply the migrations.
+
+        Returns:
+            int: self.success if the files were loaded, self.error otherwise.
+        """
+        skeletons = sorted(glob.glob(SKELETON_FILES))
+        if len(skeletons) == 0:
+            print(f"No skeleton found in {os.path.dirname(SKELETON_FILES)}")
+            return self.error
+        files = [skeletons[-1]] + sorted(glob.glob(MIGRATION_FILES))
+        connection = self._connect(database=False)
+        cursor = connection.cursor()
+        try:
+            for path in files:
+                print(f"Loading {os.path.basename(path)}")
+                for statement in self._read_statements(path):
+                    cursor.execute(statement)
+                    if cursor.with_rows is True:
+                        cursor.fetchall()
+            connection.commit()
+        except mysql.connector.Error as e:
+            print(f"Failed to load the skeleton: {e}")
+            return self.error
+        finally:
+            cursor.close()
+            connection.close()
+        return self.success
+
+    def _next_id(self, cursor: Any, table: str) -> int:
+        """
+            Get the id the next row of a table will have.
+
+        Args:
+            cursor (Any): The cursor of the seeding connection.
+            table (str): The table.
+
+        Returns:
+            int: The first free id.
+        """
+        cursor.execute(f"SELECT COALESCE(MAX(`id`), 0) + 1 FROM `{table}`")
+        return int(cursor.fetchone()[0])
+
+    def _insert(self, cursor: Any, table: str, columns: Tuple[str, ...], rows: Iterator[Tuple[Any, ...]]) -> int:
+        """
+            Insert rows by batches.
+
+        Args:
+            cursor (Any): The cursor of the seeding connection.
+            table (str): The table.
+            columns (Tuple[str, ...]): The columns given by each row.
+            rows (Iterator[Tuple[Any, ...]]): The rows.
+
+        Returns:
+            int: The amount of inserted rows.
+        """
+        query = f"INSERT INTO `{table}` ({', '.join(f'`{i}`' for i in columns)})"
+        query += f" VALUES ({', '.join(['%s'] * len(columns))})"
+        inserted = 0
+        batch: List[Tuple[Any, ...]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                cursor.executemany(query, batch)
+                inserted += len(batch)
+                batch = []
+        if len(batch) > 0:
+            cursor.executemany(query, batch)
+            inserted += len(batch)
+        print(f"{table}: {inserted} rows")
+        return inserted
+
+    def _users(self, password_hash: str) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the accounts """
+        for i in range(self.layout.users):
+            yield (
+                self.layout.first_user_id + i, f"benchmark_{i}",
+                self.layout.user_email(i), password_hash, "NULL", ""
+            )
+
+    def _connections(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the session tokens (one per account) """
+        for i in range(self.layout.users):
+            yield (self.layout.user_token(i), self.layout.first_user_id + i)
+
+    def _workspaces(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the workspaces """
+        for i in range(self.layout.workspaces):
+            yield (
+                self.layout.first_workspace_id + i, f"Workspace {i}",
+                self.layout.first_user_id + i % self.layout.users,
+                f"Benchmark workspace {i}", "NULL"
+            )
+
+    def _members(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the workspace members (the creator, as an admin) """
+        for i in range(self.layout.workspaces):
+            yield (
+                self.layout.first_user_id + i % self.layout.users,
+                self.layout.first_workspace_id + i, 1, 0, 0, 0
+            )
+
+    def _boards(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the boards """
+        for i in range(self.layout.boards):
+            yield (
+                self.layout.board_id(i), f"Board {i}",
+                BOARD_COLOURS[i % len(BOARD_COLOURS)],
+                self.layout.lists_per_board,
+                self.layout.first_workspace_id + i // self.layout.boards_per_workspace
+            )
+
+    def _lists(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the lists """
+        for i in range(self.layout.boards):
+            for position, list_id in enumerate(self.layout.list_ids(i), start=1):
+                yield (
+                    list_id, f"List {position}", self.layout.board_id(i),
+                    position * self.layout.position_gap,
+                    self.layout.cards_per_list
+                )
+
+    def _cards(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the cards """
+        for list_index in range(self.layout.lists):
+            list_id = self.layout.first_list_id + list_index
+            for position, card_id in enumerate(self.layout.card_ids(list_id), start=1):
+                yield (
+                    card_id, f"Card {position}",
+                    f"Description of the card {card_id}", None, list_id,
+                    position * self.layout.position_gap
+                )
+
+    def _notifications(self) -> Iterator[Tuple[Any, ...]]:
+        """ The rows of the notifications (the most recent ones are unread) """
+        start = datetime.now() - timedelta(minutes=self.layout.notifications_per_user)
+        for i in range(self.layout.users):
+            for j in range(self.layout.notifications_per_user):
+                yield (
+                    f"Notification {j} of the benchmark",
+                    self.layout.first_user_id + i,
+                    int(j < self.layout.notifications_per_user // 2),
+                    start + timedelta(minutes=j)
+                )
+
+    def seed(self) -> int:
+        """
+            Insert the rows of the layout and write the layout file.
+
+        Returns:
+            int: self.success if every row was inserted, self.error otherwise.
+        """
+        if self.reset is True and self.reset_database() != self.success:
+            return self.error
+        connection = self._connect()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM `{CONST.TAB_ACCOUNTS}` WHERE `email` LIKE %s",
+                (f"%@{EMAIL_DOMAIN}",)
+            )
+            if int(cursor.fetchone()[0]) > 0:
+                print("The database is already seeded, use --reset to seed it again.")
+                return self.error
+            self.layout.position_gap = CONST.POSITION_GAP
+            self.layout.first_user_id = self._next_id(cursor, CONST.TAB_ACCOUNTS)
+            self.layout.first_workspace_id = self._next_id(
+                cursor, CONST.TAB_WORKSPACES
+            )
+            self.layout.first_board_id = self._next_id(cursor, CONST.TAB_BOARDS)
+            self.layout.first_list_id = self._next_id(
+                cursor, CONST.TAB_BOARDS_LISTS
+            )
+            self.layout.first_card_id = self._next_id(
+                cursor, CONST.TAB_LISTS_CARDS
+            )
+            # Hashed once: every account shares the password
+            password_hash = PasswordHandling().hash_password(PASSWORD)
+            self._insert(
+                cursor, CONST.TAB_ACCOUNTS,
+                ("id", "username", "email", "password", "favicon", "bio"),
+                self._users(password_hash)
+            )
+            self._insert(
+                cursor, CONST.TAB_CONNECTIONS, ("token", "user_id"),
+                self._connections()
+            )
+            self._insert(
+                cursor, CONST.TAB_WORKSPACES,
+                ("id", "name", "creator_id", "description", "favicon"),
+                self._workspaces()
+            )
+            self._insert(
+                cursor, CONST.TAB_WORKSPACES_MEMBERS,
+                (
+                    "user_id", "workspace_id", "admin",
+                    "board_creation_restriction", "board_deletion_restriction",
+                    "invitation_restriction"
+                ),
+                self._members()
+            )
+            self._insert(
+                cursor, CONST.TAB_BOARDS,
+                ("id", "name", "background_color", "list_nb", "workspace_id"),
+                self._boards()
+            )
+            self._insert(
+                cursor, CONST.TAB_BOARDS_LISTS,
+                ("id", "name", "board_id", "position", "card_nb"),
+                self._lists()
+            )
+            self._insert(
+                cursor, CONST.TAB_LISTS_CARDS,
+                ("id", "name", "description", "date_end", "list_id", "position"),
+                self._cards()
+            )
+            self._insert(
+                cursor, CONST.TAB_NOTIFICATIONS,
+                ("message", "user_id", "is_read", "created_at"),
+                self._notifications()
+            )
+            connection.commit()
+        except mysql.connector.Error as e:
+            connection.rollback()
+            print(f"Failed to seed the database: {e}")
+            return self.error
+        finally:
+            cursor.close()
+            connection.close()
+        self.layout.save()
+        print(f"Layout written to {os.path.relpath(LAYOUT_FILE)}")
+        return self.success
+
+
+def main() -> int:
+    """
+        Read the arguments and seed the database.
+
+    Returns:
+        int: The exit status.
+    """
+    layout = SeedLayout()
+    reset = False
+    volumes = {
+        "--users": "users",
+        "--workspaces": "workspaces",
+        "--boards-per-workspace": "boards_per_workspace",
+        "--lists-per-board": "lists_per_board",
+        "--cards-per-list": "cards_per_list",
+        "--notifications-per-user": "notifications_per_user"
+    }
+    for arg in sys.argv[1:]:
+        key, _, value = arg.partition("=")
+        if key in ("--help", "-h"):
+            print("Usage: python3 -m benchmarks.seed_database [OPTIONS]")
+            print("Options:")
+            print("  --reset                       Reload the skeleton of db/data before seeding (drops every row)")
+            for option, attribute in volumes.items():
+                print(
+                    f"  {option + '=<n>':<30}(default: {getattr(layout, attribute)})"
+                )
+            return CONST.SUCCESS
+        if key == "--reset":
+            reset = True
+        elif key in volumes and value.isdigit() is True:
+            setattr(layout, volumes[key], int(value))
+        else:
+            print(f"Unknown argument: {arg}")
+            return CONST.ERROR
+    seeder = DatabaseSeeder(
+        layout, reset=reset, error=CONST.ERROR, success=CONST.SUCCESS
+    )
+    return seeder.seed()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
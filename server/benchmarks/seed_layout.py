@@ -0,0 +1,166 @@
+"""
+File containing the description of the seeded data.
+The rows are inserted with consecutive ids, so the layout only stores the first id and the volume of each table
+and the scenarios compute the ids they need (the board of a user, the cards of a list...) instead of querying them.
+"""
+
+import os
+import json
+from typing import Dict, List, Any
+
+# The file written by the seeder and read by the load test
+LAYOUT_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "seed_layout.json"
+)
+
+# The domain of the seeded accounts (used to find them again)
+EMAIL_DOMAIN: str = "benchmark.epitrello"
+
+# The password of every seeded account
+PASSWORD: str = "Benchmark_password_1"
+
+
+class SeedLayout:
+    """
+    The volumes and first ids of the seeded tables.
+    """
+
+    def __init__(self, users: int = 500, workspaces: int = 2000, boards_per_workspace: int = 2, lists_per_board: int = 5, cards_per_list: int = 10, notifications_per_user: int = 20, position_gap: int = 1024) -> None:
+        """
+            Constructor
+
+        Args:
+            users (int, optional): . Defaults to 500.: The amount of accounts.
+            workspaces (int, optional): . Defaults to 2000.: The amount of workspaces (shared between the accounts).
+            boards_per_workspace (int, optional): . Defaults to 2.: The amount of boards in each workspace.
+            lists_per_board (int, optional): . Defaults to 5.: The amount of lists in each board.
+            cards_per_list (int, optional): . Defaults to 10.: The amount of cards in each list.
+            notifications_per_user (int, optional): . Defaults to 20.: The amount of notifications of each account.
+            position_gap (int, optional): . Defaults to 1024.: The distance between the position keys of two neighbours.
+        """
+        self.users: int = max(1, users)
+        self.workspaces: int = max(1, workspaces)
+        self.boards_per_workspace: int = max(1, boards_per_workspace)
+        self.lists_per_board: int = max(1, lists_per_board)
+        self.cards_per_list: int = max(1, cards_per_list)
+        self.notifications_per_user: int = max(0, notifications_per_user)
+        self.position_gap: int = max(2, position_gap)
+        # ---------------- The first id of each table (set by the seeder) ---------------
+        self.first_user_id: int = 1
+        self.first_workspace_id: int = 1
+        self.first_board_id: int = 1
+        self.first_list_id: int = 1
+        self.first_card_id: int = 1
+
+    # ---------------------------------- Volumes ----------------------------------
+
+    @property
+    def boards(self) -> int:
+        """ The total amount of boards """
+        return self.workspaces * self.boards_per_workspace
+
+    @property
+    def lists(self) -> int:
+        """ The total amount of lists """
+        return self.boards * self.lists_per_board
+
+    @property
+    def cards(self) -> int:
+        """ The total amount of cards """
+        return self.lists * self.cards_per_list
+
+    # ----------------------------------- Ids -------------------------------------
+
+    def user_email(self, user_index: int) -> str:
+        """
+            Get the email of a seeded account.
+
+        Args:
+            user_index (int): The index of the account (0 to users - 1).
+
+        Returns:
+            str: The email of the account.
+        """
+        return f"user_{user_index}@{EMAIL_DOMAIN}"
+
+    def user_token(self, user_index: int) -> str:
+        """
+            Get the session token seeded for an account.
+
+        Args:
+            user_index (int): The index of the account (0 to users - 1).
+
+        Returns:
+            str: The token of the account.
+        """
+        return f"benchmark_token_{user_index}"
+
+    def board_id(self, board_index: int) -> int:
+        """ The id of a board from its index (0 to boards - 1) """
+        return self.first_board_id + board_index
+
+    def board_owner(self, board_index: int) -> int:
+        """ The index of the account that created the workspace of a board """
+        return (board_index // self.boards_per_workspace) % self.users
+
+    def list_ids(self, board_index: int) -> List[int]:
+        """ The ids of the lists of a board, in position order """
+        first = self.first_list_id + board_index * self.lists_per_board
+        return list(range(first, first + self.lists_per_board))
+
+    def card_ids(self, list_id: int) -> List[int]:
+        """ The ids of the cards seeded in a list, in position order """
+        first = self.first_card_id + (list_id - self.first_list_id) * self.cards_per_list
+        return list(range(first, first + self.cards_per_list))
+
+    # ----------------------------------- File ------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+            Convert the layout to a dictionary.
+
+        Returns:
+            Dict[str, Any]: The volumes and first ids.
+        """
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SeedLayout":
+        """
+            Build a layout from the content of the layout file.
+
+        Args:
+            data (Dict[str, Any]): The volumes and first ids.
+
+        Returns:
+            SeedLayout: The layout.
+        """
+        layout = cls()
+        for key, value in data.items():
+            if hasattr(layout, key) is True:
+                setattr(layout, key, int(value))
+        return layout
+
+    def save(self, path: str = LAYOUT_FILE) -> None:
+        """
+            Write the layout file.
+
+        Args:
+            path (str, optional): . Defaults to LAYOUT_FILE.: The file to write.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    @classmethod
+    def load(cls, path: str = LAYOUT_FILE) -> "SeedLayout":
+        """
+            Read the layout file.
+
+        Args:
+            path (str, optional): . Defaults to LAYOUT_FILE.: The file to read.
+
+        Returns:
+            SeedLayout: The layout.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
@@ -2,11 +2,13 @@
     File in charge of setting up the background tasks for the server.
 """
 
-from typing import Union, Any, Dict, Tuple
-from apscheduler.job import Job
-from apscheduler.schedulers.background import BackgroundScheduler
+from typing import Union, Any, Dict, Tuple, TYPE_CHECKING
 from apscheduler.schedulers import SchedulerAlreadyRunningError, SchedulerNotRunningError
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+if TYPE_CHECKING:
+    from apscheduler.job import Job
+    from apscheduler.schedulers.background import BackgroundScheduler
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 class BackgroundTasks:
     """_summary_
@@ -19,9 +21,10 @@ class BackgroundTasks:
         self.error: int = error
         self.debug: bool = debug
         # ------------------------ The scheduler class  ------------------------
-        self.scheduler = BackgroundScheduler()
+        # Built on first use: the worker processes never schedule anything
+        self.scheduler: Union['BackgroundScheduler', None] = None
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -42,7 +45,19 @@ class BackgroundTasks:
         else:
             self.disp.log_debug(msg, "__del__")
 
-    def safe_add_task(self, func: callable, args: Union[Tuple, None] = None, kwargs: Union[Dict, None] = None, trigger: Union[str, Any] = "interval", seconds: int = 5) -> Union[int, Job]:
+    def _get_scheduler(self) -> 'BackgroundScheduler':
+        """
+            Get the scheduler, importing and building it the first time it is needed.
+
+        Returns:
+            BackgroundScheduler: The scheduler running the tasks.
+        """
+        if self.scheduler is None:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            self.scheduler = BackgroundScheduler()
+        return self.scheduler
+
+    def safe_add_task(self, func: callable, args: Union[Tuple, None] = None, kwargs: Union[Dict, None] = None, trigger: Union[str, Any] = "interval", seconds: int = 5) -> Union[int, 'Job']:
         """_summary_
             A non-crashing implementation of the add_task function.
 
@@ -161,7 +176,7 @@ class BackgroundTasks:
             return res
         return {"data": data}
 
-    def add_task(self, func: callable, args: Union[Tuple, None] = None, kwargs: Union[Dict, None] = None, trigger: Union[str, Any] = "interval",  seconds: int = 5) -> Union[Job, None]:
+    def add_task(self, func: callable, args: Union[Tuple, None] = None, kwargs: Union[Dict, None] = None, trigger: Union[str, Any] = "interval",  seconds: int = 5) -> Union['Job', None]:
         """_summary_
             Function in charge of adding an automated call to functions that are meant to run in the background.
             They are meant to run on interval.
@@ -212,7 +227,7 @@ class BackgroundTasks:
         msg += f"args = {args}, "
         msg += f"kwargs = {kwargs}."
         self.disp.log_debug(msg, "add_task")
-        return self.scheduler.add_job(
+        return self._get_scheduler().add_job(
             func=func,
             trigger=trigger,
             seconds=seconds,
@@ -231,7 +246,7 @@ class BackgroundTasks:
             Union[int, None]: _description_: Will return self.success if it worked, otherwise None because it will have raised an error.
         """
         try:
-            self.scheduler.start()
+            self._get_scheduler().start()
             self.disp.log_info("Scheduler started...", "start")
             return self.success
         except SchedulerAlreadyRunningError:
@@ -265,10 +280,10 @@ class BackgroundTasks:
         """
         try:
             if pause is True:
-                self.scheduler.pause()
+                self._get_scheduler().pause()
                 self.disp.log_info("Scheduler paused.", "pause")
             else:
-                self.scheduler.resume()
+                self._get_scheduler().resume()
                 self.disp.log_info("Scheduler resumed.", "pause")
             return self.success
         except Exception as e:
@@ -302,6 +317,9 @@ class BackgroundTasks:
         Returns:
             Union[int, None]: _description_: will return self.success if it succeeds, or none if it raised an error.
         """
+        if self.scheduler is None:
+            self.disp.log_debug("Scheduler was never started.", "stop")
+            return self.success
         try:
             self.scheduler.shutdown(wait=wait)
             self.disp.log_info("Scheduler stopped.", "stop")
@@ -6,7 +6,8 @@ from typing import Any, List, Dict, Union
 from datetime import datetime
 import requests
 from fastapi import Response
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from ..runtime_data import RuntimeData
 from .. import constants as CONST
 
@@ -22,7 +23,7 @@ class Tasks:
         self.debug: bool = debug
         self.runtime_data: RuntimeData = runtime_data
         # ---------------------- The visual logger class  ----------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -61,6 +62,13 @@ class Tasks:
                 trigger='interval',
                 seconds=CONST.RENEW_OAUTH_TOKENS_INTERVAL
             )
+        if CONST.COMPACT_POSITIONS is True:
+            self.runtime_data.background_tasks_initialised.safe_add_task(
+                func=self.compact_positions,
+                args=None,
+                trigger='interval',
+                seconds=CONST.COMPACT_POSITIONS_INTERVAL
+            )
 
     def clean_expired_verification_nodes(self) -> None:
         """_summary_
@@ -87,26 +95,68 @@ class Tasks:
                 title
             )
             return
-        self.disp.log_debug(f"current lines = {current_lines}", title)
+        self.disp.log_debug("current lines = %s", title, current_lines)
         for i in current_lines:
             if i[date_node] is not None and i[date_node] != "" and isinstance(i[date_node], str) is True:
                 datetime_node = self.runtime_data.database_link.string_to_datetime(
                     i[date_node]
                 )
-                msg = f"Converted {i[date_node]} to a datetime instance"
-                msg += f" ({datetime_node})."
-                self.disp.log_debug(msg, title)
+                self.disp.log_debug(
+                    "Converted %s to a datetime instance (%s).",
+                    title, i[date_node], datetime_node
+                )
             else:
                 datetime_node = i[date_node]
-                self.disp.log_debug(f"Did not convert {i[date_node]}.", title)
+                self.disp.log_debug("Did not convert %s.", title, i[date_node])
             if datetime_node < current_time:
                 self.runtime_data.database_link.remove_data_from_table(
                     table=CONST.TAB_VERIFICATION,
-                    where=f"id='{i['id']}'"
+                    where=("id", "=", i["id"])
                 )
-                self.disp.log_debug(f"Removed {i}.", title)
+                self.disp.log_debug("Removed %s.", title, i)
         self.disp.log_debug("Cleaned expired lines", title)
 
+    def compact_positions(self) -> None:
+        """
+            Spread the position keys evenly again in the boards and lists where the moves used up the gaps.
+            Each group is renumbered in its own transaction, the other groups are left untouched.
+        """
+        title = "compact_positions"
+        groups = [
+            (CONST.TAB_BOARDS_LISTS, "board_id"),
+            (CONST.TAB_LISTS_CARDS, "list_id")
+        ]
+        for table, group_column in groups:
+            crowded_groups = self.runtime_data.database_link.get_crowded_position_groups(
+                table=table,
+                column="position",
+                group_column=group_column,
+                min_gap=CONST.COMPACT_POSITIONS_MIN_GAP
+            )
+            if isinstance(crowded_groups, int) is True:
+                self.disp.log_error(
+                    f"Failed to find the groups to compact in the {table} table.",
+                    title
+                )
+                continue
+            for group_id in crowded_groups:
+                with self.runtime_data.database_link.transaction() as tx:
+                    tx.renumber_positions(
+                        table=table,
+                        column="position",
+                        gap=CONST.POSITION_GAP,
+                        where=(group_column, "=", group_id)
+                    )
+                if tx.is_committed() is False:
+                    self.disp.log_error(
+                        f"Failed to compact the positions of {group_column} {group_id} in the {table} table.",
+                        title
+                    )
+            self.disp.log_debug(
+                "Compacted %s groups of the %s table.",
+                title, len(crowded_groups), table
+            )
+
     def _refresh_token(self, provider_name: str, refresh_link: str) -> Union[str, None]:
         """
         The function that use the given provider name and refresh link to generate a new token for oauth authentication
@@ -116,11 +166,11 @@ class Tasks:
             retrieved_data = self.runtime_data.database_link.get_data_from_table(
                 CONST.TAB_USER_OAUTH_CONNECTION,
                 "*",
-                f"provider_name='{provider_name}'"
+                ("provider_name", "=", provider_name)
+            )
+            self.disp.log_debug(
+                "Retrieved the provider data of %s", title, provider_name
             )
-            msg = "Retrieved provider data:"
-            msg += f"{retrieved_data}"
-            self.disp.log_debug(msg, title)
             if isinstance(retrieved_data, int):
                 self.disp.log_error(
                     "An error has been detected when retrieving the provider data", title
@@ -132,16 +182,16 @@ class Tasks:
             generated_data["client_secret"] = retrieved_data[0]["client_secret"]
             generated_data["refresh_token"] = refresh_link
             generated_data["grant_type"] = "refresh_token"
-            self.disp.log_debug(f"Generated data: {generated_data}", title)
+            self.disp.log_debug("Generated data keys: %s", title, list(generated_data))
             provider_response: Response = requests.post(
                 token_url, data=generated_data, timeout=10
             )
-            self.disp.log_debug(f"Provider response: {provider_response}", title)
+            self.disp.log_debug("Provider response: %s", title, provider_response)
             if provider_response.status_code == 200:
                 token_response = provider_response.json()
-                msg = "Provider response to json: "
-                msg += f"{token_response}"
-                self.disp.log_debug(msg, title)
+                self.disp.log_debug(
+                    "Provider response keys: %s", title, list(token_response)
+                )
                 if "access_token" in token_response:
                     return token_response["access_token"]
             else:
@@ -168,7 +218,7 @@ class Tasks:
         current_time: datetime = datetime.now()
         for oauth in oauth_connections:
             if oauth["token_lifespan"] == 0:
-                self.disp.log_debug(f"Token for {oauth['id']} does not need to be renewed.", title)
+                self.disp.log_debug("Token for %s does not need to be renewed.", title, oauth['id'])
                 continue
             node_id: str = oauth['id']
             token_expiration: datetime = oauth["token_expiration"]
@@ -180,7 +230,7 @@ class Tasks:
                 ] = self.runtime_data.database_link.get_data_from_table(
                     table=CONST.TAB_USER_OAUTH_CONNECTION,
                     column="*",
-                    where=f"id='{oauth['provider_id']}'",
+                    where=("id", "=", oauth["provider_id"]),
                     beautify=True
                 )
                 if isinstance(provider, int) is True:
@@ -203,7 +253,7 @@ class Tasks:
                     sql_mode=True
                 )
                 self.disp.log_debug(
-                    f"token expiration = {token_expiration}", title
+                    "token expiration = %s", title, token_expiration
                 )
                 if new_token != "":
                     self.runtime_data.database_link.update_data_in_table(
@@ -216,15 +266,15 @@ class Tasks:
                             "token",
                             "token_expiration"
                         ],
-                        where=f"id='{node_id}'"
+                        where=("id", "=", node_id)
                     )
                     self.disp.log_debug(
-                        f"token {new_token} updated for {node_id}"
+                        "token updated for %s", title, node_id
                     )
                 else:
                     self.disp.log_error(f"Could not renew token for {node_id}")
             else:
                 self.disp.log_debug(
-                    f"Token for {node_id} does not need to be renewed.", title
+                    "Token for %s does not need to be renewed.", title, node_id
                 )
         self.disp.log_debug("Checked for oauth that need to be renewed", title)
@@ -2,9 +2,13 @@
     File containing boilerplate functions that could be used by the server in it's endpoints_initialised for checking incoming data.
 """
 
-from typing import Union, Dict, Any
+import json
+import base64
+import binascii
+from typing import Union, Dict, List, Tuple, Any
 from fastapi import Request, UploadFile
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import RuntimeData, CONST
 
 class BoilerplateIncoming:
@@ -21,7 +25,7 @@ class BoilerplateIncoming:
         self.error: int = error
         self.runtime_data_initialised: RuntimeData = runtime_data
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -41,11 +45,11 @@ class BoilerplateIncoming:
         """
         title = "token_correct"
         self.disp.log_debug(
-            f"request = {request}", title
+            "request = %s", title, request
         )
         token = self.get_token_if_present(request)
         self.disp.log_debug(
-            f"token = {token}", title
+            "token present = %s", title, token is not None
         )
         if token is None:
             return False
@@ -67,14 +71,14 @@ class BoilerplateIncoming:
             )
             return self.error
         self.disp.log_debug(
-            f"user_data = {user_data}", title
+            "Inserting a login for user %s", title, user_data[1]
         )
         table_columns = self.runtime_data_initialised.database_link.get_table_column_names(
             CONST.TAB_CONNECTIONS
         )
         table_columns.pop(0)
         self.disp.log_debug(
-            f"table_columns = {table_columns}", title
+            "table_columns = %s", title, table_columns
         )
         status = self.runtime_data_initialised.database_link.insert_data_into_table(
             CONST.TAB_CONNECTIONS,
@@ -104,29 +108,29 @@ class BoilerplateIncoming:
         """
         title = "log_user_in"
         data = {'status': self.success, 'token': ''}
-        self.disp.log_debug(f"e-mail = {email}", title)
+        self.disp.log_debug("e-mail = %s", title, email)
         token = self.runtime_data_initialised.boilerplate_non_http_initialised.generate_token()
         usr_id = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_ACCOUNTS,
             "id",
-            f"email='{email}'",
+            ("email", "=", email),
             beautify=False
         )
         if isinstance(usr_id, int):
             data['status'] = self.error
             return data
-        self.disp.log_debug(f"usr_id = {usr_id}", title)
+        self.disp.log_debug("usr_id = %s", title, usr_id)
         try:
             uid = str(int(usr_id[0][0]))
-            self.disp.log_debug(f"uid = {uid}", title)
+            self.disp.log_debug("uid = %s", title, uid)
         except ValueError:
             data['status'] = self.error
             return data
         usr_data = [token, uid]
-        self.disp.log_debug(f"usr_data = {usr_data}", title)
+        self.disp.log_debug("Logging user %s in", title, uid)
         data['status'] = self._insert_login_into_database(usr_data)
         data['token'] = token
-        self.disp.log_debug(f"Response data: {data}", title)
+        self.disp.log_debug("Login status: %s", title, data['status'])
         return data
 
     def get_token_if_present(self, request: Request) -> Union[str, None]:
@@ -146,10 +150,11 @@ class BoilerplateIncoming:
             CONST.REQUEST_BEARER_KEY
         )
         cookie_token = request.cookies.get("token")
-        self.disp.log_debug(f"Cookie = {cookie_token}")
-        msg = f"mtoken = {mtoken}, mbearer = {mbearer}"
-        msg += f", token = {token}, bearer = {bearer}"
-        self.disp.log_debug(msg, "get_token_if_present")
+        self.disp.log_debug(
+            "Token sources present: cookie = %s, mtoken = %s, mbearer = %s, token = %s, bearer = %s",
+            "get_token_if_present", cookie_token is not None, mtoken is not None,
+            mbearer is not None, token is not None, bearer is not None
+        )
         if token is None and bearer is None and token is None and bearer is None and cookie_token is None:
             return None
         if cookie_token is not None:
@@ -193,6 +198,90 @@ class BoilerplateIncoming:
                 body = {"error": msg}
         return body
 
+    def get_pagination(self, request: Request, cursor_size: int) -> Union[Tuple[Union[int, None], Union[List[Any], None]], None]:
+        """
+            Get the limit and cursor (returned as "next" with the previous page) query parameters of a paginated endpoint.
+            Without both parameters every row is returned, like before the endpoints were paginated.
+
+        Args:
+            request (Request): The incoming request object.
+            cursor_size (int): The amount of values the cursor of the endpoint contains.
+
+        Returns:
+            Union[Tuple[Union[int, None], Union[List[Any], None]], None]: The limit (None when not paginated) and the decoded cursor (None on the first page), None if a parameter is invalid.
+        """
+        title = "get_pagination"
+        limit_param: Union[str, None] = request.query_params.get("limit")
+        cursor_param: Union[str, None] = request.query_params.get("cursor")
+        if (limit_param is None or limit_param == "") and (cursor_param is None or cursor_param == ""):
+            return None, None
+        limit: int = CONST.PAGINATION_DEFAULT_LIMIT
+        if limit_param is not None and limit_param != "":
+            try:
+                limit = int(limit_param)
+            except ValueError:
+                self.disp.log_debug("Invalid limit: %s", title, limit_param)
+                return None
+            if limit <= 0:
+                return None
+            limit = min(limit, CONST.PAGINATION_MAX_LIMIT)
+        if cursor_param is None or cursor_param == "":
+            return limit, None
+        try:
+            padding = "=" * (-len(cursor_param) % 4)
+            after = json.loads(
+                base64.urlsafe_b64decode(cursor_param + padding).decode("utf-8")
+            )
+        except (ValueError, binascii.Error):
+            self.disp.log_debug("Invalid cursor: %s", title, cursor_param)
+            return None
+        if isinstance(after, list) is False or len(after) != cursor_size:
+            return None
+        if any(isinstance(i, (str, int)) is False or isinstance(i, bool) for i in after):
+            return None
+        return limit, after
+
+    def page_query_limit(self, limit: Union[int, None]) -> Union[int, None]:
+        """
+            Get the limit of the query of a page: one extra row is fetched to know if there is a next page.
+
+        Args:
+            limit (Union[int, None]): The size of a page (None when not paginated).
+
+        Returns:
+            Union[int, None]: The limit to give to the query, None to fetch every row.
+        """
+        if limit is None:
+            return None
+        return limit + 1
+
+    def paginate(self, rows: Union[List[Any], int], limit: Union[int, None], keys: List[str]) -> Tuple[List[Any], Union[str, None]]:
+        """
+            Cut the extra row that was fetched to know if there is a next page and build the cursor of that page.
+
+        Args:
+            rows (Union[List[Any], int]): The rows fetched with the limit given by page_query_limit.
+            limit (Union[int, None]): The size of a page (None when not paginated).
+            keys (List[str]): The columns the rows are ordered by.
+
+        Returns:
+            Tuple[List[Any], Union[str, None]]: The rows of the page and the cursor of the next page (None if it is the last page).
+        """
+        if isinstance(rows, int):
+            return [], None
+        if limit is None or len(rows) <= limit:
+            return rows, None
+        page = rows[:limit]
+        last_row = page[-1]
+        values = [
+            last_row[key] if isinstance(last_row[key], int) else str(last_row[key])
+            for key in keys
+        ]
+        cursor = base64.urlsafe_b64encode(
+            json.dumps(values).encode("utf-8")
+        ).decode("utf-8").rstrip("=")
+        return page, cursor
+
     def log_user_out(self, token: str = "") -> Dict[str, Any]:
         """
             Attempt to log the user out based on the provided token.
@@ -213,17 +302,20 @@ class BoilerplateIncoming:
         login_table = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_CONNECTIONS,
             "*",
-            where=f"token={token}",
+            where=("token", "=", token),
             beautify=False
         )
         if isinstance(login_table, int):
             return False
         if len(login_table) != 1:
             return False
-        self.disp.log_debug(f"login_table = {login_table}", title)
+        self.disp.log_debug("Logging user %s out", title, login_table[0][2])
         status = self.runtime_data_initialised.database_link.remove_data_from_table(
             CONST.TAB_CONNECTIONS,
-            f"token={token}"
+            ("token", "=", token)
+        )
+        self.runtime_data_initialised.boilerplate_non_http_initialised.invalidate_token(
+            token
         )
         if status != self.success:
             data["msg"] = "Data not removed successfully !"
@@ -5,14 +5,17 @@
 import re
 import uuid
 from datetime import datetime, timedelta
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Tuple
 
 from fastapi import Response
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 from .. import RuntimeData, CONST
 from ..sql.sql_manager import SQL
+from ..sql.sql_query_boilerplates import SQLQueryBoilerplates
 from ..http_codes import HCI
+from ..token_cache import TokenCache
 
 class BoilerplateNonHTTP:
     """
@@ -28,7 +31,7 @@ class BoilerplateNonHTTP:
         self.success: int = success
         self.runtime_data_initialised: RuntimeData = runtime_data_initialised
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -36,6 +39,16 @@ class BoilerplateNonHTTP:
             debug=self.debug,
             logger=self.__class__.__name__
         )
+        # -------------------------- The token cache  --------------------------
+        self.token_cache: TokenCache = TokenCache(
+            max_size=CONST.TOKEN_CACHE_MAX_SIZE,
+            ttl=CONST.TOKEN_CACHE_TTL,
+            error=self.error,
+            success=self.success,
+            debug=self.debug
+        )
+        # --------------- The board of the lists (event routing) ---------------
+        self.list_boards: Dict[str, str] = {}
 
     def pause(self) -> str:
         """
@@ -60,11 +73,12 @@ class BoilerplateNonHTTP:
         offset_time = current_time + timedelta(seconds=seconds)
         return offset_time
 
-    def is_token_correct(self, token: str) -> bool:
+    def is_token_correct(self, token: str, skip_cache: bool = False) -> bool:
         """
             Check if the token is correct.
         Args:
             token (str): The token to check
+            skip_cache (bool, optional): Go straight to the database (the caller already missed the cache, the miss is not counted twice). Defaults to False.
 
         Returns:
             bool: True if the token is correct, False otherwise
@@ -73,17 +87,87 @@ class BoilerplateNonHTTP:
         self.disp.log_debug("Checking if the token is correct.", title)
         if isinstance(token, str) is False:
             return False
+        if skip_cache is False and self.token_cache.get(token) is not None:
+            self.disp.log_debug("The token was found in the cache.", title)
+            return True
         login_table = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_CONNECTIONS,
-            "*",
-            where=f"token={token}",
+            "user_id",
+            where=("token", "=", token),
             beautify=False
         )
-        if isinstance(login_table, int):
+        if isinstance(login_table, int) or len(login_table) == 0:
             return False
-        self.disp.log_debug(f"login_table = {login_table}", title)
+        self.disp.log_debug("The token belongs to user %s.", title, login_table[0][0])
+        self.token_cache.set(token, str(login_table[0][0]))
         return True
 
+    async def a_is_token_correct(self, token: str) -> bool:
+        """
+            Awaitable version of is_token_correct, a token missing from the cache is checked in the query thread pool.
+        Args:
+            token (str): The token to check
+
+        Returns:
+            bool: True if the token is correct, False otherwise
+        """
+        if isinstance(token, str) is False:
+            return False
+        if self.token_cache.get(token) is not None:
+            return True
+        return await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.is_token_correct, token, skip_cache=True
+        )
+
+    def invalidate_token(self, token: str) -> int:
+        """
+            Remove a token from the token cache (to be called when the token is removed from the database).
+        Args:
+            token (str): The token to forget
+
+        Returns:
+            int: self.success if the token was cached, self.error otherwise
+        """
+        if self.runtime_data_initialised.events_relay is not None:
+            self.runtime_data_initialised.events_relay.send(
+                CONST.RELAY_CHANNEL_TOKENS, {"token": token}
+            )
+        return self.token_cache.invalidate(token)
+
+    def invalidate_user_tokens(self, user_id: Union[str, int]) -> int:
+        """
+            Remove every token of a user from the token cache.
+        Args:
+            user_id (Union[str, int]): The id of the user
+
+        Returns:
+            int: The number of tokens that were removed
+        """
+        if self.runtime_data_initialised.events_relay is not None:
+            self.runtime_data_initialised.events_relay.send(
+                CONST.RELAY_CHANNEL_TOKENS, {"user_id": str(user_id)}
+            )
+        return self.token_cache.invalidate_user(user_id)
+
+    def forget_relayed_tokens(self, payload: Dict[str, Any]) -> None:
+        """
+            Remove from the token cache the tokens invalidated by another worker.
+        Args:
+            payload (Dict[str, Any]): The relayed invalidation ({"token": ...} or {"user_id": ...})
+        """
+        if payload.get("token") is not None:
+            self.token_cache.invalidate(payload["token"])
+        if payload.get("user_id") is not None:
+            self.token_cache.invalidate_user(payload["user_id"])
+
+    def get_token_cache_stats(self) -> Dict[str, int]:
+        """
+            Get the hit and miss counters of the token cache.
+        Returns:
+            Dict[str, int]: The statistics of the token cache
+        """
+        return self.token_cache.get_stats()
+
     def generate_token(self) -> str:
         """
             This is a function that will generate a token for the user.
@@ -95,19 +179,19 @@ class BoilerplateNonHTTP:
         user_token = self.runtime_data_initialised.database_link.get_data_from_table(
             table=CONST.TAB_CONNECTIONS,
             column="token",
-            where=f"token='{token}'",
+            where=("token", "=", token),
             beautify=False
         )
-        self.disp.log_debug(f"user_token = {user_token}", title)
+        self.disp.log_debug("Generated token taken: %s", title, len(user_token) > 0)
         while len(user_token) > 0:
             token = str(uuid.uuid4())
             user_token = self.runtime_data_initialised.database_link.get_data_from_table(
                 table=CONST.TAB_CONNECTIONS,
                 column="token",
-                where=f"token='{token}'",
+                where=("token", "=", token),
                 beautify=False
             )
-            self.disp.log_debug(f"user_token = {user_token}", title)
+            self.disp.log_debug("Generated token taken: %s", title, isinstance(user_token, int) is False and len(user_token) > 0)
             if isinstance(user_token, int) is True and user_token == self.error:
                 return token
             if len(user_token) == 0:
@@ -174,46 +258,65 @@ class BoilerplateNonHTTP:
                     msg = "(check_database_health) Could not connect to the database."
                     raise RuntimeError(msg) from e
 
-    def get_user_id_from_token(self, title: str, token: str) -> Union[str, Response]:
+    def get_user_id_from_token(self, title: str, token: str, skip_cache: bool = False) -> Union[str, Response]:
         """
             The function in charge of getting the user id based of the provided content.
 
         Args:
             title (str): The title of the endpoint calling it
             token (str): The token of the user account
+            skip_cache (bool, optional): Go straight to the database (the caller already missed the cache, the miss is not counted twice). Defaults to False.
 
         Returns:
             Union[str, Response]: Returns as string id if success, otherwise, a pre-made response for the endpoint.
         """
         function_title = "get_user_id_from_token"
         usr_id_node: str = "user_id"
-        self.disp.log_debug(
-            f"Getting user id based on {token}", function_title
-        )
+        self.disp.log_debug("Getting the user id of a token", function_title)
+        if skip_cache is False:
+            cached_user_id: Union[str, None] = self.token_cache.get(token)
+            if cached_user_id is not None:
+                return cached_user_id
         current_user: List[Dict[str]] = self.runtime_data_initialised.database_link.get_data_from_table(
             table=CONST.TAB_CONNECTIONS,
             column="*",
-            where=f"token='{token}'",
+            where=("token", "=", token),
             beautify=True
         )
-        self.disp.log_debug(f"current_user = {current_user}", function_title)
         if current_user == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(title)
         self.disp.log_debug(
-            f"user_length = {len(current_user)}", function_title
+            "user_length = %s", function_title, len(current_user)
         )
         if len(current_user) == 0 or len(current_user) > 1:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(title)
-        self.disp.log_debug(
-            f"current_user[0] = {current_user[0]}", function_title
-        )
         if usr_id_node not in current_user[0]:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(title)
-        msg = "str(current_user[0]["
-        msg += f"{usr_id_node}]) = {str(current_user[0][usr_id_node])}"
-        self.disp.log_debug(msg, function_title)
+        self.disp.log_debug(
+            "str(current_user[0][%s]) = %s", function_title,
+            usr_id_node, current_user[0][usr_id_node]
+        )
+        self.token_cache.set(token, str(current_user[0][usr_id_node]))
         return str(current_user[0][usr_id_node])
 
+    async def a_get_user_id_from_token(self, title: str, token: str) -> Union[str, Response]:
+        """
+            Awaitable version of get_user_id_from_token, a token missing from the cache is looked up in the query thread pool.
+
+        Args:
+            title (str): The title of the endpoint calling it
+            token (str): The token of the user account
+
+        Returns:
+            Union[str, Response]: Returns as string id if success, otherwise, a pre-made response for the endpoint.
+        """
+        cached_user_id: Union[str, None] = self.token_cache.get(token)
+        if cached_user_id is not None:
+            return cached_user_id
+        return await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.get_user_id_from_token, title, token, skip_cache=True
+        )
+
     def update_single_data(self, table: str, column_finder: str, column_to_update: str, data_finder: str, request_body: dict) -> int:
         """
         The function in charge of updating the data in the database
@@ -222,111 +325,218 @@ class BoilerplateNonHTTP:
             table,
             [request_body[column_to_update]],
             [column_to_update],
-            f"{column_finder}='{data_finder}'"
+            (column_finder, "=", data_finder)
         ) == self.error:
             return self.error
         return self.success
 
-    def delete_card(self, card_id: int) -> int:
+    async def a_update_single_data(self, table: str, column_finder: str, column_to_update: str, data_finder: str, request_body: dict) -> int:
         """
-        Delete a card list
+        Awaitable version of update_single_data, the update runs in the query thread pool
+        """
+        if await self.runtime_data_initialised.database_link.a_update_data_in_table(
+            table,
+            [request_body[column_to_update]],
+            [column_to_update],
+            (column_finder, "=", data_finder)
+        ) == self.error:
+            return self.error
+        return self.success
+
+    def _get_ids(self, database: SQLQueryBoilerplates, table: str, in_column: str, values: List[Any], column: str = "id") -> List[Any]:
+        """
+        Get the ids (or the distinct values of another column) of the rows linked to any of the given values
+        """
+        if not values:
+            return []
+        rows: Union[List[Dict[str, Any]], int] = database.get_data_from_table_in(
+            table=table,
+            column=column,
+            in_column=in_column,
+            values=values
+        )
+        if isinstance(rows, int):
+            return []
+        return list(dict.fromkeys(row[column] for row in rows))
+
+    def _bump_boards_versions(self, database: SQLQueryBoilerplates, boards_id: List[Any]) -> int:
+        """
+        Increase the version of the boards whose content is deleted, as part of the same transaction
+        """
+        for board_id in boards_id:
+            if database.shift_column_in_table(
+                table=CONST.TAB_BOARDS,
+                column="version",
+                offset=1,
+                where=("id", "=", board_id)
+            ) == self.error:
+                return self.error
+        return self.success
+
+    def delete_cards(self, cards_id: List[Any], database: Union[SQLQueryBoilerplates, None] = None) -> int:
         """
-        # Delete the card assignees
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        Delete several cards with a bounded amount of queries
+        """
+        # Run every deletion in a single transaction and bump the versions of the boards the cards were on
+        if database is None:
+            with self.runtime_data_initialised.database_link.transaction() as tx:
+                boards_id = self._get_ids(
+                    tx,
+                    CONST.TAB_BOARDS_LISTS,
+                    "id",
+                    self._get_ids(tx, CONST.TAB_LISTS_CARDS, "id", cards_id, "list_id"),
+                    "board_id"
+                )
+                status = self.delete_cards(cards_id=cards_id, database=tx)
+                if status == self.success:
+                    status = self._bump_boards_versions(tx, boards_id)
+                if status != self.success:
+                    tx.mark_failed()
+            if tx.is_committed() is False:
+                return self.error
+            return status
+
+        # Delete the cards assignees
+        database.remove_data_from_table_in(
             table=CONST.TAB_CARDS_ASSIGNEES,
-            where=f"card_id='{card_id}'"
+            in_column="card_id",
+            values=cards_id
         )
 
-        # Delete the card assignees
-        return self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Delete the cards
+        return database.remove_data_from_table_in(
             table=CONST.TAB_LISTS_CARDS,
-            where=f"id='{card_id}'"
+            in_column="id",
+            values=cards_id
         )
 
-    def delete_list(self, list_id: int) -> int:
+    def delete_lists(self, lists_id: List[Any], database: Union[SQLQueryBoilerplates, None] = None) -> int:
         """
-        Delete a board list
+        Delete several board lists and their cards with a bounded amount of queries
         """
-        # Get every board lists id by the board_id
-        cards_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_LISTS_CARDS,
-            column="id",
-            where=f"list_id='{list_id}'",
+        # Run every deletion in a single transaction and bump the versions of the boards the lists were on
+        if database is None:
+            with self.runtime_data_initialised.database_link.transaction() as tx:
+                boards_id = self._get_ids(
+                    tx, CONST.TAB_BOARDS_LISTS, "id", lists_id, "board_id"
+                )
+                status = self.delete_lists(lists_id=lists_id, database=tx)
+                if status == self.success:
+                    status = self._bump_boards_versions(tx, boards_id)
+                if status != self.success:
+                    tx.mark_failed()
+            if tx.is_committed() is False:
+                return self.error
+            return status
+
+        # Delete every card in the lists
+        self.delete_cards(
+            cards_id=self._get_ids(database, CONST.TAB_LISTS_CARDS, "list_id", lists_id),
+            database=database
         )
 
-        # Delete every card in the list
-        if isinstance(cards_id, int) is False:
-            for _, card in enumerate(cards_id):
-                self.delete_card(card_id=card["id"])
-
-        # Delete the list
-        return self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Delete the lists
+        return database.remove_data_from_table_in(
             table=CONST.TAB_BOARDS_LISTS,
-            where=f"id='{list_id}'"
+            in_column="id",
+            values=lists_id
         )
 
-    def delete_board(self, board_id: int) -> int:
+    def delete_boards(self, boards_id: List[Any], database: Union[SQLQueryBoilerplates, None] = None) -> int:
         """
-        Delete a workspace board
+        Delete several workspace boards and their content with a bounded amount of queries
         """
-        # Delete the board activities
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Run every deletion in a single transaction
+        if database is None:
+            with self.runtime_data_initialised.database_link.transaction() as tx:
+                status = self.delete_boards(boards_id=boards_id, database=tx)
+            if tx.is_committed() is False:
+                return self.error
+            return status
+
+        # Delete the boards activities
+        database.remove_data_from_table_in(
             table=CONST.TAB_BOARDS_ACTIVITIES,
-            where=f"board_id='{board_id}'"
+            in_column="board_id",
+            values=boards_id
         )
 
-        # Get every board lists id by the board_id
-        lists_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_BOARDS_LISTS,
-            column="id",
-            where=f"board_id='{board_id}'",
+        # Delete every list in the boards
+        self.delete_lists(
+            lists_id=self._get_ids(database, CONST.TAB_BOARDS_LISTS, "board_id", boards_id),
+            database=database
         )
 
-        # Delete every board in the list
-        if isinstance(lists_id, int) is False:
-            for _, board_list in enumerate(lists_id):
-                self.delete_list(list_id=board_list["id"])
-
-        # Delete the board
-        return self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Delete the boards
+        return database.remove_data_from_table_in(
             table=CONST.TAB_BOARDS,
-            where=f"id='{board_id}'"
+            in_column="id",
+            values=boards_id
         )
 
-    def delete_workspace(self, workspace_id: int) -> None:
+    def delete_workspaces(self, workspaces_id: List[Any], database: Union[SQLQueryBoilerplates, None] = None) -> int:
         """
-        The function to delete every data of a workspace
+        Delete several workspaces and their content with a bounded amount of queries
         """
-        # Delete the workspace invitation
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Run every deletion in a single transaction
+        if database is None:
+            with self.runtime_data_initialised.database_link.transaction() as tx:
+                status = self.delete_workspaces(workspaces_id=workspaces_id, database=tx)
+            if tx.is_committed() is False:
+                return self.error
+            return status
+
+        # Delete the workspaces invitations
+        database.remove_data_from_table_in(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
-            where=f"workspace_id='{workspace_id}'"
+            in_column="workspace_id",
+            values=workspaces_id
         )
 
-        # Delete the workspace member
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Delete the workspaces members
+        database.remove_data_from_table_in(
             table=CONST.TAB_WORKSPACES_MEMBERS,
-            where=f"workspace_id='{workspace_id}'"
+            in_column="workspace_id",
+            values=workspaces_id
         )
 
-        # Get every boards id by the workspace_id
-        boards_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_BOARDS,
-            column="id",
-            where=f"workspace_id='{workspace_id}'",
+        # Delete every board in the workspaces
+        self.delete_boards(
+            boards_id=self._get_ids(database, CONST.TAB_BOARDS, "workspace_id", workspaces_id),
+            database=database
         )
 
-        # Delete every board in the list
-        if isinstance(boards_id, int) is False:
-            for _, board in enumerate(boards_id):
-                self.delete_board(board_id=board["id"])
-
-        # Delete the workspace
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        # Delete the workspaces
+        return database.remove_data_from_table_in(
             table=CONST.TAB_WORKSPACES,
-            where=f"id='{workspace_id}'"
+            in_column="id",
+            values=workspaces_id
         )
 
+    def delete_card(self, card_id: int, database: Union[SQLQueryBoilerplates, None] = None) -> int:
+        """
+        Delete a card list
+        """
+        return self.delete_cards(cards_id=[card_id], database=database)
+
+    def delete_list(self, list_id: int, database: Union[SQLQueryBoilerplates, None] = None) -> int:
+        """
+        Delete a board list
+        """
+        return self.delete_lists(lists_id=[list_id], database=database)
+
+    def delete_board(self, board_id: int, database: Union[SQLQueryBoilerplates, None] = None) -> int:
+        """
+        Delete a workspace board
+        """
+        return self.delete_boards(boards_id=[board_id], database=database)
+
+    def delete_workspace(self, workspace_id: int, database: Union[SQLQueryBoilerplates, None] = None) -> int:
+        """
+        The function to delete every data of a workspace
+        """
+        return self.delete_workspaces(workspaces_id=[workspace_id], database=database)
+
     def get_workspace_member(self, user_id: str, workspace_id: str, title: str) -> Union[List[Dict[str, Any]], Response]:
         """
         A function to get a workspace member
@@ -334,7 +544,7 @@ class BoilerplateNonHTTP:
         workspace_member: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
         )
 
         # Check if the workspace member was found
@@ -352,11 +562,147 @@ class BoilerplateNonHTTP:
             )
         return workspace_member
 
-    def update_table_values(self, table: str, data: List[Any], columns: List[str], where: str, title: str, message: str) -> Response:
+    async def a_get_workspace_member(self, user_id: str, workspace_id: str, title: str) -> Union[List[Dict[str, Any]], Response]:
+        """
+        Awaitable version of get_workspace_member, the member is looked up in the query thread pool
+        """
+        workspace_member: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_WORKSPACES_MEMBERS,
+            column="*",
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
+        )
+
+        # Check if the workspace member was found
+        if workspace_member == self.error or not workspace_member:
+            response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                title=title,
+                message="The workspace member was not found.",
+                resp="not found",
+                error=True
+            )
+            return HCI.not_found(
+                content=response_body,
+                content_type=CONST.CONTENT_TYPE,
+                headers=self.runtime_data_initialised.json_header
+            )
+        return workspace_member
+
+    async def get_board_id(self, list_id: Union[str, int, None] = None, card_id: Union[str, int, None] = None) -> Union[str, None]:
+        """
+        Get the id of the board a list (or a card) belongs to
+        """
+        title: str = "get_board_id"
+        if list_id is None and card_id is not None:
+            card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+                table=CONST.TAB_LISTS_CARDS,
+                column="list_id",
+                where=("id", "=", card_id)
+            )
+            if isinstance(card, int):
+                self.disp.log_debug("Card %s not found.", title, card_id)
+                return None
+            list_id = card[0]["list_id"]
+        if list_id is None:
+            return None
+        list_id = str(list_id)
+        if list_id in self.list_boards:
+            return self.list_boards[list_id]
+        board_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_BOARDS_LISTS,
+            column="board_id",
+            where=("id", "=", list_id)
+        )
+        if isinstance(board_list, int):
+            self.disp.log_debug("List %s not found.", title, list_id)
+            return None
+        if len(self.list_boards) >= CONST.LIST_BOARD_CACHE_SIZE:
+            self.list_boards.clear()
+        self.list_boards[list_id] = str(board_list[0]["board_id"])
+        return self.list_boards[list_id]
+
+    async def bump_board_version(self, board_id: Union[str, int]) -> int:
+        """
+        Increase the version of a board by one (a single update, safe with several workers)
+        """
+        status: int = await self.runtime_data_initialised.database_link.a_shift_column_in_table(
+            table=CONST.TAB_BOARDS,
+            column="version",
+            offset=1,
+            where=("id", "=", board_id)
+        )
+        if status == self.error:
+            self.disp.log_error(
+                f"Could not bump the version of board {board_id}.", "bump_board_version"
+            )
+        return status
+
+    async def publish_board_event(self, event: str, data: Any = None, board_id: Union[str, int, None] = None, list_id: Union[str, int, None] = None, card_id: Union[str, int, None] = None, bump_version: bool = True) -> int:
+        """
+        Bump the version of a board (unless the caller already did it in its transaction) and send the change to the clients watching it
+        """
+        if board_id is None:
+            board_id = await self.get_board_id(list_id=list_id, card_id=card_id)
+        if board_id is None:
+            return 0
+        if bump_version is True:
+            await self.bump_board_version(board_id)
+        hub = self.runtime_data_initialised.board_events_hub
+        if hub is None or hub.has_subscribers(board_id) is False:
+            return 0
+        return hub.publish(board_id, event, data)
+
+    async def publish_board_row(self, event: str, table: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]], board_id: Union[str, int, None] = None, list_id: Union[str, int, None] = None, card_id: Union[str, int, None] = None, order_by: Union[str, List[str], None] = None) -> int:
+        """
+        Bump the version of a board and send the current content of the changed row to the clients watching it (the row is only queried when someone is watching)
+        """
+        if board_id is None:
+            board_id = await self.get_board_id(list_id=list_id, card_id=card_id)
+        if board_id is None:
+            return 0
+        await self.bump_board_version(board_id)
+        hub = self.runtime_data_initialised.board_events_hub
+        if hub is None or hub.has_subscribers(board_id) is False:
+            return 0
+        row: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=table,
+            column="*",
+            where=where,
+            order_by=order_by,
+            descending=order_by is not None,
+            limit=1
+        )
+        if isinstance(row, int):
+            return 0
+        return hub.publish(board_id, event, row[0])
+
+    def publish_user_notification(self, user_id: Union[str, int], notification: Dict[str, Any]) -> int:
+        """
+        Send a notification that was just inserted to the streams the user has opened (the row is given by the caller, nothing is queried)
+        """
+        hub = self.runtime_data_initialised.notification_events_hub
+        if hub is None or hub.has_subscribers(user_id) is False:
+            return 0
+        return hub.publish(
+            user_id,
+            CONST.EVENT_NOTIFICATION_CREATED,
+            notification,
+            event_id=notification["id"]
+        )
+
+    def publish_user_event(self, user_id: Union[str, int], event: str, data: Any = None) -> int:
+        """
+        Send an event that is not stored as a notification to the streams of a user
+        """
+        hub = self.runtime_data_initialised.notification_events_hub
+        if hub is None:
+            return 0
+        return hub.publish(user_id, event, data)
+
+    async def update_table_values(self, table: str, data: List[Any], columns: List[str], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]], title: str, message: str) -> Response:
         """
         A function to update a SQL table values
         """
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=table,
             data=data,
             column=columns,
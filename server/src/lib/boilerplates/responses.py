@@ -2,8 +2,9 @@
     File containing boilerplate responses that could be used by the server in it's endpoints_initialised.
 """
 from typing import Union, Dict, Any
-from fastapi import Response
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from fastapi import Request, Response
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import HCI, RuntimeData, CONST
 
 class BoilerplateResponses:
@@ -18,7 +19,7 @@ class BoilerplateResponses:
         """
         self.debug: bool = debug
         self.runtime_data_initialised: RuntimeData = runtime_data
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -42,9 +43,10 @@ class BoilerplateResponses:
         """
         func_title = "build_response_body"
         json_body = {}
-        msg = f"title={title}, message={message}, resp={resp},"
-        msg += f" error={error}"
-        self.disp.log_debug(msg, func_title)
+        self.disp.log_debug(
+            "title=%s, message=%s, resp=%s, error=%s",
+            func_title, title, message, resp, error
+        )
 
         json_body[CONST.JSON_TITLE] = title
         json_body[CONST.JSON_MESSAGE] = message
@@ -221,3 +223,40 @@ class BoilerplateResponses:
             error=True
         )
         return HCI.bad_request(body, content_type=CONST.CONTENT_TYPE, headers=self.runtime_data_initialised.json_header)
+
+    def success_with_etag(self, request: Request, content: Dict[str, Any], etag: Union[str, None] = None) -> Response:
+        """
+            Function that will return a success response tagged with an ETag, or a 304 (no body) if the client already has this version.
+
+        Args:
+            request (Request): The request of the user (to read the If-None-Match header)
+            content (Dict[str, Any]): The body to send (usually built with build_response_body)
+            etag (Union[str, None], optional): A version based ETag. Defaults to None.: A hash of the body is used when None.
+
+        Returns:
+            Response: The pre-compiled response (ready to go)
+        """
+        return HCI.send_message_with_etag(
+            if_none_match=request.headers.get(CONST.REQUEST_IF_NONE_MATCH_KEY),
+            content=content,
+            content_type=CONST.CONTENT_TYPE,
+            headers=self.runtime_data_initialised.json_header,
+            etag=etag
+        )
+
+    def build_server_sent_event(self, event: Dict[str, Any]) -> str:
+        """
+            Function that will format an event of the events hub as a server-sent event.
+
+        Args:
+            event (Dict[str, Any]): The event published in the hub.
+
+        Returns:
+            str: The text to write in the event stream (the id line is only added when the event has one)
+        """
+        message = ""
+        if event.get(CONST.EVENT_ID_KEY) is not None:
+            message += f"id: {event[CONST.EVENT_ID_KEY]}\n"
+        message += f"event: {event.get(CONST.EVENT_TYPE_KEY)}\n"
+        message += f"data: {HCI.json_text(event.get(CONST.EVENT_DATA_KEY))}\n\n"
+        return message
@@ -3,11 +3,11 @@
 """
 
 from typing import List, Union, Dict, Any, Optional
-import boto3
-from botocore.client import Config
 from botocore.exceptions import BotoCoreError, ClientError
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import CONST
+from ..request_timing import timed_dependency, DEPENDENCY_BUCKET
 
 
 class Bucket:
@@ -21,7 +21,7 @@ class Bucket:
         self.success: int = success
 
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -30,7 +30,7 @@ class Bucket:
             logger=self.__class__.__name__
         )
         # ----------------------- The connector address  -----------------------
-        self.connection: Optional[boto3.resource] = None
+        self.connection: Optional[Any] = None
 
     def connect(self) -> int:
         """
@@ -39,6 +39,9 @@ class Bucket:
         Returns:
             int: success or error code.
         """
+        # boto3 takes a while to import, it is only loaded once the bucket is used
+        import boto3
+        from botocore.client import Config
         try:
             self.connection = boto3.resource(
                 's3',
@@ -110,6 +113,7 @@ class Bucket:
             )
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def get_bucket_names(self) -> Union[List[str], int]:
         """
         Retrieve a list of all bucket names.
@@ -118,7 +122,7 @@ class Bucket:
             Union[List[str], int]: A list of bucket names or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             buckets = [bucket.name for bucket in self.connection.buckets.all()]
             return buckets
@@ -129,6 +133,7 @@ class Bucket:
             )
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def create_bucket(self, bucket_name: str) -> int:
         """
         Create a new bucket.
@@ -140,7 +145,7 @@ class Bucket:
             int: success or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             self.connection.create_bucket(Bucket=bucket_name)
             self.disp.log_info(
@@ -155,6 +160,7 @@ class Bucket:
             )
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def upload_file(self, bucket_name: str, file_path: str, key_name: Optional[str] = None) -> int:
         """
         Upload a file to the specified bucket.
@@ -169,7 +175,7 @@ class Bucket:
         """
         key_name = key_name or file_path
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             self.connection.Bucket(bucket_name).upload_file(
                 file_path,
@@ -185,6 +191,7 @@ class Bucket:
             self.disp.log_error(msg, "upload_file")
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def download_file(self, bucket_name: str, key_name: str, destination_path: str) -> int:
         """
         Download a file from the specified bucket.
@@ -198,7 +205,7 @@ class Bucket:
             int: success or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             self.connection.Bucket(bucket_name).download_file(
                 key_name, destination_path)
@@ -212,6 +219,7 @@ class Bucket:
             self.disp.log_error(msg, "download_file")
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def delete_file(self, bucket_name: str, key_name: str) -> int:
         """
         Delete a file from the specified bucket.
@@ -224,7 +232,7 @@ class Bucket:
             int: success or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             self.connection.Bucket(bucket_name).Object(key_name).delete()
             self.disp.log_info(
@@ -238,6 +246,7 @@ class Bucket:
             self.disp.log_error(msg, "delete_file")
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def delete_bucket(self, bucket_name: str) -> int:
         """
         Delete a bucket.
@@ -249,7 +258,7 @@ class Bucket:
             int: success or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             self.connection.Bucket(bucket_name).delete()
             self.disp.log_info(
@@ -264,6 +273,7 @@ class Bucket:
             )
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def get_bucket_files(self, bucket_name: str) -> Union[List[str], int]:
         """
         List all files in the specified bucket.
@@ -275,7 +285,7 @@ class Bucket:
             Union[List[str], int]: List of file names or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             files = []
             for obj in self.connection.Bucket(bucket_name).objects.all():
@@ -287,6 +297,7 @@ class Bucket:
             self.disp.log_error(msg, "get_bucket_files")
             return self.error
 
+    @timed_dependency(DEPENDENCY_BUCKET)
     def get_bucket_file(self, bucket_name: str, key_name: str) -> Union[Dict[str, Any], int]:
         """
         Get information about a specific file in the bucket.
@@ -299,7 +310,7 @@ class Bucket:
             Union[Dict[str, Any], int]: File metadata (path and size) or error code.
         """
         try:
-            if self.connection is None:
+            if self.connection is None and self.connect() != self.success:
                 raise ConnectionError("No connection established.")
             obj = self.connection.Bucket(bucket_name).Object(key_name)
             return {'file_path': key_name, 'file_size': obj.content_length}
@@ -0,0 +1,260 @@
+"""
+    File containing the ASGI middleware in charge of compressing the response bodies (brotli or gzip, depending on what the client accepts).
+"""
+
+import zlib
+from typing import Union, List, Dict, Tuple, Any, Callable, Awaitable
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODING_BROTLI: str = "br"
+ENCODING_GZIP: str = "gzip"
+
+# The bodies that are already compressed or that must reach the client chunk by chunk
+EXCLUDED_CONTENT_TYPES: Tuple[str, ...] = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/x-7z-compressed",
+    "application/vnd.rar"
+)
+
+
+class _Compressor:
+    """
+    A streaming compressor (the same calls for gzip and brotli).
+    """
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        """
+            Constructor
+
+        Args:
+            encoding (str): The encoding to produce (ENCODING_BROTLI or ENCODING_GZIP).
+            gzip_level (int): The gzip compression level (1 -> 9).
+            brotli_quality (int): The brotli quality (0 -> 11).
+        """
+        self.encoding: str = encoding
+        if encoding == ENCODING_BROTLI:
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._gzip = None
+        else:
+            self._brotli = None
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+            Compress a chunk and flush it so that it can be sent right away.
+
+        Args:
+            data (bytes): The chunk to compress.
+
+        Returns:
+            bytes: The compressed chunk.
+        """
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """
+            Compress the last chunk and close the stream.
+
+        Args:
+            data (bytes, optional): . Defaults to b"".: The last chunk.
+
+        Returns:
+            bytes: The end of the compressed stream.
+        """
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """
+    The middleware that compresses the responses bigger than a threshold, streamed responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4, use_brotli: bool = True) -> None:
+        """
+            Constructor
+
+        Args:
+            app (Callable[..., Awaitable[None]]): The ASGI application to wrap.
+            minimum_size (int, optional): . Defaults to 1000.: The size (in bytes) under which a body is sent as is.
+            gzip_level (int, optional): . Defaults to 6.: The gzip compression level (1 -> 9).
+            brotli_quality (int, optional): . Defaults to 4.: The brotli quality (0 -> 11).
+            use_brotli (bool, optional): . Defaults to True.: Offer brotli when the module is installed.
+        """
+        self.app: Callable[..., Awaitable[None]] = app
+        self.minimum_size: int = max(0, int(minimum_size))
+        self.gzip_level: int = min(9, max(1, int(gzip_level)))
+        self.brotli_quality: int = min(11, max(0, int(brotli_quality)))
+        self.use_brotli: bool = use_brotli is True and brotli is not None
+
+    def _negotiate(self, accept_encoding: str) -> Union[str, None]:
+        """
+            Pick the encoding to use from the Accept-Encoding header of the request.
+
+        Args:
+            accept_encoding (str): The content of the header.
+
+        Returns:
+            Union[str, None]: The chosen encoding, None if the body must not be compressed.
+        """
+        weights: Dict[str, float] = {}
+        for item in accept_encoding.lower().split(","):
+            parts = item.strip().split(";")
+            weight = 1.0
+            for parameter in parts[1:]:
+                parameter = parameter.strip()
+                if parameter.startswith("q="):
+                    try:
+                        weight = float(parameter[2:])
+                    except ValueError:
+                        weight = 0.0
+            if parts[0] != "":
+                weights[parts[0]] = weight
+        wildcard = weights.get("*", 0.0)
+        candidates: List[str] = [ENCODING_GZIP]
+        if self.use_brotli is True:
+            candidates.insert(0, ENCODING_BROTLI)
+        chosen: Union[str, None] = None
+        best = 0.0
+        for encoding in candidates:
+            weight = weights.get(encoding, wildcard)
+            if weight > best:
+                chosen = encoding
+                best = weight
+        return chosen
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]], send: Callable[..., Awaitable[None]]) -> None:
+        """
+            Run the wrapped application and compress its response when possible.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = self._negotiate(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """
+    The send function of a single response, it holds the start message until it knows if the body is worth compressing.
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Callable[..., Awaitable[None]]) -> None:
+        """
+            Constructor
+        """
+        self.middleware: CompressionMiddleware = middleware
+        self.encoding: str = encoding
+        self.downstream: Callable[..., Awaitable[None]] = send
+        self.start_message: Union[Dict[str, Any], None] = None
+        self.compressor: Union[_Compressor, None] = None
+        self.passthrough: bool = False
+
+    def _can_compress(self, headers: List[Tuple[bytes, bytes]], status: int) -> bool:
+        """
+            Check if the response can be compressed (not already encoded, not a stream that must stay readable, has a body).
+        """
+        if status < 200 or status in (204, 304):
+            return False
+        for key, value in headers:
+            if key == b"content-encoding":
+                return False
+            if key == b"content-type":
+                content_type = value.decode("latin-1").lower()
+                if content_type.startswith(EXCLUDED_CONTENT_TYPES) is True:
+                    return False
+        return True
+
+    def _encoded_headers(self, length: Union[int, None]) -> List[Tuple[bytes, bytes]]:
+        """
+            Build the headers of the compressed response.
+
+        Args:
+            length (Union[int, None]): The size of the compressed body, None when it is streamed.
+
+        Returns:
+            List[Tuple[bytes, bytes]]: The new headers.
+        """
+        headers: List[Tuple[bytes, bytes]] = []
+        vary: List[bytes] = []
+        for key, value in self.start_message.get("headers", []):
+            if key == b"content-length":
+                continue
+            if key == b"vary":
+                vary.append(value)
+                continue
+            headers.append((key, value))
+        if not any(b"accept-encoding" in i.lower() for i in vary):
+            vary.append(b"Accept-Encoding")
+        headers.append((b"vary", b", ".join(vary)))
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode("latin-1")))
+        return headers
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        """
+            Forward the messages of the application, compressing the body when it is worth it.
+        """
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            if self._can_compress(message.get("headers", []), message["status"]) is False:
+                self.passthrough = True
+                await self.downstream(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough is True:
+            await self.downstream(message)
+            return
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self.compressor is None:
+            if more_body is False and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.downstream(self.start_message)
+                await self.downstream(message)
+                return
+            self.compressor = _Compressor(
+                self.encoding,
+                self.middleware.gzip_level,
+                self.middleware.brotli_quality
+            )
+            if more_body is False:
+                compressed = self.compressor.finish(body)
+                self.start_message["headers"] = self._encoded_headers(
+                    len(compressed)
+                )
+                await self.downstream(self.start_message)
+                await self.downstream(
+                    {"type": "http.response.body", "body": compressed, "more_body": False}
+                )
+                return
+            self.start_message["headers"] = self._encoded_headers(None)
+            await self.downstream(self.start_message)
+        if more_body is True:
+            chunk = self.compressor.compress(body)
+        else:
+            chunk = self.compressor.finish(body)
+        await self.downstream(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
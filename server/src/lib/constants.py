@@ -88,12 +88,14 @@ JSON_ERROR: str = "error"
 JSON_RESP: str = "resp"
 JSON_LOGGED_IN: str = "logged in"
 JSON_UID: str = "user_uid"
+JSON_NEXT: str = "next"
 
 # Json header for the server response header
 JSON_HEADER_APP_NAME: str = "EpiTrello"
 JSON_HEADER_HOST: str = "0.0.0.0"
 JSON_HEADER_PORT: str = "5000"
 CONTENT_TYPE="JSON"
+CONTENT_TYPE_EVENT_STREAM: str = "text/event-stream"
 
 # Mail management
 SENDER_ADDRESS = _get_environement_variable(ENV, "SENDER_ADDRESS")
@@ -118,6 +120,7 @@ ALLOWED_METHODS: list[str] = [
     "DELETE", "HEAD",
     "OPTIONS"
 ]
+WEBSOCKET_METHOD: str = "WEBSOCKET"
 
 # Database management
 DB_HOST = _get_environement_variable(ENV, "DB_HOST")
@@ -147,6 +150,23 @@ SERVER_TIMEOUT_KEEP_ALIVE = _get_toml_variable(
     TOML_CONF, "Server_configuration", "timeout_keep_alive", 30
 )
 
+# |- Server configuration -> compression settings
+COMPRESSION_ENABLED = _get_toml_variable(
+    TOML_CONF, "Server_configuration.compression", "enabled", True
+)
+COMPRESSION_MINIMUM_SIZE = max(0, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.compression", "minimum_size", 1000
+)))
+COMPRESSION_GZIP_LEVEL = min(9, max(1, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.compression", "gzip_level", 6
+))))
+COMPRESSION_BROTLI = _get_toml_variable(
+    TOML_CONF, "Server_configuration.compression", "brotli", True
+)
+COMPRESSION_BROTLI_QUALITY = min(11, max(0, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.compression", "brotli_quality", 4
+))))
+
 # |- Server configuration -> Status codes
 SUCCESS = int(_get_toml_variable(
     TOML_CONF, "Server_configuration.status_codes", "success", 0
@@ -229,6 +249,67 @@ DATABASE_COLLATION = _get_toml_variable(
     TOML_CONF, "Server_configuration.database", "collation", "utf8mb4_unicode_ci"
 )
 
+# |- Server configuration -> token cache settings
+TOKEN_CACHE_MAX_SIZE = int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.token_cache", "max_size", 1024
+))
+TOKEN_CACHE_TTL = int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.token_cache", "ttl", 60
+))
+
+# |- Server configuration -> ordering settings
+POSITION_GAP = max(2, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.ordering", "position_gap", 1024
+)))
+
+# |- Server configuration -> pagination settings
+PAGINATION_MAX_LIMIT = max(1, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.pagination", "max_limit", 200
+)))
+PAGINATION_DEFAULT_LIMIT = min(PAGINATION_MAX_LIMIT, max(1, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.pagination", "default_limit", 50
+))))
+
+# |- Server configuration -> index advisor settings
+INDEX_ADVISOR_CHECK_ON_STARTUP = _get_toml_variable(
+    TOML_CONF, "Server_configuration.index_advisor", "check_on_startup", True
+)
+
+# |- Server configuration -> real-time events settings
+EVENTS_QUEUE_SIZE = max(1, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.events", "queue_size", 100
+)))
+EVENTS_PING_INTERVAL = max(1, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.events", "ping_interval", 30
+)))
+EVENTS_SSE_RETRY = max(0, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.events", "sse_retry", 3000
+)))
+
+# |- Server configuration -> json settings
+JSON_SERIALISER = str(_get_toml_variable(
+    TOML_CONF, "Server_configuration.json", "serialiser", "auto"
+))
+
+# |- Server configuration -> metrics settings
+METRICS_ENABLED = bool(_get_toml_variable(
+    TOML_CONF, "Server_configuration.metrics", "enabled", True
+))
+METRICS_ROUTES = bool(_get_toml_variable(
+    TOML_CONF, "Server_configuration.metrics", "routes", True
+))
+METRICS_EXPOSE = bool(_get_toml_variable(
+    TOML_CONF, "Server_configuration.metrics", "expose", False
+))
+
+# |- Server configuration -> logging settings
+LOG_MAX_LENGTH = max(0, int(_get_toml_variable(
+    TOML_CONF, "Server_configuration.logging", "max_length", 2000
+)))
+LOG_BACKGROUND_WRITES = bool(_get_toml_variable(
+    TOML_CONF, "Server_configuration.logging", "background_writes", True
+))
+
 # |- Tasks settings
 CLEAN_VERIFICATION = _get_toml_variable(
     TOML_CONF, "Tasks", "clean_verification", True
@@ -242,6 +323,15 @@ RENEW_OAUTH_TOKENS = _get_toml_variable(
 RENEW_OAUTH_TOKENS_INTERVAL = _get_toml_variable(
     TOML_CONF, "Tasks", "renew_oauth_tokens_interval", 300
 )
+COMPACT_POSITIONS = _get_toml_variable(
+    TOML_CONF, "Tasks", "compact_positions", True
+)
+COMPACT_POSITIONS_INTERVAL = _get_toml_variable(
+    TOML_CONF, "Tasks", "compact_positions_interval", 3600
+)
+COMPACT_POSITIONS_MIN_GAP = max(2, int(_get_toml_variable(
+    TOML_CONF, "Tasks", "compact_positions_min_gap", 8
+)))
 
 # For Verification value
 OAUTH_STATE_EXPIRATION = 600
@@ -263,9 +353,90 @@ TAB_LISTS_CARDS = "lists_cards"
 TAB_CARDS_ASSIGNEES = "cards_assignees"
 TAB_CARDS_LABEL = "cards_label"
 
+# The columns added (or made NOT NULL) by the migrations of db/migrations, the server refuses to start without them
+# (table -> [(column, must be NOT NULL, migration file)])
+REQUIRED_COLUMNS: dict[str, list[tuple[str, bool, str]]] = {
+    TAB_BOARDS: [("version", True, "migration_002_board_versions.sql")],
+    TAB_BOARDS_ACTIVITIES: [
+        ("created_at", True, "migration_003_activities_created_at.sql")
+    ]
+}
+
+# The queries the endpoints run the most, checked by the index advisor
+# (the where values are samples, only the plan matters)
+INDEX_ADVISOR_QUERIES: list[dict] = [
+    {"table": TAB_BOARDS_LISTS, "where": "board_id='1'", "order_by": "position"},
+    {"table": TAB_LISTS_CARDS, "where": "list_id='1'", "order_by": "position"},
+    {
+        "table": TAB_NOTIFICATIONS, "where": "user_id='1'",
+        "order_by": ["created_at", "id"], "descending": True, "limit": 51
+    },
+    {
+        "table": TAB_BOARDS_ACTIVITIES, "where": "board_id='1'",
+        "order_by": ["created_at", "id"], "descending": True, "limit": 51
+    },
+    {
+        "table": TAB_WORKSPACES_INVITATIONS, "where": "user_id='1'",
+        "order_by": "id", "descending": True, "limit": 51
+    },
+    {
+        "table": TAB_WORKSPACES_INVITATIONS,
+        "where": ["workspace_id='1'", "user_id='1'"]
+    },
+    {
+        "table": TAB_WORKSPACES_MEMBERS,
+        "where": ["workspace_id='1'", "user_id='1'"]
+    },
+    {"table": TAB_CARDS_ASSIGNEES, "where": ["card_id='1'", "user_id='1'"]},
+    {"table": TAB_CARDS_LABEL, "where": "card_id='1'"},
+    {"table": TAB_BOARDS, "where": "workspace_id='1'"},
+    {"table": TAB_CONNECTIONS, "where": "token='1'"},
+]
+
+# Real-time events (content of the messages and event names)
+EVENT_TYPE_KEY: str = "event"
+EVENT_TOPIC_KEY: str = "topic"
+EVENT_DATA_KEY: str = "data"
+EVENT_ID_KEY: str = "id"
+EVENT_RESYNC: str = "resync"
+EVENT_PING: str = "ping"
+EVENT_SUBSCRIBED: str = "subscribed"
+EVENT_LIST_CREATED: str = "list.created"
+EVENT_LIST_UPDATED: str = "list.updated"
+EVENT_LIST_MOVED: str = "list.moved"
+EVENT_LIST_DELETED: str = "list.deleted"
+EVENT_CARD_CREATED: str = "card.created"
+EVENT_CARD_UPDATED: str = "card.updated"
+EVENT_CARD_MOVED: str = "card.moved"
+EVENT_CARD_DELETED: str = "card.deleted"
+EVENT_LABEL_CREATED: str = "label.created"
+EVENT_LABEL_UPDATED: str = "label.updated"
+EVENT_LABEL_DELETED: str = "label.deleted"
+EVENT_ASSIGNEE_ADDED: str = "assignee.added"
+EVENT_ASSIGNEE_REMOVED: str = "assignee.removed"
+EVENT_ACTIVITY_CREATED: str = "activity.created"
+EVENT_ACTIVITY_DELETED: str = "activity.deleted"
+EVENT_ACTIVITIES_CLEARED: str = "activities.cleared"
+EVENT_NOTIFICATION_CREATED: str = "notification.created"
+EVENT_INVITATION_RECEIVED: str = "invitation.received"
+
+# The amount of list -> board links remembered to route the card events (a list never changes board)
+LIST_BOARD_CACHE_SIZE: int = 4096
+
+# Pre-fork mode (workers > 1)
+# The environment variable the supervisor passes the worker settings through
+WORKER_SETTINGS_ENV: str = "EPITRELLO_WORKER_SETTINGS"
+# The relay sharing the in-process messages between the workers (loopback only)
+EVENTS_RELAY_HOST: str = "127.0.0.1"
+RELAY_CHANNEL_BOARD_EVENTS: str = "board_events"
+RELAY_CHANNEL_NOTIFICATION_EVENTS: str = "notification_events"
+RELAY_CHANNEL_TOKENS: str = "tokens"
+
 # Incoming header variables
 REQUEST_TOKEN_KEY = "token"
 REQUEST_BEARER_KEY = "authorization"
+REQUEST_LAST_EVENT_ID_KEY = "last-event-id"
+REQUEST_IF_NONE_MATCH_KEY = "if-none-match"
 
 # Get user info banned columns (filtered out columns)
 USER_INFO_BANNED: list[str] = ["password"]
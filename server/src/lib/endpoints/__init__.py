@@ -16,6 +16,7 @@ from .card_management import CardManagement
 from .label_management import CardsLabelManagement
 from .notifications_management import Notifications
 from .oauth_authentication import OAuthAuthentication
+from .board_events import BoardEvents
 
 
 __all__ = [
@@ -32,5 +33,6 @@ __all__ = [
     "CardManagement",
     "CardsLabelManagement",
     "Notifications",
-    "OAuthAuthentication"
+    "OAuthAuthentication",
+    "BoardEvents"
 ]
@@ -5,7 +5,8 @@ The file that contains the class that handle any boards activities history
 from typing import Union, List, Dict, Any
 from datetime import datetime
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -24,7 +25,7 @@ class ActivitiesHistory:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -43,20 +44,31 @@ class ActivitiesHistory:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
-        # Get the activities data
-        activities: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        # Get the pagination parameters
+        pagination = self.runtime_data_initialised.boilerplate_incoming_initialised.get_pagination(request, 2)
+        if pagination is None:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
+        limit, after = pagination
+
+        # Get the activities data (newest first)
+        activities: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
             column="*",
-            where=f"board_id='{board_id}'",
+            where=("board_id", "=", board_id),
+            compact=True,
+            order_by=["created_at", "id"],
+            descending=True,
+            limit=self.runtime_data_initialised.boilerplate_incoming_initialised.page_query_limit(limit),
+            after=after
         )
 
         # Check if the activities were found
@@ -73,9 +85,9 @@ class ActivitiesHistory:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        for _, activity in enumerate(activities):
-            if activity["created_at"] is not None:
-                activity["created_at"] = activity["created_at"].isoformat()
+        activities, next_cursor = self.runtime_data_initialised.boilerplate_incoming_initialised.paginate(
+            activities, limit, ["created_at", "id"]
+        )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -83,6 +95,7 @@ class ActivitiesHistory:
             message=activities,
             resp="success",
         )
+        response_body[CONST.JSON_NEXT] = next_cursor
 
         # Send the response
         return HCI.success(
@@ -99,7 +112,7 @@ class ActivitiesHistory:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -108,10 +121,10 @@ class ActivitiesHistory:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the board data
-        board: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS,
             column="*",
-            where=f"id='{board_id}'",
+            where=("id", "=", board_id),
         )
 
         # Check if the boards was found
@@ -139,7 +152,7 @@ class ActivitiesHistory:
         columns.pop(0)
 
         # Insert the data to the activities history table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
             data=[request_body["message"], str(datetime.now().replace(microsecond=0)), board_id],
             column=columns
@@ -149,6 +162,15 @@ class ActivitiesHistory:
                 title=title
             )
 
+        # Tell the board subscribers about the new activity
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_ACTIVITY_CREATED,
+            table=CONST.TAB_BOARDS_ACTIVITIES,
+            where=("board_id", "=", board_id),
+            board_id=board_id,
+            order_by="id"
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -171,14 +193,14 @@ class ActivitiesHistory:
 
         # Token checking
         token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the activity data
-        activity: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        activity: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
             column="*",
-            where=[f"id='{activity_id}'", f"board_id='{board_id}'"],
+            where=[("id", "=", activity_id), ("board_id", "=", board_id)],
         )
 
         # Check if the activity was found
@@ -196,9 +218,16 @@ class ActivitiesHistory:
             )
 
         # Delete the activity
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
-            where=f"id='{activity_id}'"
+            where=("id", "=", activity_id)
+        )
+
+        # Tell the board subscribers about the deletion
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_ACTIVITY_DELETED,
+            {"id": activity_id},
+            board_id=board_id
         )
 
         # Set the response body
@@ -224,14 +253,14 @@ class ActivitiesHistory:
 
         # Token checking
         token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the activities data
-        activities: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        activities: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
             column="*",
-            where=f"board_id='{board_id}'",
+            where=("board_id", "=", board_id),
         )
 
         # Check if the activities was found
@@ -249,9 +278,16 @@ class ActivitiesHistory:
             )
 
         # Delete the activities
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_BOARDS_ACTIVITIES,
-            where=f"board_id='{board_id}'"
+            where=("board_id", "=", board_id)
+        )
+
+        # Tell the board subscribers about the deletion
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_ACTIVITIES_CLEARED,
+            None,
+            board_id=board_id
         )
 
         # Set the response body
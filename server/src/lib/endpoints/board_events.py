@@ -0,0 +1,112 @@
+"""
+The file that contains the class that streams the changes of a board to the connected clients
+"""
+
+import asyncio
+from typing import Union, List, Dict, Any
+from fastapi import WebSocket, WebSocketDisconnect, status
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
+from .. import constants as CONST
+from ..runtime_data import RuntimeData
+from ..http_codes import HCI
+from ..events_hub import EventsSubscription
+
+class BoardEvents:
+    """
+    The class that sends the board changes over a websocket
+    """
+    def __init__(self, runtime_data: RuntimeData, error: int = 84, success: int = 0, debug: bool = False) -> None:
+        """
+        Constructor
+        """
+        # -------------------------- Inherited values --------------------------
+        self.runtime_data_initialised: RuntimeData = runtime_data
+        self.error: int = error
+        self.success: int = success
+        self.debug: bool = debug
+        # ------------------------ The logging function ------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            FILE_DESCRIPTOR,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+
+    async def _wait_for_disconnect(self, websocket: WebSocket) -> None:
+        """
+        Read (and ignore) the client messages until the client leaves
+        """
+        try:
+            while True:
+                await websocket.receive_text()
+        except (WebSocketDisconnect, RuntimeError):
+            return
+
+    async def _send_event(self, websocket: WebSocket, event: Dict[str, Any]) -> None:
+        """
+        Send an event as a json text frame (serialised like the http bodies)
+        """
+        await websocket.send_text(HCI.json_text(event))
+
+    async def board_events(self, websocket: WebSocket, board_id: str) -> None:
+        """
+        Stream the changes made on a board (cards, lists, labels, assignees, activities)
+        """
+        title: str = "Board events"
+
+        # Token checking
+        token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(websocket)
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        # Check if the board exists
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_BOARDS,
+            column="id",
+            where=("id", "=", board_id),
+        )
+        if board == self.error or not board:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        # Listen to the board
+        await websocket.accept()
+        hub = self.runtime_data_initialised.board_events_hub
+        subscription: EventsSubscription = hub.subscribe(board_id)
+        receiver = asyncio.create_task(self._wait_for_disconnect(websocket))
+        getter: Union[asyncio.Task, None] = None
+        try:
+            await self._send_event(websocket, {
+                CONST.EVENT_TYPE_KEY: CONST.EVENT_SUBSCRIBED,
+                CONST.EVENT_TOPIC_KEY: str(board_id),
+                CONST.EVENT_DATA_KEY: None
+            })
+            while True:
+                if getter is None:
+                    getter = asyncio.create_task(subscription.get())
+                done, _ = await asyncio.wait(
+                    {getter, receiver},
+                    timeout=CONST.EVENTS_PING_INTERVAL,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if receiver in done:
+                    break
+                if getter in done:
+                    await self._send_event(websocket, getter.result())
+                    getter = None
+                    continue
+                await self._send_event(websocket, {
+                    CONST.EVENT_TYPE_KEY: CONST.EVENT_PING,
+                    CONST.EVENT_DATA_KEY: None
+                })
+        except (WebSocketDisconnect, RuntimeError) as e:
+            self.disp.log_debug("Board %s client left: %s", title, board_id, e)
+        finally:
+            hub.unsubscribe(subscription)
+            receiver.cancel()
+            if getter is not None:
+                getter.cancel()
@@ -4,7 +4,8 @@ The file that contains the class that handle boards management
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class BoardsManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -42,20 +43,20 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the boards data
-        boards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        boards: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS,
             column="*",
-            where=f"workspace_id='{workspace_id}'",
+            where=("workspace_id", "=", workspace_id),
         )
 
         # Check if the boards was found
@@ -96,20 +97,20 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the boards data
-        board: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS,
             column="*",
-            where=f"id='{board_id}'",
+            where=("id", "=", board_id),
         )
 
         # Check if the board was found
@@ -133,6 +134,177 @@ class BoardsManagement:
             resp="success",
         )
 
+        # Send the response (or a 304 if the client already has this version)
+        return self.runtime_data_initialised.boilerplate_responses_initialised.success_with_etag(
+            request=request,
+            content=response_body
+        )
+
+    async def get_board_version(self, request: Request, board_id: str) -> Response:
+        """
+        Get the version of a board (increased by every change made on its content)
+        """
+        title: str = "Get board version"
+
+        # Check The token sended in the request
+        token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
+            request
+        )
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
+            token
+        )
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
+        if token_valid is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
+                title=title
+            )
+
+        # Get the board version (primary key lookup)
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_BOARDS,
+            column="version",
+            where=("id", "=", board_id),
+        )
+
+        # Check if the board was found
+        if board == self.error or not board:
+            response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                title=title,
+                message="The board was not found.",
+                resp="not found",
+                error=True
+            )
+            return HCI.not_found(
+                content=response_body,
+                content_type=CONST.CONTENT_TYPE,
+                headers=self.runtime_data_initialised.json_header
+            )
+
+        # Set the response body
+        response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+            title=title,
+            message={"id": board_id, "version": board[0]["version"]},
+            resp="success",
+        )
+
+        # Send the response (or a 304 if the client already has this version)
+        return self.runtime_data_initialised.boilerplate_responses_initialised.success_with_etag(
+            request=request,
+            content=response_body,
+            etag=f'W/"board-{board_id}-{board[0]["version"]}"'
+        )
+
+    async def get_board_full(self, request: Request, board_id: str) -> Response:
+        """
+        Get a board with its lists, cards, labels and assignees in a single response
+        """
+        title: str = "Get full board"
+
+        # Check The token sended in the request
+        token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
+            request
+        )
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
+            token
+        )
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
+        if token_valid is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
+                title=title
+            )
+
+        # Get the boards data
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_BOARDS,
+            column="*",
+            where=("id", "=", board_id),
+        )
+
+        # Check if the board was found
+        if board == self.error or not board:
+            response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                title=title,
+                message="The board was not found.",
+                resp="not found",
+                error=True
+            )
+            return HCI.not_found(
+                content=response_body,
+                content_type=CONST.CONTENT_TYPE,
+                headers=self.runtime_data_initialised.json_header
+            )
+
+        # Get the lists of the board
+        lists: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+            table=CONST.TAB_BOARDS_LISTS,
+            column="*",
+            where=("board_id", "=", board_id),
+        )
+        if isinstance(lists, int):
+            lists = []
+        lists.sort(key=lambda board_list: board_list["position"])
+
+        # Get the cards of every list in one query
+        cards: Union[List[Dict[str, Any]], int] = []
+        if lists:
+            cards = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+                table=CONST.TAB_LISTS_CARDS,
+                column="*",
+                in_column="list_id",
+                values=[board_list["id"] for board_list in lists]
+            )
+            if isinstance(cards, int):
+                cards = []
+        cards.sort(key=lambda card: card["position"])
+
+        # Get the labels and assignees of every card in one query each
+        labels: Union[List[Dict[str, Any]], int] = []
+        assignees: Union[List[Dict[str, Any]], int] = []
+        if cards:
+            card_ids: List[Any] = [card["id"] for card in cards]
+            labels = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+                table=CONST.TAB_CARDS_LABEL,
+                column="*",
+                in_column="card_id",
+                values=card_ids
+            )
+            if isinstance(labels, int):
+                labels = []
+            assignees = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+                table=CONST.TAB_CARDS_ASSIGNEES,
+                column="*",
+                in_column="card_id",
+                values=card_ids
+            )
+            if isinstance(assignees, int):
+                assignees = []
+
+        # Nest the rows: board -> lists -> cards -> labels/assignees
+        cards_by_list: Dict[Any, List[Dict[str, Any]]] = {
+            board_list["id"]: [] for board_list in lists
+        }
+        labels_by_card: Dict[Any, List[Dict[str, Any]]] = {}
+        assignees_by_card: Dict[Any, List[Dict[str, Any]]] = {}
+        for label in labels:
+            labels_by_card.setdefault(label["card_id"], []).append(label)
+        for assignee in assignees:
+            assignees_by_card.setdefault(assignee["card_id"], []).append(assignee)
+        for card in cards:
+            card["labels"] = labels_by_card.get(card["id"], [])
+            card["assignees"] = assignees_by_card.get(card["id"], [])
+            cards_by_list.setdefault(card["list_id"], []).append(card)
+        for board_list in lists:
+            board_list["cards"] = cards_by_list.get(board_list["id"], [])
+        board_data: Dict[str, Any] = board[0]
+        board_data["lists"] = lists
+
+        # Set the response body
+        response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+            title=title,
+            message=board_data,
+            resp="success",
+        )
+
         # Send the response
         return HCI.success(
             content=response_body,
@@ -150,10 +322,10 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -161,7 +333,7 @@ class BoardsManagement:
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Check if every required information is in the request body
         if not request_body or not all(key in request_body for key in ("name", "background_color")):
@@ -170,7 +342,7 @@ class BoardsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
@@ -178,7 +350,7 @@ class BoardsManagement:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title,
@@ -200,10 +372,10 @@ class BoardsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                 title=title
             )
-        columns.pop(0)
+        columns = [i for i in columns[1:] if i != "version"]
 
         # Insert the data to the boards table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_BOARDS,
             data=[request_body["name"], request_body["background_color"], "0", workspace_id],
             column=columns
@@ -237,10 +409,10 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -248,7 +420,7 @@ class BoardsManagement:
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Check if every required information is in the request body
         if not request_body or not all(key in request_body for key in ("name", "background_color")):
@@ -257,7 +429,7 @@ class BoardsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
@@ -265,7 +437,7 @@ class BoardsManagement:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -280,11 +452,11 @@ class BoardsManagement:
             )
 
         # Update the data to the boards table
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_BOARDS,
             data=[request_body["name"] , request_body["background_color"]],
             columns=["name", "background_color"],
-            where=f"id='{board_id}'",
+            where=("id", "=", board_id),
             title=title,
             message="The board information has been updated."
         )
@@ -299,10 +471,10 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title,
@@ -311,10 +483,10 @@ class BoardsManagement:
 
         # Get the request body
         request_body = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Get the user id by the token
-        usr_id = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -322,7 +494,7 @@ class BoardsManagement:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -340,7 +512,7 @@ class BoardsManagement:
         if "name" in request_body:
             if request_body["name"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_BOARDS,
                 "id",
                 "name",
@@ -351,7 +523,7 @@ class BoardsManagement:
         if "background_color" in request_body:
             if request_body["background_color"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_BOARDS,
                 "id",
                 "background_color",
@@ -384,10 +556,10 @@ class BoardsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -395,10 +567,10 @@ class BoardsManagement:
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -406,7 +578,7 @@ class BoardsManagement:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -421,7 +593,8 @@ class BoardsManagement:
             )
 
         # Delete the board
-        status: int = self.runtime_data_initialised.boilerplate_non_http_initialised.delete_board(
+        status: int = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.runtime_data_initialised.boilerplate_non_http_initialised.delete_board,
             board_id=board_id
         )
         if status == self.error:
@@ -2,11 +2,14 @@
 The file that contains bonus endpoint (not interesting endpoints)
 """
 
+from typing import Union
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
+from ..prometheus_metrics import PROMETHEUS_CONTENT_TYPE
 
 
 class Bonus:
@@ -22,7 +25,7 @@ class Bonus:
         self.success: int = success
         self.error: int = error
         self.runtime_data_initialised: RuntimeData = runtime_data
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -40,3 +43,79 @@ class Bonus:
             content_type=CONST.CONTENT_TYPE,
             headers=self.runtime_data_initialised.json_header
         )
+
+    async def _check_stats_token(self, request: Request, title: str) -> Union[Response, None]:
+        """
+        Make sure the statistics are only sent to a logged in caller (returns the error response, None if the token is valid)
+        """
+        token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
+            request
+        )
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
+            token
+        )
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
+        if token_valid is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
+                title=title
+            )
+        return None
+
+    async def get_token_cache_stats(self, request: Request) -> Response:
+        """
+        Send the hit and miss counters of the token cache (used to size it)
+        """
+        denied: Union[Response, None] = await self._check_stats_token(
+            request, "get_token_cache_stats"
+        )
+        if denied is not None:
+            return denied
+        return HCI.success(
+            content=self.runtime_data_initialised.boilerplate_non_http_initialised.get_token_cache_stats(),
+            content_type=CONST.CONTENT_TYPE,
+            headers=self.runtime_data_initialised.json_header
+        )
+
+    async def get_metrics(self, request: Request) -> Response:
+        """
+        Send the timing counters of the server in the Prometheus text format (the scraper sends the token as a bearer)
+        """
+        denied: Union[Response, None] = await self._check_stats_token(
+            request, "get_metrics"
+        )
+        if denied is not None:
+            return denied
+        lines = self.runtime_data_initialised.database_link.render_sql_metrics()
+        if self.runtime_data_initialised.route_metrics is not None:
+            lines.extend(self.runtime_data_initialised.route_metrics.render())
+        return HCI.success(
+            content="\n".join(lines) + "\n",
+            content_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+    async def get_route_stats(self, request: Request) -> Response:
+        """
+        Send the latency quantiles and the dependency times of each route, the most time consuming first
+        """
+        denied: Union[Response, None] = await self._check_stats_token(
+            request, "get_route_stats"
+        )
+        if denied is not None:
+            return denied
+        if self.runtime_data_initialised.route_metrics is None:
+            body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                title="Route statistics",
+                message="The route metrics are disabled.",
+                resp="disabled",
+                error=True
+            )
+            return HCI.not_found(
+                content=body,
+                content_type=CONST.CONTENT_TYPE,
+                headers=self.runtime_data_initialised.json_header
+            )
+        return HCI.success(
+            content=self.runtime_data_initialised.route_metrics.get_stats(),
+            content_type=CONST.CONTENT_TYPE,
+            headers=self.runtime_data_initialised.json_header
+        )
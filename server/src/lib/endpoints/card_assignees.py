@@ -4,7 +4,8 @@ The file that contains the class that handle collaboration on a card
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class CardAssignees:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -40,14 +41,14 @@ class CardAssignees:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the card assignees
-        card_assignees: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_assignees: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_ASSIGNEES,
             column="*",
-            where=f"card_id='{card_id}'",
+            where=("card_id", "=", card_id),
         )
 
         # Check if the assignees was found
@@ -86,7 +87,7 @@ class CardAssignees:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -97,10 +98,10 @@ class CardAssignees:
         # Get the workspace member
         user_id = request_body.get("user_id")
         workspace_id = request_body.get("workspace_id")
-        member: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        member: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=[f"workspace_id='{workspace_id}'", f"user_id='{user_id}'"]
+            where=[("workspace_id", "=", workspace_id), ("user_id", "=", user_id)]
         )
 
         # Check if the workspace member was found
@@ -118,10 +119,10 @@ class CardAssignees:
             )
 
         # Get the card
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=f"id='{card_id}'",
+            where=("id", "=", card_id),
         )
 
         # Check if the card was found
@@ -138,7 +139,7 @@ class CardAssignees:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_CARDS_ASSIGNEES,
             data=[user_id, card_id],
             column=["user_id", "card_id"]
@@ -148,6 +149,13 @@ class CardAssignees:
                 title=title
             )
 
+        # Tell the board subscribers about the new assignee
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_ASSIGNEE_ADDED,
+            {"card_id": card_id, "user_id": user_id},
+            list_id=card[0]["list_id"]
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -170,14 +178,14 @@ class CardAssignees:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the card assignee
-        card_assignee: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_assignee: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_ASSIGNEES,
             column="*",
-            where=[f"user_id='{user_id}'", f"card_id='{card_id}'"]
+            where=[("user_id", "=", user_id), ("card_id", "=", card_id)]
         )
 
         # Check if the card assignee was found
@@ -194,9 +202,16 @@ class CardAssignees:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_CARDS_ASSIGNEES,
-            where=[f"user_id='{user_id}'", f"card_id='{card_id}'"]
+            where=[("user_id", "=", user_id), ("card_id", "=", card_id)]
+        )
+
+        # Tell the board subscribers about the removal
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_ASSIGNEE_REMOVED,
+            {"card_id": card_id, "user_id": user_id},
+            card_id=card_id
         )
 
         # Set the response body
@@ -5,7 +5,8 @@ The file that contains the class that handle card management
 from typing import Union, List, Dict, Any
 from datetime import datetime
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -24,7 +25,7 @@ class CardManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -43,20 +44,20 @@ class CardManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the card data
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=[f"id='{card_id}'", f"list_id='{list_id}'"],
+            where=[("id", "=", card_id), ("list_id", "=", list_id)],
         )
 
         # Check if the card was found
@@ -73,9 +74,6 @@ class CardManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        if card[0]["date_end"] is not None:
-            card[0]["date_end"] = card[0]["date_end"].isoformat()
-
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -83,11 +81,10 @@ class CardManagement:
             resp="success",
         )
 
-        # Send the response
-        return HCI.success(
-            content=response_body,
-            content_type=CONST.CONTENT_TYPE,
-            headers=self.runtime_data_initialised.json_header
+        # Send the response (or a 304 if the client already has this version)
+        return self.runtime_data_initialised.boilerplate_responses_initialised.success_with_etag(
+            request=request,
+            content=response_body
         )
 
     async def get_list_cards(self, request: Request, list_id: str) -> Response:
@@ -100,20 +97,20 @@ class CardManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the cards data
-        cards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        cards: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=f"list_id='{list_id}'",
+            where=("list_id", "=", list_id),
         )
 
         # Check if the cards was found
@@ -130,10 +127,6 @@ class CardManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        for _, card in enumerate(cards):
-            if card["date_end"] is not None:
-                card["date_end"] = card["date_end"].isoformat()
-
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -141,11 +134,10 @@ class CardManagement:
             resp="success",
         )
 
-        # Send the response
-        return HCI.success(
-            content=response_body,
-            content_type=CONST.CONTENT_TYPE,
-            headers=self.runtime_data_initialised.json_header
+        # Send the response (or a 304 if the client already has this version)
+        return self.runtime_data_initialised.boilerplate_responses_initialised.success_with_etag(
+            request=request,
+            content=response_body
         )
 
     async def create_card(self, request: Request, list_id: str) -> Response:
@@ -156,7 +148,7 @@ class CardManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -176,10 +168,10 @@ class CardManagement:
             date_end = None
 
         # Get the list number from the board
-        searched_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        searched_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"id='{list_id}'",
+            where=("id", "=", list_id),
         )
 
         # Check if the list was found
@@ -206,36 +198,61 @@ class CardManagement:
             )
         columns.pop(0)
 
-        cards_nb: str = str(searched_list[0]["card_nb"] + 1)
-
-        # Insert the data to the boards table
-        if date_end is not None:
-            status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        # Insert the card and update the card count in a single transaction
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            # Place the card after the last card of the list
+            position_key: int = await tx.get_next_position_key(
                 table=CONST.TAB_LISTS_CARDS,
-                data=[request_body["name"], request_body["description"], date_end.isoformat(), list_id, cards_nb],
-                column=columns
+                column="position",
+                where=("list_id", "=", list_id),
+                gap=CONST.POSITION_GAP
             )
+            if position_key < 0:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
+                    title=title
+                )
+
+            # Insert the data to the cards table
+            if date_end is not None:
+                status: int = await tx.insert_data_into_table(
+                    table=CONST.TAB_LISTS_CARDS,
+                    data=[request_body["name"], request_body["description"], date_end.isoformat(), list_id, str(position_key)],
+                    column=columns
+                )
+            else:
+                columns.pop(2)
+                status: int = await tx.insert_data_into_table(
+                    table=CONST.TAB_LISTS_CARDS,
+                    data=[request_body["name"], request_body["description"], list_id, str(position_key)],
+                    column=columns
+                )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                     title=title
                 )
-        else:
-            columns.pop(2)
-            status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
-                table=CONST.TAB_LISTS_CARDS,
-                data=[request_body["name"], request_body["description"], list_id, cards_nb],
-                column=columns
+
+            # Increment the card count in the list
+            status: int = await tx.shift_column_in_table(
+                table=CONST.TAB_BOARDS_LISTS,
+                column="card_nb",
+                offset=1,
+                where=("id", "=", list_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                     title=title
                 )
+        if tx.is_committed() is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
+                title=title
+            )
 
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
-            table=CONST.TAB_BOARDS_LISTS,
-            data=[cards_nb],
-            column=["card_nb"],
-            where=f"id={list_id}"
+        # Tell the board subscribers about the new card
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_CARD_CREATED,
+            table=CONST.TAB_LISTS_CARDS,
+            where=[("list_id", "=", list_id), ("position", "=", position_key)],
+            board_id=searched_list[0]["board_id"]
         )
 
         # Set the response body
@@ -260,7 +277,7 @@ class CardManagement:
 
         # Token checking
         token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -269,10 +286,10 @@ class CardManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the card data
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=[f"id='{card_id}'", f"list_id='{list_id}'"],
+            where=[("id", "=", card_id), ("list_id", "=", list_id)],
         )
 
         # Check if the card was found
@@ -290,15 +307,26 @@ class CardManagement:
             )
 
         # Update the workspace data
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        response: Response = await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_LISTS_CARDS,
             data=[request_body["name"], request_body["description"]],
             columns=["name", "description"],
-            where=f"id='{card_id}'",
+            where=("id", "=", card_id),
             title=title,
             message="The card information has been updated."
         )
 
+        # Tell the board subscribers about the change
+        if response.status_code == 200:
+            await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+                CONST.EVENT_CARD_UPDATED,
+                table=CONST.TAB_LISTS_CARDS,
+                where=("id", "=", card_id),
+                list_id=list_id
+            )
+
+        return response
+
     async def update_card_position(self, request: Request, list_id: str, card_id: str) -> Response:
         """
         Update the position of a card and eventually update the list where it is
@@ -307,7 +335,7 @@ class CardManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -318,10 +346,10 @@ class CardManagement:
         new_list_id: str = str(request_body["new_list_id"])
 
         # Get the new list data
-        new_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        new_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"id='{new_list_id}'"
+            where=("id", "=", new_list_id)
         )
 
         # Check if the list was found
@@ -339,10 +367,10 @@ class CardManagement:
             )
 
         # Get the card data
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=[f"id='{card_id}'", f"list_id='{list_id}'"]
+            where=[("id", "=", card_id), ("list_id", "=", list_id)]
         )
 
         # Check if the card was found
@@ -392,134 +420,74 @@ class CardManagement:
                     headers=self.runtime_data_initialised.json_header
                 )
 
-        # If no position change, return success
-        if (current_card_position == new_position and list_id == new_list_id):
-            # Set the response body
-            response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
-                title=title,
-                message="The list position remains the same.",
-                resp="success"
-            )
-
-            # Send the response
-            return HCI.success(
-                content=response_body,
-                content_type=CONST.CONTENT_TYPE,
-                headers=self.runtime_data_initialised.json_header
-            )
-
-        # Get the cards list of the new list
-        list_cards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_LISTS_CARDS,
-            column="*",
-            where=f"list_id='{new_list_id}'"
-        )
-
-        if (list_id != new_list_id):
-            self.runtime_data_initialised.database_link.update_data_in_table(
+        # Find the key, move the card and update the card counts in a single transaction
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            # Find the key placing the card at the requested position
+            position_key: int = await tx.get_position_key(
                 table=CONST.TAB_LISTS_CARDS,
-                data=[new_list_id],
-                column=["list_id"],
-                where=f"id='{card_id}'"
-            )
-
-            old_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-                table=CONST.TAB_BOARDS_LISTS,
-                column="*",
-                where=f"id='{list_id}'"
-            )
+                column="position",
+                index=new_position,
+                where=("list_id", "=", new_list_id),
+                row_id=card_id,
+                gap=CONST.POSITION_GAP
+            )
+            if position_key < 0:
+                tx.mark_failed()
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
 
-            self.runtime_data_initialised.database_link.update_data_in_table(
-                table=CONST.TAB_BOARDS_LISTS,
-                data=[str(old_list[0]["card_nb"] - 1)],
-                column=["card_nb"],
-                where=f"id='{list_id}'"
-            )
+            # If no position change, return success
+            if (position_key == current_card_position and list_id == new_list_id):
+                # Set the response body
+                response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                    title=title,
+                    message="The list position remains the same.",
+                    resp="success"
+                )
 
-            self.runtime_data_initialised.database_link.update_data_in_table(
-                table=CONST.TAB_BOARDS_LISTS,
-                data=[str(new_list[0]["card_nb"] + 1)],
-                column=["card_nb"],
-                where=f"id='{new_list_id}'"
-            )
+                # Send the response
+                return HCI.success(
+                    content=response_body,
+                    content_type=CONST.CONTENT_TYPE,
+                    headers=self.runtime_data_initialised.json_header
+                )
 
-            # Update the cards position of the old list
-            old_list_cards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+            # Move the card (the other cards keep their keys)
+            status: int = await tx.update_data_in_table(
                 table=CONST.TAB_LISTS_CARDS,
-                column="*",
-                where=f"list_id='{list_id}'"
+                data=[new_list_id, str(position_key)],
+                column=["list_id", "position"],
+                where=("id", "=", card_id)
             )
+            if status == self.error:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
 
-            if isinstance(old_list_cards, int):
-                # Decrement the card count in the list
-                status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+            if (list_id != new_list_id):
+                # Update the card count of both lists
+                status: int = await tx.shift_column_in_table(
                     table=CONST.TAB_BOARDS_LISTS,
-                    data=["0"],
-                    column=["card_nb"],
-                    where=f"id='{list_id}'"
+                    column="card_nb",
+                    offset=-1,
+                    where=[("id", "=", list_id), ("card_nb", ">", 0)]
                 )
                 if status == self.error:
                     return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
-            else:
-                for _, list_card in enumerate(old_list_cards):
-                    if list_card["position"] >= current_card_position:
-                        self.runtime_data_initialised.database_link.update_data_in_table(
-                            table=CONST.TAB_LISTS_CARDS,
-                            data=[str(list_card["position"] - 1)],
-                            column=["position"],
-                            where=f"id={list_card['id']}"
-                        )
-
-            # Get the cards list of the new list
-            list_cards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-                table=CONST.TAB_LISTS_CARDS,
-                column="*",
-                where=f"list_id='{new_list_id}'"
-            )
-
-            # Update the cards position of the new list
-            for _, list_card in enumerate(list_cards):
-                if list_card["id"] == int(card_id):
-                    self.runtime_data_initialised.database_link.update_data_in_table(
-                        table=CONST.TAB_LISTS_CARDS,
-                        data=[str(new_position)],
-                        column=["position"],
-                        where=f"id='{card_id}'"
-                    )
-                else:
-                    if list_card["position"] >= new_position:
-                        self.runtime_data_initialised.database_link.update_data_in_table(
-                            table=CONST.TAB_LISTS_CARDS,
-                            data=[str(list_card["position"] + 1)],
-                            column=["position"],
-                            where=f"id={list_card['id']}"
-                        )
-        else:
-            for _, list_card in enumerate(list_cards):
-                if list_card["id"] == int(card_id):
-                    self.runtime_data_initialised.database_link.update_data_in_table(
-                        table=CONST.TAB_LISTS_CARDS,
-                        data=[str(new_position)],
-                        column=["position"],
-                        where=f"id='{card_id}'"
-                    )
-                else:
-                    if new_position > current_card_position:
-                        if list_card["position"] >= current_card_position and list_card["position"] <= new_position:
-                            self.runtime_data_initialised.database_link.update_data_in_table(
-                                table=CONST.TAB_LISTS_CARDS,
-                                data=[str(list_card["position"] - 1)],
-                                column=["position"],
-                                where=f"id={list_card['id']}"
-                            )
-                    elif new_position < current_card_position:
-                        if list_card["position"] >= new_position and list_card["position"] <= current_card_position:
-                            self.runtime_data_initialised.database_link.update_data_in_table(
-                                table=CONST.TAB_LISTS_CARDS,
-                                data=[str(list_card["position"] + 1)],
-                                column=["position"],
-                                where=f"id={list_card['id']}"
-                            )
+                status: int = await tx.shift_column_in_table(
+                    table=CONST.TAB_BOARDS_LISTS,
+                    column="card_nb",
+                    offset=1,
+                    where=("id", "=", new_list_id)
+                )
+                if status == self.error:
+                    return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+        if tx.is_committed() is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+
+        # Tell the board subscribers about the move
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_CARD_MOVED,
+            {"id": card_id, "from_list_id": list_id, "list_id": new_list_id, "position": position_key},
+            board_id=new_list[0]["board_id"]
+        )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -543,17 +511,17 @@ class CardManagement:
 
         # Token checking
         token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
 
         # Get the card data
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=[f"id='{card_id}'", f"list_id='{list_id}'"],
+            where=[("id", "=", card_id), ("list_id", "=", list_id)],
         )
 
         # Check if the card was found
@@ -574,7 +542,7 @@ class CardManagement:
         if "name" in request_body:
             if request_body["name"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_LISTS_CARDS,
                 "id",
                 "name",
@@ -583,7 +551,7 @@ class CardManagement:
             ) == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         if "description" in request_body:
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_LISTS_CARDS,
                 "id",
                 "description",
@@ -597,7 +565,7 @@ class CardManagement:
                 try:
                     request_body["date_end"] = datetime.strptime(date_end, "%Y-%m-%d")
                     request_body["date_end"] = request_body["date_end"].isoformat()
-                    if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+                    if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                         CONST.TAB_LISTS_CARDS,
                         "id",
                         "date_end",
@@ -614,6 +582,14 @@ class CardManagement:
                         title=title,
                     )
 
+        # Tell the board subscribers about the change
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_CARD_UPDATED,
+            table=CONST.TAB_LISTS_CARDS,
+            where=("id", "=", card_id),
+            list_id=list_id
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -636,14 +612,14 @@ class CardManagement:
 
         # Token checking
         token: Union[str, None] = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the card data
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=[f"id='{card_id}'", f"list_id='{list_id}'"],
+            where=[("id", "=", card_id), ("list_id", "=", list_id)],
         )
 
         # Check if the card was found
@@ -660,16 +636,11 @@ class CardManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        current_position: int = card[0]["position"]
-
-        # Delete the card
-        self.runtime_data_initialised.boilerplate_non_http_initialised.delete_card(card_id=int(card_id))
-
         # Get the list number from the board
-        searched_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        searched_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"id='{list_id}'",
+            where=("id", "=", list_id),
         )
 
         # Check if the list was found
@@ -686,43 +657,47 @@ class CardManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        list_cards: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_LISTS_CARDS,
-            column="*",
-            where=f"list_id='{list_id}'"
-        )
-
-        if isinstance(list_cards, int):
-            # Decrement the card count in the list
-            status: int = self.runtime_data_initialised.database_link.update_data_in_table(
-                table=CONST.TAB_BOARDS_LISTS,
-                data=["0"],
-                column=["card_nb"],
-                where=f"id='{list_id}'"
+        # Delete the card, decrement the card count of the list and bump the board version in a single transaction
+        board_id: Any = searched_list[0]["board_id"]
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            status: int = await tx.remove_data_from_table(
+                table=CONST.TAB_CARDS_ASSIGNEES,
+                where=("card_id", "=", card_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
-        else:
-            # Decrement the position of every cards after the deleted card
-            for _, list_card in enumerate(list_cards):
-                if list_card["position"] >= current_position:
-                    self.runtime_data_initialised.database_link.update_data_in_table(
-                        table=CONST.TAB_LISTS_CARDS,
-                        data=[str(list_card["position"] - 1)],
-                        column=["position"],
-                        where=f"id={list_card['id']}"
-                    )
-
-            # Decrement the card count in the list
-            cards_nb: str = str(searched_list[0]["card_nb"] - 1)
-            status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+            status: int = await tx.remove_data_from_table(
+                table=CONST.TAB_LISTS_CARDS,
+                where=("id", "=", card_id)
+            )
+            if status == self.error:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+            status: int = await tx.shift_column_in_table(
                 table=CONST.TAB_BOARDS_LISTS,
-                data=[cards_nb],
-                column=["card_nb"],
-                where=f"id='{list_id}'"
+                column="card_nb",
+                offset=-1,
+                where=[("id", "=", list_id), ("card_nb", ">", 0)]
+            )
+            if status == self.error:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+            status: int = await tx.shift_column_in_table(
+                table=CONST.TAB_BOARDS,
+                column="version",
+                offset=1,
+                where=("id", "=", board_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+        if tx.is_committed() is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+
+        # Tell the board subscribers about the deletion (the version was bumped with it)
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_CARD_DELETED,
+            {"id": card_id, "list_id": list_id},
+            board_id=board_id,
+            bump_version=False
+        )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -4,7 +4,8 @@ The file that contains the class that handle cards label
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class CardsLabelManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -40,14 +41,14 @@ class CardsLabelManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the card labels
-        card_labels: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_labels: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_LABEL,
             column="*",
-            where=f"card_id='{card_id}'",
+            where=("card_id", "=", card_id),
         )
 
         # Check if the labels was found
@@ -86,7 +87,7 @@ class CardsLabelManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -95,10 +96,10 @@ class CardsLabelManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the card
-        card: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_LISTS_CARDS,
             column="*",
-            where=f"id='{card_id}'",
+            where=("id", "=", card_id),
         )
 
         # Check if the card was found
@@ -119,7 +120,7 @@ class CardsLabelManagement:
         # card_label: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
         #     table=CONST.TAB_CARDS_LABEL,
         #     column="*",
-        #     where=f"card_id='{card_id}'",
+        #     where=("card_id", "=", card_id),
         # )
 
         # Check if the card was found
@@ -146,7 +147,7 @@ class CardsLabelManagement:
             )
         columns.pop(0)
 
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_CARDS_LABEL,
             data=[request_body["title"], request_body["color"], card_id],
             column=columns
@@ -156,6 +157,15 @@ class CardsLabelManagement:
                 title=title
             )
 
+        # Tell the board subscribers about the new label
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_LABEL_CREATED,
+            table=CONST.TAB_CARDS_LABEL,
+            where=("card_id", "=", card_id),
+            list_id=card[0]["list_id"],
+            order_by="id"
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -178,7 +188,7 @@ class CardsLabelManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -187,10 +197,10 @@ class CardsLabelManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the card label
-        card_label: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_label: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_LABEL,
             column="*",
-            where=[f"id='{label_id}'", f"card_id='{card_id}'"],
+            where=[("id", "=", label_id), ("card_id", "=", card_id)],
         )
 
         # Check if the card label was found
@@ -207,15 +217,26 @@ class CardsLabelManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        response: Response = await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_CARDS_LABEL,
             data=[request_body["title"], request_body["color"]],
             columns=["title", "color"],
-            where=f"id='{label_id}'",
+            where=("id", "=", label_id),
             title=title,
             message="The card label information has been updated."
         )
 
+        # Tell the board subscribers about the change
+        if response.status_code == 200:
+            await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+                CONST.EVENT_LABEL_UPDATED,
+                table=CONST.TAB_CARDS_LABEL,
+                where=("id", "=", label_id),
+                card_id=card_id
+            )
+
+        return response
+
     async def patch_label(self, request: Request, card_id: str, label_id: str) -> Response:
         """
         Modify a label
@@ -224,17 +245,17 @@ class CardsLabelManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
 
         # Get the card label
-        card_label: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_label: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_LABEL,
             column="*",
-            where=[f"id='{label_id}'", f"card_id='{card_id}'"],
+            where=[("id", "=", label_id), ("card_id", "=", card_id)],
         )
 
         # Check if the card label was found
@@ -255,7 +276,7 @@ class CardsLabelManagement:
         if "title" in request_body:
             if request_body["title"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_CARDS_LABEL,
                 "id",
                 "title",
@@ -266,7 +287,7 @@ class CardsLabelManagement:
         if "color" in request_body:
             if request_body["color"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_CARDS_LABEL,
                 "id",
                 "color",
@@ -275,6 +296,14 @@ class CardsLabelManagement:
             ) == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
 
+        # Tell the board subscribers about the change
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_LABEL_UPDATED,
+            table=CONST.TAB_CARDS_LABEL,
+            where=("id", "=", label_id),
+            card_id=card_id
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -297,14 +326,14 @@ class CardsLabelManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the card label
-        card_label: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        card_label: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_CARDS_LABEL,
             column="*",
-            where=[f"id='{label_id}'", f"card_id='{card_id}'"],
+            where=[("id", "=", label_id), ("card_id", "=", card_id)],
         )
 
         # Check if the card label was found
@@ -322,9 +351,16 @@ class CardsLabelManagement:
             )
 
         # Delete the card label
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_CARDS_LABEL,
-            where=f"id='{label_id}'"
+            where=("id", "=", label_id)
+        )
+
+        # Tell the board subscribers about the deletion
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_LABEL_DELETED,
+            {"id": label_id, "card_id": card_id},
+            card_id=card_id
         )
 
         # Set the response body
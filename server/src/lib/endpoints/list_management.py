@@ -4,7 +4,8 @@ The file that contains the class that handle list management
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class ListsManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -42,20 +43,20 @@ class ListsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the lists data
-        lists: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        lists: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"board_id='{board_id}'",
+            where=("board_id", "=", board_id),
         )
 
         # Check if the lists was found
@@ -96,20 +97,20 @@ class ListsManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the lists data
-        single_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        single_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=[f"id='{list_id}'", f"board_id='{board_id}'"],
+            where=[("id", "=", list_id), ("board_id", "=", board_id)],
         )
 
         # Check if the lists was found
@@ -148,7 +149,7 @@ class ListsManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -157,10 +158,10 @@ class ListsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the list number from the board
-        board: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        board: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS,
             column="*",
-            where=f"id='{board_id}'",
+            where=("id", "=", board_id),
         )
 
         # Check if the boards was found
@@ -188,10 +189,23 @@ class ListsManagement:
         columns.pop(0)
 
         lists_nb: str = str(board[0]["list_nb"] + 1)
+
+        # Place the list after the last list of the board
+        position_key: int = await self.runtime_data_initialised.database_link.a_get_next_position_key(
+            table=CONST.TAB_BOARDS_LISTS,
+            column="position",
+            where=("board_id", "=", board_id),
+            gap=CONST.POSITION_GAP
+        )
+        if position_key < 0:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
+                title=title
+            )
+
         # Insert the data to the boards table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_BOARDS_LISTS,
-            data=[request_body["name"], board_id, lists_nb, "0"],
+            data=[request_body["name"], board_id, str(position_key), "0"],
             column=columns
         )
         if status == self.error:
@@ -199,11 +213,19 @@ class ListsManagement:
                 title=title
             )
 
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=CONST.TAB_BOARDS,
             data=[lists_nb],
             column=["list_nb"],
-            where=f"id={board_id}"
+            where=("id", "=", board_id)
+        )
+
+        # Tell the board subscribers about the new list
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_LIST_CREATED,
+            table=CONST.TAB_BOARDS_LISTS,
+            where=[("board_id", "=", board_id), ("position", "=", position_key)],
+            board_id=board_id
         )
 
         # Set the response body
@@ -228,7 +250,7 @@ class ListsManagement:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -237,15 +259,23 @@ class ListsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Update the list name in the database
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=CONST.TAB_BOARDS_LISTS,
             data=[request_body["name"]],
             column=["name"],
-            where=f"id='{list_id}'"
+            where=("id", "=", list_id)
         )
         if status == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
 
+        # Tell the board subscribers about the change
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_row(
+            CONST.EVENT_LIST_UPDATED,
+            table=CONST.TAB_BOARDS_LISTS,
+            where=("id", "=", list_id),
+            list_id=list_id
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -262,13 +292,13 @@ class ListsManagement:
 
     async def update_list_position(self, request: Request, list_id: str) -> Response:
         """
-        Update the position of a list and reorganize the affected lists
+        Update the position of a list (only the moved list is rewritten)
         """
         title: str = "Update list position"
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -277,10 +307,10 @@ class ListsManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the current list data
-        current_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        current_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"id='{list_id}'"
+            where=("id", "=", list_id)
         )
 
         # Check if the list was found
@@ -302,10 +332,10 @@ class ListsManagement:
         new_position: int = int(request_body["position"])
         board_id: int = current_list["board_id"]
 
-        board_data: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        board_data: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS,
             column="*",
-            where=f"id='{board_id}'"
+            where=("id", "=", board_id)
         )
 
         if (new_position <= 0 or new_position > board_data[0]["list_nb"]):
@@ -322,54 +352,56 @@ class ListsManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        # If no position change, return success
-        if current_position == new_position:
-            # Set the response body
-            response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
-                title=title,
-                message="The list position remains the same.",
-                resp="success"
+        # Find the key and move the list in a single transaction
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            # Find the key placing the list at the requested position
+            position_key: int = await tx.get_position_key(
+                table=CONST.TAB_BOARDS_LISTS,
+                column="position",
+                index=new_position,
+                where=("board_id", "=", board_id),
+                row_id=list_id,
+                gap=CONST.POSITION_GAP
             )
+            if position_key < 0:
+                tx.mark_failed()
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
 
-            # Send the response
-            return HCI.success(
-                content=response_body,
-                content_type=CONST.CONTENT_TYPE,
-                headers=self.runtime_data_initialised.json_header
+            # If no position change, return success
+            if position_key == current_position:
+                # Set the response body
+                response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
+                    title=title,
+                    message="The list position remains the same.",
+                    resp="success"
+                )
+
+                # Send the response
+                return HCI.success(
+                    content=response_body,
+                    content_type=CONST.CONTENT_TYPE,
+                    headers=self.runtime_data_initialised.json_header
+                )
+
+            # Move the list (the other lists keep their keys)
+            status: int = await tx.update_data_in_table(
+                table=CONST.TAB_BOARDS_LISTS,
+                data=[str(position_key)],
+                column=["position"],
+                where=("id", "=", list_id)
             )
+            if status == self.error:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+        if tx.is_committed() is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
 
-        board_lists: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_BOARDS_LISTS,
-            column="*",
-            where=f"board_id='{board_id}'"
+        # Tell the board subscribers about the move
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_LIST_MOVED,
+            {"id": list_id, "position": position_key},
+            board_id=board_id
         )
 
-        for _, board_list in enumerate(board_lists):
-            if board_list["id"] == int(list_id):
-                self.runtime_data_initialised.database_link.update_data_in_table(
-                    table=CONST.TAB_BOARDS_LISTS,
-                    data=[str(new_position)],
-                    column=["position"],
-                    where=f"id='{list_id}'"
-                )
-            else:
-                if new_position > current_position:
-                    if board_list["position"] >= current_position and board_list["position"] <= new_position:
-                        self.runtime_data_initialised.database_link.update_data_in_table(
-                            table=CONST.TAB_BOARDS_LISTS,
-                            data=[str(board_list["position"] - 1)],
-                            column=["position"],
-                            where=f"id={board_list['id']}"
-                        )
-                elif new_position < current_position:
-                    if board_list["position"] >= new_position and board_list["position"] <= current_position:
-                        self.runtime_data_initialised.database_link.update_data_in_table(
-                            table=CONST.TAB_BOARDS_LISTS,
-                            data=[str(board_list["position"] + 1)],
-                            column=["position"],
-                            where=f"id={board_list['id']}"
-                        )
-
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -386,20 +418,20 @@ class ListsManagement:
 
     async def delete_list(self, request: Request, list_id: str) -> Response:
         """
-        Delete a list and adjust the positions and list count
+        Delete a list and adjust the list count
         """
         title: str = "Delete list"
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the current list data
-        current_list: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        current_list: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_BOARDS_LISTS,
             column="*",
-            where=f"id='{list_id}'"
+            where=("id", "=", list_id)
         )
 
         # Check if the list was found
@@ -417,53 +449,43 @@ class ListsManagement:
             )
 
         current_list: Dict[str, Any] = current_list[0]
-        current_position: int = current_list["position"]
         board_id: int = current_list["board_id"]
 
-        # Delete the list
-        status: int = self.runtime_data_initialised.database_link.remove_data_from_table(
-            table=CONST.TAB_BOARDS_LISTS,
-            where=f"id='{list_id}'"
-        )
-        if status == self.error:
-            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
-
-        board_lists: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-            table=CONST.TAB_BOARDS_LISTS,
-            column="*",
-            where=f"board_id='{board_id}'"
-        )
-
-        if isinstance(board_lists, int):
-            # Decrement the list count in the board
-            status: int = self.runtime_data_initialised.database_link.update_data_in_table(
-                table=CONST.TAB_BOARDS,
-                data=["0"],
-                column=["list_nb"],
-                where=f"id='{board_id}'"
+        # Delete the list and update the list count in a single transaction
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            status: int = await tx.remove_data_from_table(
+                table=CONST.TAB_BOARDS_LISTS,
+                where=("id", "=", list_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
-        else:
-            # Decrement the position of every lists after the deleted list
-            for _, board_list in enumerate(board_lists):
-                if board_list["position"] >= current_position:
-                    self.runtime_data_initialised.database_link.update_data_in_table(
-                        table=CONST.TAB_BOARDS_LISTS,
-                        data=[str(board_list["position"] - 1)],
-                        column=["position"],
-                        where=f"id={board_list['id']}"
-                    )
-
-            # Decrement the list count in the board
-            status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+
+            list_nb: int = await tx.get_table_size(
+                table=CONST.TAB_BOARDS_LISTS,
+                column="id",
+                where=("board_id", "=", board_id)
+            )
+            if list_nb < 0:
+                tx.mark_failed()
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+
+            status: int = await tx.update_data_in_table(
                 table=CONST.TAB_BOARDS,
-                data=[str(len(board_lists))],
+                data=[str(list_nb)],
                 column=["list_nb"],
-                where=f"id='{board_id}'"
+                where=("id", "=", board_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+        if tx.is_committed() is False:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title=title)
+
+        # Tell the board subscribers about the deletion
+        await self.runtime_data_initialised.boilerplate_non_http_initialised.publish_board_event(
+            CONST.EVENT_LIST_DELETED,
+            {"id": list_id},
+            board_id=board_id
+        )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
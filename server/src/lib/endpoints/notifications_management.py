@@ -2,13 +2,17 @@
 The file that contains the class that handle users notifications
 """
 
-from typing import Union, List, Dict, Any
+import asyncio
+from typing import Union, List, Dict, Any, AsyncIterator
 from datetime import datetime
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from fastapi.responses import StreamingResponse
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
+from ..events_hub import EventsSubscription
 
 class Notifications:
     """
@@ -24,7 +28,7 @@ class Notifications:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -43,29 +47,39 @@ class Notifications:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
 
-        # Get the notifications data
-        notifications: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        # Get the pagination parameters
+        pagination = self.runtime_data_initialised.boilerplate_incoming_initialised.get_pagination(request, 2)
+        if pagination is None:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
+        limit, after = pagination
+
+        # Get the notifications data (newest first)
+        notifications: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
             column="*",
-            where=f"user_id='{usr_id}'",
+            where=("user_id", "=", usr_id),
+            order_by=["created_at", "id"],
+            descending=True,
+            limit=self.runtime_data_initialised.boilerplate_incoming_initialised.page_query_limit(limit),
+            after=after
         )
 
         # Check if the notifications were found
@@ -82,9 +96,9 @@ class Notifications:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        for _, notification in enumerate(notifications):
-            if notification["created_at"] is not None:
-                notification["created_at"] = notification["created_at"].isoformat()
+        notifications, next_cursor = self.runtime_data_initialised.boilerplate_incoming_initialised.paginate(
+            notifications, limit, ["created_at", "id"]
+        )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -92,6 +106,7 @@ class Notifications:
             message=notifications,
             resp="success",
         )
+        response_body[CONST.JSON_NEXT] = next_cursor
 
         # Send the response
         return HCI.success(
@@ -100,6 +115,94 @@ class Notifications:
             headers=self.runtime_data_initialised.json_header
         )
 
+    async def _notifications_stream(self, request: Request, usr_id: str, last_event_id: Union[int, None]) -> AsyncIterator[str]:
+        """
+        Write the missed notifications, then every new one, as server-sent events
+        """
+        title: str = "notifications_stream"
+        hub = self.runtime_data_initialised.notification_events_hub
+        responses = self.runtime_data_initialised.boilerplate_responses_initialised
+        subscription: EventsSubscription = hub.subscribe(usr_id)
+        try:
+            yield f"retry: {CONST.EVENTS_SSE_RETRY}\n\n"
+
+            # Replay the notifications inserted while the client was away
+            while last_event_id is not None:
+                missed: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
+                    table=CONST.TAB_NOTIFICATIONS,
+                    column="*",
+                    where=("user_id", "=", usr_id),
+                    order_by="id",
+                    limit=CONST.PAGINATION_MAX_LIMIT,
+                    after=[last_event_id]
+                )
+                if isinstance(missed, int):
+                    break
+                for notification in missed:
+                    yield responses.build_server_sent_event({
+                        CONST.EVENT_ID_KEY: notification["id"],
+                        CONST.EVENT_TYPE_KEY: CONST.EVENT_NOTIFICATION_CREATED,
+                        CONST.EVENT_DATA_KEY: notification
+                    })
+                last_event_id = missed[-1]["id"]
+                if len(missed) < CONST.PAGINATION_MAX_LIMIT:
+                    break
+
+            # Forward the live events
+            while await request.is_disconnected() is False:
+                try:
+                    event: Dict[str, Any] = await asyncio.wait_for(
+                        subscription.get(), timeout=CONST.EVENTS_PING_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield f": {CONST.EVENT_PING}\n\n"
+                    continue
+                event_id = event.get(CONST.EVENT_ID_KEY)
+                if event_id is not None and last_event_id is not None and event_id <= last_event_id:
+                    continue
+                if event_id is not None:
+                    last_event_id = event_id
+                yield responses.build_server_sent_event(event)
+        finally:
+            hub.unsubscribe(subscription)
+            self.disp.log_debug("Notification stream of %s closed.", title, usr_id)
+
+    async def stream_user_notifications(self, request: Request) -> Response:
+        """
+        Push the notifications of a user as they are created (server-sent events, resumable with Last-Event-ID)
+        """
+        title: str = "stream_user_notifications"
+
+        # Token checking
+        token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
+            return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
+
+        # Get the user id by the token
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
+            title,
+            token
+        )
+        if isinstance(usr_id, Response) is True:
+            return usr_id
+
+        # Get the id of the last notification the client received
+        last_event_id: Union[str, None] = request.headers.get(CONST.REQUEST_LAST_EVENT_ID_KEY)
+        if last_event_id is not None:
+            if last_event_id.strip().isdigit() is False:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
+            last_event_id = int(last_event_id)
+
+        # Send the stream
+        headers: Dict[str, str] = dict(self.runtime_data_initialised.json_header)
+        headers["Cache-Control"] = "no-cache"
+        headers["X-Accel-Buffering"] = "no"
+        return StreamingResponse(
+            self._notifications_stream(request, str(usr_id), last_event_id),
+            media_type=CONST.CONTENT_TYPE_EVENT_STREAM,
+            headers=headers
+        )
+
     async def add_user_notification(self, request: Request, user_id: str) -> Response:
         """
         Add a notification to a user
@@ -108,7 +211,7 @@ class Notifications:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the request body
@@ -117,10 +220,10 @@ class Notifications:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
 
         # Get the user data
-        user: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{user_id}'",
+            where=("id", "=", user_id),
         )
 
         # Check if the user was found
@@ -147,17 +250,28 @@ class Notifications:
             )
         columns.pop(0)
 
-        # Insert the data to the notifications table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
-            table=CONST.TAB_NOTIFICATIONS,
-            data=[request_body["message"], user_id, "0", str(datetime.now().replace(microsecond=0))],
-            column=columns
-        )
-        if status == self.error:
+        # Insert the data to the notifications table (in a transaction to read the id it was given)
+        created_at: datetime = datetime.now().replace(microsecond=0)
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            status: int = await tx.insert_data_into_table(
+                table=CONST.TAB_NOTIFICATIONS,
+                data=[request_body["message"], user_id, "0", str(created_at)],
+                column=columns
+            )
+            notification_id: Union[int, None] = tx.get_last_insert_id()
+        if status == self.error or tx.is_committed() is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                 title=title
             )
 
+        # Push the notification to the streams of the user
+        if notification_id is not None:
+            notification: Dict[str, Any] = {"id": notification_id}
+            notification.update(zip(columns, [request_body["message"], int(user_id), 0, created_at]))
+            self.runtime_data_initialised.boilerplate_non_http_initialised.publish_user_notification(
+                user_id, notification
+            )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -180,23 +294,23 @@ class Notifications:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the user id
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
 
         # Get the notification data
-        notifications: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        notifications: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
             column="*",
-            where=[f"id='{notification_id}'", f"user_id='{usr_id}'"],
+            where=[("id", "=", notification_id), ("user_id", "=", usr_id)],
         )
 
         # Check if the notification were found
@@ -213,11 +327,11 @@ class Notifications:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=CONST.TAB_NOTIFICATIONS,
             data=["1"],
             column=["is_read"],
-            where=f"id='{notification_id}'"
+            where=("id", "=", notification_id)
         )
 
         if status == self.error:
@@ -247,23 +361,23 @@ class Notifications:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the user id
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
 
         # Get the notifications data
-        notifications: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        notifications: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
             column="*",
-            where=f"user_id='{usr_id}'",
+            where=("user_id", "=", usr_id),
         )
 
         # Check if the notifications were found
@@ -280,11 +394,11 @@ class Notifications:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=CONST.TAB_NOTIFICATIONS,
             data=["1"],
             column=["is_read"],
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
         )
 
         if status == self.error:
@@ -314,23 +428,23 @@ class Notifications:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the user id
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
 
         # Get the notification data
-        notification: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        notification: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
             column="*",
-            where=[f"id='{notification_id}'", f"user_id='{usr_id}'"],
+            where=[("id", "=", notification_id), ("user_id", "=", usr_id)],
         )
 
         # Check if the notification were found
@@ -348,9 +462,9 @@ class Notifications:
             )
 
         # Delete the notification
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
-            where=f"id='{notification_id}'"
+            where=("id", "=", notification_id)
         )
 
         # Set the response body
@@ -375,23 +489,23 @@ class Notifications:
 
         # Token checking
         token = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(request)
-        if not self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(token):
+        if not await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(token):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title=title)
 
         # Get the user id
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
 
         # Get the notification sdata
-        notifications: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        notifications: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
             column="*",
-            where=f"user_id='{usr_id}'",
+            where=("user_id", "=", usr_id),
         )
 
         # Check if the notifications were found
@@ -409,9 +523,9 @@ class Notifications:
             )
 
         # Delete the notifications
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
         )
 
         # Set the response body
@@ -7,7 +7,8 @@ from datetime import datetime, timedelta
 from typing import Union, Dict, List, Any
 import requests
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -33,7 +34,7 @@ class OAuthAuthentication:
         self.runtime_data_initialised: RuntimeData = runtime_data
         self.verification: List[Dict[str, Any]] = []
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -51,7 +52,7 @@ class OAuthAuthentication:
         retrieved_provider = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_USER_OAUTH_CONNECTION,
             "*",
-            f"provider_name='{provider}'"
+            ("provider_name", "=", provider)
         )
         if isinstance(retrieved_provider, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -75,7 +76,7 @@ class OAuthAuthentication:
             response = requests.post(
                 token_url, data=data, headers=headers, timeout=10
             )
-            self.disp.log_debug(f"Exchange response = {response}", title)
+            self.disp.log_debug("Exchange response = %s", title, response)
             response.raise_for_status()
             token_response = response.json()
             if "error" in token_response:
@@ -114,9 +115,9 @@ class OAuthAuthentication:
         retrieved_data = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_USER_OAUTH_CONNECTION,
             "*",
-            f"provider_name='{provider}'"
+            ("provider_name", "=", provider)
         )
-        self.disp.log_debug(f"Retrieved oauth provider data: {retrieved_data}", title)
+        self.disp.log_debug("Retrieved oauth provider %s", title, provider)
         if isinstance(retrieved_data, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
                 "get_user_info",
@@ -128,8 +129,8 @@ class OAuthAuthentication:
             "Authorization": f"Bearer {access_token}"
         }
         user_info_url = retrieved_data[0]["user_info_base_url"]
-        self.disp.log_debug(f"User info headers: {headers}", title)
-        self.disp.log_debug(f"User info url: {user_info_url}", title)
+        self.disp.log_debug("User info headers: %s", title, headers)
+        self.disp.log_debug("User info url: %s", title, user_info_url)
         response = requests.get(user_info_url, headers=headers, timeout=10)
         if response.status_code != 200:
             return self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -139,7 +140,7 @@ class OAuthAuthentication:
                 True
             )
         user_info = response.json()
-        self.disp.log_debug(f"User info: {user_info}", title)
+        self.disp.log_debug("User info: %s", title, user_info)
         if provider == "github":
             for _, info in enumerate(user_info):
                 if info["primary"]:
@@ -157,39 +158,37 @@ class OAuthAuthentication:
         retrieved_user = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_ACCOUNTS,
             "*",
-            f"email='{email}'"
+            ("email", "=", email)
         )
-        self.disp.log_debug(f"Retrieved user: {retrieved_user}", title)
+        self.disp.log_debug("Retrieved user found: %s", title, isinstance(retrieved_user, int) is False)
 
         # Si l'utilisateur existe
         if isinstance(retrieved_user, int) is False:
             retrieved_provider = self.runtime_data_initialised.database_link.get_data_from_table(
                 CONST.TAB_USER_OAUTH_CONNECTION,
                 "*",
-                f"provider_name='{provider}'"
+                ("provider_name", "=", provider)
             )
-            msg = "Retrieved provider: "
-            msg += f"{retrieved_provider}"
-            self.disp.log_debug(msg, title)
+            self.disp.log_debug("Retrieved the provider %s", title, provider)
             if isinstance(retrieved_user, int):
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
             connection_data.append(str(retrieved_user[0]["id"]))
             connection_data.append(str(retrieved_provider[0]["id"]))
-            self.disp.log_debug(f"Connection data: {connection_data}", title)
+            self.disp.log_debug("Connection data values: %s", title, len(connection_data))
 
             provider_id = str(retrieved_provider[0]["id"])
             user_id = str(retrieved_user[0]["id"])
             if isinstance(self.runtime_data_initialised.database_link.get_data_from_table(
                 CONST.TAB_ACTIVE_OAUTHS,
                 "*",
-                f"provider_id='{provider_id}' AND user_id='{user_id}'"
+                [("provider_id", "=", provider_id), ("user_id", "=", user_id)]
             ), int):
                 columns = self.runtime_data_initialised.database_link.get_table_column_names(
                     CONST.TAB_ACTIVE_OAUTHS)
                 if isinstance(columns, int):
                     return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
                 columns.pop(0)
-                self.disp.log_debug(f"Columns list = {columns}", title)
+                self.disp.log_debug("Columns list = %s", title, columns)
                 if self.runtime_data_initialised.database_link.insert_data_into_table(
                     CONST.TAB_ACTIVE_OAUTHS,
                     connection_data,
@@ -222,7 +221,7 @@ class OAuthAuthentication:
         if isinstance(columns, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         columns.pop(0)
-        self.disp.log_debug(f"Columns list = {columns}", title)
+        self.disp.log_debug("Columns list = %s", title, columns)
         username: str = email.split('@')[0]
         user_data: list = []
         user_data.append(username)
@@ -230,34 +229,34 @@ class OAuthAuthentication:
         user_data.append(provider)
         user_data.append("NULL")
         user_data.append("")
-        self.disp.log_debug(f"Data list = {user_data}", title)
+        self.disp.log_debug("Creating the account of %s", title, username)
         if self.runtime_data_initialised.database_link.insert_data_into_table(CONST.TAB_ACCOUNTS, user_data, columns) == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         retrieved_user = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_ACCOUNTS,
             "*",
-            f"email='{email}'"
+            ("email", "=", email)
         )
-        self.disp.log_debug(f"Retrieved user: {retrieved_user}", title)
+        self.disp.log_debug("Retrieved user found: %s", title, isinstance(retrieved_user, int) is False)
         if isinstance(retrieved_user, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         retrieved_provider = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_USER_OAUTH_CONNECTION,
             "*",
-            f"provider_name='{provider}'"
+            ("provider_name", "=", provider)
         )
-        self.disp.log_debug(f"Retrieved provider: {retrieved_provider}", title)
+        self.disp.log_debug("Retrieved provider found: %s", title, isinstance(retrieved_provider, int) is False)
         if isinstance(retrieved_user, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         connection_data.append(str(retrieved_user[0]["id"]))
         connection_data.append(str(retrieved_provider[0]["id"]))
-        self.disp.log_debug(f"Connection data: {connection_data}", title)
+        self.disp.log_debug("Connection data values: %s", title, len(connection_data))
         columns = self.runtime_data_initialised.database_link.get_table_column_names(
             CONST.TAB_ACTIVE_OAUTHS)
         if isinstance(columns, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         columns.pop(0)
-        self.disp.log_debug(f"Columns list = {columns}", title)
+        self.disp.log_debug("Columns list = %s", title, columns)
         if self.runtime_data_initialised.database_link.insert_data_into_table(
             CONST.TAB_ACTIVE_OAUTHS,
             connection_data,
@@ -293,7 +292,7 @@ class OAuthAuthentication:
         # if not access_token:
         #     return self.runtime_data_initialised.boilerplate_responses_initialised.no_access_token(title)
         data.append(access_token)
-        self.disp.log_debug(f"Gotten access token: {access_token}", title)
+        self.disp.log_debug("Access token received: %s", title, access_token is not None)
         if provider == "github":
             data.append(
                 self.runtime_data_initialised.database_link.datetime_to_string(
@@ -337,7 +336,7 @@ class OAuthAuthentication:
                     headers=self.runtime_data_initialised.json_header
                 )
             data.append(refresh_link)
-        self.disp.log_debug(f"Generated data for new oauth connexion user: {data}", title)
+        self.disp.log_debug("Generated %s values for new oauth connexion user", title, len(data))
         user_info = self._get_user_info(provider, access_token)
         if "error" in user_info:
             body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -371,11 +370,11 @@ class OAuthAuthentication:
                 content_type=CONST.CONTENT_TYPE,
                 headers=self.runtime_data_initialised.json_header
             )
-        self.disp.log_debug(f"Query params: {query_params}", title)
+        self.disp.log_debug("Query params: %s", title, query_params)
         code = query_params.get("code")
-        self.disp.log_debug(f"Code: {code}", title)
+        self.disp.log_debug("Code: %s", title, code)
         state = query_params.get("state")
-        self.disp.log_debug(f"State: {state}", title)
+        self.disp.log_debug("State: %s", title, state)
         if not code or not state:
             body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
                 title=title,
@@ -401,23 +400,26 @@ class OAuthAuthentication:
                 content_type=CONST.CONTENT_TYPE,
                 headers=self.runtime_data_initialised.json_header
             )
-        self.disp.log_debug(f"Uuid retrived: {uuid_gotten}", title)
-        self.disp.log_debug(f"Provider: {provider}", title)
-        data = self.runtime_data_initialised.database_link.get_data_from_table(
+        self.disp.log_debug("Uuid retrived: %s", title, uuid_gotten)
+        self.disp.log_debug("Provider: %s", title, provider)
+        data = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             CONST.TAB_VERIFICATION,
             "*",
-            f"definition='{uuid_gotten}'"
+            ("definition", "=", uuid_gotten)
         )
-        self.disp.log_debug(f"Data received: {data}", title)
+        self.disp.log_debug("Verification rows received: %s", title, data if isinstance(data, int) else len(data))
         if isinstance(data, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
-        if isinstance(self.runtime_data_initialised.database_link.drop_data_from_table(
+        if isinstance(await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             CONST.TAB_VERIFICATION,
-            f"definition='{uuid_gotten}'"
+            ("definition", "=", uuid_gotten)
         ), int) is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
-        token_response = self._exchange_code_for_token(provider, code)
-        self.disp.log_debug(f"Token response: {token_response}", title)
+        # The provider requests and the account queries are blocking, they run in the query thread pool
+        token_response = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self._exchange_code_for_token, provider, code
+        )
+        self.disp.log_debug("Token response keys: %s", title, list(token_response))
         if "error" in token_response:
             body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
                 title=title,
@@ -430,7 +432,9 @@ class OAuthAuthentication:
                 content_type=CONST.CONTENT_TYPE,
                 headers=self.runtime_data_initialised.json_header
             )
-        return self._handle_token_response(token_response, provider)
+        return await self.runtime_data_initialised.database_link.a_run_blocking(
+            self._handle_token_response, token_response, provider
+        )
 
     def _generate_oauth_authorization_url(self, provider: str) -> Union[int, str]:
         """
@@ -440,9 +444,9 @@ class OAuthAuthentication:
         retrived_provider = self.runtime_data_initialised.database_link.get_data_from_table(
             CONST.TAB_USER_OAUTH_CONNECTION,
             "*",
-            f"provider_name='{provider}'"
+            ("provider_name", "=", provider)
         )
-        self.disp.log_debug(f"Retrived provider: {retrived_provider}", title)
+        self.disp.log_debug("Retrived provider: %s", title, retrived_provider)
         if isinstance(retrived_provider, int):
             self.disp.log_error("Unknown or Unsupported OAuth provider", title)
             return self.error
@@ -454,7 +458,7 @@ class OAuthAuthentication:
         columns = self.runtime_data_initialised.database_link.get_table_column_names(
             CONST.TAB_VERIFICATION
         )
-        self.disp.log_debug(f"Columns list: {columns}", title)
+        self.disp.log_debug("Columns list: %s", title, columns)
         if isinstance(columns, int):
             return self.error
         columns.pop(0)
@@ -463,7 +467,7 @@ class OAuthAuthentication:
         )
         et_str = self.runtime_data_initialised.database_link.datetime_to_string(
             expiration_time, False)
-        self.disp.log_debug(f"Expiration time: {et_str}", et_str)
+        self.disp.log_debug("Expiration time: %s", et_str, et_str)
         data: list = []
         data.append("state")
         data.append(state)
@@ -482,7 +486,7 @@ class OAuthAuthentication:
         url = url.replace("/", "%2F")
         url = url.replace("?", "%3F")
         url = url.replace("&", "%26")
-        self.disp.log_debug(f"url = {url}", title)
+        self.disp.log_debug("url = %s", title, url)
         return url
 
     async def oauth_login(self, request: Request) -> Response:
@@ -491,7 +495,7 @@ class OAuthAuthentication:
         """
         title = "oauth_login"
         request_body = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or "provider" not in request_body:
             body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
                 title=title,
@@ -505,9 +509,11 @@ class OAuthAuthentication:
                 headers=self.runtime_data_initialised.json_header
             )
         provider = request_body["provider"]
-        self.disp.log_debug(f"Oauth login provider: {provider}", title)
-        authorization_url = self._generate_oauth_authorization_url(provider)
-        self.disp.log_debug(f"Authorization url: {authorization_url}", title)
+        self.disp.log_debug("Oauth login provider: %s", title, provider)
+        authorization_url = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self._generate_oauth_authorization_url, provider
+        )
+        self.disp.log_debug("Authorization url: %s", title, authorization_url)
         if isinstance(authorization_url, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title)
         body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
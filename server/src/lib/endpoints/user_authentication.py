@@ -5,7 +5,8 @@ The file that contains users authentication endpoint
 import random
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -25,7 +26,7 @@ class UsersAuthentication:
         self.success: int = success
         self.error: int = error
         self.runtime_data_initialised: RuntimeData = runtime_data
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -55,7 +56,7 @@ class UsersAuthentication:
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or not all(key in request_body for key in ("email", "password")):
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
         if request_body["email"] == "" or request_body["password"] == "":
@@ -63,10 +64,10 @@ class UsersAuthentication:
 
         # Check if the user already exist
         email_str: str = "email"
-        user_info: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_info: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"email='{request_body[email_str]}'"
+            where=("email", "=", request_body[email_str])
         )
         if isinstance(user_info, int) is False:
             node = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -82,7 +83,7 @@ class UsersAuthentication:
             password=request_body["password"]
         )
         username = request_body["email"].split('@')[0]
-        self.disp.log_debug(f"Username = {username}", title)
+        self.disp.log_debug("Username = %s", title, username)
 
         # Get the columns
         columns: Union[List[str], int] = self.runtime_data_initialised.database_link.get_table_column_names(
@@ -93,10 +94,10 @@ class UsersAuthentication:
                 title=title
             )
         columns.pop(0)
-        self.disp.log_debug(f"Columns = {columns}", title)
+        self.disp.log_debug("Columns = %s", title, columns)
 
         # Insert the data in the database
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_ACCOUNTS,
             data=[username, request_body["email"], hashed_password, "NULL", ""],
             column=columns
@@ -107,7 +108,8 @@ class UsersAuthentication:
             )
 
         # Set the user in the connexions
-        data: Dict[str, Any] = self.runtime_data_initialised.boilerplate_incoming_initialised.log_user_in(
+        data: Dict[str, Any] = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.runtime_data_initialised.boilerplate_incoming_initialised.log_user_in,
             request_body["email"]
         )
         if data["status"] == self.error:
@@ -152,7 +154,7 @@ class UsersAuthentication:
         request_body = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or not all(key in request_body for key in ("email", "password")):
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(
                 title
@@ -165,12 +167,12 @@ class UsersAuthentication:
             )
 
         # Check the informations passed in the request
-        user_info: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_info: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"email='{email}'"
+            where=("email", "=", email)
         )
-        self.disp.log_debug(f"Retrived data: {user_info}", title)
+        self.disp.log_debug("Retrived accounts: %s", title, user_info if isinstance(user_info, int) else len(user_info))
         if isinstance(user_info, int):
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title
@@ -181,7 +183,8 @@ class UsersAuthentication:
             )
 
         # Set the user in the connexions
-        data = self.runtime_data_initialised.boilerplate_incoming_initialised.log_user_in(
+        data = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.runtime_data_initialised.boilerplate_incoming_initialised.log_user_in,
             email
         )
         if data["status"] == self.error:
@@ -218,7 +221,7 @@ class UsersAuthentication:
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or ("email") not in request_body:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(
                 title
@@ -228,13 +231,13 @@ class UsersAuthentication:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(
                 title
             )
-        data: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        data: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"email='{email}'",
+            where=("email", "=", email),
             beautify=True
         )
-        self.disp.log_debug(f"user query = {data}", title)
+        self.disp.log_debug("user query rows = %s", title, data if isinstance(data, int) else len(data))
         if data == self.error or len(data) == 0:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(
                 title
@@ -251,13 +254,13 @@ class UsersAuthentication:
             new_node['email'] = email
             new_node['code'] = code
             self.verification_code.append(new_node)
-        self.disp.log_debug(f"Verification codes: {self.verification_code}", title)
+        self.disp.log_debug("Verification codes: %s", title, self.verification_code)
         code_style: str = "background-color: lightgray;border: 2px lightgray solid;border-radius: 6px;color: black;font-weight: bold;padding: 5px;padding-top: 5px;padding-bottom: 5px;padding-top: 0px;padding-bottom: 0px;"
         email_subject: str = "[Epitrello] Verification code"
         body: str = ""
         body += "<p>The code is: "
         body += f"<span style=\"{code_style}\">{code}</span></p>"
-        self.disp.log_debug(f"e-mail body: {body}", title)
+        self.disp.log_debug("e-mail body: %s", title, body)
         status: int = self.mail_management_initialised.send_email(
             email,
             email_subject,
@@ -285,7 +288,7 @@ class UsersAuthentication:
         """
         title: str = "Reset password"
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or not all(key in request_body for key in ("email", "code", "password")):
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
         body_email: str = request_body["email"]
@@ -318,11 +321,11 @@ class UsersAuthentication:
         )
         data.append(hashed_password)
         column.append("password")
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_ACCOUNTS,
             data=data,
             columns=column,
-            where=f"email='{body_email}'",
+            where=("email", "=", body_email),
             title=title,
             message="Password changed successfully."
         )
@@ -5,7 +5,8 @@ The file that contains the class that handle user management
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Union
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -26,7 +27,7 @@ class UserManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -56,27 +57,27 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
-        usr_id = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
-        self.disp.log_debug(f"user_id = {usr_id}", title)
+        self.disp.log_debug("user_id = %s", title, usr_id)
         if isinstance(usr_id, Response) is True:
             return usr_id
-        user_profile = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_profile = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{usr_id}'",
+            where=("id", "=", usr_id),
         )
-        self.disp.log_debug(f"User profile = {user_profile}", title)
+        self.disp.log_debug("User profile = %s", title, user_profile)
         if user_profile == self.error or len(user_profile) == 0:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
                 title=title
@@ -105,20 +106,20 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
-        user_profile = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_profile = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{user_id}'",
+            where=("id", "=", user_id),
         )
-        self.disp.log_debug(f"User profile = {user_profile}", title)
+        self.disp.log_debug("User profile = %s", title, user_profile)
         if user_profile == self.error or len(user_profile) == 0:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
                 title=title
@@ -147,10 +148,10 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -158,7 +159,7 @@ class UserManagement:
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
         if not request_body or not all(key in request_body for key in ("username", "email", "bio")):
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
         body_username: str = request_body["username"]
@@ -166,18 +167,18 @@ class UserManagement:
         body_bio: str = request_body["bio"]
         if body_username == "" or body_email == "":
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
         if isinstance(usr_id, Response) is True:
             return usr_id
-        user_profile: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_profile: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{usr_id}'",
+            where=("id", "=", usr_id),
         )
-        self.disp.log_debug(f"User profile = {user_profile}", title)
+        self.disp.log_debug("User profile = %s", title, user_profile)
         if user_profile == self.error or len(user_profile) == 0:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
                 title=title
@@ -197,11 +198,11 @@ class UserManagement:
                 title=title,
             )
         columns.pop(0)
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_ACCOUNTS,
             data=data,
             columns=columns,
-            where=f"id='{usr_id}'",
+            where=("id", "=", usr_id),
             title=title,
             message="The account information has been updated."
         )
@@ -214,10 +215,10 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
@@ -225,19 +226,19 @@ class UserManagement:
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        self.disp.log_debug("Request body: %s", title, request_body)
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
         if isinstance(usr_id, Response) is True:
             return usr_id
-        user_profile = self.runtime_data_initialised.database_link.get_data_from_table(
+        user_profile = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{usr_id}'",
+            where=("id", "=", usr_id),
         )
-        self.disp.log_debug(f"User profile = {user_profile}", title)
+        self.disp.log_debug("User profile = %s", title, user_profile)
         if user_profile == self.error or len(user_profile) == 0:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
                 title=title,
@@ -245,7 +246,7 @@ class UserManagement:
         if "username" in request_body:
             if request_body["username"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_ACCOUNTS,
                 "id",
                 "username",
@@ -258,7 +259,7 @@ class UserManagement:
         if "email" in request_body:
             if request_body["email"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_ACCOUNTS,
                 "id",
                 "email",
@@ -274,18 +275,18 @@ class UserManagement:
             data: Dict[str, Any] = [
                 self.password_handling_initialised.hash_password(request_body["password"])
             ]
-            status = self.runtime_data_initialised.database_link.update_data_in_table(
+            status = await self.runtime_data_initialised.database_link.a_update_data_in_table(
                 CONST.TAB_ACCOUNTS,
                 data,
                 ["password"],
-                f"id='{usr_id}'"
+                ("id", "=", usr_id)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                     title=title,
                 )
         if "bio" in request_body:
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_ACCOUNTS,
                 "id",
                 "bio",
@@ -313,10 +314,10 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -324,7 +325,7 @@ class UserManagement:
 
         # Get the request body
         request_body = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Check if every required information is in the request body
         if not request_body or "file" not in request_body:
@@ -332,7 +333,7 @@ class UserManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -340,10 +341,10 @@ class UserManagement:
             return usr_id
 
         # Get the user information
-        user: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{usr_id}'"
+            where=("id", "=", usr_id)
         )
         if user == self.error or not user:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
@@ -359,7 +360,7 @@ class UserManagement:
         )
         if isinstance(file_url, Response):
             return file_url
-        self.disp.log_debug(f"User={user}", title)
+        self.disp.log_debug("User=%s", title, user)
 
         # Delete old photo from MinIO
         if user[0]["favicon"] is not None or user[0]["favicon"] != "NULL":
@@ -378,11 +379,11 @@ class UserManagement:
             )
 
         # Update the profile photo of the user
-        status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+        status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
             table=CONST.TAB_ACCOUNTS,
             data=[file_url],
             column=["favicon"],
-            where=f"id='{usr_id}'"
+            where=("id", "=", usr_id)
         )
         if status == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
@@ -413,17 +414,17 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -431,48 +432,55 @@ class UserManagement:
             return usr_id
 
         # Get the workspaces id created by the user
-        workspaces_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspaces_id: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="id",
-            where=f"creator_id='{usr_id}'",
+            where=("creator_id", "=", usr_id),
         )
 
         # Delete every workspaces in the list
         if isinstance(workspaces_id, int) is False:
-            for _, workspace in enumerate(workspaces_id):
-                self.runtime_data_initialised.boilerplate_non_http_initialised.delete_workspace(
-                    workspace_id=int(workspace["id"])
+            status: int = await self.runtime_data_initialised.database_link.a_run_blocking(
+                self.runtime_data_initialised.boilerplate_non_http_initialised.delete_workspaces,
+                workspaces_id=[workspace["id"] for workspace in workspaces_id]
+            )
+            if status == self.error:
+                return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
+                    title=title
                 )
 
         # Delete the user in the cards assignees
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_CARDS_ASSIGNEES,
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
         )
 
         # Delete the user in the workspaces members
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
         )
 
         # Delete the user notifications
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_NOTIFICATIONS,
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
         )
 
         # Delete the user in the connected users table
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_CONNECTIONS,
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id)
+        )
+        self.runtime_data_initialised.boilerplate_non_http_initialised.invalidate_user_tokens(
+            usr_id
         )
 
         # Delete the favicon
-        user: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        user: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"id='{usr_id}'"
+            where=("id", "=", usr_id)
         )
         if user == self.error or not user:
             if user[0]["favicon"] != "NULL" and user[0]["favicon"] != None:
@@ -486,9 +494,9 @@ class UserManagement:
                     )
 
         # Delete the user
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_ACCOUNTS,
-            where=f"id='{usr_id}'"
+            where=("id", "=", usr_id)
         )
 
         # Set the response body
@@ -513,17 +521,20 @@ class UserManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
-        status: int = self.runtime_data_initialised.database_link.remove_data_from_table(
+        status: int = await self.runtime_data_initialised.database_link.a_remove_data_from_table(
             CONST.TAB_CONNECTIONS,
-            f"token='{token}'"
+            ("token", "=", token)
+        )
+        self.runtime_data_initialised.boilerplate_non_http_initialised.invalidate_token(
+            token
         )
         if status == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
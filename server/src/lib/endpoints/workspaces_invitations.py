@@ -4,7 +4,8 @@ The file that contains the class that handle workspaces invitations
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class WorkspacesInvitations:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -42,17 +43,17 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -60,7 +61,7 @@ class WorkspacesInvitations:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title,
@@ -75,10 +76,10 @@ class WorkspacesInvitations:
             )
 
         # Check if the user exist
-        member_to_invite: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        member_to_invite: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_ACCOUNTS,
             column="*",
-            where=f"email='{email}'",
+            where=("email", "=", email),
         )
         if member_to_invite == self.error or not member_to_invite:
             return self.runtime_data_initialised.boilerplate_responses_initialised.user_not_found(
@@ -87,10 +88,10 @@ class WorkspacesInvitations:
 
         # Check if the user is already in the workspace
         id_tab: str = "id"
-        member_to_invite_workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        member_to_invite_workspace: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=[f"user_id='{member_to_invite[0][id_tab]}'", f"workspace_id='{workspace_id}'"]
+            where=[("user_id", "=", member_to_invite[0][id_tab]), ("workspace_id", "=", workspace_id)]
         )
         if isinstance(member_to_invite_workspace, int) is False:
             response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -106,10 +107,10 @@ class WorkspacesInvitations:
             )
 
         # Check if the user has been already invited
-        member_to_invite_invitation: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        member_to_invite_invitation: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=[f"user_id='{member_to_invite[0][id_tab]}'", f"workspace_id='{workspace_id}'"]
+            where=[("user_id", "=", member_to_invite[0][id_tab]), ("workspace_id", "=", workspace_id)]
         )
         if isinstance(member_to_invite_invitation, int) is False:
             response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -128,25 +129,34 @@ class WorkspacesInvitations:
         columns: Union[List[str], int] = self.runtime_data_initialised.database_link.get_table_column_names(
             table_name=CONST.TAB_WORKSPACES_INVITATIONS
         )
-        self.disp.log_debug(f"Columns: {columns}", title)
+        self.disp.log_debug("Columns: %s", title, columns)
         if columns == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                 title=title
             )
         columns.pop(0)
 
-        # Send the invitation
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
-            table=CONST.TAB_WORKSPACES_INVITATIONS,
-            data=[str(member_to_invite[0][id_tab]), workspace_id],
-            column=columns
-        )
-        self.disp.log_debug(f"Send invitation status: {status}", title)
-        if status == self.error:
+        # Send the invitation (in a transaction to read the id it was given)
+        async with self.runtime_data_initialised.database_link.a_transaction() as tx:
+            status: int = await tx.insert_data_into_table(
+                table=CONST.TAB_WORKSPACES_INVITATIONS,
+                data=[str(member_to_invite[0][id_tab]), workspace_id],
+                column=columns
+            )
+            invitation_id: Union[int, None] = tx.get_last_insert_id()
+        self.disp.log_debug("Send invitation status: %s", title, status)
+        if status == self.error or tx.is_committed() is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                 title=title
             )
 
+        # Push the invitation to the streams of the invited user
+        self.runtime_data_initialised.boilerplate_non_http_initialised.publish_user_event(
+            member_to_invite[0][id_tab],
+            CONST.EVENT_INVITATION_RECEIVED,
+            {"id": invitation_id, "workspace_id": workspace_id}
+        )
+
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title=title,
@@ -171,28 +181,41 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
         if isinstance(usr_id, Response) is True:
             return usr_id
 
-        # Get my invitations
-        my_invitations: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        # Get the pagination parameters
+        pagination = self.runtime_data_initialised.boilerplate_incoming_initialised.get_pagination(request, 1)
+        if pagination is None:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
+        limit, after = pagination
+
+        # Get my invitations (newest first)
+        my_invitations: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=f"user_id='{usr_id}'"
+            where=("user_id", "=", usr_id),
+            order_by="id",
+            descending=True,
+            limit=self.runtime_data_initialised.boilerplate_incoming_initialised.page_query_limit(limit),
+            after=after
+        )
+        my_invitations, next_cursor = self.runtime_data_initialised.boilerplate_incoming_initialised.paginate(
+            my_invitations, limit, ["id"]
         )
 
         # Check if the workspace member was found
@@ -209,21 +232,26 @@ class WorkspacesInvitations:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        # Get every workspaces names where the user is invited
+        # Get every workspaces names where the user is invited in one query
+        workspaces: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+            table=CONST.TAB_WORKSPACES,
+            column=["id", "name", "favicon"],
+            in_column="id",
+            values=[item["workspace_id"] for item in my_invitations]
+        )
+        self.disp.log_debug("workspaces=%s", title, workspaces)
+        workspaces_by_id: Dict[Any, Dict[str, Any]] = {}
+        if isinstance(workspaces, int) is False:
+            workspaces_by_id = {workspace["id"]: workspace for workspace in workspaces}
         invitations_list: List[Dict[str, Any]] = []
-        for idx, item in enumerate(my_invitations):
-            workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-                table=CONST.TAB_WORKSPACES,
-                column="*",
-                where=f"id='{item['workspace_id']}'"
-            )
-            self.disp.log_debug(f"workspace_name={workspace}", title)
-            if workspace == self.error or not workspace:
+        for _, item in enumerate(my_invitations):
+            workspace: Union[Dict[str, Any], None] = workspaces_by_id.get(item["workspace_id"])
+            if workspace is None:
                 continue
             invitations_list.append({
-                "id": my_invitations[idx]["id"],
-                "name": workspace[0]["name"],
-                "favicon": workspace[0]["favicon"]
+                "id": item["id"],
+                "name": workspace["name"],
+                "favicon": workspace["favicon"]
             })
 
         # Set the response body
@@ -232,6 +260,7 @@ class WorkspacesInvitations:
             message=invitations_list,
             resp="success"
         )
+        data[CONST.JSON_NEXT] = next_cursor
 
         # Send the response
         return HCI.success(
@@ -250,28 +279,41 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
         if isinstance(usr_id, Response) is True:
             return usr_id
 
-        # Get workspace invitations
-        workspace_invitations: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        # Get the pagination parameters
+        pagination = self.runtime_data_initialised.boilerplate_incoming_initialised.get_pagination(request, 1)
+        if pagination is None:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title=title)
+        limit, after = pagination
+
+        # Get workspace invitations (newest first)
+        workspace_invitations: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=f"workspace_id='{workspace_id}'"
+            where=("workspace_id", "=", workspace_id),
+            order_by="id",
+            descending=True,
+            limit=self.runtime_data_initialised.boilerplate_incoming_initialised.page_query_limit(limit),
+            after=after
+        )
+        workspace_invitations, next_cursor = self.runtime_data_initialised.boilerplate_incoming_initialised.paginate(
+            workspace_invitations, limit, ["id"]
         )
 
         # Check if the workspace member was found
@@ -288,21 +330,26 @@ class WorkspacesInvitations:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        # Get every users name invited in the workspace
+        # Get every users name invited in the workspace in one query
+        users: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+            table=CONST.TAB_ACCOUNTS,
+            column=["id", "username", "email", "favicon"],
+            in_column="id",
+            values=[item["user_id"] for item in workspace_invitations]
+        )
+        users_by_id: Dict[Any, Dict[str, Any]] = {}
+        if isinstance(users, int) is False:
+            users_by_id = {user["id"]: user for user in users}
         invitations_list: List[Dict[str, Any]] = []
         for _, item in enumerate(workspace_invitations):
-            user: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-                table=CONST.TAB_ACCOUNTS,
-                column="*",
-                where=f"id='{item['user_id']}'"
-            )
-            if user == self.error or not user:
+            user: Union[Dict[str, Any], None] = users_by_id.get(item["user_id"])
+            if user is None:
                 continue
             invitations_list.append({
                 "id": item["id"],
-                "username": user[0]["username"],
-                "email": user[0]["email"],
-                "favicon": user[0]["favicon"]
+                "username": user["username"],
+                "email": user["email"],
+                "favicon": user["favicon"]
             })
 
         # Set the response body
@@ -311,6 +358,7 @@ class WorkspacesInvitations:
             message=invitations_list,
             resp="success"
         )
+        data[CONST.JSON_NEXT] = next_cursor
 
         # Send the response
         return HCI.success(
@@ -329,17 +377,17 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -347,10 +395,10 @@ class WorkspacesInvitations:
             return usr_id
 
         # Get Invitation data
-        invitation: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        invitation: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Check if the invitation was found
@@ -377,7 +425,7 @@ class WorkspacesInvitations:
         columns: Union[List[str], int] = self.runtime_data_initialised.database_link.get_table_column_names(
             table_name=CONST.TAB_WORKSPACES_MEMBERS
         )
-        self.disp.log_debug(f"Columns: {columns}", title)
+        self.disp.log_debug("Columns: %s", title, columns)
         if columns == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
                 title=title
@@ -385,7 +433,7 @@ class WorkspacesInvitations:
         columns.pop(0)
 
         # Insert the user in the workspace member
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=[usr_id, str(invitation[0]["workspace_id"]), "0", "0", "0", "0"],
             column=columns
@@ -396,9 +444,9 @@ class WorkspacesInvitations:
             )
 
         # Delete the invitation
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Set the response body
@@ -425,17 +473,17 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
@@ -443,10 +491,10 @@ class WorkspacesInvitations:
             return usr_id
 
         # Get Invitation data
-        invitation: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        invitation: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Check if the invitation was found
@@ -464,7 +512,7 @@ class WorkspacesInvitations:
             )
 
         # Get the data of the workspace member to check his right
-        workspace_member: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        workspace_member: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title,
@@ -479,9 +527,9 @@ class WorkspacesInvitations:
             )
 
         # Delete the invitation
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Set the response body
@@ -509,17 +557,17 @@ class WorkspacesInvitations:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
@@ -527,10 +575,10 @@ class WorkspacesInvitations:
             return usr_id
 
         # Get Invitation data
-        invitation: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        invitation: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
             column="*",
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Check if the invitation was found
@@ -554,9 +602,9 @@ class WorkspacesInvitations:
             )
 
         # Delete the invitation
-        self.runtime_data_initialised.database_link.drop_data_from_table(
+        await self.runtime_data_initialised.database_link.a_drop_data_from_table(
             table=CONST.TAB_WORKSPACES_INVITATIONS,
-            where=f"id='{invitation_id}'"
+            where=("id", "=", invitation_id)
         )
 
         # Set the response body
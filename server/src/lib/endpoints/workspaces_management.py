@@ -4,7 +4,8 @@ The file that contains the class that handle workspaces management
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -24,7 +25,7 @@ class WorkspacesManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -50,20 +51,20 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the workspace data
-        workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspace: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="*",
-            where=f"id='{workspace_id}'",
+            where=("id", "=", workspace_id),
         )
         if workspace == self.error or not workspace:
             response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -102,17 +103,17 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -120,10 +121,10 @@ class WorkspacesManagement:
             return usr_id
 
         # Get every workspaces id where the user is
-        workspaces_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspaces_id: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=f"user_id='{usr_id}'",
+            where=("user_id", "=", usr_id),
         )
 
         # Check if the workspaces was found
@@ -140,17 +141,21 @@ class WorkspacesManagement:
                 headers=self.runtime_data_initialised.json_header
             )
 
-        # Get every workspaces where the user is
-        workspace_id_str = "workspace_id"
+        # Get every workspaces where the user is in one query
+        found_workspaces: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table_in(
+            table=CONST.TAB_WORKSPACES,
+            column="*",
+            in_column="id",
+            values=[item["workspace_id"] for item in workspaces_id]
+        )
         workspaces: List[Dict[str, Any]] = []
-        for _, item in enumerate(workspaces_id):
-            workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
-                table=CONST.TAB_WORKSPACES,
-                column="*",
-                where=f"id='{item[workspace_id_str]}'",
-            )
-            if isinstance(workspace, int) is False:
-                workspaces.append(workspace[0])
+        if isinstance(found_workspaces, int) is False:
+            workspaces_by_id: Dict[Any, Dict[str, Any]] = {
+                workspace["id"]: workspace for workspace in found_workspaces
+            }
+            for _, item in enumerate(workspaces_id):
+                if item["workspace_id"] in workspaces_by_id:
+                    workspaces.append(workspaces_by_id[item["workspace_id"]])
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -176,10 +181,10 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title
@@ -187,7 +192,7 @@ class WorkspacesManagement:
 
         # Get the request body
         request_body = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Check if every required information is in the request body
         if not request_body or not all(key in request_body for key in ("name", "description", "favicon")):
@@ -196,7 +201,7 @@ class WorkspacesManagement:
             return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
 
         # Get the user id by the token
-        usr_id = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title=title,
             token=token
         )
@@ -224,7 +229,7 @@ class WorkspacesManagement:
         columns.pop(0)
 
         # Insert the data to the workspace table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_WORKSPACES,
             data=[request_body["name"], usr_id, request_body["description"], file_url],
             column=columns
@@ -245,10 +250,10 @@ class WorkspacesManagement:
         columns.pop(0)
 
         # Get the workspace_id
-        workspace_id: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspace_id: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="id",
-            where=f"name='{request_body['name']}'",
+            where=("name", "=", request_body["name"]),
         )
 
         # Check if the workspace was found
@@ -266,7 +271,7 @@ class WorkspacesManagement:
             )
 
         # Insert the data to the workspace members table
-        status: int = self.runtime_data_initialised.database_link.insert_data_into_table(
+        status: int = await self.runtime_data_initialised.database_link.a_insert_data_into_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=[usr_id, str(workspace_id[-1]["id"]), "1", "1", "1", "1"],
             column=columns
@@ -300,10 +305,10 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
@@ -313,7 +318,7 @@ class WorkspacesManagement:
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(
             request
         )
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Check if every required information is in the request body
         if not request_body or not all(key in request_body for key in ("name", "description")):
@@ -322,7 +327,7 @@ class WorkspacesManagement:
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Any] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Any] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -330,10 +335,10 @@ class WorkspacesManagement:
             return usr_id
 
         # Get the workspace data
-        workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspace: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="*",
-            where=f"id='{workspace_id}'",
+            where=("id", "=", workspace_id),
         )
 
         # Check if the workspace was found
@@ -357,11 +362,11 @@ class WorkspacesManagement:
             )
 
         # Update the workspace data
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_WORKSPACES,
             data=[request_body["name"], request_body["description"]],
             columns=["name", "description"],
-            where=f"id='{workspace_id}'",
+            where=("id", "=", workspace_id),
             title=title,
             message="The workspace information has been updated."
         )
@@ -376,19 +381,19 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title, token)
 
         # Get the request body
         request_body: Dict[str, Any] = await self.runtime_data_initialised.boilerplate_incoming_initialised.get_body(request)
-        self.disp.log_debug(f"Request body: {request_body}", title)
+        self.disp.log_debug("Request body: %s", title, request_body)
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -396,10 +401,10 @@ class WorkspacesManagement:
             return usr_id
 
         # Get the workspace data
-        workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspace: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="*",
-            where=f"id='{workspace_id}'",
+            where=("id", "=", workspace_id),
         )
 
         # Check if the workspace was found
@@ -426,7 +431,7 @@ class WorkspacesManagement:
         if "name" in request_body:
             if request_body["name"] == "":
                 return self.runtime_data_initialised.boilerplate_responses_initialised.bad_request(title)
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_WORKSPACES,
                 "id",
                 "name",
@@ -435,7 +440,7 @@ class WorkspacesManagement:
             ) == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(title, token)
         if "description" in request_body:
-            if self.runtime_data_initialised.boilerplate_non_http_initialised.update_single_data(
+            if await self.runtime_data_initialised.boilerplate_non_http_initialised.a_update_single_data(
                 CONST.TAB_WORKSPACES,
                 "id",
                 "description",
@@ -476,11 +481,11 @@ class WorkspacesManagement:
 
             # Update the profile photo of the user
             id_str: str = workspace[0]["id"]
-            status: int = self.runtime_data_initialised.database_link.update_data_in_table(
+            status: int = await self.runtime_data_initialised.database_link.a_update_data_in_table(
                 table=CONST.TAB_WORKSPACES,
                 data=[file_url],
                 column=["favicon"],
-                where=f"id='{id_str}'"
+                where=("id", "=", id_str)
             )
             if status == self.error:
                 return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
@@ -511,15 +516,15 @@ class WorkspacesManagement:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(title, token)
 
         # Get the user id by the token
-        usr_id: Union[str, Any] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Any] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -527,10 +532,10 @@ class WorkspacesManagement:
             return usr_id
 
         # Get the workspace data
-        workspace: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        workspace: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES,
             column="*",
-            where=f"id='{workspace_id}'",
+            where=("id", "=", workspace_id),
         )
 
         # Check if the workspace was found
@@ -574,9 +579,14 @@ class WorkspacesManagement:
                 )
 
         # Delete the workspace
-        self.runtime_data_initialised.boilerplate_non_http_initialised.delete_workspace(
+        status: int = await self.runtime_data_initialised.database_link.a_run_blocking(
+            self.runtime_data_initialised.boilerplate_non_http_initialised.delete_workspace,
             workspace_id=workspace[0]["id"]
         )
+        if status == self.error:
+            return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
+                title=title
+            )
 
         # Set the response body
         response_body: Dict[str, Any] = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
@@ -4,7 +4,8 @@ The file that contains the class that handle workspaces members
 
 from typing import Union, List, Dict, Any
 from fastapi import Response, Request
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 from .. import constants as CONST
 from ..runtime_data import RuntimeData
 from ..http_codes import HCI
@@ -23,7 +24,7 @@ class WorkspacesMembers:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -42,20 +43,20 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the workspace members
-        members: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        members: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=f"workspace_id='{workspace_id}'"
+            where=("workspace_id", "=", workspace_id)
         )
 
         # Check if the workspace member was found
@@ -79,11 +80,10 @@ class WorkspacesMembers:
             resp="success"
         )
 
-        # Send the response
-        return HCI.success(
-            content=data,
-            content_type=CONST.CONTENT_TYPE,
-            headers=self.runtime_data_initialised.json_header
+        # Send the response (or a 304 if the client already has this version)
+        return self.runtime_data_initialised.boilerplate_responses_initialised.success_with_etag(
+            request=request,
+            content=data
         )
 
     async def get_workspace_specific_member(self, request: Request, workspace_id: str, user_id: str) -> Response:
@@ -96,20 +96,20 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the workspace member
-        member: Union[List[Dict[str, Any]], int] = self.runtime_data_initialised.database_link.get_data_from_table(
+        member: Union[List[Dict[str, Any]], int] = await self.runtime_data_initialised.database_link.a_get_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             column="*",
-            where=[f"workspace_id='{workspace_id}'", f"user_id='{user_id}'"]
+            where=[("workspace_id", "=", workspace_id), ("user_id", "=", user_id)]
         )
 
         # Check if the workspace member was found
@@ -150,17 +150,17 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -168,7 +168,7 @@ class WorkspacesMembers:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        operator: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        operator: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -183,34 +183,34 @@ class WorkspacesMembers:
             )
 
         # Get the user value to change
-        user: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        user: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=user_id,
             workspace_id=workspace_id,
             title=title
         )
         if isinstance(user, Response):
             return user
-        self.disp.log_debug(f"user={user}", title)
-        self.disp.log_debug(f"Type={type(user[0]['admin'])}", title)
+        self.disp.log_debug("user=%s", title, user)
+        self.disp.log_debug("Type=%s", title, type(user[0]['admin']))
 
         # When the user is not an admin
         if user[0]["admin"] == 0:
             self.disp.log_debug("Change to admin", title)
-            return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+            return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
                 table=CONST.TAB_WORKSPACES_MEMBERS,
                 data=["1"],
                 columns=["admin"],
-                where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+                where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
                 title=title,
                 message="The member information has been updated."
             )
 
         # When the user is an admin
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=["0"],
             columns=["admin"],
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
             title=title,
             message="The member information has been updated."
         )
@@ -225,17 +225,17 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title,
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -243,7 +243,7 @@ class WorkspacesMembers:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        operator: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        operator: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -258,7 +258,7 @@ class WorkspacesMembers:
             )
 
         # Get the user value to change
-        user: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        user: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=user_id,
             workspace_id=workspace_id,
             title=title
@@ -268,21 +268,21 @@ class WorkspacesMembers:
 
         # When the user has the right to create a board
         if user[0]["board_creation_restriction"] == 0:
-            return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+            return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
                 table=CONST.TAB_WORKSPACES_MEMBERS,
                 data=["1"],
                 columns=["board_creation_restriction"],
-                where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+                where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
                 title=title,
                 message="The member information has been updated."
             )
 
         # When the user does not have the right to create a board
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=["0"],
             columns=["board_creation_restriction"],
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
             title=title,
             message="The member information has been updated."
         )
@@ -297,17 +297,17 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -315,7 +315,7 @@ class WorkspacesMembers:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        operator: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        operator: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -330,7 +330,7 @@ class WorkspacesMembers:
             )
 
         # Get the user value to change
-        user: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        user: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=user_id,
             workspace_id=workspace_id,
             title=title
@@ -340,21 +340,21 @@ class WorkspacesMembers:
 
         # When the user has the right to delete a board
         if user[0]["board_deletion_restriction"] == 0:
-            return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+            return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
                 table=CONST.TAB_WORKSPACES_MEMBERS,
                 data=["1"],
                 columns=["board_deletion_restriction"],
-                where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+                where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
                 title=title,
                 message="The member information has been updated."
             )
 
         # When the user does not have the right to deletion a board
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=["0"],
             columns=["board_deletion_restriction"],
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
             title=title,
             message="The member information has been updated."
         )
@@ -369,17 +369,17 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -387,7 +387,7 @@ class WorkspacesMembers:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        operator: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        operator: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -402,7 +402,7 @@ class WorkspacesMembers:
             )
 
         # Get the user value to change
-        user: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        user: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=user_id,
             workspace_id=workspace_id,
             title=title
@@ -412,21 +412,21 @@ class WorkspacesMembers:
 
         # When the user has the right to invite a user
         if user[0]["invitation_restriction"] == 0:
-            return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+            return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
                 table=CONST.TAB_WORKSPACES_MEMBERS,
                 data=["1"],
                 columns=["invitation_restriction"],
-                where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+                where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
                 title=title,
                 message="The member information has been updated."
             )
 
         # When the user does not have the right to invite a user
-        return self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
+        return await self.runtime_data_initialised.boilerplate_non_http_initialised.update_table_values(
             table=CONST.TAB_WORKSPACES_MEMBERS,
             data=["0"],
             columns=["invitation_restriction"],
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"],
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)],
             title=title,
             message="The member information has been updated."
         )
@@ -441,17 +441,17 @@ class WorkspacesMembers:
         token: str = self.runtime_data_initialised.boilerplate_incoming_initialised.get_token_if_present(
             request
         )
-        token_valid: bool = self.runtime_data_initialised.boilerplate_non_http_initialised.is_token_correct(
+        token_valid: bool = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_is_token_correct(
             token
         )
-        self.disp.log_debug(f"token = {token}, valid = {token_valid}", title)
+        self.disp.log_debug("token present = %s, valid = %s", title, token is not None, token_valid)
         if token_valid is False:
             return self.runtime_data_initialised.boilerplate_responses_initialised.unauthorized(
                 title=title
             )
 
         # Get the user id by the token
-        usr_id: Union[str, Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_user_id_from_token(
+        usr_id: Union[str, Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_user_id_from_token(
             title,
             token
         )
@@ -459,7 +459,7 @@ class WorkspacesMembers:
             return usr_id
 
         # Get the data of the workspace member to check his right
-        operator: Union[List[Dict[str, Any]], Response] = self.runtime_data_initialised.boilerplate_non_http_initialised.get_workspace_member(
+        operator: Union[List[Dict[str, Any]], Response] = await self.runtime_data_initialised.boilerplate_non_http_initialised.a_get_workspace_member(
             user_id=usr_id,
             workspace_id=workspace_id,
             title=title
@@ -474,9 +474,9 @@ class WorkspacesMembers:
             )
 
         # Delete the member
-        status: int = self.runtime_data_initialised.database_link.remove_data_from_table(
+        status: int = await self.runtime_data_initialised.database_link.a_remove_data_from_table(
             table=CONST.TAB_WORKSPACES_MEMBERS,
-            where=[f"user_id='{user_id}'", f"workspace_id='{workspace_id}'"]
+            where=[("user_id", "=", user_id), ("workspace_id", "=", workspace_id)]
         )
         if status == self.error:
             return self.runtime_data_initialised.boilerplate_responses_initialised.internal_server_error(
@@ -2,8 +2,12 @@
     This is the file in charge of storing the endpoints_initialised ready to be imported into the server class.
 """
 
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from typing import Any
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
+from . import constants as CONST
 from .runtime_data import RuntimeData
+from .lazy_endpoint import LazyEndpoint
 from .endpoints import (
     Bonus,
     UsersAuthentication,
@@ -18,7 +22,8 @@ from .endpoints import (
     CardManagement,
     CardsLabelManagement,
     Notifications,
-    OAuthAuthentication
+    OAuthAuthentication,
+    BoardEvents
 )
 
 class Endpoints:
@@ -33,7 +38,7 @@ class Endpoints:
         self.success: int = success
         self.error: int = error
         self.runtime_data_initialised: RuntimeData = runtime_data
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -42,89 +47,33 @@ class Endpoints:
             logger=self.__class__.__name__
         )
         # ------------------- Initialize endpoints sub-classes ------------------
-        self.bonus: Bonus = Bonus(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.users_authentication: UsersAuthentication = UsersAuthentication(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.oauth_authentication: OAuthAuthentication = OAuthAuthentication(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.user_management: UserManagement = UserManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.workspaces_management: WorkspacesManagement = WorkspacesManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.boards_management: BoardsManagement = BoardsManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.workspaces_invitations: WorkspacesInvitations = WorkspacesInvitations(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.workspaces_members: WorkspacesMembers = WorkspacesMembers(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.list_management: ListsManagement = ListsManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.activities_hitory: ActivitiesHistory = ActivitiesHistory(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.card_assignees: CardAssignees = CardAssignees(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.card_management: CardManagement = CardManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.card_label_management: CardsLabelManagement = CardsLabelManagement(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
-        )
-        self.notifications: Notifications = Notifications(
-            runtime_data=runtime_data,
-            success=success,
-            error=error,
-            debug=debug
+        # The classes are only built when one of their routes is first called
+        self.bonus: Bonus = self._lazy(Bonus)
+        self.users_authentication: UsersAuthentication = self._lazy(UsersAuthentication)
+        self.oauth_authentication: OAuthAuthentication = self._lazy(OAuthAuthentication)
+        self.user_management: UserManagement = self._lazy(UserManagement)
+        self.workspaces_management: WorkspacesManagement = self._lazy(WorkspacesManagement)
+        self.boards_management: BoardsManagement = self._lazy(BoardsManagement)
+        self.workspaces_invitations: WorkspacesInvitations = self._lazy(WorkspacesInvitations)
+        self.workspaces_members: WorkspacesMembers = self._lazy(WorkspacesMembers)
+        self.list_management: ListsManagement = self._lazy(ListsManagement)
+        self.activities_hitory: ActivitiesHistory = self._lazy(ActivitiesHistory)
+        self.card_assignees: CardAssignees = self._lazy(CardAssignees)
+        self.card_management: CardManagement = self._lazy(CardManagement)
+        self.card_label_management: CardsLabelManagement = self._lazy(CardsLabelManagement)
+        self.notifications: Notifications = self._lazy(Notifications)
+        self.board_events: BoardEvents = self._lazy(BoardEvents)
+
+    def _lazy(self, endpoint_class: type) -> Any:
+        """
+        Wrap an endpoint class so that it is built on the first call of one of its routes
+        """
+        return LazyEndpoint(
+            endpoint_class,
+            runtime_data=self.runtime_data_initialised,
+            success=self.success,
+            error=self.error,
+            debug=self.debug
         )
 
     def inject_routes(self) -> None:
@@ -138,6 +87,17 @@ class Endpoints:
         self.runtime_data_initialised.paths_initialised.add_path(
             "/api/v1/", self.bonus.get_hello_world, "GET"
         )
+        if CONST.METRICS_EXPOSE is True:
+            self.runtime_data_initialised.paths_initialised.add_path(
+                "/api/v1/stats/token_cache", self.bonus.get_token_cache_stats, "GET"
+            )
+            if CONST.METRICS_ENABLED is True:
+                self.runtime_data_initialised.paths_initialised.add_path(
+                    "/metrics", self.bonus.get_metrics, "GET"
+                )
+                self.runtime_data_initialised.paths_initialised.add_path(
+                    "/api/v1/stats/routes", self.bonus.get_route_stats, "GET"
+                )
 
         # Users authentication routes
         self.runtime_data_initialised.paths_initialised.add_path(
@@ -214,6 +174,15 @@ class Endpoints:
         self.runtime_data_initialised.paths_initialised.add_path(
             "/api/v1/board/{board_id}", self.boards_management.get_board_by_id, "GET"
         )
+        self.runtime_data_initialised.paths_initialised.add_path(
+            "/api/v1/board/{board_id}/full", self.boards_management.get_board_full, "GET"
+        )
+        self.runtime_data_initialised.paths_initialised.add_path(
+            "/api/v1/board/{board_id}/version", self.boards_management.get_board_version, "GET"
+        )
+        self.runtime_data_initialised.paths_initialised.add_path(
+            "/api/v1/board/{board_id}/events", self.board_events.board_events, "WEBSOCKET"
+        )
         self.runtime_data_initialised.paths_initialised.add_path(
             "/api/v1/workspace/{workspace_id}/board", self.boards_management.create_board, "POST"
         )
@@ -359,6 +328,9 @@ class Endpoints:
         self.runtime_data_initialised.paths_initialised.add_path(
             "/api/v1/my_notifications", self.notifications.get_user_notifications, "GET"
         )
+        self.runtime_data_initialised.paths_initialised.add_path(
+            "/api/v1/my_notifications/stream", self.notifications.stream_user_notifications, "GET"
+        )
         self.runtime_data_initialised.paths_initialised.add_path(
             "/api/v1/user/{user_id}/notification", self.notifications.add_user_notification, "POST"
         )
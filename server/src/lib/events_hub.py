@@ -0,0 +1,279 @@
+"""
+    File containing the in-process publish/subscribe hub used to push changes to the connected clients.
+"""
+
+import asyncio
+import threading
+from typing import Union, Dict, Any, List, Set, TYPE_CHECKING
+
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
+
+from . import constants as CONST
+if TYPE_CHECKING:
+    from .events_relay import EventsRelayClient
+
+
+class EventsSubscription:
+    """
+    The queue of events waiting to be sent to a single connected client.
+    """
+
+    def __init__(self, topic: str, max_size: int) -> None:
+        """
+            Constructor (must be called from the event loop the client is served on).
+
+        Args:
+            topic (str): The topic the client listens to (a board id, a user id...)
+            max_size (int): The maximum amount of events waiting to be sent.
+        """
+        self.topic: str = topic
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_size))
+        self.dropped: int = 0
+
+    def push(self, event: Dict[str, Any]) -> None:
+        """
+            Queue an event, a client that cannot keep up is asked to reload its data instead.
+
+        Args:
+            event (Dict[str, Any]): The event to send.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            while self.queue.empty() is False:
+                self.queue.get_nowait()
+            self.queue.put_nowait(
+                {CONST.EVENT_TYPE_KEY: CONST.EVENT_RESYNC, CONST.EVENT_DATA_KEY: None}
+            )
+
+    async def get(self) -> Dict[str, Any]:
+        """
+            Wait for the next event.
+
+        Returns:
+            Dict[str, Any]: The next event to send.
+        """
+        return await self.queue.get()
+
+
+class EventsHub:
+    """
+    The class in charge of dispatching the published events to the subscribers of a topic.
+    """
+
+    def __init__(self, queue_size: int = 100, error: int = 84, success: int = 0, debug: bool = False) -> None:
+        """
+            Constructor
+
+        Args:
+            queue_size (int, optional): . Defaults to 100.: The maximum amount of events waiting to be sent to a client.
+            error (int, optional): . Defaults to 84.
+            success (int, optional): . Defaults to 0.
+            debug (bool, optional): . Defaults to False.
+        """
+        self.debug: bool = debug
+        self.success: int = success
+        self.error: int = error
+        self.queue_size: int = max(1, int(queue_size))
+        # ------------------------ The logging function ------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            FILE_DESCRIPTOR,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ------------------------ The subscribers list ------------------------
+        self._lock: threading.Lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[EventsSubscription]] = {}
+        self.published: int = 0
+        # ------------- The link to the other workers (if there are) -----------
+        self.relay: Union['EventsRelayClient', None] = None
+        self.relay_channel: str = ""
+
+    def set_relay(self, relay: 'EventsRelayClient', channel: str) -> None:
+        """
+            Share the events of the hub with the hubs of the other workers.
+
+        Args:
+            relay (EventsRelayClient): The connection to the relay of the supervisor.
+            channel (str): The name the events of this hub are relayed under.
+        """
+        self.relay = relay
+        self.relay_channel = channel
+        relay.register(channel, self._deliver_relayed)
+        with self._lock:
+            topics = list(self._subscriptions)
+        for topic in topics:
+            relay.advertise(channel, topic, True)
+
+    def _deliver_relayed(self, payload: Dict[str, Any]) -> int:
+        """
+            Send an event published by another worker to the local subscribers.
+
+        Args:
+            payload (Dict[str, Any]): The relayed event.
+
+        Returns:
+            int: The number of subscribers the event was sent to.
+        """
+        if payload.get(CONST.EVENT_TOPIC_KEY) is None:
+            return 0
+        return self.deliver(
+            payload[CONST.EVENT_TOPIC_KEY],
+            payload.get(CONST.EVENT_TYPE_KEY),
+            payload.get(CONST.EVENT_DATA_KEY),
+            payload.get(CONST.EVENT_ID_KEY)
+        )
+
+    def subscribe(self, topic: Union[str, int]) -> EventsSubscription:
+        """
+            Start listening to a topic (must be called from the event loop of the client).
+
+        Args:
+            topic (Union[str, int]): The topic to listen to.
+
+        Returns:
+            EventsSubscription: The queue the events of the topic are sent to.
+        """
+        subscription = EventsSubscription(str(topic), self.queue_size)
+        with self._lock:
+            first = subscription.topic not in self._subscriptions
+            self._subscriptions.setdefault(subscription.topic, set()).add(
+                subscription
+            )
+            if first is True and self.relay is not None:
+                self.relay.advertise(self.relay_channel, subscription.topic, True)
+        self.disp.log_debug("New subscriber on '%s'.", "subscribe", topic)
+        return subscription
+
+    def unsubscribe(self, subscription: EventsSubscription) -> int:
+        """
+            Stop listening to a topic.
+
+        Args:
+            subscription (EventsSubscription): The subscription returned by subscribe.
+
+        Returns:
+            int: self.success if the subscription was active, self.error otherwise
+        """
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.topic)
+            if subscribers is None or subscription not in subscribers:
+                return self.error
+            subscribers.discard(subscription)
+            if len(subscribers) == 0:
+                self._subscriptions.pop(subscription.topic, None)
+                if self.relay is not None:
+                    self.relay.advertise(self.relay_channel, subscription.topic, False)
+        self.disp.log_debug(
+            "Subscriber left '%s'.", "unsubscribe", subscription.topic
+        )
+        return self.success
+
+    def has_subscribers(self, topic: Union[str, int, None] = None) -> bool:
+        """
+            Check if anyone is listening (to a topic or at all).
+
+        Args:
+            topic (Union[str, int, None], optional): . Defaults to None.: The topic to check, every topic if None.
+
+        Returns:
+            bool: True if at least one client, on this worker or on another one, would receive an event.
+        """
+        with self._lock:
+            if topic is None and len(self._subscriptions) > 0:
+                return True
+            if topic is not None and str(topic) in self._subscriptions:
+                return True
+        if self.relay is None:
+            return False
+        return self.relay.has_remote_topic(self.relay_channel, topic)
+
+    def publish(self, topic: Union[str, int], event: str, data: Any = None, event_id: Union[str, int, None] = None) -> int:
+        """
+            Send an event to every subscriber of a topic, on this worker and on the others (can be called from any thread).
+            The event only goes through the relay when another worker has a subscriber for the topic.
+
+        Args:
+            topic (Union[str, int]): The topic of the event.
+            event (str): The kind of event (card.created, list.moved...)
+            data (Any, optional): . Defaults to None.: The content of the event (must be json serialisable).
+            event_id (Union[str, int, None], optional): . Defaults to None.: The identifier of the event, if any.
+
+        Returns:
+            int: The number of subscribers of this worker the event was sent to.
+        """
+        if self.relay is not None and self.relay.has_remote_topic(self.relay_channel, topic) is True:
+            payload: Dict[str, Any] = {
+                CONST.EVENT_TYPE_KEY: event,
+                CONST.EVENT_TOPIC_KEY: str(topic),
+                CONST.EVENT_DATA_KEY: data
+            }
+            if event_id is not None:
+                payload[CONST.EVENT_ID_KEY] = event_id
+            self.relay.send(self.relay_channel, payload)
+        return self.deliver(topic, event, data, event_id)
+
+    def deliver(self, topic: Union[str, int], event: str, data: Any = None, event_id: Union[str, int, None] = None) -> int:
+        """
+            Send an event to the subscribers of a topic connected to this worker (can be called from any thread).
+
+        Args:
+            topic (Union[str, int]): The topic of the event.
+            event (str): The kind of event (card.created, list.moved...)
+            data (Any, optional): . Defaults to None.: The content of the event (must be json serialisable).
+            event_id (Union[str, int, None], optional): . Defaults to None.: The identifier of the event, if any.
+
+        Returns:
+            int: The number of subscribers the event was sent to.
+        """
+        with self._lock:
+            subscribers: List[EventsSubscription] = list(
+                self._subscriptions.get(str(topic), ())
+            )
+        if len(subscribers) == 0:
+            return 0
+        payload: Dict[str, Any] = {
+            CONST.EVENT_TYPE_KEY: event,
+            CONST.EVENT_TOPIC_KEY: str(topic),
+            CONST.EVENT_DATA_KEY: data
+        }
+        if event_id is not None:
+            payload[CONST.EVENT_ID_KEY] = event_id
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for subscription in subscribers:
+            if subscription.loop is current_loop:
+                subscription.push(payload)
+            elif subscription.loop.is_closed() is False:
+                subscription.loop.call_soon_threadsafe(
+                    subscription.push, payload
+                )
+        self.published += 1
+        self.disp.log_debug(
+            "Event '%s' sent to %s subscriber(s) of '%s'.",
+            "publish", event, len(subscribers), topic
+        )
+        return len(subscribers)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+            Get the usage counters of the hub.
+
+        Returns:
+            Dict[str, int]: The amount of topics, subscribers and published events.
+        """
+        with self._lock:
+            return {
+                "topics": len(self._subscriptions),
+                "subscribers": sum(len(i) for i in self._subscriptions.values()),
+                "published": self.published,
+                "queue_size": self.queue_size
+            }
@@ -0,0 +1,565 @@
+"""
+    File containing the relay that forwards the in-process messages (hub events, token invalidations) between the worker processes.
+    The supervisor runs the relay server on the loopback interface, every worker connects to it and receives what the other workers send.
+    A worker proves it was started by the supervisor with the secret of the run, then advertises the topics its clients listen to,
+    so that an event is only sent to the workers that have a subscriber for its topic.
+"""
+
+import hmac
+import json
+import queue
+import socket
+import threading
+from typing import Union, Dict, Any, List, Set, Tuple, Callable
+
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
+
+from .http_codes import HCI
+
+RELAY_CHANNEL_KEY: str = "channel"
+RELAY_PAYLOAD_KEY: str = "payload"
+RELAY_SECRET_KEY: str = "secret"
+RELAY_TOPIC_KEY: str = "topic"
+
+# The channel of the messages exchanged with the relay itself (topic advertisements)
+RELAY_CONTROL_CHANNEL: str = "relay"
+RELAY_ACTION_KEY: str = "action"
+RELAY_COUNT_KEY: str = "count"
+RELAY_ACTION_SUBSCRIBE: str = "subscribe"
+RELAY_ACTION_UNSUBSCRIBE: str = "unsubscribe"
+RELAY_ACTION_TOPIC_COUNT: str = "topic_count"
+
+# The time a new connection has to send the secret (in seconds)
+RELAY_AUTH_TIMEOUT: float = 5.0
+
+
+class EventsRelayServer:
+    """
+    The relay run by the supervisor, every line sent by a worker is copied to the other workers.
+    """
+
+    def __init__(self, secret: str, host: str = "127.0.0.1", port: int = 0, error: int = 84, success: int = 0, debug: bool = False) -> None:
+        """
+            Constructor
+
+        Args:
+            secret (str): The secret the workers must send before anything else (shared through the worker settings).
+            host (str, optional): . Defaults to "127.0.0.1".: The address to listen on (keep it on the loopback interface).
+            port (int, optional): . Defaults to 0.: The port to listen on (0 lets the system pick a free one).
+            error (int, optional): . Defaults to 84.
+            success (int, optional): . Defaults to 0.
+            debug (bool, optional): . Defaults to False.
+        """
+        self.debug: bool = debug
+        self.success: int = success
+        self.error: int = error
+        self.secret: str = secret
+        self.host: str = host
+        self.port: int = port
+        # ------------------------ The logging function ------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            FILE_DESCRIPTOR,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ------------------------ The connected workers -----------------------
+        self._lock: threading.Lock = threading.Lock()
+        self._clients: List[socket.socket] = []
+        # Each connection is written by several serving threads, a line must be sent whole
+        self._send_locks: Dict[socket.socket, threading.Lock] = {}
+        self._listener: Union[socket.socket, None] = None
+        self.relayed: int = 0
+        # ------------- The topics the clients of each worker listen to ---------
+        self._client_topics: Dict[socket.socket, Set[Tuple[str, str]]] = {}
+        self._topic_counts: Dict[Tuple[str, str], int] = {}
+
+    def start(self) -> int:
+        """
+            Start listening for the workers (in a background thread).
+
+        Returns:
+            int: self.success if the relay is listening, self.error otherwise
+        """
+        title = "start"
+        try:
+            self._listener = socket.create_server((self.host, self.port))
+        except OSError as e:
+            self.disp.log_error(f"Could not start the events relay: {e}", title)
+            return self.error
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(
+            target=self._accept_loop, name="events_relay", daemon=True
+        ).start()
+        self.disp.log_info(
+            f"Events relay listening on {self.host}:{self.port}.", title
+        )
+        return self.success
+
+    def _accept_loop(self) -> None:
+        """
+            Accept the workers until the relay is stopped.
+        """
+        while self._listener is not None:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=self._serve_client, args=(client,), name="events_relay_client", daemon=True
+            ).start()
+
+    def _is_authenticated(self, line: bytes) -> bool:
+        """
+            Check the first line sent by a connection.
+
+        Args:
+            line (bytes): The line (a json document holding the secret).
+
+        Returns:
+            bool: True if the connection knows the secret of the run.
+        """
+        try:
+            secret = json.loads(line).get(RELAY_SECRET_KEY)
+        except (ValueError, AttributeError):
+            return False
+        if isinstance(secret, str) is False:
+            return False
+        return hmac.compare_digest(secret.encode("utf-8"), self.secret.encode("utf-8"))
+
+    def _serve_client(self, client: socket.socket) -> None:
+        """
+            Check the secret of a worker, then route every message it sends.
+
+        Args:
+            client (socket.socket): The connection of the worker.
+        """
+        title = "_serve_client"
+        try:
+            with client.makefile("rb") as stream:
+                client.settimeout(RELAY_AUTH_TIMEOUT)
+                if self._is_authenticated(stream.readline()) is False:
+                    self.disp.log_warning(
+                        "Refused a connection that did not send the relay secret.", title
+                    )
+                    return
+                client.settimeout(None)
+                send_lock = threading.Lock()
+                # The snapshot is sent before any later count update (they wait for the send lock)
+                with send_lock:
+                    with self._lock:
+                        self._clients.append(client)
+                        self._client_topics[client] = set()
+                        self._send_locks[client] = send_lock
+                        counts = list(self._topic_counts.items())
+                    for (channel, topic), count in counts:
+                        client.sendall(
+                            self._topic_count_line(channel, topic, count)
+                        )
+                for line in stream:
+                    self._route(line, client)
+        except OSError as e:
+            self.disp.log_debug("A worker left the relay: %s", title, e)
+        finally:
+            self._drop(client)
+
+    def _route(self, line: bytes, sender: socket.socket) -> None:
+        """
+            Handle a topic advertisement, or send a message to the workers that listen to its topic.
+
+        Args:
+            line (bytes): The message (a json document followed by a new line).
+            sender (socket.socket): The connection the message came from.
+        """
+        try:
+            message = json.loads(line)
+            channel = message.get(RELAY_CHANNEL_KEY)
+            payload = message.get(RELAY_PAYLOAD_KEY) or {}
+            topic = payload.get(RELAY_TOPIC_KEY)
+        except (ValueError, AttributeError):
+            self.disp.log_error("Invalid message sent to the relay.", "_route")
+            return
+        if channel == RELAY_CONTROL_CHANNEL:
+            self._update_topics(sender, payload)
+            return
+        with self._lock:
+            if topic is None:
+                clients = [i for i in self._clients if i is not sender]
+            else:
+                key = (channel, str(topic))
+                clients = [
+                    i for i in self._clients
+                    if i is not sender and key in self._client_topics.get(i, ())
+                ]
+        for client in clients:
+            self._send(client, line)
+        self.relayed += 1
+
+    def _update_topics(self, client: socket.socket, payload: Dict[str, Any]) -> None:
+        """
+            Remember that a worker started or stopped listening to a topic and tell the workers the new count.
+
+        Args:
+            client (socket.socket): The connection of the worker.
+            payload (Dict[str, Any]): The advertisement ({"action": ..., "channel": ..., "topic": ...}).
+        """
+        key = (str(payload.get(RELAY_CHANNEL_KEY)), str(payload.get(RELAY_TOPIC_KEY)))
+        action = payload.get(RELAY_ACTION_KEY)
+        with self._lock:
+            topics = self._client_topics.get(client)
+            if topics is None:
+                return
+            if action == RELAY_ACTION_SUBSCRIBE and key not in topics:
+                topics.add(key)
+                self._topic_counts[key] = self._topic_counts.get(key, 0) + 1
+            elif action == RELAY_ACTION_UNSUBSCRIBE and key in topics:
+                topics.discard(key)
+                self._topic_counts[key] -= 1
+            else:
+                return
+            count = self._topic_counts[key]
+            if count == 0:
+                self._topic_counts.pop(key, None)
+            clients = list(self._clients)
+        line = self._topic_count_line(key[0], key[1], count)
+        for i in clients:
+            self._send(i, line)
+
+    @staticmethod
+    def _topic_count_line(channel: str, topic: str, count: int) -> bytes:
+        """
+            Build the message telling the workers how many of them listen to a topic.
+
+        Args:
+            channel (str): The channel of the topic.
+            topic (str): The topic.
+            count (int): The number of workers with at least one subscriber.
+
+        Returns:
+            bytes: The message (a json document followed by a new line).
+        """
+        return (HCI.json_text({
+            RELAY_CHANNEL_KEY: RELAY_CONTROL_CHANNEL,
+            RELAY_PAYLOAD_KEY: {
+                RELAY_ACTION_KEY: RELAY_ACTION_TOPIC_COUNT,
+                RELAY_CHANNEL_KEY: channel,
+                RELAY_TOPIC_KEY: topic,
+                RELAY_COUNT_KEY: count
+            }
+        }) + "\n").encode("utf-8")
+
+    def _send(self, client: socket.socket, line: bytes) -> None:
+        """
+            Send a line to a worker (one writer at a time per connection), forget the worker if it is gone.
+
+        Args:
+            client (socket.socket): The connection of the worker.
+            line (bytes): The message (a json document followed by a new line).
+        """
+        with self._lock:
+            send_lock = self._send_locks.get(client)
+        if send_lock is None:
+            return
+        try:
+            with send_lock:
+                client.sendall(line)
+        except OSError:
+            self._drop(client)
+
+    def _drop(self, client: socket.socket) -> None:
+        """
+            Forget a worker connection.
+
+        Args:
+            client (socket.socket): The connection to close.
+        """
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            self._send_locks.pop(client, None)
+            topics = self._client_topics.pop(client, set())
+            counts: List[Tuple[Tuple[str, str], int]] = []
+            for key in topics:
+                self._topic_counts[key] -= 1
+                counts.append((key, self._topic_counts[key]))
+                if self._topic_counts[key] == 0:
+                    self._topic_counts.pop(key, None)
+            clients = list(self._clients)
+        for (channel, topic), count in counts:
+            line = self._topic_count_line(channel, topic, count)
+            for i in clients:
+                self._send(i, line)
+        try:
+            client.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        client.close()
+
+    def stop(self) -> int:
+        """
+            Close the relay and the worker connections.
+
+        Returns:
+            int: self.success
+        """
+        listener = self._listener
+        self._listener = None
+        if listener is not None:
+            listener.close()
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            self._drop(client)
+        return self.success
+
+
+class EventsRelayClient:
+    """
+    The connection of a worker to the relay of the supervisor.
+    """
+
+    def __init__(self, host: str, port: int, secret: str, error: int = 84, success: int = 0, debug: bool = False) -> None:
+        """
+            Constructor
+
+        Args:
+            host (str): The address of the relay.
+            port (int): The port of the relay.
+            secret (str): The secret of the run (given by the supervisor).
+            error (int, optional): . Defaults to 84.
+            success (int, optional): . Defaults to 0.
+            debug (bool, optional): . Defaults to False.
+        """
+        self.debug: bool = debug
+        self.success: int = success
+        self.error: int = error
+        self.host: str = host
+        self.port: int = int(port)
+        self.secret: str = secret
+        # ------------------------ The logging function ------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            FILE_DESCRIPTOR,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # --------------------- The handlers of each channel -------------------
+        self._lock: threading.Lock = threading.Lock()
+        self._socket: Union[socket.socket, None] = None
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        # ------ The lines waiting to be written (by the writer thread) --------
+        self._outgoing: queue.SimpleQueue = queue.SimpleQueue()
+        # ----------- The topics listened to on this and the other workers ------
+        self._advertised: Set[Tuple[str, str]] = set()
+        self._topic_counts: Dict[Tuple[str, str], int] = {}
+
+    def connect(self) -> int:
+        """
+            Connect to the relay and start reading the messages of the other workers (in a background thread).
+
+        Returns:
+            int: self.success if the worker is connected, self.error otherwise
+        """
+        title = "connect"
+        try:
+            self._socket = socket.create_connection((self.host, self.port))
+            self._socket.sendall(self._encode({RELAY_SECRET_KEY: self.secret}))
+        except OSError as e:
+            self.disp.log_error(
+                f"Could not reach the events relay on {self.host}:{self.port}: {e}", title
+            )
+            self._socket = None
+            return self.error
+        threading.Thread(
+            target=self._read_loop, args=(self._socket,), name="events_relay_reader", daemon=True
+        ).start()
+        threading.Thread(
+            target=self._write_loop, args=(self._socket,), name="events_relay_writer", daemon=True
+        ).start()
+        self.disp.log_debug(
+            "Connected to the events relay on %s:%s.", title, self.host, self.port
+        )
+        return self.success
+
+    def is_connected(self) -> bool:
+        """
+            Check if the worker is connected to the relay.
+
+        Returns:
+            bool: True if the messages are shared with the other workers.
+        """
+        return self._socket is not None
+
+    def register(self, channel: str, handler: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+            Set the function called (from the reader thread) with the payloads received on a channel.
+
+        Args:
+            channel (str): The name of the channel (i.e. "board_events").
+            handler (Callable[[Dict[str, Any]], Any]): The function receiving the payloads.
+        """
+        self._handlers[channel] = handler
+
+    def advertise(self, channel: str, topic: Union[str, int], listening: bool) -> int:
+        """
+            Tell the relay that this worker started or stopped having subscribers for a topic.
+
+        Args:
+            channel (str): The name of the channel.
+            topic (Union[str, int]): The topic (a board id, a user id...)
+            listening (bool): True when the first local subscriber arrives, False when the last one leaves.
+
+        Returns:
+            int: self.success if the advertisement was queued, self.error otherwise
+        """
+        key = (channel, str(topic))
+        with self._lock:
+            if listening is True:
+                self._advertised.add(key)
+            else:
+                self._advertised.discard(key)
+        return self.send(RELAY_CONTROL_CHANNEL, {
+            RELAY_ACTION_KEY: RELAY_ACTION_SUBSCRIBE if listening is True else RELAY_ACTION_UNSUBSCRIBE,
+            RELAY_CHANNEL_KEY: channel,
+            RELAY_TOPIC_KEY: key[1]
+        })
+
+    def has_remote_topic(self, channel: str, topic: Union[str, int, None] = None) -> bool:
+        """
+            Check if another worker has subscribers for a topic (as last reported by the relay).
+
+        Args:
+            channel (str): The name of the channel.
+            topic (Union[str, int, None], optional): . Defaults to None.: The topic to check, every topic of the channel if None.
+
+        Returns:
+            bool: True if an event of the topic would reach a client of another worker.
+        """
+        if self._socket is None:
+            return False
+        with self._lock:
+            for key, count in self._topic_counts.items():
+                if key[0] != channel or (topic is not None and key[1] != str(topic)):
+                    continue
+                if count - (1 if key in self._advertised else 0) > 0:
+                    return True
+        return False
+
+    def _update_topic_count(self, payload: Dict[str, Any]) -> None:
+        """
+            Store the number of workers listening to a topic (sent by the relay).
+
+        Args:
+            payload (Dict[str, Any]): The update ({"action": "topic_count", "channel": ..., "topic": ..., "count": ...}).
+        """
+        if payload.get(RELAY_ACTION_KEY) != RELAY_ACTION_TOPIC_COUNT:
+            return
+        key = (str(payload.get(RELAY_CHANNEL_KEY)), str(payload.get(RELAY_TOPIC_KEY)))
+        count = int(payload.get(RELAY_COUNT_KEY) or 0)
+        with self._lock:
+            if count > 0:
+                self._topic_counts[key] = count
+            else:
+                self._topic_counts.pop(key, None)
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> bytes:
+        """
+            Serialise a message sent to the relay.
+
+        Args:
+            message (Dict[str, Any]): The message.
+
+        Returns:
+            bytes: The json document followed by a new line.
+        """
+        return (HCI.json_text(message) + "\n").encode("utf-8")
+
+    def send(self, channel: str, payload: Dict[str, Any]) -> int:
+        """
+            Send a payload to the other workers (the line is written by the writer thread, so this never blocks the event loop).
+
+        Args:
+            channel (str): The name of the channel.
+            payload (Dict[str, Any]): The content to send (serialised like the http bodies).
+
+        Returns:
+            int: self.success if the payload was queued, self.error otherwise
+        """
+        if self._socket is None:
+            return self.error
+        self._outgoing.put(
+            self._encode({RELAY_CHANNEL_KEY: channel, RELAY_PAYLOAD_KEY: payload})
+        )
+        return self.success
+
+    def _write_loop(self, sock: socket.socket) -> None:
+        """
+            Write the queued lines to the relay until the connection is closed.
+
+        Args:
+            sock (socket.socket): The connection to the relay.
+        """
+        while self._socket is sock:
+            line = self._outgoing.get()
+            if line is None:
+                return
+            try:
+                sock.sendall(line)
+            except OSError as e:
+                self.disp.log_error(f"Lost the events relay: {e}", "_write_loop")
+                self.close()
+                return
+
+    def _read_loop(self, sock: socket.socket) -> None:
+        """
+            Hand the messages of the other workers to the handler of their channel.
+
+        Args:
+            sock (socket.socket): The connection to the relay.
+        """
+        title = "_read_loop"
+        try:
+            with sock.makefile("rb") as stream:
+                for line in stream:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        self.disp.log_error("Invalid relayed message.", title)
+                        continue
+                    if message.get(RELAY_CHANNEL_KEY) == RELAY_CONTROL_CHANNEL:
+                        self._update_topic_count(message.get(RELAY_PAYLOAD_KEY) or {})
+                        continue
+                    handler = self._handlers.get(message.get(RELAY_CHANNEL_KEY))
+                    if handler is not None:
+                        handler(message.get(RELAY_PAYLOAD_KEY) or {})
+        except OSError as e:
+            self.disp.log_debug("The events relay closed: %s", title, e)
+        if self._socket is sock:
+            self.disp.log_warning(
+                "The events relay is gone, the events stay on this worker.", title
+            )
+            self.close()
+
+    def close(self) -> int:
+        """
+            Disconnect from the relay.
+
+        Returns:
+            int: self.success
+        """
+        sock = self._socket
+        self._socket = None
+        if sock is not None:
+            self._outgoing.put(None)
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        return self.success
@@ -3,8 +3,18 @@ The file that contains every possible http code for sending response
 """
 
 import json
-from typing import Mapping, Union, Dict, Any
+import hashlib
+from time import perf_counter
+from decimal import Decimal
+from datetime import date, time, timedelta
+from typing import Mapping, Union, Dict, Any, Callable
 from fastapi import Response
+from .request_timing import record_dependency_time, DEPENDENCY_SERIALISATION
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class HttpCodes:
     """
@@ -17,7 +27,9 @@ class HttpCodes:
     * The 5xx: Server error
     """
 
-    def __init__(self) -> None:
+    def __init__(self, json_serialiser: Union[str, Callable[[Any], Union[str, bytes]]] = "auto") -> None:
+        self.json_dumps: Callable[[Any], Union[str, bytes]] = self._json_dumps_standard
+        self.set_json_serialiser(json_serialiser)
         self.authorised_statuses = [
             100, 101, 102, 103, 110,
             200, 201, 202, 203, 204, 205,
@@ -146,10 +158,107 @@ class HttpCodes:
         """
         if data is None:
             return ""
-        if data_type == self.data_types['json'] and isinstance(data, Dict):
-            return json.dumps(data)
+        if isinstance(data, bytes):
+            return data
+        if data_type == self.data_types['json'] and isinstance(data, (Dict, list)):
+            start = perf_counter()
+            body = self.json_dumps(data)
+            record_dependency_time(
+                DEPENDENCY_SERIALISATION, perf_counter() - start
+            )
+            return body
         return str(data)
 
+    def set_json_serialiser(self, json_serialiser: Union[str, Callable[[Any], Union[str, bytes]]] = "auto") -> bool:
+        """
+        Function in charge of choosing the function that turns the json bodies into text.
+
+        Args:
+            json_serialiser (Union[str, Callable[[Any], Union[str, bytes]]], optional): . Defaults to "auto".: "orjson", "json", "auto" (orjson when installed) or a function taking the body and returning str or bytes.
+
+        Returns:
+            bool: : True if the requested serialiser is used, False if the standard json module was used instead.
+        """
+        if callable(json_serialiser) is True:
+            self.json_dumps = json_serialiser
+            return True
+        name = str(json_serialiser).lower()
+        if name in ("auto", "orjson") and orjson is not None:
+            self.json_dumps = self._json_dumps_orjson
+            return True
+        self.json_dumps = self._json_dumps_standard
+        return name in ("auto", "json")
+
+    def json_text(self, data: Any) -> str:
+        """
+        Function in charge of serialising data with the current serialiser for the channels that need text (websockets, server-sent events).
+
+        Args:
+            data (Any): : The data to serialise.
+
+        Returns:
+            str: : The json text.
+        """
+        text = self.json_dumps(data)
+        if isinstance(text, bytes):
+            return text.decode("utf-8")
+        return text
+
+    def _json_dumps_orjson(self, data: Any) -> bytes:
+        """
+        Function in charge of serialising a body with orjson (dates and datetimes are handled natively).
+
+        Args:
+            data (Any): : The body to serialise.
+
+        Returns:
+            bytes: : The utf-8 json text.
+        """
+        return orjson.dumps(
+            data, default=self._json_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def _json_dumps_standard(self, data: Any) -> str:
+        """
+        Function in charge of serialising a body with the standard json module.
+
+        Args:
+            data (Any): : The body to serialise.
+
+        Returns:
+            str: : The json text.
+        """
+        return json.dumps(data, default=self._json_default)
+
+    def _json_default(self, item: Any) -> Any:
+        """
+        Function in charge of converting the objects that json cannot serialise by itself (sql rows, dates, decimals...).
+
+        Args:
+            item (Any): : The object to convert.
+
+        Raises:
+            TypeError: : If the object cannot be converted.
+
+        Returns:
+            Any: : A json serialisable version of the object.
+        """
+        if hasattr(item, "to_dict") is True:
+            return item.to_dict()
+        if isinstance(item, (date, time)):
+            return item.isoformat()
+        if isinstance(item, Decimal):
+            if item == item.to_integral_value():
+                return int(item)
+            return float(item)
+        if isinstance(item, timedelta):
+            return item.total_seconds()
+        if isinstance(item, (set, frozenset, tuple)):
+            return list(item)
+        raise TypeError(
+            f"Object of type {type(item).__name__} is not JSON serializable"
+        )
+
     def send_message_on_status(self, status: int = 200, content: Any = {'msg': 'message'}, content_type: str = "JSON", headers: Mapping[str, str] = None) -> Response:
         """
         A generic function in charge of sending a message with a status.
@@ -177,6 +286,71 @@ class HttpCodes:
 
         return Response(status_code=status, content=data, media_type=data_type, headers=data_header)
 
+    # """ Conditional responses (ETag / If-None-Match) """
+
+    def compute_etag(self, data: Union[str, bytes]) -> str:
+        """
+        Function in charge of computing the weak ETag of a serialised body.
+
+        Args:
+            data (Union[str, bytes]): : The body that is going to be sent.
+
+        Returns:
+            str: : The ETag (a short hash of the body).
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return f'W/"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+    def etag_matches(self, etag: str, if_none_match: Union[str, None] = None) -> bool:
+        """
+        Function in charge of checking if one of the ETags sent by the client matches the current one (weak comparison).
+
+        Args:
+            etag (str): : The ETag of the current version of the resource.
+            if_none_match (Union[str, None], optional): . Defaults to None.: The content of the If-None-Match header.
+
+        Returns:
+            bool: : True if the client already has this version.
+        """
+        if if_none_match is None or if_none_match.strip() == "":
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        current = etag.removeprefix("W/")
+        for candidate in if_none_match.split(","):
+            if candidate.strip().removeprefix("W/") == current:
+                return True
+        return False
+
+    def send_message_with_etag(self, if_none_match: Union[str, None] = None, status: int = 200, content: Any = {'msg': 'message'}, content_type: str = "JSON", headers: Mapping[str, str] = None, etag: Union[str, None] = None) -> Response:
+        """
+        A function in charge of sending a message with its ETag, or a 304 without a body if the client already has it.
+
+        Args:
+            if_none_match (Union[str, None], optional): The content of the If-None-Match header. Defaults to None.
+            status (int, optional): HTTP status code. Defaults to 200.
+            content (Any, optional): The content to send. Defaults to None.
+            content_type (str, optional): The type of the content. Defaults to "JSON".
+            headers (Mapping[str, str], optional): The headers. Defaults to None.
+            etag (Union[str, None], optional): A version based ETag, the content is not serialised on a match. Defaults to None (hash of the body).
+
+        Returns:
+            Response: FastAPI response object.
+        """
+        data_header = dict(self._check_header(headers))
+        if etag is not None and self.etag_matches(etag, if_none_match) is True:
+            data_header["ETag"] = etag
+            return Response(status_code=304, headers=data_header)
+        data_type = self._check_data_type(content_type)
+        data = self._process_data_content(content, data_type)
+        if etag is None:
+            etag = self.compute_etag(data)
+        data_header["ETag"] = etag
+        if self.etag_matches(etag, if_none_match) is True:
+            return Response(status_code=304, headers=data_header)
+        return self.send_message_on_status(status=status, content=data, content_type=data_type, headers=data_header)
+
     # """ 1xx informational response"""
 
     def send_continue(self, content: Any = {'msg': 'message'}, content_type: str = "JSON", headers: Mapping[str, str] = None) -> Response:
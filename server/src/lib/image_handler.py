@@ -7,7 +7,8 @@ import tempfile
 import uuid
 from typing import Union, List
 from fastapi import Response, UploadFile
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 from . import constants as CONST
 from .runtime_data import RuntimeData
 
@@ -23,7 +24,7 @@ class ImageHandler:
         self.success: int = success
         self.error: int = error
         self.runtime_data_initialised: RuntimeData = runtime_data
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -37,7 +38,7 @@ class ImageHandler:
         A generic function to upload an image
         """
         # Vérify if the bucket exist, if not the code create it
-        self.disp.log_debug(f"Given file={file}", title)
+        self.disp.log_debug("Given file=%s", title, file)
         buckets_list: Union[List[str], int] = self.runtime_data_initialised.bucket_link.get_bucket_names()
         if buckets_list == self.error or bucket_name not in buckets_list:
             creation_status: int = self.runtime_data_initialised.bucket_link.create_bucket(
@@ -48,10 +49,10 @@ class ImageHandler:
                     title=title
                 )
         filename = file.filename
-        self.disp.log_debug(f"File={file}", title)
+        self.disp.log_debug("File=%s", title, file)
         extension = "."
         extension += filename.split(".")[-1]
-        self.disp.log_debug(f"Extension={extension}", title)
+        self.disp.log_debug("Extension=%s", title, extension)
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             file_content = await file.read()
             temp_file.write(file_content)
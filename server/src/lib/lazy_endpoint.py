@@ -0,0 +1,89 @@
+"""
+    File containing the proxy that delays the creation of an endpoint class until one of its routes is called.
+"""
+
+import inspect
+import functools
+import threading
+from typing import Union, Dict, Any, Callable
+
+
+class LazyEndpoint:
+    """
+    Stand-in for an endpoint class: the routes are registered with handlers that have the signature of the real methods,
+    the class itself (and its logger) is only built when the first request reaches one of them.
+    """
+
+    def __init__(self, endpoint_class: type, **kwargs: Any) -> None:
+        """
+            Constructor
+
+        Args:
+            endpoint_class (type): The endpoint class to build on first use.
+            kwargs (Any): The arguments given to the constructor of the class.
+        """
+        self._endpoint_class: type = endpoint_class
+        self._kwargs: Dict[str, Any] = kwargs
+        self._instance: Union[Any, None] = None
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get_instance(self) -> Any:
+        """
+            Get the endpoint class, building it the first time.
+
+        Returns:
+            Any: The instance of the endpoint class.
+        """
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._endpoint_class(**self._kwargs)
+        return self._instance
+
+    def is_initialised(self) -> bool:
+        """
+            Check if the endpoint class has been built.
+
+        Returns:
+            bool: True once a route of the class has been called.
+        """
+        return self._instance is not None
+
+    def _build_handler(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+            Build a handler that forwards the calls to a method of the endpoint class.
+            The handler exposes the signature of the method (without self) so that FastAPI reads the same parameters.
+
+        Args:
+            name (str): The name of the method.
+            method (Callable[..., Any]): The method, read from the class.
+
+        Returns:
+            Callable[..., Any]: The handler to register.
+        """
+        if inspect.iscoroutinefunction(method) is True:
+            async def handler(*args: Any, **kwargs: Any) -> Any:
+                return await getattr(self.get_instance(), name)(*args, **kwargs)
+        else:
+            def handler(*args: Any, **kwargs: Any) -> Any:
+                return getattr(self.get_instance(), name)(*args, **kwargs)
+        functools.update_wrapper(handler, method)
+        signature = inspect.signature(method)
+        handler.__signature__ = signature.replace(
+            parameters=list(signature.parameters.values())[1:]
+        )
+        return handler
+
+    def __getattr__(self, name: str) -> Any:
+        """
+            Get a route handler of the endpoint class (other attributes are read from the built class).
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = inspect.getattr_static(self._endpoint_class, name, None)
+        if inspect.isfunction(method) is False:
+            return getattr(self.get_instance(), name)
+        if name not in self._handlers:
+            self._handlers[name] = self._build_handler(name, method)
+        return self._handlers[name]
@@ -0,0 +1,322 @@
+"""
+    File containing the logging facade used across the server: it builds the message only when its level is shown,
+    shortens the large payloads and hands the writing of the logs to a background thread.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import reprlib
+import threading
+from typing import Union, List, Tuple, Any, Callable
+
+from display_tty import Disp
+
+from . import constants as CONST
+
+# The amount of log records written in one go by the background writer
+WRITE_BATCH_SIZE: int = 256
+
+# The amount of items shown for a list, a tuple, a set or a dict (the rest is replaced by ...)
+PAYLOAD_MAX_ITEMS: int = 20
+
+
+class _LogWriter:
+    """
+    The background thread that runs the handlers of the loggers (console and file), the request handlers only queue the records.
+    """
+
+    def __init__(self) -> None:
+        """
+            Constructor
+        """
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: Union[threading.Thread, None] = None
+
+    def attach(self, logger: Union[logging.Logger, None]) -> bool:
+        """
+            Move the handlers of a logger behind the queue of the writer.
+
+        Args:
+            logger (Union[logging.Logger, None]): The logger to detach from its handlers.
+
+        Returns:
+            bool: True if the handlers of the logger are now run by the writer.
+        """
+        if logger is None:
+            return False
+        with self._lock:
+            targets = [
+                i for i in logger.handlers if not isinstance(i, _QueuedHandler)
+            ]
+            if len(targets) == 0:
+                return any(isinstance(i, _QueuedHandler) for i in logger.handlers)
+            for handler in targets:
+                logger.removeHandler(handler)
+            logger.addHandler(_QueuedHandler(self, targets))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log_writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+        return True
+
+    def put(self, handlers: List[logging.Handler], record: logging.LogRecord) -> None:
+        """
+            Queue a record for the handlers it was meant for.
+
+        Args:
+            handlers (List[logging.Handler]): The handlers to run.
+            record (logging.LogRecord): The record to write.
+        """
+        self._queue.put((handlers, record))
+
+    def _run(self) -> None:
+        """
+            Write the queued records, by batches, until the writer is stopped.
+        """
+        while True:
+            batch: List[Union[Tuple[List[logging.Handler], logging.LogRecord], None]] = [
+                self._queue.get()
+            ]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in batch:
+                if item is None:
+                    return
+                handlers, record = item
+                for handler in handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+    def stop(self) -> None:
+        """
+            Write the records that are still queued and stop the writer.
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout=5)
+
+
+class _QueuedHandler(logging.handlers.QueueHandler):
+    """
+    The handler left on the logger, it formats the record and gives it to the writer.
+    """
+
+    def __init__(self, writer: _LogWriter, handlers: List[logging.Handler]) -> None:
+        """
+            Constructor
+
+        Args:
+            writer (_LogWriter): The background writer.
+            handlers (List[logging.Handler]): The handlers that used to be on the logger.
+        """
+        super().__init__(None)
+        self.writer: _LogWriter = writer
+        self.handlers: List[logging.Handler] = handlers
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+            Send the record to the writer.
+
+        Args:
+            record (logging.LogRecord): The record (already formatted by prepare).
+        """
+        self.writer.put(self.handlers, record)
+
+
+LOG_WRITER: _LogWriter = _LogWriter()
+
+
+class LazyDisp:
+    """
+    Drop-in replacement for Disp: same constructor and logging functions, but the debug messages cost nothing when debug is off.
+    The messages can be given as a %-format string followed by its arguments, or as a function returning the message.
+    """
+
+    def __init__(self, *args: Any, debug: bool = False, logger: Union[str, None] = None, max_length: int = CONST.LOG_MAX_LENGTH, **kwargs: Any) -> None:
+        """
+            Constructor (the arguments are given to Disp).
+
+        Args:
+            debug (bool, optional): . Defaults to False.: Show the debug messages.
+            logger (Union[str, None], optional): . Defaults to None.: The name of the logger.
+            max_length (int, optional): . Defaults to CONST.LOG_MAX_LENGTH.: The length after which a message is cut (0 to never cut).
+        """
+        self.debug: bool = debug
+        self.max_length: int = max(0, int(max_length))
+        self.disp: Disp = Disp(*args, debug=debug, logger=logger, **kwargs)
+        # ---------------------- The shortening of payloads --------------------
+        self._repr: reprlib.Repr = reprlib.Repr()
+        self._repr.maxlevel = 4
+        self._repr.maxlist = PAYLOAD_MAX_ITEMS
+        self._repr.maxtuple = PAYLOAD_MAX_ITEMS
+        self._repr.maxset = PAYLOAD_MAX_ITEMS
+        self._repr.maxfrozenset = PAYLOAD_MAX_ITEMS
+        self._repr.maxdict = PAYLOAD_MAX_ITEMS
+        self._repr.maxstring = self.max_length or 10 ** 9
+        self._repr.maxother = self.max_length or 10 ** 9
+        # ----------------------- The writing of the logs ----------------------
+        if CONST.LOG_BACKGROUND_WRITES is True:
+            LOG_WRITER.attach(self._get_logger(logger))
+
+    def _get_logger(self, name: Union[str, None]) -> Union[logging.Logger, None]:
+        """
+            Find the logging.Logger used by Disp.
+
+        Args:
+            name (Union[str, None]): The name given to Disp.
+
+        Returns:
+            Union[logging.Logger, None]: The logger, None if Disp does not use the logging module.
+        """
+        logger = getattr(self.disp, "logger", None)
+        if isinstance(logger, logging.Logger):
+            return logger
+        if name is not None and name in logging.Logger.manager.loggerDict:
+            return logging.getLogger(name)
+        return None
+
+    def _shorten(self, text: str) -> str:
+        """
+            Cut a message that is longer than max_length.
+
+        Args:
+            text (str): The message.
+
+        Returns:
+            str: The message, followed by the amount of removed characters if it was cut.
+        """
+        if self.max_length == 0 or len(text) <= self.max_length:
+            return text
+        return f"{text[:self.max_length]}... ({len(text) - self.max_length} more characters)"
+
+    def _render_argument(self, argument: Any) -> str:
+        """
+            Turn an argument of the message into text without going through all of a large payload.
+
+        Args:
+            argument (Any): The argument.
+
+        Returns:
+            str: The text of the argument.
+        """
+        if isinstance(argument, (list, tuple, dict, set, frozenset)):
+            return self._repr.repr(argument)
+        return self._shorten(str(argument))
+
+    def _render(self, message: Union[str, Callable[[], str]], args: Tuple[Any, ...]) -> str:
+        """
+            Build the message.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            args (Tuple[Any, ...]): The arguments of the %-format string.
+
+        Returns:
+            str: The message to write.
+        """
+        if callable(message):
+            message = message()
+        if len(args) > 0:
+            message = message % tuple(self._render_argument(i) for i in args)
+        return self._shorten(str(message))
+
+    def _forward(self, function: Callable[..., Any], message: Union[str, Callable[[], str]], title: Union[str, None], args: Tuple[Any, ...]) -> None:
+        """
+            Give the built message to a logging function of Disp.
+
+        Args:
+            function (Callable[..., Any]): The logging function of Disp.
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None]): The name of the calling function (the default of Disp is used if None).
+            args (Tuple[Any, ...]): The arguments of the %-format string.
+        """
+        if title is None:
+            function(self._render(message, args))
+        else:
+            function(self._render(message, args), title)
+
+    def is_debug_enabled(self) -> bool:
+        """
+            Check if the debug messages are shown (to skip building a debug only value).
+
+        Returns:
+            bool: True if debug is on.
+        """
+        return self.debug
+
+    def log_debug(self, message: Union[str, Callable[[], str]], title: Union[str, None] = None, *args: Any) -> None:
+        """
+            Log a debug message, nothing is built when debug is off.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None], optional): . Defaults to None.: The name of the calling function.
+            args (Any): The arguments of the %-format string.
+        """
+        if self.debug is False:
+            return
+        self._forward(self.disp.log_debug, message, title, args)
+
+    def log_info(self, message: Union[str, Callable[[], str]], title: Union[str, None] = None, *args: Any) -> None:
+        """
+            Log an information message.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None], optional): . Defaults to None.: The name of the calling function.
+            args (Any): The arguments of the %-format string.
+        """
+        self._forward(self.disp.log_info, message, title, args)
+
+    def log_warning(self, message: Union[str, Callable[[], str]], title: Union[str, None] = None, *args: Any) -> None:
+        """
+            Log a warning message.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None], optional): . Defaults to None.: The name of the calling function.
+            args (Any): The arguments of the %-format string.
+        """
+        self._forward(self.disp.log_warning, message, title, args)
+
+    def log_error(self, message: Union[str, Callable[[], str]], title: Union[str, None] = None, *args: Any) -> None:
+        """
+            Log an error message.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None], optional): . Defaults to None.: The name of the calling function.
+            args (Any): The arguments of the %-format string.
+        """
+        self._forward(self.disp.log_error, message, title, args)
+
+    def log_critical(self, message: Union[str, Callable[[], str]], title: Union[str, None] = None, *args: Any) -> None:
+        """
+            Log a critical message.
+
+        Args:
+            message (Union[str, Callable[[], str]]): The message, a %-format string or a function returning the message.
+            title (Union[str, None], optional): . Defaults to None.: The name of the calling function.
+            args (Any): The arguments of the %-format string.
+        """
+        self._forward(self.disp.log_critical, message, title, args)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+            Give access to the other functions of Disp.
+        """
+        if name == "disp":
+            raise AttributeError(name)
+        return getattr(self.disp, name)
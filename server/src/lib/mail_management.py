@@ -9,7 +9,8 @@ from email import encoders
 from email.message import EmailMessage
 from email.utils import make_msgid
 from email.mime.base import MIMEBase
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 from . import constants as CONST
 
 
@@ -38,7 +39,7 @@ class MailManagement:
         self.port = CONST.SENDER_PORT
 
         # ------------------------ The visual debugger  ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
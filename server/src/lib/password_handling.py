@@ -2,7 +2,8 @@
     File containing the class in charge of handling password for the server
 """
 import bcrypt
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 
 
 class PasswordHandling:
@@ -19,7 +20,7 @@ class PasswordHandling:
         self.error: int = error
         self.salt_rounds = 10
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -56,14 +57,16 @@ class PasswordHandling:
         Returns:
             bool: True if it's the same, False if not
         """
-        msg = f"password = {type(password)}, "
-        msg += f"password_hash = {type(password_hash)}"
-        self.disp.log_debug(msg, "check_password")
+        self.disp.log_debug(
+            "password = %s, password_hash = %s", "check_password",
+            type(password), type(password_hash)
+        )
         if isinstance(password, bytes) is False:
             password = password.encode("utf-8")
         if isinstance(password_hash, bytes) is False:
             password_hash = password_hash.encode("utf-8")
-        msg = f"password = {type(password)}, password_hash = "
-        msg += f"{type(password_hash)}"
-        self.disp.log_debug(msg, "check_password")
+        self.disp.log_debug(
+            "password = %s, password_hash = %s", "check_password",
+            type(password), type(password_hash)
+        )
         return bcrypt.checkpw(password, password_hash)
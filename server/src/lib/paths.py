@@ -2,9 +2,10 @@
     File in charge of referencing all the paths_initialised supported by the server.
 """
 from typing import Union, List, Dict, Any
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 from .runtime_data import RuntimeData
-from .constants import PATH_KEY, ENDPOINT_KEY, METHOD_KEY, ALLOWED_METHODS
+from .constants import PATH_KEY, ENDPOINT_KEY, METHOD_KEY, ALLOWED_METHODS, WEBSOCKET_METHOD
 
 class ServerPaths:
     """
@@ -21,7 +22,7 @@ class ServerPaths:
         self.routes: List[Dict[str, Any]] = []
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -37,18 +38,23 @@ class ServerPaths:
         Args:
             path (str): The path to call for the endpoint to be triggered
             endpoint (str): The function that represents the endpoint
-            method (str, list): The method used for the provided path (GET, PUT, POST, etc)
+            method (str, list): The method used for the provided path (GET, PUT, POST, etc), WEBSOCKET for a websocket endpoint
 
         Returns:
             int: success if it succeeded, error if there was an error in the data.
         """
-        self.disp.log_debug(f"Adding path <{path}>", "add_path")
+        self.disp.log_debug("Adding path <%s>", "add_path", path)
 
         if isinstance(path, (str)) is False or isinstance(method, (str, list)) is False or callable(endpoint) is False:
             self.disp.log_error(
                 f"Failed to insert {path} with method {method}", "add_path"
             )
             return self.error
+        if isinstance(method, str) is True and method.upper() == WEBSOCKET_METHOD:
+            self.routes.append(
+                {PATH_KEY: path, ENDPOINT_KEY: endpoint, METHOD_KEY: [WEBSOCKET_METHOD]}
+            )
+            return self.success
         if isinstance(method, str) is True and method.upper() not in ALLOWED_METHODS:
             msg = f"Failed to insert {path}, method {method} not allowed"
             self.disp.log_error(msg, "add_path")
@@ -82,7 +88,13 @@ class ServerPaths:
         """
         self.disp.log_info("injecting routes", "inject_routes")
         for route in self.routes:
-            self.disp.log_debug(f"route = {route}", "inject_routes")
+            self.disp.log_debug("route = %s", "inject_routes", route)
+            if route[METHOD_KEY] == [WEBSOCKET_METHOD]:
+                self.runtime_data_initialised.app.add_api_websocket_route(
+                    route[PATH_KEY],
+                    route[ENDPOINT_KEY]
+                )
+                continue
             self.runtime_data_initialised.app.add_api_route(
                 route[PATH_KEY],
                 route[ENDPOINT_KEY],
@@ -0,0 +1,264 @@
+"""
+    File containing the metric families (counters and histograms) that are rendered in the Prometheus text format on /metrics.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Union, Dict, Tuple, List, Sequence
+
+# The upper bounds (in seconds) of the latency buckets, from 1ms to 10s
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# The Content-Type of the Prometheus text format
+PROMETHEUS_CONTENT_TYPE: str = "text/plain"
+
+
+def _format_value(value: float) -> str:
+    """
+        Write a sample value the way Prometheus reads it.
+
+    Args:
+        value (float): The value to write.
+
+    Returns:
+        str: The value, without a decimal part when it is a whole number.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer() is True:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """
+        Build the {name="value",...} part of a sample.
+
+    Args:
+        names (Sequence[str]): The names of the labels.
+        values (Sequence[str]): The values of the labels (in the same order).
+        extra (str, optional): . Defaults to "".: An already formatted label added at the end (the le of the buckets).
+
+    Returns:
+        str: The labels of the sample, an empty string if there are none.
+    """
+    labels: List[str] = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace(
+            "\n", "\\n"
+        ).replace('"', '\\"')
+        labels.append(f'{name}="{escaped}"')
+    if extra != "":
+        labels.append(extra)
+    if len(labels) == 0:
+        return ""
+    return "{" + ",".join(labels) + "}"
+
+
+class CounterFamily:
+    """
+    A counter that only goes up, one value per combination of labels.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        """
+            Constructor
+
+        Args:
+            name (str): The name of the metric (i.e. epitrello_sql_errors_total).
+            documentation (str): The description written in the HELP line.
+            label_names (Sequence[str], optional): . Defaults to ().: The names of the labels.
+        """
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._lock: threading.Lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        """
+            Increase the counter of a combination of labels.
+
+        Args:
+            labels (Tuple[str, ...], optional): . Defaults to ().: The values of the labels.
+            amount (float, optional): . Defaults to 1.: The amount to add.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, labels: Tuple[str, ...] = ()) -> float:
+        """
+            Get the value of a combination of labels.
+
+        Args:
+            labels (Tuple[str, ...], optional): . Defaults to ().: The values of the labels.
+
+        Returns:
+            float: The value of the counter (0 if it was never increased).
+        """
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        """
+            Write the counter in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        lines: List[str] = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter"
+        ]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(
+                f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class HistogramFamily:
+    """
+    A histogram of observations (durations, sizes) split in buckets, one histogram per combination of labels.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+            Constructor
+
+        Args:
+            name (str): The name of the metric (i.e. epitrello_sql_query_duration_seconds).
+            documentation (str): The description written in the HELP line.
+            label_names (Sequence[str], optional): . Defaults to ().: The names of the labels.
+            buckets (Sequence[float], optional): . Defaults to DEFAULT_BUCKETS.: The upper bounds of the buckets.
+        """
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self.buckets: Tuple[float, ...] = tuple(sorted(float(i) for i in buckets))
+        self._lock: threading.Lock = threading.Lock()
+        # labels -> [count of each bucket (the last one is +Inf), sum, count]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        """
+            Record an observation.
+
+        Args:
+            labels (Tuple[str, ...]): The values of the labels.
+            value (float): The observed value.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            node = self._values.get(labels)
+            if node is None:
+                node = [0] * (len(self.buckets) + 3)
+                self._values[labels] = node
+            node[index] += 1
+            node[-2] += value
+            node[-1] += 1
+
+    def get_count(self, labels: Tuple[str, ...] = ()) -> int:
+        """
+            Get the amount of observations of a combination of labels.
+
+        Args:
+            labels (Tuple[str, ...], optional): . Defaults to ().: The values of the labels.
+
+        Returns:
+            int: The amount of observations.
+        """
+        with self._lock:
+            node = self._values.get(labels)
+            return 0 if node is None else int(node[-1])
+
+    def get_sum(self, labels: Tuple[str, ...] = ()) -> float:
+        """
+            Get the sum of the observations of a combination of labels.
+
+        Args:
+            labels (Tuple[str, ...], optional): . Defaults to ().: The values of the labels.
+
+        Returns:
+            float: The sum of the observed values.
+        """
+        with self._lock:
+            node = self._values.get(labels)
+            return 0.0 if node is None else node[-2]
+
+    def get_labels(self) -> List[Tuple[str, ...]]:
+        """
+            Get the combinations of labels that have been observed.
+
+        Returns:
+            List[Tuple[str, ...]]: The values of the labels, sorted.
+        """
+        with self._lock:
+            return sorted(self._values)
+
+    def quantile(self, labels: Tuple[str, ...], quantile: float) -> Union[float, None]:
+        """
+            Estimate a quantile from the buckets (the same interpolation as histogram_quantile in Prometheus).
+
+        Args:
+            labels (Tuple[str, ...]): The values of the labels.
+            quantile (float): The quantile to estimate (0.5, 0.95, 0.99...)
+
+        Returns:
+            Union[float, None]: The estimated value, None if nothing was observed.
+        """
+        with self._lock:
+            node = self._values.get(labels)
+            if node is None or node[-1] == 0:
+                return None
+            counts = list(node[:-2])
+            total = node[-1]
+        rank = min(1.0, max(0.0, quantile)) * total
+        cumulated = 0
+        for index, amount in enumerate(counts):
+            if cumulated + amount >= rank and amount > 0:
+                if index == len(self.buckets):
+                    return self.buckets[-1] if len(self.buckets) > 0 else None
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * ((rank - cumulated) / amount)
+            cumulated += amount
+        return None
+
+    def render(self) -> List[str]:
+        """
+            Write the histogram in the Prometheus text format (the buckets are cumulative).
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        lines: List[str] = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram"
+        ]
+        with self._lock:
+            values = sorted((i, list(j)) for i, j in self._values.items())
+        bounds = self.buckets + (float("inf"),)
+        for labels, node in values:
+            cumulated = 0
+            for bound, amount in zip(bounds, node):
+                cumulated += amount
+                bucket_labels = _format_labels(
+                    self.label_names, labels, f'le="{_format_value(bound)}"'
+                )
+                lines.append(
+                    f"{self.name}_bucket{bucket_labels} {_format_value(cumulated)}"
+                )
+            sample_labels = _format_labels(self.label_names, labels)
+            lines.append(
+                f"{self.name}_sum{sample_labels} {_format_value(node[-2])}"
+            )
+            lines.append(
+                f"{self.name}_count{sample_labels} {_format_value(node[-1])}"
+            )
+        return lines
@@ -0,0 +1,113 @@
+"""
+    File containing the per-request accumulator of the time spent in the dependencies (database, bucket, serialisation).
+    The accumulator of the running request is held in a context variable so that the sql and bucket wrappers can feed it without knowing the route.
+"""
+
+import threading
+import functools
+from time import perf_counter
+from contextvars import ContextVar, Token
+from typing import Union, Dict, List, Any, Callable
+
+DEPENDENCY_DB: str = "db"
+DEPENDENCY_BUCKET: str = "bucket"
+DEPENDENCY_SERIALISATION: str = "serialisation"
+DEPENDENCIES: List[str] = [
+    DEPENDENCY_DB, DEPENDENCY_BUCKET, DEPENDENCY_SERIALISATION
+]
+
+
+class RequestTimings:
+    """
+    The time spent (and the amount of calls) in each dependency while serving a single request.
+    """
+
+    def __init__(self) -> None:
+        """
+            Constructor
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self.seconds: Dict[str, float] = {i: 0.0 for i in DEPENDENCIES}
+        self.calls: Dict[str, int] = {i: 0 for i in DEPENDENCIES}
+
+    def add(self, dependency: str, seconds: float) -> None:
+        """
+            Add a call to a dependency (the sql queries can come from several threads at once).
+
+        Args:
+            dependency (str): The dependency (one of DEPENDENCIES).
+            seconds (float): The time the call took.
+        """
+        with self._lock:
+            self.seconds[dependency] = self.seconds.get(dependency, 0.0) + seconds
+            self.calls[dependency] = self.calls.get(dependency, 0) + 1
+
+
+_CURRENT_TIMINGS: ContextVar[Union[RequestTimings, None]] = ContextVar(
+    "epitrello_request_timings", default=None
+)
+
+
+def start_request_timings() -> Token:
+    """
+        Start collecting the dependency times of the request served by the current context.
+
+    Returns:
+        Token: The token to give to end_request_timings.
+    """
+    return _CURRENT_TIMINGS.set(RequestTimings())
+
+
+def get_request_timings() -> Union[RequestTimings, None]:
+    """
+        Get the accumulator of the request served by the current context.
+
+    Returns:
+        Union[RequestTimings, None]: The accumulator, None outside of a request (background tasks, start-up).
+    """
+    return _CURRENT_TIMINGS.get()
+
+
+def end_request_timings(token: Token) -> None:
+    """
+        Stop collecting the dependency times of the request.
+
+    Args:
+        token (Token): The token returned by start_request_timings.
+    """
+    _CURRENT_TIMINGS.reset(token)
+
+
+def record_dependency_time(dependency: str, seconds: float) -> None:
+    """
+        Add the time of a dependency call to the running request (nothing happens outside of a request).
+
+    Args:
+        dependency (str): The dependency (one of DEPENDENCIES).
+        seconds (float): The time the call took.
+    """
+    timings = _CURRENT_TIMINGS.get()
+    if timings is not None:
+        timings.add(dependency, seconds)
+
+
+def timed_dependency(dependency: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+        Decorator adding the duration of every call of a (blocking) function to the running request.
+
+    Args:
+        dependency (str): The dependency the time is attributed to.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: The decorator.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_dependency_time(dependency, perf_counter() - start)
+        return wrapper
+    return decorator
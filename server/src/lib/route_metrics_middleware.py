@@ -0,0 +1,193 @@
+"""
+    File containing the ASGI middleware that times every request per route template and the metrics it feeds.
+"""
+
+from time import perf_counter
+from typing import Union, Dict, List, Tuple, Any, Callable, Awaitable
+
+from .prometheus_metrics import CounterFamily, HistogramFamily, DEFAULT_BUCKETS
+from .request_timing import (
+    DEPENDENCIES, DEPENDENCY_DB, RequestTimings,
+    start_request_timings, get_request_timings, end_request_timings
+)
+
+# The route label of the requests that did not reach an endpoint (unknown path, rejected by a middleware)
+UNMATCHED_ROUTE: str = "<unmatched>"
+
+# The upper bounds (in bytes) of the response size buckets
+SIZE_BUCKETS: Tuple[float, ...] = (
+    100, 1000, 10000, 100000, 1000000, 10000000
+)
+
+# The upper bounds of the amount of sql queries run by a single request (a new N+1 loop moves a route up)
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (
+    0, 1, 2, 5, 10, 25, 50, 100, 250
+)
+
+# The quantiles given by the json statistics
+STATS_QUANTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50", 0.5), ("p95", 0.95), ("p99", 0.99)
+)
+
+
+class RouteMetrics:
+    """
+    The counters of the requests, grouped by route template (i.e. /api/v1/board/{board_id}) and method.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+            Constructor
+
+        Args:
+            buckets (Tuple[float, ...], optional): . Defaults to DEFAULT_BUCKETS.: The upper bounds (in seconds) of the latency buckets.
+        """
+        self.requests: CounterFamily = CounterFamily(
+            "epitrello_http_requests_total",
+            "Amount of requests answered, per route template, method and status.",
+            ("route", "method", "status")
+        )
+        self.duration: HistogramFamily = HistogramFamily(
+            "epitrello_http_request_duration_seconds",
+            "Time spent answering the requests.",
+            ("route", "method"),
+            buckets
+        )
+        self.response_size: HistogramFamily = HistogramFamily(
+            "epitrello_http_response_size_bytes",
+            "Size of the response bodies (as sent, after compression).",
+            ("route", "method"),
+            SIZE_BUCKETS
+        )
+        self.dependency_seconds: CounterFamily = CounterFamily(
+            "epitrello_http_dependency_seconds_total",
+            "Time spent in the database, the bucket and the json serialisation while answering the requests.",
+            ("route", "method", "dependency")
+        )
+        self.db_queries: HistogramFamily = HistogramFamily(
+            "epitrello_http_db_queries_per_request",
+            "Amount of sql queries run by a single request.",
+            ("route", "method"),
+            QUERY_COUNT_BUCKETS
+        )
+
+    def observe(self, route: str, method: str, status: int, duration: float, size: int, timings: Union[RequestTimings, None] = None) -> None:
+        """
+            Record an answered request.
+
+        Args:
+            route (str): The route template.
+            method (str): The http method.
+            status (int): The status of the response.
+            duration (float): The time taken to answer (in seconds).
+            size (int): The size of the body (in bytes).
+            timings (Union[RequestTimings, None], optional): . Defaults to None.: The time spent in each dependency.
+        """
+        labels = (route, method)
+        self.requests.inc((route, method, str(status)))
+        self.duration.observe(labels, duration)
+        self.response_size.observe(labels, size)
+        if timings is None:
+            return
+        for dependency in DEPENDENCIES:
+            if timings.calls[dependency] > 0:
+                self.dependency_seconds.inc(
+                    (route, method, dependency), timings.seconds[dependency]
+                )
+        self.db_queries.observe(labels, timings.calls[DEPENDENCY_DB])
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+            Summarise the metrics of each route (used to find the slow routes without a Prometheus server).
+
+        Returns:
+            List[Dict[str, Any]]: The count, latency quantiles, mean size and mean dependency times of each route.
+        """
+        stats: List[Dict[str, Any]] = []
+        for labels in self.duration.get_labels():
+            count = self.duration.get_count(labels)
+            if count == 0:
+                continue
+            node: Dict[str, Any] = {
+                "route": labels[0],
+                "method": labels[1],
+                "count": count,
+                "mean": self.duration.get_sum(labels) / count
+            }
+            for name, quantile in STATS_QUANTILES:
+                node[name] = self.duration.quantile(labels, quantile)
+            node["mean_size"] = self.response_size.get_sum(labels) / count
+            node["mean_db_queries"] = self.db_queries.get_sum(labels) / count
+            for dependency in DEPENDENCIES:
+                node[f"mean_{dependency}"] = self.dependency_seconds.get(
+                    labels + (dependency,)
+                ) / count
+            stats.append(node)
+        stats.sort(key=lambda i: i["mean"] * i["count"], reverse=True)
+        return stats
+
+    def render(self) -> List[str]:
+        """
+            Write the route metrics in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metrics.
+        """
+        lines: List[str] = []
+        lines.extend(self.requests.render())
+        lines.extend(self.duration.render())
+        lines.extend(self.response_size.render())
+        lines.extend(self.dependency_seconds.render())
+        lines.extend(self.db_queries.render())
+        return lines
+
+
+class RouteMetricsMiddleware:
+    """
+    The middleware that times the requests, it reads the route template once the router has matched the request.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], route_metrics: RouteMetrics) -> None:
+        """
+            Constructor
+
+        Args:
+            app (Callable[..., Awaitable[None]]): The ASGI application to wrap.
+            route_metrics (RouteMetrics): The metrics the requests are recorded in.
+        """
+        self.app: Callable[..., Awaitable[None]] = app
+        self.route_metrics: RouteMetrics = route_metrics
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]], send: Callable[..., Awaitable[None]]) -> None:
+        """
+            Run the wrapped application and record the request.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        response: Dict[str, int] = {"status": 500, "size": 0}
+
+        async def timed_send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        token = start_request_timings()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            duration = perf_counter() - start
+            timings = get_request_timings()
+            end_request_timings(token)
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            self.route_metrics.observe(
+                route,
+                scope.get("method", ""),
+                response["status"],
+                duration,
+                response["size"],
+                timings
+            )
@@ -1,7 +1,7 @@
 """
     This file is the one in charge of containing data that will change during the server runtime.
 """
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Union, Dict, Any, TYPE_CHECKING
 from fastapi import FastAPI
 import uvicorn
 from . import constants as CONST
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from .server_management import ServerManagement
     from .boilerplates import BoilerplateIncoming, BoilerplateNonHTTP, BoilerplateResponses
     from .background_tasks import BackgroundTasks, Tasks
+    from .events_hub import EventsHub
+    from .events_relay import EventsRelayClient
+    from .route_metrics_middleware import RouteMetrics
 
 class RuntimeData:
     """
@@ -61,3 +64,11 @@ class RuntimeData:
         self.boilerplate_responses_initialised: 'BoilerplateResponses' = None
         self.background_tasks_initialised: 'BackgroundTasks' = None
         self.tasks_initialised: 'Tasks' = None
+        # ------------------------ Real-time event hubs  -----------------------
+        self.board_events_hub: 'EventsHub' = None
+        self.notification_events_hub: 'EventsHub' = None
+        # ------------------ Pre-fork mode (worker processes) ------------------
+        self.events_relay: 'EventsRelayClient' = None
+        self.supervisor_pid: Union[int, None] = None
+        # --------------------------- Request metrics --------------------------
+        self.route_metrics: 'RouteMetrics' = None
@@ -2,10 +2,20 @@
 The file that contains every data initialised for the runtime
 """
 
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+import os
+import json
+import secrets
+from typing import Union
+import uvicorn
+from fastapi import FastAPI
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 from .sql import SQL
 from .bucket import Bucket
 from .background_tasks import BackgroundTasks, Tasks
+from .events_hub import EventsHub
+from .events_relay import EventsRelayServer, EventsRelayClient
+from .http_codes import HCI
 from . import Endpoints, ServerPaths, RuntimeData, ServerManagement, CONST
 from .boilerplates import BoilerplateIncoming, BoilerplateNonHTTP, BoilerplateResponses
 
@@ -25,7 +35,7 @@ class Server:
         self.error: int = error
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -41,6 +51,12 @@ class Server:
             error=self.error,
             success=self.success
         )
+        # ---------------------- The json response encoder ---------------------
+        if HCI.set_json_serialiser(CONST.JSON_SERIALISER) is False:
+            self.disp.log_warning(
+                f"The '{CONST.JSON_SERIALISER}' json serialiser is not available, using the standard json module.",
+                "__init__"
+            )
         # ----- The classes that need to be tracked for the server to run  -----
         self.disp.log_debug("Initialising database link.", "__init__")
         self.runtime_data_initialised.database_link = SQL(
@@ -58,6 +74,18 @@ class Server:
             success=self.success,
             debug=self.debug
         )
+        self.runtime_data_initialised.board_events_hub = EventsHub(
+            queue_size=CONST.EVENTS_QUEUE_SIZE,
+            error=self.error,
+            success=self.success,
+            debug=self.debug
+        )
+        self.runtime_data_initialised.notification_events_hub = EventsHub(
+            queue_size=CONST.EVENTS_QUEUE_SIZE,
+            error=self.error,
+            success=self.success,
+            debug=self.debug
+        )
         self.runtime_data_initialised.server_management_initialised = ServerManagement(
             self.runtime_data_initialised,
             error=self.error,
@@ -116,10 +144,15 @@ class Server:
             The main function of the server.
             This is the one in charge of starting the server.
         """
-        self.runtime_data_initialised.server_management_initialised.initialise_classes()
-        self.runtime_data_initialised.paths_initialised.load_default_paths_initialised()
-        self.runtime_data_initialised.paths_initialised.inject_routes()
+        if self.check_schema() != self.success:
+            return self.error
+        workers = CONST.SERVER_WORKERS
+        if workers is not None and int(workers) > 1:
+            return self.run_workers(int(workers))
+        self.build_app()
         self.runtime_data_initialised.tasks_initialised.inject_tasks()
+        if CONST.INDEX_ADVISOR_CHECK_ON_STARTUP is True:
+            self.check_indexes()
         status = self.runtime_data_initialised.background_tasks_initialised.safe_start()
         if status != self.success:
             self.disp.log_error(
@@ -134,6 +167,172 @@ class Server:
             return self.error
         return self.success
 
+    def run_workers(self, workers: int) -> int:
+        """
+            Run the server in pre-fork mode.
+            This process becomes the supervisor: it runs the background tasks (once for the whole server) and the events relay,
+            while uvicorn forks the workers that answer the requests (each one builds its own database pool with create_worker_app).
+
+        Args:
+            workers (int): The number of worker processes.
+
+        Returns:
+            int: self.success if the server stopped normally, self.error otherwise.
+        """
+        title = "run_workers"
+        relay_secret = secrets.token_hex(32)
+        relay = EventsRelayServer(
+            secret=relay_secret,
+            host=CONST.EVENTS_RELAY_HOST,
+            error=self.error,
+            success=self.success,
+            debug=self.debug
+        )
+        if relay.start() != self.success:
+            return self.error
+        os.environ[CONST.WORKER_SETTINGS_ENV] = json.dumps({
+            "host": self.host,
+            "port": self.port,
+            "success": self.success,
+            "error": self.error,
+            "app_name": self.runtime_data_initialised.app_name,
+            "debug": self.debug,
+            "relay_port": relay.port,
+            "relay_secret": relay_secret
+        })
+        self.runtime_data_initialised.tasks_initialised.inject_tasks()
+        if CONST.INDEX_ADVISOR_CHECK_ON_STARTUP is True:
+            self.check_indexes()
+        status = self.runtime_data_initialised.background_tasks_initialised.safe_start()
+        if status != self.success:
+            self.disp.log_error(
+                "Error: background tasks failed to start.",
+                title
+            )
+            relay.stop()
+            return status
+        if CONST.SERVER_DEV_RELOAD is True:
+            self.disp.log_warning(
+                "Reload is not available with several workers, it is ignored.", title
+            )
+        self.disp.log_info(f"Starting {workers} workers.", title)
+        try:
+            uvicorn.run(
+                f"{__name__}:create_worker_app",
+                factory=True,
+                host=self.host,
+                port=self.port,
+                workers=workers,
+                lifespan=CONST.SERVER_LIFESPAN,
+                timeout_keep_alive=CONST.SERVER_TIMEOUT_KEEP_ALIVE,
+                log_level=CONST.SERVER_DEV_LOG_LEVEL,
+                use_colors=CONST.SERVER_DEV_USE_COLOURS,
+                proxy_headers=CONST.SERVER_PROD_PROXY_HEADERS,
+                forwarded_allow_ips=CONST.SERVER_PROD_FORWARDED_ALLOW_IPS
+            )
+        except Exception as e:
+            self.disp.log_error(f"Error: {e}", title)
+            return self.error
+        finally:
+            relay.stop()
+        return self.success
+
+    def build_worker_app(self, relay_port: Union[int, None] = None, relay_secret: str = "") -> FastAPI:
+        """
+            Build the application of a worker process (pre-fork mode), the background tasks are left to the supervisor.
+
+        Args:
+            relay_port (Union[int, None], optional): The port of the events relay of the supervisor. Defaults to None.
+            relay_secret (str, optional): The secret the relay expects from the workers. Defaults to "".
+
+        Returns:
+            FastAPI: The application the worker serves.
+        """
+        self.runtime_data_initialised.supervisor_pid = os.getppid()
+        if relay_port is not None:
+            relay = EventsRelayClient(
+                host=CONST.EVENTS_RELAY_HOST,
+                port=relay_port,
+                secret=relay_secret,
+                error=self.error,
+                success=self.success,
+                debug=self.debug
+            )
+            if relay.connect() == self.success:
+                self.runtime_data_initialised.events_relay = relay
+                self.runtime_data_initialised.board_events_hub.set_relay(
+                    relay, CONST.RELAY_CHANNEL_BOARD_EVENTS
+                )
+                self.runtime_data_initialised.notification_events_hub.set_relay(
+                    relay, CONST.RELAY_CHANNEL_NOTIFICATION_EVENTS
+                )
+                relay.register(
+                    CONST.RELAY_CHANNEL_TOKENS,
+                    self.runtime_data_initialised.boilerplate_non_http_initialised.forget_relayed_tokens
+                )
+        return self.build_app()
+
+    def build_app(self) -> FastAPI:
+        """
+            Build the FastAPI application and register its routes (the endpoint classes are only built on their first call).
+
+        Returns:
+            FastAPI: The application to serve.
+        """
+        self.runtime_data_initialised.server_management_initialised.initialise_classes()
+        self.runtime_data_initialised.paths_initialised.load_default_paths_initialised()
+        self.runtime_data_initialised.paths_initialised.inject_routes()
+        return self.runtime_data_initialised.app
+
+    def check_schema(self) -> int:
+        """
+            Make sure the migrations the code relies on were applied to the database.
+
+        Returns:
+            int: : self.success if every required column exists (and is NOT NULL when required), self.error otherwise.
+        """
+        title = "check_schema"
+        status = self.success
+        for table, required in CONST.REQUIRED_COLUMNS.items():
+            try:
+                description = self.runtime_data_initialised.database_link.describe_table(
+                    table
+                )
+            except RuntimeError:
+                description = self.error
+            if isinstance(description, int) is True:
+                self.disp.log_critical(f"Could not describe the {table} table.", title)
+                return self.error
+            # DESCRIBE rows: (Field, Type, Null, Key, Default, Extra)
+            nullable = {row[0]: row[2] == "YES" for row in description}
+            for column, not_null, migration in required:
+                if column not in nullable:
+                    problem = "is missing"
+                elif not_null is True and nullable[column] is True:
+                    problem = "accepts NULL"
+                else:
+                    continue
+                self.disp.log_critical(
+                    f"The {table}.{column} column {problem}, apply db/migrations/{migration} (mariadb -u <user> -p < {migration}).",
+                    title
+                )
+                status = self.error
+        return status
+
+    def check_indexes(self) -> int:
+        """
+            Run EXPLAIN on the hot queries of the endpoints and warn about the ones doing a full table scan.
+
+        Returns:
+            int: : self.success if every query uses an index, self.error otherwise.
+        """
+        if self.check_schema() != self.success:
+            return self.error
+        self.disp.log_info("Checking the indexes of the hot queries.", "check_indexes")
+        return self.runtime_data_initialised.database_link.check_indexes(
+            CONST.INDEX_ADVISOR_QUERIES
+        )
+
     def is_running(self) -> bool:
         """
             The function in charge of checking if the server is running.
@@ -156,3 +355,30 @@ class Server:
             del self.runtime_data_initialised.tasks_initialised
             self.runtime_data_initialised.tasks_initialised = None
         self.disp.log_info("Server stopped", title)
+
+
+# The server instance of a worker process (kept alive for as long as the worker runs)
+WORKER_SERVER: Union[Server, None] = None
+
+
+def create_worker_app() -> FastAPI:
+    """
+        The application factory uvicorn calls in every worker process of the pre-fork mode.
+        The settings are passed by the supervisor through the environment.
+
+    Returns:
+        FastAPI: The application of the worker.
+    """
+    global WORKER_SERVER
+    settings = json.loads(os.environ[CONST.WORKER_SETTINGS_ENV])
+    WORKER_SERVER = Server(
+        host=settings["host"],
+        port=settings["port"],
+        success=settings["success"],
+        error=settings["error"],
+        app_name=settings["app_name"],
+        debug=settings["debug"]
+    )
+    return WORKER_SERVER.build_worker_app(
+        settings.get("relay_port"), settings.get("relay_secret", "")
+    )
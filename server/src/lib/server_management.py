@@ -2,14 +2,18 @@
     This is the file in charge of containing the functions that will manage the server run status.
 """
 
+import os
 import signal
 import uvicorn
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from display_tty import Disp, TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
 from . import CONST
 from .http_codes import HCI
 from .runtime_data import RuntimeData
+from .compression_middleware import CompressionMiddleware
+from .route_metrics_middleware import RouteMetrics, RouteMetricsMiddleware
 
 class ServerManagement:
     """
@@ -26,7 +30,7 @@ class ServerManagement:
         self.success: int = success
         self.debug: bool = debug
         # ------------------------ The logging function ------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             FILE_DESCRIPTOR,
             SAVE_TO_FILE,
@@ -84,7 +88,11 @@ class ServerManagement:
         if self.runtime_data_initialised.bucket_link.is_connected() is True:
             self.runtime_data_initialised.bucket_link.disconnect()
         self.runtime_data_initialised.continue_running = False
-        self.runtime_data_initialised.server.handle_exit(signal.SIGTERM, None)
+        if self.runtime_data_initialised.supervisor_pid is not None:
+            # Pre-fork mode: the supervisor stops every worker
+            os.kill(self.runtime_data_initialised.supervisor_pid, signal.SIGTERM)
+        else:
+            self.runtime_data_initialised.server.handle_exit(signal.SIGTERM, None)
         body = self.runtime_data_initialised.boilerplate_responses_initialised.build_response_body(
             title="Shutdown",
             message="The server is shutting down.",
@@ -108,6 +116,21 @@ class ServerManagement:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        if CONST.COMPRESSION_ENABLED is True:
+            self.runtime_data_initialised.app.add_middleware(
+                CompressionMiddleware,
+                minimum_size=CONST.COMPRESSION_MINIMUM_SIZE,
+                gzip_level=CONST.COMPRESSION_GZIP_LEVEL,
+                brotli_quality=CONST.COMPRESSION_BROTLI_QUALITY,
+                use_brotli=CONST.COMPRESSION_BROTLI
+            )
+        if CONST.METRICS_ENABLED is True and CONST.METRICS_ROUTES is True:
+            # Added last so that it times the whole stack (and measures the compressed sizes)
+            self.runtime_data_initialised.route_metrics = RouteMetrics()
+            self.runtime_data_initialised.app.add_middleware(
+                RouteMetricsMiddleware,
+                route_metrics=self.runtime_data_initialised.route_metrics
+            )
         msg = "uvicorn.Config(\n"
         msg += f"app='{self.runtime_data_initialised.app}',\n"
         msg += f"host='{self.runtime_data_initialised.host}',\n"
@@ -140,5 +163,5 @@ class ServerManagement:
         self.runtime_data_initialised.server = uvicorn.Server(
             self.runtime_data_initialised.config
         )
-        self.runtime_data_initialised.bucket_link.connect()
+        # The bucket (and boto3) is connected on its first use
         self.runtime_data_initialised.continue_running = True
@@ -0,0 +1,351 @@
+"""
+    File in charge of exposing the blocking sql boilerplates as awaitable functions.
+    The calls are offloaded to a thread pool that is sized to the connection pool so that the event loop is never blocked by a query.
+"""
+
+import asyncio
+import functools
+import contextvars
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Union, Any, Callable, AsyncIterator, Tuple
+
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
+
+from . import sql_constants as SCONST
+from .sql_query_boilerplates import SQLQueryBoilerplates
+from .sql_transaction import SQLTransaction
+
+
+class SQLAsyncWrapper:
+    """
+    The class in charge of running the sql boilerplates outside of the event loop.
+    """
+
+    def __init__(self, sql_query_boilerplates: SQLQueryBoilerplates, max_workers: int, success: int = 0, error: int = 84, debug: bool = False, executor: Union[ThreadPoolExecutor, None] = None, sql_transaction: Union[SQLTransaction, None] = None) -> None:
+        """
+            The constructor of the async wrapper.
+
+        Args:
+            sql_query_boilerplates (SQLQueryBoilerplates): : The blocking functions to offload.
+            max_workers (int): : The maximum number of queries that can run at the same time (should match the pool size).
+            executor (Union[ThreadPoolExecutor, None], optional): . Defaults to None.: A thread pool to share instead of creating one (it is not shut down by this instance).
+            sql_transaction (Union[SQLTransaction, None], optional): . Defaults to None.: The transaction the boilerplates are bound to, if any.
+            success (int, optional): . Defaults to 0.
+            error (int, optional): . Defaults to 84.
+            debug (bool, optional): . Defaults to False.
+        """
+        # -------------------------- Inherited values --------------------------
+        self.sql_query_boilerplates: SQLQueryBoilerplates = sql_query_boilerplates
+        self.max_workers: int = max(1, max_workers)
+        self.error: int = error
+        self.debug: bool = debug
+        self.success: int = success
+        # --------------------------- logger section ---------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ------------------------ The query thread pool -----------------------
+        self.sql_transaction: Union[SQLTransaction, None] = sql_transaction
+        self.owns_executor: bool = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="sql_async"
+            )
+        self.executor: Union[ThreadPoolExecutor, None] = executor
+
+    async def _run_in_executor(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+            Run a blocking function in the query thread pool and wait for its result.
+
+        Args:
+            func (Callable): : The blocking function to run.
+
+        Raises:
+            RuntimeError: : If the thread pool has already been shut down.
+
+        Returns:
+            Any: : The value returned by the function.
+        """
+        if self.executor is None:
+            raise RuntimeError("The sql thread pool is not initialised.")
+        loop = asyncio.get_running_loop()
+        # The context is copied so that the query time is added to the request that asked for it
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    async def get_data_from_table(self, table: str, column: Union[str, List[str]], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", beautify: bool = True, compact: bool = False, order_by: Union[str, List[str], None] = None, descending: bool = False, limit: Union[int, None] = None, after: Union[List[Any], None] = None) -> Union[int, List[Dict[str, Any]]]:
+        """
+            Awaitable version of SQLQueryBoilerplates.get_data_from_table.
+
+        Returns:
+            Union[int, List[Dict[str, Any]]]: : Will return the data you requested, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.get_data_from_table,
+            table=table,
+            column=column,
+            where=where,
+            beautify=beautify,
+            compact=compact,
+            order_by=order_by,
+            descending=descending,
+            limit=limit,
+            after=after
+        )
+
+    async def get_data_from_table_in(self, table: str, column: Union[str, List[str]], in_column: str, values: List[Any], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", beautify: bool = True, compact: bool = False) -> Union[int, List[Dict[str, Any]]]:
+        """
+            Awaitable version of SQLQueryBoilerplates.get_data_from_table_in.
+
+        Returns:
+            Union[int, List[Dict[str, Any]]]: : Will return the data you requested, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.get_data_from_table_in,
+            table=table,
+            column=column,
+            in_column=in_column,
+            values=values,
+            where=where,
+            beautify=beautify,
+            compact=compact
+        )
+
+    async def get_table_size(self, table: str, column: Union[str, List[str]], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.get_table_size.
+
+        Returns:
+            int: : Return the size of the table, -1 if an error occurred.
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.get_table_size,
+            table=table,
+            column=column,
+            where=where
+        )
+
+    async def insert_data_into_table(self, table: str, data: Union[List[List[str]], List[str]], column: Union[List[str], None] = None) -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.insert_data_into_table.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.insert_data_into_table,
+            table=table,
+            data=data,
+            column=column
+        )
+
+    async def update_data_in_table(self, table: str, data: List[str], column: List, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.update_data_in_table.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.update_data_in_table,
+            table=table,
+            data=data,
+            column=column,
+            where=where
+        )
+
+    async def remove_data_from_table(self, table: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.remove_data_from_table.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.remove_data_from_table,
+            table=table,
+            where=where
+        )
+
+    async def remove_data_from_table_in(self, table: str, in_column: str, values: List[Any], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.remove_data_from_table_in.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.remove_data_from_table_in,
+            table=table,
+            in_column=in_column,
+            values=values,
+            where=where
+        )
+
+    async def shift_column_in_table(self, table: str, column: str, offset: int, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.shift_column_in_table.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.shift_column_in_table,
+            table=table,
+            column=column,
+            offset=offset,
+            where=where
+        )
+
+    async def get_position_key(self, table: str, column: str, index: int, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", row_id: Union[str, int, None] = None, gap: int = SCONST.POSITION_GAP, id_column: str = "id") -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.get_position_key.
+
+        Returns:
+            int: : The key to store, SCONST.POSITION_KEY_ERROR otherwise.
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.get_position_key,
+            table=table,
+            column=column,
+            index=index,
+            where=where,
+            row_id=row_id,
+            gap=gap,
+            id_column=id_column
+        )
+
+    async def get_next_position_key(self, table: str, column: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", gap: int = SCONST.POSITION_GAP) -> int:
+        """
+            Awaitable version of SQLQueryBoilerplates.get_next_position_key.
+
+        Returns:
+            int: : The key to store, SCONST.POSITION_KEY_ERROR otherwise.
+        """
+        return await self._run_in_executor(
+            self.sql_query_boilerplates.get_next_position_key,
+            table=table,
+            column=column,
+            where=where,
+            gap=gap
+        )
+
+    async def run_blocking(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+            Run a blocking function that queries the database several times (i.e. a deletion cascade) in the query thread pool.
+
+        Args:
+            func (Callable): : The blocking function to run.
+
+        Returns:
+            Any: : The value returned by the function.
+        """
+        return await self._run_in_executor(func, *args, **kwargs)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator['SQLAsyncWrapper']:
+        """
+            Awaitable version of SQLManageConnections.transaction.
+            The yielded wrapper runs every query on the same connection and the changes are committed once when the block ends.
+
+        Yields:
+            SQLAsyncWrapper: : The awaitable query functions bound to the transaction.
+        """
+        sql_transaction: SQLTransaction = await self._run_in_executor(
+            SQLTransaction,
+            self.sql_query_boilerplates.sql_pool,
+            success=self.success,
+            error=self.error,
+            debug=self.debug
+        )
+        bound_boilerplates = SQLQueryBoilerplates(
+            sql_pool=sql_transaction,
+            success=self.success,
+            error=self.error,
+            debug=self.debug,
+            schema_registry=self.sql_query_boilerplates.schema_registry
+        )
+        try:
+            yield SQLAsyncWrapper(
+                sql_query_boilerplates=bound_boilerplates,
+                max_workers=1,
+                success=self.success,
+                error=self.error,
+                debug=self.debug,
+                executor=self.executor,
+                sql_transaction=sql_transaction
+            )
+        except BaseException:
+            await self._run_in_executor(sql_transaction.end, commit=False)
+            raise
+        await self._run_in_executor(sql_transaction.end, commit=True)
+
+    def is_committed(self) -> bool:
+        """
+            Check that the bound transaction was committed once its block ended (call it after the block).
+
+        Returns:
+            bool: : True if the changes were committed (or if no transaction is bound), False if they were rolled back.
+        """
+        if self.sql_transaction is None:
+            return True
+        return self.sql_transaction.is_committed()
+
+    def get_last_insert_id(self) -> Union[int, None]:
+        """
+            Get the id generated for the last row inserted in the bound transaction.
+
+        Returns:
+            Union[int, None]: : The AUTO_INCREMENT id, None if no row was inserted or if no transaction is bound.
+        """
+        if self.sql_transaction is None:
+            return None
+        return self.sql_transaction.get_last_insert_id()
+
+    def mark_failed(self) -> int:
+        """
+            Roll the bound transaction back instead of committing it when its block ends.
+
+        Returns:
+            int: : self.success if a transaction is bound, self.error otherwise.
+        """
+        if self.sql_transaction is None:
+            return self.error
+        self.sql_transaction.mark_failed()
+        return self.success
+
+    def shutdown(self, wait: bool = True) -> int:
+        """
+            Stop the query thread pool.
+
+        Args:
+            wait (bool, optional): . Defaults to True.: Wait for the running queries to finish.
+
+        Returns:
+            int: : self.success
+        """
+        title = "shutdown"
+        if self.owns_executor is False:
+            self.executor = None
+            return self.success
+        if self.executor is not None:
+            self.disp.log_debug("Shutting down the sql thread pool.", title)
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+        return self.success
+
+    def __del__(self) -> None:
+        """
+            Stop the thread pool when the class is destroyed
+        """
+        self.shutdown(wait=False)
@@ -2,14 +2,20 @@
     File in charge of containing the class that will manage the sql connections.
 """
 
-from typing import Union, Any
+import time
+from contextlib import contextmanager
+from typing import Union, List, Any, Iterator, Tuple
 
 import mysql
 import mysql.connector
 import mysql.connector.cursor
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 from . import sql_constants as SCONST
+from .sql_row import SQLRow
+from .sql_metrics import SQLMetrics
+from .sql_transaction import SQLTransaction
 from .. import constants as CONST
 
 class SQLManageConnections:
@@ -41,7 +47,7 @@ class SQLManageConnections:
         self.password: str = password
         self.db_name: str = db_name
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -71,6 +77,8 @@ class SQLManageConnections:
             "ssl_cipher": CONST.DATABASE_SSL_CIPHER,
             "ssl_verify_cert": CONST.DATABASE_SSL_VERIFY_CERT
         }
+        # --------------------- The timing of the queries ----------------------
+        self.metrics: SQLMetrics = SQLMetrics(enabled=CONST.METRICS_ENABLED)
         # ---------------- variables containing the connection  ----------------
         self.pool: Union[
             None,
@@ -124,7 +132,7 @@ class SQLManageConnections:
             for i in SCONST.UNWANTED_ARGUMENTS:
                 if i in self.pool_parameters and self.pool_parameters[i] is None:
                     self.disp.log_debug(
-                        f"Removed '{i}' from the pool parameters.", title
+                        "Removed '%s' from the pool parameters.", title, i
                     )
                     self.pool_parameters.pop(i)
             self.show_connection_info(title)
@@ -165,15 +173,20 @@ class SQLManageConnections:
             raise RuntimeError("Connection pool is not initialized.")
         try:
             self.disp.log_debug("Getting an sql connection", title)
-            return self.pool.get_connection()
+            start = time.perf_counter()
+            connection = self.pool.get_connection()
+            self.metrics.observe_pool_wait(time.perf_counter() - start)
+            return connection
         except mysql.connector.errors.OperationalError as oe:
             msg = "OperationalError: Could not retrieve a connection from the pool."
             msg += f" Original error: {str(oe)}"
+            self.metrics.observe_error(("", "connection"))
             self.disp.log_critical(msg, title)
             raise RuntimeError(msg) from oe
         except mysql.connector.Error as e:
             msg = "MySQL Error: An unexpected error occurred while getting the connection."
             msg += f" Original error: {str(e)}"
+            self.metrics.observe_error(("", "connection"))
             self.disp.log_critical(msg, title)
             raise RuntimeError(msg) from e
 
@@ -191,6 +204,20 @@ class SQLManageConnections:
             raise RuntimeError("Cannot get cursor, connection is not active.")
         return connection.cursor()
 
+    def _execute(self, cursor: mysql.connector.cursor.MySQLCursor, query: str, params: Union[List[Any], None] = None) -> None:
+        """
+        Executes a query, binding the parameters to its placeholders if some are provided.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): The active cursor.
+            query (str): The query to execute.
+            params (Union[List[Any], None], optional): The values bound to the placeholders. Defaults to None.
+        """
+        if params is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, tuple(params))
+
     def close_cursor(self, cursor: mysql.connector.cursor.MySQLCursor) -> int:
         """
         Closes the given cursor.
@@ -260,13 +287,15 @@ class SQLManageConnections:
         msg += f"connection = {status}"
         self.disp.log_debug(msg, title)
 
-    def run_and_commit(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None) -> int:
+    def run_and_commit(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None, params: Union[List[Any], None] = None, shape: Union[Tuple[str, str], None] = None) -> int:
         """
         Executes a query and commits changes.
 
         Args:
             cursor (mysql.connector.cursor.MySQLCursor): The active cursor.
             query (str): The query to execute.
+            params (Union[List[Any], None], optional): The values bound to the placeholders (escaped by the client, no statement is prepared on the server). Defaults to None.
+            shape (Union[Tuple[str, str], None], optional): The table and operation the query is timed under, read from the query if None. Defaults to None.
         """
         title = "run_and_commit"
         self.disp.log_debug("Running and committing sql query.", title)
@@ -283,11 +312,15 @@ class SQLManageConnections:
         else:
             self.disp.log_debug("Cursor found, using it.", title)
             internal_cursor = cursor
+        if shape is None and self.metrics.enabled is True:
+            shape = self.metrics.query_shape(query)
         try:
-            self.disp.log_debug(f"Executing query: {query}.", title)
-            internal_cursor.execute(query)
+            self.disp.log_debug("Executing query: %s.", title, query)
+            start = time.perf_counter()
+            self._execute(internal_cursor, query, params)
             self.disp.log_debug("Committing content.", title)
             internal_cursor._connection.commit()
+            self.metrics.observe_query(shape, time.perf_counter() - start)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -302,6 +335,7 @@ class SQLManageConnections:
             msg = "ProgrammingError: Failed to execute the query."
             msg += f" Original error: {str(pe)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -316,6 +350,7 @@ class SQLManageConnections:
             msg = "IntegrityError: Integrity constraint issue occurred during query execution."
             msg += f" Original error: {str(ie)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -330,6 +365,7 @@ class SQLManageConnections:
             msg = "OperationalError: Operational error occurred during query execution."
             msg += f" Original error: {str(oe)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -344,6 +380,7 @@ class SQLManageConnections:
             msg = "MySQL Error: An unexpected error occurred during query execution."
             msg += f" Original error: {str(e)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -355,15 +392,42 @@ class SQLManageConnections:
                 )
             raise RuntimeError(msg) from e
 
-    def run_and_fetch_all(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None) -> Union[int, Any]:
+    def _format_rows(self, description: List[Any], raw_data: List[tuple], row_mode: str) -> List[Any]:
+        """
+        Convert the rows returned by the cursor into the requested format using the column names of the cursor.
+
+        Args:
+            description (List[Any]): The cursor.description of the executed query.
+            raw_data (List[tuple]): The rows returned by fetchall.
+            row_mode (str): One of SCONST.ROW_MODES.
+
+        Returns:
+            List[Any]: The formatted rows.
+        """
+        if row_mode == SCONST.ROW_MODE_DICT:
+            column_names = [column[0] for column in description]
+            return [dict(zip(column_names, row)) for row in raw_data]
+        if row_mode == SCONST.ROW_MODE_ROW:
+            column_index = {
+                column[0]: index for index, column in enumerate(description)
+            }
+            return [SQLRow(column_index, row) for row in raw_data]
+        return raw_data.copy()
+
+    def run_and_fetch_all(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None, row_mode: str = SCONST.ROW_MODE_TUPLE, params: Union[List[Any], None] = None) -> Union[int, Any]:
         """
         Executes a query and fetches all results.
 
         Args:
             cursor (mysql.connector.cursor.MySQLCursor): The active cursor.
             query (str): The query to execute.
+            row_mode (str, optional): The format of the rows: 'tuple' (raw), 'dict' or 'row' (compact dict-like SQLRow). Defaults to 'tuple'.
+            params (Union[List[Any], None], optional): The values bound to the placeholders (escaped by the client, no statement is prepared on the server). Defaults to None.
         """
         title = "run_and_fetchall"
+        if row_mode not in SCONST.ROW_MODES:
+            self.disp.log_error(f"Unknown row mode '{row_mode}'.", title)
+            return self.error
         if cursor is None:
             connection = self.get_connection()
             if connection is None:
@@ -375,13 +439,18 @@ class SQLManageConnections:
                 return self.error
         else:
             internal_cursor = cursor
+        shape: Union[Tuple[str, str], None] = None
+        if self.metrics.enabled is True:
+            shape = self.metrics.query_shape(query)
         try:
-            self.disp.log_debug(f"Executing query: {query}.", title)
-            internal_cursor.execute(query)
+            self.disp.log_debug("Executing query: %s.", title, query)
+            start = time.perf_counter()
+            self._execute(internal_cursor, query, params)
             if internal_cursor is None or internal_cursor.description is None:
                 self.disp.log_error(
                     "Failed to gather data from the table, cursor is invalid.", title
                 )
+                self.metrics.observe_error(shape)
                 if cursor is None:
                     self.disp.log_debug(
                         "The cursor was generated by us, releasing.", title
@@ -398,9 +467,13 @@ class SQLManageConnections:
                 "Storing a copy of the content of the cursor.", title
             )
             raw_data = internal_cursor.fetchall()
-            self.disp.log_debug(f"Raw gathered data {raw_data}", title)
-            data = raw_data.copy()
-            self.disp.log_debug(f"Data gathered: {data}.", title)
+            data = self._format_rows(
+                internal_cursor.description, raw_data, row_mode
+            )
+            self.metrics.observe_query(
+                shape, time.perf_counter() - start, len(raw_data)
+            )
+            self.disp.log_debug("Rows gathered: %s.", title, len(raw_data))
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -415,6 +488,7 @@ class SQLManageConnections:
             msg = "ProgrammingError: Failed to execute the query."
             msg += f" Original error: {str(pe)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -429,6 +503,7 @@ class SQLManageConnections:
             msg = "IntegrityError: Integrity constraint issue occurred during query execution."
             msg += f" Original error: {str(ie)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -443,6 +518,7 @@ class SQLManageConnections:
             msg = "OperationalError: Operational error occurred during query execution."
             msg += f" Original error: {str(oe)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -457,6 +533,7 @@ class SQLManageConnections:
             msg = "MySQL Error: An unexpected error occurred during query execution."
             msg += f" Original error: {str(e)}"
             self.disp.log_error(msg, title)
+            self.metrics.observe_error(shape)
             if cursor is None:
                 self.disp.log_debug(
                     "The cursor was generated by us, releasing.", title
@@ -468,19 +545,41 @@ class SQLManageConnections:
                 )
             raise RuntimeError(msg) from e
 
-    def run_editing_command(self, sql_query: str, table: str, action_type: str = "update") -> int:
+    @contextmanager
+    def transaction(self) -> Iterator[SQLTransaction]:
+        """
+        Hold a single connection for several queries and commit them once when the block ends.
+        The changes are rolled back if the block raises or if one of the statements failed.
+
+        Yields:
+            SQLTransaction: The unit of work to run the queries on.
+        """
+        sql_transaction = SQLTransaction(
+            self, success=self.success, error=self.error, debug=self.debug
+        )
+        try:
+            yield sql_transaction
+        except BaseException:
+            sql_transaction.end(commit=False)
+            raise
+        sql_transaction.end(commit=True)
+
+    def run_editing_command(self, sql_query: str, table: str, action_type: str = "update", params: Union[List[Any], None] = None) -> int:
         """
             Function in charge of running the execute and making sure that the connection to the database is still valid.
 
         Args:
             command (str): 
+            params (Union[List[Any], None], optional): The values bound to the placeholders. Defaults to None.
 
         Returns:
             int: 
         """
         title = "_run_editing_command"
         try:
-            resp = self.run_and_commit(query=sql_query)
+            resp = self.run_and_commit(
+                query=sql_query, params=params, shape=(table, action_type)
+            )
             if resp != self.success:
                 self.disp.log_error(
                     f"Failed to {action_type} data in '{table}'.", title
@@ -555,7 +654,7 @@ class SQLManageConnections:
         self.disp.log_debug(
             "Checking if the provided cursor is active.", title
         )
-        self.disp.log_debug(f"Content of the cursor: {dir(cursor)}.", title)
+        self.disp.log_debug(lambda: f"Content of the cursor: {dir(cursor)}.", title)
         resp = cursor is not None and cursor._connection is not None
         if resp:
             self.disp.log_debug("The cursor is active.", title)
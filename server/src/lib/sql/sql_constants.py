@@ -2,7 +2,7 @@
     File in charge of storing information that is required for the sql library, but is constant.
 """
 
-from typing import List
+from typing import List, Tuple
 
 # initialisation arguments to remove if empty (or equal to None)
 UNWANTED_ARGUMENTS = [
@@ -54,6 +54,36 @@ DATE_ONLY: str = '%Y-%m-%d'
 
 DATE_AND_TIME: str = '%Y-%m-%d %H:%M:%S'
 
+# Parameterised queries
+PLACEHOLDER: str = "%s"
+
+# A table or column name (optionally prefixed by its table and/or wrapped in backticks)
+IDENTIFIER_PATTERN: str = r"^`?[A-Za-z_][A-Za-z0-9_$]*`?(\.`?[A-Za-z_][A-Za-z0-9_$]*`?)?$"
+
+# A where condition in the form: column<operator>value
+WHERE_CONDITION_PATTERN: str = r"^\s*(`?[A-Za-z_][A-Za-z0-9_$]*`?(?:\.`?[A-Za-z_][A-Za-z0-9_$]*`?)?)\s*(<=|>=|!=|<>|=|<|>)\s*(.*?)\s*$"
+
+# The operators a where condition can use
+WHERE_OPERATORS: Tuple[str, ...] = ("<=", ">=", "!=", "<>", "=", "<", ">")
+
+# The value of a where condition written as a string: a quoted literal (quotes doubled inside), a `column` or a single word
+WHERE_VALUE_PATTERN: str = r"^(?:'((?:[^']|'')*)'|\"((?:[^\"]|\"\")*)\"|(`[A-Za-z_][A-Za-z0-9_$]*`(?:\.`[A-Za-z_][A-Za-z0-9_$]*`)?)|([^\s'\"`]+))$"
+
+# The AND that separates two where conditions written in the same string
+WHERE_AND_SPLIT_PATTERN: str = r"\s+AND\s+(?=`?[A-Za-z_][A-Za-z0-9_$.`]*\s*(?:<=|>=|!=|<>|=|<|>))"
+
+# The maximum amount of values sent in a single IN (...) clause
+IN_CHUNK_SIZE: int = 500
+
+# Row formats that can be returned by run_and_fetch_all
+ROW_MODE_TUPLE: str = "tuple"
+
+ROW_MODE_DICT: str = "dict"
+
+ROW_MODE_ROW: str = "row"
+
+ROW_MODES: List[str] = [ROW_MODE_TUPLE, ROW_MODE_DICT, ROW_MODE_ROW]
+
 # Error messages
 CONNECTION_FAILED: str = "Connection to the database is non-existant, aborting command."
 
@@ -61,3 +91,15 @@ CURSOR_FAILED: str = "Cursor to the database is non-existant, aborting command."
 
 # Specific error codes
 GET_TABLE_SIZE_ERROR: int = (-1)
+
+# Sparse ordering keys (rows are spaced so that a move only rewrites the moved row)
+POSITION_GAP: int = 1024
+
+POSITION_KEY_ERROR: int = (-1)
+
+# Index advisor (EXPLAIN access type of a full table scan and the arguments explain_query accepts)
+EXPLAIN_FULL_SCAN: str = "ALL"
+
+EXPLAIN_ARGUMENTS: List[str] = [
+    "table", "column", "where", "order_by", "descending", "limit"
+]
@@ -0,0 +1,119 @@
+"""
+    File in charge of checking that the queries sent by the server are served by an index.
+    It runs EXPLAIN on a list of queries and warns about the ones the database answers with a full table scan.
+"""
+
+from typing import List, Dict, Any
+
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
+
+from . import sql_constants as SCONST
+from .sql_query_boilerplates import SQLQueryBoilerplates
+
+
+class SQLIndexAdvisor:
+    """
+    The class in charge of spotting the queries that are not covered by an index.
+    """
+
+    def __init__(self, sql_query_boilerplates: SQLQueryBoilerplates, success: int = 0, error: int = 84, debug: bool = False) -> None:
+        """
+            The constructor of the index advisor.
+
+        Args:
+            sql_query_boilerplates (SQLQueryBoilerplates): : The functions used to build and explain the queries.
+            success (int, optional): . Defaults to 0.
+            error (int, optional): . Defaults to 84.
+            debug (bool, optional): . Defaults to False.
+        """
+        # -------------------------- Inherited values --------------------------
+        self.sql_query_boilerplates: SQLQueryBoilerplates = sql_query_boilerplates
+        self.error: int = error
+        self.debug: bool = debug
+        self.success: int = success
+        # --------------------------- logger section ---------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+
+    def _describe_query(self, query: Dict[str, Any]) -> str:
+        """
+            Turn a query description into a short text for the logs.
+
+        Args:
+            query (Dict[str, Any]): : The arguments given to explain_query.
+
+        Returns:
+            str: : The table followed by its where clause and its ordering.
+        """
+        where = query.get("where", "")
+        if isinstance(where, list):
+            where = " AND ".join(where)
+        description = f"{query.get('table')}"
+        if where != "":
+            description += f" WHERE {where}"
+        order_by = query.get("order_by")
+        if order_by is not None:
+            if isinstance(order_by, list):
+                order_by = ", ".join(order_by)
+            description += f" ORDER BY {order_by}"
+        return description
+
+    def explain(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+            Explain a query and return the steps of its plan that read the whole table.
+
+        Args:
+            query (Dict[str, Any]): : The arguments given to explain_query (table, column, where, order_by, descending, limit).
+
+        Returns:
+            List[Dict[str, Any]]: : The full scan steps (empty if the query uses an index or could not be explained).
+        """
+        title = "explain"
+        arguments = {
+            key: value for key, value in query.items()
+            if key in SCONST.EXPLAIN_ARGUMENTS
+        }
+        plan = self.sql_query_boilerplates.explain_query(**arguments)
+        if isinstance(plan, int) is True:
+            self.disp.log_error(
+                f"Could not explain '{self._describe_query(query)}'.", title
+            )
+            return []
+        return [
+            step for step in plan
+            if str(step.get("type", "")).upper() == SCONST.EXPLAIN_FULL_SCAN
+        ]
+
+    def check(self, queries: List[Dict[str, Any]]) -> int:
+        """
+            Explain every query and log a warning for each one that does a full table scan.
+
+        Args:
+            queries (List[Dict[str, Any]]): : The arguments given to explain_query for each query.
+
+        Returns:
+            int: : self.success if every query uses an index, self.error otherwise.
+        """
+        title = "check"
+        status = self.success
+        for query in queries:
+            full_scans = self.explain(query)
+            if len(full_scans) == 0:
+                continue
+            status = self.error
+            for step in full_scans:
+                msg = f"Full table scan on '{step.get('table')}'"
+                msg += f" (~{step.get('rows')} rows, possible keys: {step.get('possible_keys')})"
+                msg += f" for '{self._describe_query(query)}'."
+                self.disp.log_warning(msg, title)
+        if status == self.success:
+            self.disp.log_info(
+                f"The {len(queries)} checked queries are served by an index.", title
+            )
+        return status
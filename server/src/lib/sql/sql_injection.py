@@ -10,7 +10,8 @@
 import base64
 from typing import Union, List
 
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 
 class SQLInjection:
@@ -22,7 +23,7 @@ class SQLInjection:
         self.error: int = error
         self.success: int = success
         # ---------------------------- Logging data ----------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -69,8 +70,8 @@ class SQLInjection:
             for i in self.symbols:
                 if i in string:
                     self.disp.log_debug(
-                        f"Failed for {string}, node {i} was found.",
-                        "check_if_symbol_sql_injection"
+                        "Failed for %s, node %s was found.",
+                        "check_if_symbol_sql_injection", string, i
                     )
                     return True
         else:
@@ -94,8 +95,8 @@ class SQLInjection:
             for i in self.keywords:
                 if i in string:
                     self.disp.log_debug(
-                        f"Failed for {string}, node {i} was found.",
-                        "check_if_command_sql_injection"
+                        "Failed for %s, node %s was found.",
+                        "check_if_command_sql_injection", string, i
                     )
                     return True
         else:
@@ -115,8 +116,8 @@ class SQLInjection:
             for i in self.logic_gates:
                 if i in string:
                     self.disp.log_debug(
-                        f"Failed for {string}, node {i} was found.",
-                        "check_if_logic_gate_sql_injection"
+                        "Failed for %s, node %s was found.",
+                        "check_if_logic_gate_sql_injection", string, i
                     )
                     return True
         else:
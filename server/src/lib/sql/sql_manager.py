@@ -3,11 +3,19 @@
     This contains functions that simplify the process of interracting with databases as well as check for injection attempts.
 """
 
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from contextlib import contextmanager
+from typing import Iterator
+
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 from .sql_time_manipulation import SQLTimeManipulation
 from .sql_connections import SQLManageConnections
 from .sql_query_boilerplates import SQLQueryBoilerplates
+from .sql_async_wrapper import SQLAsyncWrapper
+from .sql_index_advisor import SQLIndexAdvisor
+from .sql_metrics import SQLMetrics
+from .. import constants as CONST
 
 
 class SQL:
@@ -37,12 +45,15 @@ class SQL:
         self.password: str = password
         self.db_name: str = db_name
         # ----------------- Pre class variable initialisation  -----------------
-        self.disp: Disp = None
+        self.disp: LazyDisp = None
         self.sql_manage_connections: SQLManageConnections = None
         self.sql_time_manipulation: SQLTimeManipulation = None
         self.sql_query_boilerplates: SQLQueryBoilerplates = None
+        self.sql_async_wrapper: SQLAsyncWrapper = None
+        self.sql_index_advisor: SQLIndexAdvisor = None
+        self.sql_metrics: SQLMetrics = None
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -76,6 +87,9 @@ class SQL:
             msg = "Failed to initialise the connection pool."
             self.disp.log_critical(msg, "__init__")
             raise RuntimeError(f"Error: {msg}")
+        # ------------------------- sql timing metrics -------------------------
+        self.sql_metrics: SQLMetrics = self.sql_manage_connections.metrics
+        self.render_sql_metrics: SQLMetrics.render = self.sql_metrics.render
         # ----------------------- sql query boilerplates -----------------------
         self.sql_query_boilerplates: SQLQueryBoilerplates = SQLQueryBoilerplates(
             sql_pool=self.sql_manage_connections, success=self.success,
@@ -84,17 +98,76 @@ class SQL:
         self.get_table_column_names: SQLQueryBoilerplates.get_table_column_names = self.sql_query_boilerplates.get_table_column_names
         self.get_table_names: SQLQueryBoilerplates.get_table_names = self.sql_query_boilerplates.get_table_names
         self.describe_table: SQLQueryBoilerplates.describe_table = self.sql_query_boilerplates.describe_table
+        self.refresh_schema: SQLQueryBoilerplates.refresh_schema = self.sql_query_boilerplates.refresh_schema
         self.insert_data_into_table: SQLQueryBoilerplates.insert_data_into_table = self.sql_query_boilerplates.insert_data_into_table
         self.get_data_from_table: SQLQueryBoilerplates.get_data_from_table = self.sql_query_boilerplates.get_data_from_table
+        self.get_data_from_table_in: SQLQueryBoilerplates.get_data_from_table_in = self.sql_query_boilerplates.get_data_from_table_in
+        self.explain_query: SQLQueryBoilerplates.explain_query = self.sql_query_boilerplates.explain_query
         self.get_table_size: SQLQueryBoilerplates.get_table_size = self.sql_query_boilerplates.get_table_size
         self.update_data_in_table: SQLQueryBoilerplates.update_data_in_table = self.sql_query_boilerplates.update_data_in_table
         self.remove_data_from_table: SQLQueryBoilerplates.remove_data_from_table = self.sql_query_boilerplates.remove_data_from_table
         self.drop_data_from_table: SQLQueryBoilerplates.remove_data_from_table = self.sql_query_boilerplates.remove_data_from_table
+        self.remove_data_from_table_in: SQLQueryBoilerplates.remove_data_from_table_in = self.sql_query_boilerplates.remove_data_from_table_in
+        self.shift_column_in_table: SQLQueryBoilerplates.shift_column_in_table = self.sql_query_boilerplates.shift_column_in_table
+        self.get_position_key: SQLQueryBoilerplates.get_position_key = self.sql_query_boilerplates.get_position_key
+        self.get_next_position_key: SQLQueryBoilerplates.get_next_position_key = self.sql_query_boilerplates.get_next_position_key
+        self.renumber_positions: SQLQueryBoilerplates.renumber_positions = self.sql_query_boilerplates.renumber_positions
+        self.get_crowded_position_groups: SQLQueryBoilerplates.get_crowded_position_groups = self.sql_query_boilerplates.get_crowded_position_groups
+        # ---------------------------- Index advisor ---------------------------
+        self.sql_index_advisor: SQLIndexAdvisor = SQLIndexAdvisor(
+            sql_query_boilerplates=self.sql_query_boilerplates,
+            success=self.success,
+            error=self.error,
+            debug=self.debug
+        )
+        self.check_indexes: SQLIndexAdvisor.check = self.sql_index_advisor.check
+        # ----------------------- async query functions  -----------------------
+        self.sql_async_wrapper: SQLAsyncWrapper = SQLAsyncWrapper(
+            sql_query_boilerplates=self.sql_query_boilerplates,
+            max_workers=CONST.DATABASE_MAX_POOL_CONNECTIONS,
+            success=self.success,
+            error=self.error,
+            debug=self.debug
+        )
+        self.a_get_data_from_table: SQLAsyncWrapper.get_data_from_table = self.sql_async_wrapper.get_data_from_table
+        self.a_get_data_from_table_in: SQLAsyncWrapper.get_data_from_table_in = self.sql_async_wrapper.get_data_from_table_in
+        self.a_get_table_size: SQLAsyncWrapper.get_table_size = self.sql_async_wrapper.get_table_size
+        self.a_insert_data_into_table: SQLAsyncWrapper.insert_data_into_table = self.sql_async_wrapper.insert_data_into_table
+        self.a_update_data_in_table: SQLAsyncWrapper.update_data_in_table = self.sql_async_wrapper.update_data_in_table
+        self.a_remove_data_from_table: SQLAsyncWrapper.remove_data_from_table = self.sql_async_wrapper.remove_data_from_table
+        self.a_drop_data_from_table: SQLAsyncWrapper.remove_data_from_table = self.sql_async_wrapper.remove_data_from_table
+        self.a_remove_data_from_table_in: SQLAsyncWrapper.remove_data_from_table_in = self.sql_async_wrapper.remove_data_from_table_in
+        self.a_shift_column_in_table: SQLAsyncWrapper.shift_column_in_table = self.sql_async_wrapper.shift_column_in_table
+        self.a_get_position_key: SQLAsyncWrapper.get_position_key = self.sql_async_wrapper.get_position_key
+        self.a_get_next_position_key: SQLAsyncWrapper.get_next_position_key = self.sql_async_wrapper.get_next_position_key
+        self.a_transaction: SQLAsyncWrapper.transaction = self.sql_async_wrapper.transaction
+        self.a_run_blocking: SQLAsyncWrapper.run_blocking = self.sql_async_wrapper.run_blocking
+
+    @contextmanager
+    def transaction(self) -> Iterator[SQLQueryBoilerplates]:
+        """
+            Run several queries on a single connection and commit them once when the block ends.
+            The changes are rolled back if the block raises or if one of the statements failed.
+
+        Yields:
+            SQLQueryBoilerplates: : The query functions bound to the transaction.
+        """
+        with self.sql_manage_connections.transaction() as sql_transaction:
+            yield SQLQueryBoilerplates(
+                sql_pool=sql_transaction,
+                success=self.success,
+                error=self.error,
+                debug=self.debug,
+                schema_registry=self.sql_query_boilerplates.schema_registry
+            )
 
     def __del__(self) -> None:
         """
             Disconnect the database when the class is destroyed
         """
+        if self.sql_async_wrapper is not None:
+            self.sql_async_wrapper.shutdown(wait=False)
+            self.sql_async_wrapper = None
         if self.sql_manage_connections is not None:
             del self.sql_manage_connections
             self.sql_manage_connections = None
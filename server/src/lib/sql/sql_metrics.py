@@ -0,0 +1,141 @@
+"""
+    File in charge of containing the timing counters of the sql calls (per query shape), they are exposed on /metrics.
+"""
+
+import re
+from typing import Tuple, List, Union, Sequence
+
+from ..prometheus_metrics import CounterFamily, HistogramFamily, DEFAULT_BUCKETS
+from ..request_timing import record_dependency_time, DEPENDENCY_DB
+
+# The operations kept as a label, the other statements are counted as "other"
+KNOWN_OPERATIONS: Tuple[str, ...] = (
+    "select", "insert", "update", "delete", "replace",
+    "alter", "create", "drop", "explain", "show"
+)
+
+# Only the start of a query is read to find its shape (the values can be long)
+SHAPE_SCAN_LENGTH: int = 512
+
+
+class SQLMetrics:
+    """
+    The class recording the duration, the returned rows and the errors of the sql queries, grouped by table and operation.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+            Constructor
+
+        Args:
+            enabled (bool, optional): . Defaults to True.: Record the queries (nothing is recorded when False).
+            buckets (Sequence[float], optional): . Defaults to DEFAULT_BUCKETS.: The upper bounds (in seconds) of the latency buckets.
+        """
+        self.enabled: bool = enabled
+        self._table_pattern: re.Pattern = re.compile(
+            r"\b(?:FROM|INTO|TABLE)\s+`?([A-Za-z0-9_$]+)", re.IGNORECASE
+        )
+        self._update_pattern: re.Pattern = re.compile(
+            r"^\s*UPDATE\s+(?:LOW_PRIORITY\s+|IGNORE\s+)*`?([A-Za-z0-9_$]+)",
+            re.IGNORECASE
+        )
+        # ------------------------- The metric families ------------------------
+        self.query_duration: HistogramFamily = HistogramFamily(
+            "epitrello_sql_query_duration_seconds",
+            "Time spent running the sql queries (execution, fetch and commit).",
+            ("table", "operation"),
+            buckets
+        )
+        self.rows_returned: CounterFamily = CounterFamily(
+            "epitrello_sql_rows_returned_total",
+            "Amount of rows returned by the sql queries.",
+            ("table", "operation")
+        )
+        self.query_errors: CounterFamily = CounterFamily(
+            "epitrello_sql_errors_total",
+            "Amount of sql queries that failed.",
+            ("table", "operation")
+        )
+        self.pool_wait: HistogramFamily = HistogramFamily(
+            "epitrello_sql_pool_wait_seconds",
+            "Time spent waiting for a connection of the pool.",
+            (),
+            buckets
+        )
+
+    def query_shape(self, query: str) -> Tuple[str, str]:
+        """
+            Find the table and the operation of a query.
+
+        Args:
+            query (str): The query that is run.
+
+        Returns:
+            Tuple[str, str]: The table (empty if not found) and the operation (select, update...)
+        """
+        head = query[:SHAPE_SCAN_LENGTH]
+        words = head.split(None, 1)
+        if len(words) == 0:
+            return ("", "other")
+        operation = words[0].lower()
+        if operation == "update":
+            match = self._update_pattern.search(head)
+        else:
+            match = self._table_pattern.search(head)
+        if operation not in KNOWN_OPERATIONS:
+            operation = "other"
+        if match is None:
+            return ("", operation)
+        return (match.group(1), operation)
+
+    def observe_query(self, shape: Tuple[str, str], duration: float, rows: Union[int, None] = None) -> None:
+        """
+            Record a query that succeeded (its time is also added to the request being served, if any).
+
+        Args:
+            shape (Tuple[str, str]): The table and the operation of the query.
+            duration (float): The time the query took (in seconds).
+            rows (Union[int, None], optional): . Defaults to None.: The amount of returned rows, None if nothing was fetched.
+        """
+        record_dependency_time(DEPENDENCY_DB, duration)
+        if self.enabled is False:
+            return
+        self.query_duration.observe(shape, duration)
+        if rows is not None:
+            self.rows_returned.inc(shape, rows)
+
+    def observe_error(self, shape: Tuple[str, str]) -> None:
+        """
+            Record a query that failed.
+
+        Args:
+            shape (Tuple[str, str]): The table and the operation of the query.
+        """
+        if self.enabled is False:
+            return
+        self.query_errors.inc(shape)
+
+    def observe_pool_wait(self, duration: float) -> None:
+        """
+            Record the time spent getting a connection from the pool.
+
+        Args:
+            duration (float): The waiting time (in seconds).
+        """
+        if self.enabled is False:
+            return
+        self.pool_wait.observe((), duration)
+
+    def render(self) -> List[str]:
+        """
+            Write the sql metrics in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metrics.
+        """
+        lines: List[str] = []
+        lines.extend(self.query_duration.render())
+        lines.extend(self.rows_returned.render())
+        lines.extend(self.query_errors.render())
+        lines.extend(self.pool_wait.render())
+        return lines
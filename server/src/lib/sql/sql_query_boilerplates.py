@@ -2,16 +2,19 @@
     File in charge of storing the functions that will interract directly with the database.
 """
 
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Union, Any, Tuple
 
 import mysql
 import mysql.connector
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 
 from . import sql_constants as SCONST
 from .sql_injection import SQLInjection
 from .sql_connections import SQLManageConnections
+from .sql_transaction import SQLTransaction
+from .sql_schema_registry import SQLSchemaRegistry
 from .sql_sanitisation_functions import SQLSanitiseFunctions
 
 
@@ -19,12 +22,13 @@ class SQLQueryBoilerplates:
     """
     """
 
-    def __init__(self, sql_pool: SQLManageConnections, success: int = 0, error: int = 84, debug: bool = False) -> None:
+    def __init__(self, sql_pool: SQLManageConnections, success: int = 0, error: int = 84, debug: bool = False, schema_registry: Union[SQLSchemaRegistry, None] = None) -> None:
         """
         The class in charge of managing sql queries (it contains the required boilerplate functions).
 
         Args:
             sql_pool (SQLManageConnections): 
+            schema_registry (Union[SQLSchemaRegistry, None], optional): . Defaults to None.: The cache of the table descriptions, a new one is created if None.
             success (int, optional): . Defaults to 0.
             error (int, optional): . Defaults to 84.
             debug (bool, optional): . Defaults to False.
@@ -35,7 +39,7 @@ class SQLQueryBoilerplates:
         self.debug: bool = debug
         self.success: int = success
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -52,6 +56,30 @@ class SQLQueryBoilerplates:
         self.sanitize_functions: SQLSanitiseFunctions = SQLSanitiseFunctions(
             success=self.success, error=self.error, debug=self.debug
         )
+        # ----------------------- Table schema registry ------------------------
+        if schema_registry is None:
+            schema_registry = SQLSchemaRegistry(
+                success=self.success, error=self.error, debug=self.debug
+            )
+        self.schema_registry: SQLSchemaRegistry = schema_registry
+
+    def is_committed(self) -> bool:
+        """
+            Check that the transaction the boilerplates are bound to was committed once its block ended (call it after the block).
+
+        Returns:
+            bool: : True if the changes were committed (or if no transaction is bound), False if they were rolled back.
+        """
+        if isinstance(self.sql_pool, SQLTransaction) is False:
+            return True
+        return self.sql_pool.is_committed()
+
+    def mark_failed(self) -> None:
+        """
+            Make sure the transaction the boilerplates are bound to is rolled back when its block ends (does nothing if no transaction is bound).
+        """
+        if isinstance(self.sql_pool, SQLTransaction) is True:
+            self.sql_pool.mark_failed()
 
     def get_table_column_names(self, table_name: str) -> Union[List[str], int]:
         """
@@ -82,6 +110,18 @@ class SQLQueryBoilerplates:
             self.disp.log_error(msg, "get_table_column_names")
             return self.error
 
+    def refresh_schema(self, table: Union[str, None] = None) -> int:
+        """
+            Forget the stored table descriptions so that they are fetched again (to be called after a migration).
+
+        Args:
+            table (Union[str, None], optional): . Defaults to None.: The table to refresh, every table if None.
+
+        Returns:
+            int: : self.success
+        """
+        return self.schema_registry.refresh(table)
+
     def get_table_names(self) -> Union[int, List[str]]:
         """
             Get the names of the tables in the database.
@@ -118,7 +158,13 @@ class SQLQueryBoilerplates:
             Union[int, List[Any]]: : A list containing the description of the table, or self.error if an error occurs.
         """
         title = "describe_table"
-        self.disp.log_debug(f"Describing table {table}", title)
+        self.disp.log_debug("Describing table %s", title, table)
+        cached_description = self.schema_registry.get_description(table)
+        if cached_description is not None:
+            self.disp.log_debug(
+                "Description of %s found in the registry.", title, table
+            )
+            return cached_description
         if self.sql_injection.check_if_sql_injection(table) is True:
             self.disp.log_error("Injection detected.", "sql")
             return self.error
@@ -129,6 +175,7 @@ class SQLQueryBoilerplates:
                     f"Failed to describe table  {table}", title
                 )
                 return self.error
+            self.schema_registry.set_description(table, resp)
             return resp
         except mysql.connector.errors.ProgrammingError as pe:
             msg = f"ProgrammingError: The table '{table}'"
@@ -155,6 +202,138 @@ class SQLQueryBoilerplates:
             self.disp.log_critical(msg, title)
             raise RuntimeError(msg) from e
 
+    def _check_identifiers(self, identifiers: Union[str, List[str]], allow_star: bool = False) -> bool:
+        """
+            Check that the table and column names can be safely written in a query.
+
+        Args:
+            identifiers (Union[str, List[str]]): : The names to check.
+            allow_star (bool, optional): . Defaults to False.: Accept '*' as a column name.
+
+        Returns:
+            bool: : True if every name is valid, False otherwise.
+        """
+        if isinstance(identifiers, str) is True:
+            identifiers = [identifiers]
+        if isinstance(identifiers, list) is False:
+            return False
+        for name in identifiers:
+            if allow_star is True and name == "*":
+                continue
+            if self.sanitize_functions.is_safe_identifier(name) is False:
+                self.disp.log_error(
+                    f"Invalid identifier: '{name}'.", "_check_identifiers"
+                )
+                return False
+        return True
+
+    def _compile_columns(self, column: Union[str, List[str]]) -> str:
+        """
+            Convert the column(s) into the column section of a query.
+
+        Args:
+            column (Union[str, List[str]]): : The column(s) that were checked with _check_identifiers.
+
+        Returns:
+            str: : The quoted columns, separated by commas.
+        """
+        if isinstance(column, str) is True:
+            column = [column]
+        return ", ".join(
+            self.sanitize_functions.quote_identifier(i) for i in column
+        )
+
+    def _compile_where(self, sql_command: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]) -> Union[Tuple[str, List[Any]], int]:
+        """
+            Append the where clause to a query.
+
+        Args:
+            sql_command (str): : The query without its where clause.
+            where (Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]): : The conditions.
+
+        Returns:
+            Union[Tuple[str, List[Any]], int]: : The completed query and its parameters, self.error if the conditions are invalid.
+        """
+        if where is None or where == "" or where == []:
+            return sql_command, []
+        compiled = self.sanitize_functions.build_where_clause(where)
+        if isinstance(compiled, int) is True:
+            return self.error
+        clause, params = compiled
+        if clause != "":
+            sql_command += f" WHERE {clause}"
+        return sql_command, params
+
+    def _compile_ordering(self, sql_command: str, order_by: Union[str, List[str], None] = None, descending: bool = False, limit: Union[int, None] = None, after: Union[List[Any], None] = None) -> Union[Tuple[str, List[Any]], int]:
+        """
+            Append the keyset condition, the ORDER BY and the LIMIT sections to a query that already contains its where clause.
+
+        Args:
+            sql_command (str): : The query with its where clause.
+            order_by (Union[str, List[str], None], optional): . Defaults to None.: The column(s) used to sort the rows.
+            descending (bool, optional): . Defaults to False.: Sort every order_by column in descending order.
+            limit (Union[int, None], optional): . Defaults to None.: The maximum amount of rows to return.
+            after (Union[List[Any], None], optional): . Defaults to None.: The order_by values of the last row of the previous page.
+
+        Returns:
+            Union[Tuple[str, List[Any]], int]: : The completed query and the parameters to add, self.error if the arguments are invalid.
+        """
+        params: List[Any] = []
+        if isinstance(order_by, str) is True:
+            order_by = [order_by]
+        if order_by is None or len(order_by) == 0:
+            if after is not None:
+                return self.error
+            order_by = []
+        if self._check_identifiers(order_by) is False:
+            return self.error
+        quoted = [self.sanitize_functions.quote_identifier(i) for i in order_by]
+        if after is not None:
+            if len(after) != len(quoted):
+                return self.error
+            operator = "<" if descending is True else ">"
+            conditions = []
+            for index, column in enumerate(quoted):
+                equalities = [f"{i} = {SCONST.PLACEHOLDER}" for i in quoted[:index]]
+                equalities.append(f"{column} {operator} {SCONST.PLACEHOLDER}")
+                conditions.append(f"({' AND '.join(equalities)})")
+                params.extend(after[:index + 1])
+            sql_command += " AND" if " WHERE " in sql_command else " WHERE"
+            sql_command += f" ({' OR '.join(conditions)})"
+        if len(quoted) > 0:
+            direction = " DESC" if descending is True else ""
+            sql_command += " ORDER BY " + ", ".join(f"{i}{direction}" for i in quoted)
+        if limit is not None:
+            if isinstance(limit, int) is False or limit < 0:
+                return self.error
+            sql_command += f" LIMIT {limit}"
+        return sql_command, params
+
+    def _compile_select(self, table: str, column: Union[str, List[str]], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", order_by: Union[str, List[str], None] = None, descending: bool = False, limit: Union[int, None] = None, after: Union[List[Any], None] = None) -> Union[Tuple[str, List[Any]], int]:
+        """
+            Build the SELECT query (and its bound values) run by get_data_from_table.
+
+        Returns:
+            Union[Tuple[str, List[Any]], int]: : The query and the values of its placeholders, self.error if an element is invalid.
+        """
+        if self._check_identifiers(table) is False or self._check_identifiers(column, allow_star=True) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        sql_command = f"SELECT {self._compile_columns(column)} FROM {table}"
+        compiled = self._compile_where(sql_command, where)
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return self.error
+        sql_command, params = compiled
+        compiled = self._compile_ordering(
+            sql_command, order_by, descending, limit, after
+        )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid ordering or pagination.", "sql")
+            return self.error
+        sql_command, order_params = compiled
+        return sql_command, params + order_params
+
     def insert_data_into_table(self, table: str, data: Union[List[List[str]], List[str]], column: Union[List[str], None] = None) -> int:
         """
         Insert data into a table.
@@ -169,118 +348,212 @@ class SQLQueryBoilerplates:
         """
         title = "insert_data_into_table"
         self.disp.log_debug("Inserting data into the table.", title)
-        if column is None:
-            column = ""
-        if self.sql_injection.check_if_injections_in_strings([table, data, column]) is True:
-            self.disp.log_error("Injection detected.", "sql")
+        if self._check_identifiers(table) is False:
+            self.disp.log_error("Invalid table name.", "sql")
             return self.error
 
-        if column == "":
+        if column is None or column == "":
             column = self.get_table_column_names(table)
+            if isinstance(column, int) is True:
+                return self.error
+        if isinstance(column, str) is True:
+            column = [column]
+        if self._check_identifiers(column) is False:
+            self.disp.log_error("Invalid column name.", "sql")
+            return self.error
 
-        column = self.sanitize_functions.escape_risky_column_names(column)
-
-        column_str = ", ".join(column)
+        column_str = self._compile_columns(column)
         column_length = len(column)
 
         if isinstance(data, List) is True and (len(data) > 0 and isinstance(data[0], List) is True):
             self.disp.log_debug("processing double array", title)
-            values = ""
-            max_lengths = len(data)
-            for index, line in enumerate(data):
-                values += self.sanitize_functions.process_sql_line(
-                    line, column, column_length
-                )
-                if index < max_lengths - 1:
-                    values += ", "
-                if index == max_lengths - 1:
-                    break
-
+            lines = data
         elif isinstance(data, List) is True:
             self.disp.log_debug("processing single array", title)
-            values = self.sanitize_functions.process_sql_line(
-                data, column, column_length
-            )
+            lines = [data]
         else:
             self.disp.log_error(
                 "data is expected to be, either of type: List[str] or List[List[str]]",
                 title
             )
             return self.error
+
+        params: List[Any] = []
+        for line in lines:
+            if len(line) < column_length:
+                self.disp.log_error(
+                    "The line is shorter than the number of columns.", title
+                )
+                return self.error
+            for i in range(0, column_length):
+                params.append(self.sanitize_functions.prepare_sql_value(line[i]))
+        placeholders = ", ".join([SCONST.PLACEHOLDER] * column_length)
+        values = ", ".join([f"({placeholders})"] * len(lines))
         sql_query = f"INSERT INTO {table} ({column_str}) VALUES {values}"
-        self.disp.log_debug(f"sql_query = '{sql_query}'", title)
-        return self.sql_pool.run_editing_command(sql_query, table, "insert")
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        return self.sql_pool.run_editing_command(
+            sql_query, table, "insert", params=params
+        )
 
-    def get_data_from_table(self, table: str, column: Union[str, List[str]], where: Union[str, List[str]] = "", beautify: bool = True) -> Union[int, List[Dict[str, Any]]]:
+    def get_data_from_table(self, table: str, column: Union[str, List[str]], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", beautify: bool = True, compact: bool = False, order_by: Union[str, List[str], None] = None, descending: bool = False, limit: Union[int, None] = None, after: Union[List[Any], None] = None) -> Union[int, List[Dict[str, Any]]]:
         """
         Args:
             table (str): 
             column (Union[str, List[str]]): 
-            where (Union[str, List[str]]): 
+            where (Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]): 
+            beautify (bool, optional): . Defaults to True.: Return the rows as dictionaries (named after the cursor columns) instead of tuples.
+            compact (bool, optional): . Defaults to False.: When beautifying, return SQLRow instances (dict-like, lighter on large result sets) instead of dictionaries.
+            order_by (Union[str, List[str], None], optional): . Defaults to None.: The column(s) used to sort the rows.
+            descending (bool, optional): . Defaults to False.: Sort every order_by column in descending order.
+            limit (Union[int, None], optional): . Defaults to None.: The maximum amount of rows to return.
+            after (Union[List[Any], None], optional): . Defaults to None.: Keyset pagination, only return the rows placed after these order_by values.
 
         Returns:
             Union[int, List[Dict[str, Any]]]: : Will return the data you requested, self.error otherwise
         """
         title = "get_data_from_table"
-        self.disp.log_debug(f"fetching data from the table {table}", title)
-        if self.sql_injection.check_if_injections_in_strings([table, column]) is True or self.sql_injection.check_if_symbol_and_command_injection(where) is True:
-            self.disp.log_error("Injection detected.", "sql")
+        self.disp.log_debug("fetching data from the table %s", title, table)
+        compiled = self._compile_select(
+            table, column, where, order_by, descending, limit, after
+        )
+        if isinstance(compiled, int) is True:
             return self.error
-        if isinstance(column, list) is True:
-            column = self.sanitize_functions.escape_risky_column_names(column)
-            column = ", ".join(column)
-        sql_command = f"SELECT {column} FROM {table}"
-        if isinstance(where, (str, List)) is True:
-            where = self.sanitize_functions.escape_risky_column_names_where_mode(
-                where
-            )
-        if isinstance(where, List) is True:
-            where = " AND ".join(where)
-        if where != "":
-            sql_command += f" WHERE {where}"
-        self.disp.log_debug(f"sql_query = '{sql_command}'", title)
-        resp = self.sql_pool.run_and_fetch_all(query=sql_command)
+        sql_command, params = compiled
+        self.disp.log_debug("sql_query = '%s'", title, sql_command)
+        row_mode = SCONST.ROW_MODE_TUPLE
+        if beautify is True:
+            row_mode = SCONST.ROW_MODE_ROW if compact is True else SCONST.ROW_MODE_DICT
+        resp = self.sql_pool.run_and_fetch_all(
+            query=sql_command, row_mode=row_mode, params=params
+        )
         if isinstance(resp, int) is True and resp != self.success:
             self.disp.log_error(
                 "Failed to fetch the data from the table.", title
             )
             return self.error
-        self.disp.log_debug(f"Queried data: {resp}", title)
-        if beautify is False:
-            return resp
-        data = self.describe_table(table)
-        return self.sanitize_functions.beautify_table(data, resp)
+        self.disp.log_debug("Queried rows: %s", title, resp if isinstance(resp, int) else len(resp))
+        if beautify is True and len(resp) == 0:
+            self.disp.log_error("There is no table content.", title)
+            return self.error
+        return resp
+
+    def get_data_from_table_in(self, table: str, column: Union[str, List[str]], in_column: str, values: List[Any], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", beautify: bool = True, compact: bool = False, chunk_size: int = SCONST.IN_CHUNK_SIZE) -> Union[int, List[Dict[str, Any]]]:
+        """
+            Fetch the rows whose column matches any of the given values (WHERE column IN (...)) instead of running one query per value.
+
+        Args:
+            table (str): : The name of the table.
+            column (Union[str, List[str]]): : The column(s) to fetch.
+            in_column (str): : The column compared to the values (i.e. id).
+            values (List[Any]): : The values to look for, duplicates are only sent once.
+            where (Union[str, List[str]], optional): . Defaults to "".: Additional conditions.
+            beautify (bool, optional): . Defaults to True.: Return the rows as dictionaries instead of tuples.
+            compact (bool, optional): . Defaults to False.: When beautifying, return SQLRow instances instead of dictionaries.
+            chunk_size (int, optional): . Defaults to SCONST.IN_CHUNK_SIZE.: The maximum amount of values sent in a single query.
+
+        Returns:
+            Union[int, List[Dict[str, Any]]]: : The rows of every chunk, self.error otherwise (or if nothing was found when beautifying).
+        """
+        title = "get_data_from_table_in"
+        self.disp.log_debug(
+            "fetching data from the table %s for %s values", title, table, len(values)
+        )
+        if self._check_identifiers([table, in_column]) is False or self._check_identifiers(column, allow_star=True) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        unique_values = list(dict.fromkeys(str(i) for i in values))
+        chunk_size = max(1, int(chunk_size))
+        row_mode = SCONST.ROW_MODE_TUPLE
+        if beautify is True:
+            row_mode = SCONST.ROW_MODE_ROW if compact is True else SCONST.ROW_MODE_DICT
+        quoted_in_column = self.sanitize_functions.quote_identifier(in_column)
+        data: List[Any] = []
+        for index in range(0, len(unique_values), chunk_size):
+            chunk = unique_values[index:index + chunk_size]
+            compiled = self._compile_where(
+                f"SELECT {self._compile_columns(column)} FROM {table}", where
+            )
+            if isinstance(compiled, int) is True:
+                self.disp.log_error("Invalid where clause.", "sql")
+                return self.error
+            sql_command, params = compiled
+            sql_command += " AND" if " WHERE " in sql_command else " WHERE"
+            placeholders = ", ".join([SCONST.PLACEHOLDER] * len(chunk))
+            sql_command += f" {quoted_in_column} IN ({placeholders})"
+            self.disp.log_debug("sql_query = '%s'", title, sql_command)
+            resp = self.sql_pool.run_and_fetch_all(
+                query=sql_command, row_mode=row_mode, params=params + chunk
+            )
+            if isinstance(resp, int) is True:
+                self.disp.log_error(
+                    "Failed to fetch the data from the table.", title
+                )
+                return self.error
+            data.extend(resp)
+        if beautify is True and len(data) == 0:
+            self.disp.log_error("There is no table content.", title)
+            return self.error
+        return data
+
+    def explain_query(self, table: str, column: Union[str, List[str]] = "*", where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", order_by: Union[str, List[str], None] = None, descending: bool = False, limit: Union[int, None] = None) -> Union[int, List[Dict[str, Any]]]:
+        """
+            Run EXPLAIN on the query get_data_from_table would send with the same arguments.
+
+        Args:
+            table (str): : The table that is read.
+            column (Union[str, List[str]], optional): . Defaults to "*".
+            where (Union[str, List[str]], optional): . Defaults to "".
+            order_by (Union[str, List[str], None], optional): . Defaults to None.
+            descending (bool, optional): . Defaults to False.
+            limit (Union[int, None], optional): . Defaults to None.
+
+        Returns:
+            Union[int, List[Dict[str, Any]]]: : One dictionary per step of the plan (id, select_type, table, type, key, rows, Extra...), self.error otherwise.
+        """
+        title = "explain_query"
+        compiled = self._compile_select(
+            table, column, where, order_by, descending, limit
+        )
+        if isinstance(compiled, int) is True:
+            return self.error
+        sql_command, params = compiled
+        sql_command = f"EXPLAIN {sql_command}"
+        self.disp.log_debug("sql_query = '%s'", title, sql_command)
+        resp = self.sql_pool.run_and_fetch_all(
+            query=sql_command, row_mode=SCONST.ROW_MODE_DICT, params=params
+        )
+        if isinstance(resp, int) is True:
+            self.disp.log_error(f"Failed to explain the query on {table}.", title)
+            return self.error
+        return resp
 
-    def get_table_size(self, table: str, column: Union[str, List[str]], where: Union[str, List[str]] = "") -> Union[int]:
+    def get_table_size(self, table: str, column: Union[str, List[str]], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> Union[int]:
         """
             Get the size of a table.
 
         Args:
             table (str): 
             column (Union[str, List[str]]): 
-            where (Union[str, List[str]]): 
+            where (Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]): 
 
         Returns:
             int: : Return the size of the table, -1 if an error occurred.
         """
         title = "get_table_size"
-        self.disp.log_debug(f"fetching data from the table {table}", title)
-        if self.sql_injection.check_if_injections_in_strings([table, column]) is True or self.sql_injection.check_if_symbol_and_command_injection(where) is True:
-            self.disp.log_error("Injection detected.", "sql")
+        self.disp.log_debug("fetching data from the table %s", title, table)
+        if self._check_identifiers(table) is False or self._check_identifiers(column, allow_star=True) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
             return SCONST.GET_TABLE_SIZE_ERROR
-        if isinstance(column, list) is True:
-            column = ", ".join(column)
-        sql_command = f"SELECT COUNT({column}) FROM {table}"
-        if isinstance(where, (str, List)) is True:
-            where = self.sanitize_functions.escape_risky_column_names_where_mode(
-                where
-            )
-        if isinstance(where, List) is True:
-            where = " AND ".join(where)
-        if where != "":
-            sql_command += f" WHERE {where}"
-        self.disp.log_debug(f"sql_query = '{sql_command}'", title)
-        resp = self.sql_pool.run_and_fetch_all(query=sql_command)
+        sql_command = f"SELECT COUNT({self._compile_columns(column)}) FROM {table}"
+        compiled = self._compile_where(sql_command, where)
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return SCONST.GET_TABLE_SIZE_ERROR
+        sql_command, params = compiled
+        self.disp.log_debug("sql_query = '%s'", title, sql_command)
+        resp = self.sql_pool.run_and_fetch_all(
+            query=sql_command, params=params
+        )
         if isinstance(resp, int) is True and resp != self.success:
             self.disp.log_error(
                 "Failed to fetch the data from the table.", title
@@ -296,7 +569,7 @@ class SQLQueryBoilerplates:
             return SCONST.GET_TABLE_SIZE_ERROR
         return resp[0][0]
 
-    def update_data_in_table(self, table: str, data: List[str], column: List, where: Union[str, List[str]] = "") -> int:
+    def update_data_in_table(self, table: str, data: List[str], column: List, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
         """
             Update the data contained in a table.
 
@@ -309,52 +582,62 @@ class SQLQueryBoilerplates:
             int: 
         """
         title = "update_data_in_table"
-        msg = f"Updating the data contained in the table: {table}"
-        self.disp.log_debug(msg, title)
-        if column is None:
-            column = ""
-
-        if self.sql_injection.check_if_injections_in_strings([table, column, data]) is True or self.sql_injection.check_if_symbol_and_command_injection(where) is True:
-            self.disp.log_error("Injection detected.", "sql")
+        self.disp.log_debug(
+            "Updating the data contained in the table: %s", title, table
+        )
+        if self._check_identifiers(table) is False:
+            self.disp.log_error("Invalid table name.", "sql")
             return self.error
 
-        if column == "":
+        if column is None or column == "":
             column = self.get_table_column_names(table)
+            if isinstance(column, int) is True:
+                return self.error
 
-        column = self.sanitize_functions.escape_risky_column_names(column)
-
-        if isinstance(column, str) and isinstance(data, str):
-            data = [data]
+        if isinstance(column, str) is True:
             column = [column]
-            column_length = len(column)
+        if isinstance(data, str) is True:
+            data = [data]
+        if self._check_identifiers(column) is False:
+            self.disp.log_error("Invalid column name.", "sql")
+            return self.error
 
         column_length = len(column)
         self.disp.log_debug(
-            f"data = {data}, column = {column}, length = {column_length}",
-            title
+            "data = %s, column = %s, length = %s",
+            title, data, column, column_length
         )
+        if len(data) < column_length:
+            self.disp.log_error(
+                "There is less data than columns to update.", title
+            )
+            return self.error
 
-        where = self.sanitize_functions.escape_risky_column_names_where_mode(
-            where
+        update_line = ", ".join(
+            f"{self.sanitize_functions.quote_identifier(i)} = {SCONST.PLACEHOLDER}"
+            for i in column
         )
+        params: List[Any] = [
+            self.sanitize_functions.prepare_sql_value(data[i])
+            for i in range(0, column_length)
+        ]
 
-        if isinstance(where, List) is True:
-            where = " AND ".join(where)
-
-        update_line = self.sanitize_functions.compile_update_line(
-            data, column, column_length
+        compiled = self._compile_where(
+            f"UPDATE {table} SET {update_line}", where
         )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return self.error
+        sql_query, where_params = compiled
+        params.extend(where_params)
 
-        sql_query = f"UPDATE {table} SET {update_line}"
-
-        if where != "":
-            sql_query += f" WHERE {where}"
-
-        self.disp.log_debug(f"sql_query = '{sql_query}'", title)
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
 
-        return self.sql_pool.run_editing_command(sql_query, table, "update")
+        return self.sql_pool.run_editing_command(
+            sql_query, table, "update", params=params
+        )
 
-    def remove_data_from_table(self, table: str, where: Union[str, List[str]] = "") -> int:
+    def remove_data_from_table(self, table: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
         """
             Remove the data from a table.
         Args:
@@ -366,24 +649,309 @@ class SQLQueryBoilerplates:
             int: 
         """
         self.disp.log_debug(
-            f"Removing data from table {table}",
-            "remove_data_from_table"
+            "Removing data from table %s",
+            "remove_data_from_table", table
         )
-        if self.sql_injection.check_if_sql_injection(table) is True or self.sql_injection.check_if_symbol_and_command_injection(where) is True:
-            self.disp.log_error("Injection detected.", "sql")
+        if self._check_identifiers(table) is False:
+            self.disp.log_error("Invalid table name.", "sql")
+            return self.error
+
+        compiled = self._compile_where(f"DELETE FROM {table}", where)
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
             return self.error
+        sql_query, params = compiled
+
+        self.disp.log_debug(
+            "sql_query = '%s'",
+            "remove_data_from_table", sql_query
+        )
 
-        if isinstance(where, List) is True:
-            where = " AND ".join(where)
+        return self.sql_pool.run_editing_command(
+            sql_query, table, "delete", params=params
+        )
 
-        sql_query = f"DELETE FROM {table}"
+    def remove_data_from_table_in(self, table: str, in_column: str, values: List[Any], where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", chunk_size: int = SCONST.IN_CHUNK_SIZE) -> int:
+        """
+            Remove the rows whose column matches any of the given values (WHERE column IN (...)) instead of running one query per value.
 
-        if where != "":
-            sql_query += f" WHERE {where}"
+        Args:
+            table (str): : The name of the table.
+            in_column (str): : The column compared to the values (i.e. id).
+            values (List[Any]): : The values of the rows to remove, nothing is done if empty.
+            where (Union[str, List[str]], optional): . Defaults to "".: Additional conditions.
+            chunk_size (int, optional): . Defaults to SCONST.IN_CHUNK_SIZE.: The maximum amount of values sent in a single query.
 
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise.
+        """
+        title = "remove_data_from_table_in"
+        if self._check_identifiers([table, in_column]) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        unique_values = list(dict.fromkeys(str(i) for i in values))
+        chunk_size = max(1, int(chunk_size))
+        quoted_in_column = self.sanitize_functions.quote_identifier(in_column)
+        for index in range(0, len(unique_values), chunk_size):
+            chunk = unique_values[index:index + chunk_size]
+            compiled = self._compile_where(f"DELETE FROM {table}", where)
+            if isinstance(compiled, int) is True:
+                self.disp.log_error("Invalid where clause.", "sql")
+                return self.error
+            sql_query, params = compiled
+            sql_query += " AND" if " WHERE " in sql_query else " WHERE"
+            placeholders = ", ".join([SCONST.PLACEHOLDER] * len(chunk))
+            sql_query += f" {quoted_in_column} IN ({placeholders})"
+            self.disp.log_debug("sql_query = '%s'", title, sql_query)
+            status = self.sql_pool.run_editing_command(
+                sql_query, table, "delete", params=params + chunk
+            )
+            if status != self.success:
+                return self.error
+        return self.success
+
+    def shift_column_in_table(self, table: str, column: str, offset: int, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "") -> int:
+        """
+            Add an offset to a numeric column of every matching row in a single statement (i.e. shifting positions).
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The numeric column to shift.
+            offset (int): : The value added to the column (can be negative).
+            where (Union[str, List[str]], optional): . Defaults to "".: The rows to shift.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise.
+        """
+        title = "shift_column_in_table"
         self.disp.log_debug(
-            f"sql_query = '{sql_query}'",
-            "remove_data_from_table"
+            "Shifting %s by %s in %s", title, column, offset, table
+        )
+        if self._check_identifiers([table, column]) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        if isinstance(offset, int) is False:
+            self.disp.log_error("The offset must be an integer.", title)
+            return self.error
+        quoted_column = self.sanitize_functions.quote_identifier(column)
+        compiled = self._compile_where(
+            f"UPDATE {table} SET {quoted_column} = {quoted_column} + {SCONST.PLACEHOLDER}",
+            where
         )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return self.error
+        sql_query, where_params = compiled
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        return self.sql_pool.run_editing_command(
+            sql_query, table, "update", params=[offset] + where_params
+        )
+
+    def _fetch_position_keys(self, table: str, column: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", id_column: str = "id", lock: bool = False) -> Union[List[Tuple[Any, int]], int]:
+        """
+            Get the (id, position key) pairs of a group, sorted by their key.
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The position column.
+            where (Union[str, List[str]], optional): . Defaults to "".: The group the positions belong to (i.e. the list or board).
+            id_column (str, optional): . Defaults to "id".: The column containing the id of the rows.
+            lock (bool, optional): . Defaults to False.: Lock the rows of the group (SELECT ... FOR UPDATE) until the bound transaction ends.
+
+        Returns:
+            Union[List[Tuple[Any, int]], int]: : The sorted pairs, self.error otherwise.
+        """
+        title = "_fetch_position_keys"
+        quoted_column = self.sanitize_functions.quote_identifier(column)
+        quoted_id = self.sanitize_functions.quote_identifier(id_column)
+        compiled = self._compile_where(
+            f"SELECT {quoted_id}, {quoted_column} FROM {table}", where
+        )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return self.error
+        sql_query, params = compiled
+        sql_query += f" ORDER BY {quoted_column}, {quoted_id}"
+        if lock is True:
+            sql_query += " FOR UPDATE"
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        resp = self.sql_pool.run_and_fetch_all(query=sql_query, params=params)
+        if isinstance(resp, int) is True:
+            self.disp.log_error("Failed to fetch the position keys.", title)
+            return self.error
+        return [(i[0], int(i[1] or 0)) for i in resp]
+
+    def get_position_key(self, table: str, column: str, index: int, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", row_id: Union[str, int, None] = None, gap: int = SCONST.POSITION_GAP, id_column: str = "id") -> int:
+        """
+            Get the sparse ordering key that places a row at the given index of its group.
+            The key is taken in the middle of the gap left between the two neighbours so that a move only rewrites the moved row.
+            When the neighbours are contiguous the group is renumbered once before trying again.
+            Inside a transaction the rows of the group stay locked until it ends, so write the key in the same transaction.
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The position column.
+            index (int): : The wanted position of the row in the group (starts at 1).
+            where (Union[str, List[str]], optional): . Defaults to "".: The group the positions belong to (i.e. the list or board).
+            row_id (Union[str, int, None], optional): . Defaults to None.: The id of the row if it is already part of the group.
+            gap (int, optional): . Defaults to SCONST.POSITION_GAP.: The spacing between two keys when appending or renumbering.
+            id_column (str, optional): . Defaults to "id".: The column containing the id of the rows.
+
+        Returns:
+            int: : The key to store (the current one if the row is already at this index), SCONST.POSITION_KEY_ERROR otherwise.
+        """
+        title = "get_position_key"
+        if self._check_identifiers([table, column, id_column]) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return SCONST.POSITION_KEY_ERROR
+        lock = isinstance(self.sql_pool, SQLTransaction)
+        for attempt in range(2):
+            rows = self._fetch_position_keys(
+                table, column, where, id_column, lock=lock
+            )
+            if isinstance(rows, int) is True:
+                return SCONST.POSITION_KEY_ERROR
+            current_key = None
+            keys: List[int] = []
+            for node_id, key in rows:
+                if row_id is not None and str(node_id) == str(row_id):
+                    current_key = key
+                    continue
+                keys.append(key)
+            index = min(max(1, int(index)), len(keys) + 1)
+            previous = keys[index - 2] if index > 1 else 0
+            following = keys[index - 1] if index <= len(keys) else None
+            if current_key is not None and current_key > previous and (following is None or current_key < following):
+                return current_key
+            if following is None:
+                return previous + gap
+            if following - previous > 1:
+                return previous + (following - previous) // 2
+            if attempt == 0:
+                self.disp.log_debug(
+                    "No room left between %s and %s, renumbering the group.",
+                    title, previous, following
+                )
+                status = self.renumber_positions(
+                    table, column, gap=gap, where=where, id_column=id_column
+                )
+                if status != self.success:
+                    return SCONST.POSITION_KEY_ERROR
+        self.disp.log_error("Could not find a free position key.", title)
+        return SCONST.POSITION_KEY_ERROR
+
+    def get_next_position_key(self, table: str, column: str, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", gap: int = SCONST.POSITION_GAP) -> int:
+        """
+            Get the key that places a new row after every other row of its group.
+            Inside a transaction the rows of the group stay locked until it ends, so insert the row in the same transaction.
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The position column.
+            where (Union[str, List[str]], optional): . Defaults to "".: The group the positions belong to (i.e. the list or board).
+            gap (int, optional): . Defaults to SCONST.POSITION_GAP.: The spacing left after the last key.
 
-        return self.sql_pool.run_editing_command(sql_query, table, "delete")
+        Returns:
+            int: : The key to store, SCONST.POSITION_KEY_ERROR otherwise.
+        """
+        title = "get_next_position_key"
+        if self._check_identifiers([table, column]) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return SCONST.POSITION_KEY_ERROR
+        quoted_column = self.sanitize_functions.quote_identifier(column)
+        compiled = self._compile_where(
+            f"SELECT COALESCE(MAX({quoted_column}), 0) FROM {table}", where
+        )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return SCONST.POSITION_KEY_ERROR
+        sql_query, params = compiled
+        if isinstance(self.sql_pool, SQLTransaction) is True:
+            sql_query += " FOR UPDATE"
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        resp = self.sql_pool.run_and_fetch_all(query=sql_query, params=params)
+        if isinstance(resp, int) is True or len(resp) == 0:
+            self.disp.log_error("Failed to fetch the last position key.", title)
+            return SCONST.POSITION_KEY_ERROR
+        return int(resp[0][0]) + gap
+
+    def renumber_positions(self, table: str, column: str, gap: int = SCONST.POSITION_GAP, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]] = "", partition_by: str = "", id_column: str = "id") -> int:
+        """
+            Spread the position keys evenly (gap, 2 * gap, ...) while keeping their order, in a single statement.
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The position column.
+            gap (int, optional): . Defaults to SCONST.POSITION_GAP.: The spacing between two keys.
+            where (Union[str, List[str]], optional): . Defaults to "".: The rows to renumber.
+            partition_by (str, optional): . Defaults to "".: The column grouping the rows (i.e. board_id), every group restarts at gap.
+            id_column (str, optional): . Defaults to "id".: The column containing the id of the rows.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise.
+        """
+        title = "renumber_positions"
+        identifiers = [table, column, id_column]
+        if partition_by != "":
+            identifiers.append(partition_by)
+        if self._check_identifiers(identifiers) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        if isinstance(gap, int) is False or gap <= 0:
+            self.disp.log_error("The gap must be a positive integer.", title)
+            return self.error
+        quoted_column = self.sanitize_functions.quote_identifier(column)
+        quoted_id = self.sanitize_functions.quote_identifier(id_column)
+        window = f"ORDER BY {quoted_column}, {quoted_id}"
+        if partition_by != "":
+            window = f"PARTITION BY {self.sanitize_functions.quote_identifier(partition_by)} {window}"
+        compiled = self._compile_where(
+            f"SELECT {quoted_id}, ROW_NUMBER() OVER ({window}) AS rank_nb FROM {table}",
+            where
+        )
+        if isinstance(compiled, int) is True:
+            self.disp.log_error("Invalid where clause.", "sql")
+            return self.error
+        ranked_query, where_params = compiled
+        sql_query = f"UPDATE {table} AS target JOIN ({ranked_query}) AS ranked"
+        sql_query += f" ON target.{quoted_id} = ranked.{quoted_id}"
+        sql_query += f" SET target.{quoted_column} = ranked.rank_nb * {SCONST.PLACEHOLDER}"
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        return self.sql_pool.run_editing_command(
+            sql_query, table, "update", params=where_params + [gap]
+        )
+
+    def get_crowded_position_groups(self, table: str, column: str, group_column: str, min_gap: int, id_column: str = "id") -> Union[List[Any], int]:
+        """
+            Get the groups in which two neighbouring position keys are closer than min_gap (the groups worth renumbering).
+
+        Args:
+            table (str): : The name of the table.
+            column (str): : The position column.
+            group_column (str): : The column grouping the rows (i.e. board_id).
+            min_gap (int): : The smallest spacing accepted between two keys (the first key is compared with 0).
+            id_column (str, optional): . Defaults to "id".: The column containing the id of the rows.
+
+        Returns:
+            Union[List[Any], int]: : The ids of the groups, self.error otherwise.
+        """
+        title = "get_crowded_position_groups"
+        if self._check_identifiers([table, column, group_column, id_column]) is False:
+            self.disp.log_error("Invalid table or column name.", "sql")
+            return self.error
+        if isinstance(min_gap, int) is False:
+            self.disp.log_error("The minimum gap must be an integer.", title)
+            return self.error
+        quoted_column = self.sanitize_functions.quote_identifier(column)
+        quoted_group = self.sanitize_functions.quote_identifier(group_column)
+        quoted_id = self.sanitize_functions.quote_identifier(id_column)
+        sql_query = f"SELECT {quoted_group} FROM (SELECT {quoted_group}, {quoted_column}"
+        sql_query += f" - LAG({quoted_column}, 1, 0) OVER (PARTITION BY {quoted_group}"
+        sql_query += f" ORDER BY {quoted_column}, {quoted_id}) AS key_gap FROM {table}) AS gaps"
+        sql_query += f" GROUP BY {quoted_group} HAVING MIN(key_gap) < {SCONST.PLACEHOLDER}"
+        self.disp.log_debug("sql_query = '%s'", title, sql_query)
+        resp = self.sql_pool.run_and_fetch_all(query=sql_query, params=[min_gap])
+        if isinstance(resp, int) is True:
+            self.disp.log_error("Failed to fetch the crowded groups.", title)
+            return self.error
+        return [i[0] for i in resp]
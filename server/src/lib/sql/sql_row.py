@@ -0,0 +1,87 @@
+"""
+    File in charge of containing the compact row type returned by the queries when the row mode is set to 'row'.
+"""
+
+from typing import List, Dict, Tuple, Any, Iterator
+
+
+class SQLRow:
+    """
+    A tuple backed row that can be read (and edited) like a dictionary.
+    The column index is shared between every row of the same result set so that a row only stores its values.
+    """
+
+    __slots__ = ("_columns", "_values")
+
+    def __init__(self, columns: Dict[str, int], values: Tuple[Any, ...]) -> None:
+        """
+            The constructor of the row.
+
+        Args:
+            columns (Dict[str, int]): : The column name to value index mapping (shared between rows).
+            values (Tuple[Any, ...]): : The values of the row as returned by the cursor.
+        """
+        self._columns: Dict[str, int] = columns
+        self._values: List[Any] = list(values)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._columns[key]]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._columns:
+            raise KeyError(
+                f"'{key}' is not a column of this row, convert it with to_dict() first."
+            )
+        self._values[self._columns[key]] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SQLRow):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SQLRow({self.to_dict()})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+            Get the value of a column, or the default if the column does not exist.
+        """
+        index = self._columns.get(key)
+        if index is None:
+            return default
+        return self._values[index]
+
+    def keys(self) -> List[str]:
+        """
+            Get the column names of the row.
+        """
+        return list(self._columns)
+
+    def values(self) -> List[Any]:
+        """
+            Get the values of the row.
+        """
+        return list(self._values)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """
+            Get the (column, value) pairs of the row.
+        """
+        return list(zip(self._columns, self._values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+            Convert the row to a standard dictionary.
+        """
+        return dict(zip(self._columns, self._values))
@@ -2,9 +2,11 @@
     File in charge of cleaning and sanitising sql queries before they are submitted to the database.
 """
 
-from typing import List, Dict, Any, Union
+import re
+from typing import List, Any, Union, Tuple
 
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 from . import sql_constants as SCONST
 from .sql_time_manipulation import SQLTimeManipulation
@@ -25,316 +27,207 @@ class SQLSanitiseFunctions:
         self.debug: bool = debug
         self.success: int = success
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
             debug=self.debug,
             logger=self.__class__.__name__
         )
-        # ----------------- Database risky keyword sanitising  -----------------
-        self.risky_keywords: List[str] = SCONST.RISKY_KEYWORDS
-        self.keyword_logic_gates: List[str] = SCONST.KEYWORD_LOGIC_GATES
         # ---------------------- Time manipulation class  ----------------------
         self.sql_time_manipulation: SQLTimeManipulation = SQLTimeManipulation(
             self.debug
         )
+        # ------------------- Parameterised query patterns  --------------------
+        self.identifier_pattern: re.Pattern = re.compile(
+            SCONST.IDENTIFIER_PATTERN
+        )
+        self.where_condition_pattern: re.Pattern = re.compile(
+            SCONST.WHERE_CONDITION_PATTERN, re.DOTALL
+        )
+        self.where_and_split_pattern: re.Pattern = re.compile(
+            SCONST.WHERE_AND_SPLIT_PATTERN, re.IGNORECASE
+        )
+        self.where_value_pattern: re.Pattern = re.compile(
+            SCONST.WHERE_VALUE_PATTERN, re.DOTALL
+        )
 
-    def protect_sql_cell(self, cell: str) -> str:
+    def is_safe_identifier(self, name: str) -> bool:
         """
-            This is a function in charge of cleaning by nullifying (escaping) characters that could cause the sql command to break.
+            Check if a string can be used as a table or column name in a query.
 
         Args:
-            cells (str): : The cell to be checked
+            name (str): : The identifier to check.
 
         Returns:
-            str: : A (hopfully) clean string.
+            bool: : True if the identifier only contains allowed characters.
         """
-        result = ""
-        for char in cell:
-            if char in ("'", '"', "\\", '\0', "\r"):
-                self.disp.log_info(
-                    f"Escaped character '{char}' in '{cell}'.",
-                    "_protect_sql_cell"
-                )
-                result += "\\"+char
-            else:
-                result += char
-        return result
-
-    def escape_risky_column_names(self, columns: Union[List[str], str]) -> Union[List[str], str]:
-        """
-            Escape the risky column names.
-
-        Args:
-            columns (List[str]): 
+        if isinstance(name, str) is False:
+            return False
+        return self.identifier_pattern.match(name) is not None
 
-        Returns:
-            List[str]: 
+    def quote_identifier(self, name: str) -> str:
         """
-        title = "_escape_risky_column_names"
-        self.disp.log_debug("Escaping risky column names.", title)
-        if isinstance(columns, str):
-            data = [columns]
-        else:
-            data = columns
-        for index, item in enumerate(data):
-            if "=" in item:
-                key, value = item.split("=", maxsplit=1)
-                self.disp.log_debug(f"key = {key}, value = {value}", title)
-                if key.lower() in self.risky_keywords:
-                    self.disp.log_warning(
-                        f"Escaping risky column name '{key}'.",
-                        "_escape_risky_column_names"
-                    )
-                    data[index] = f"`{key}`={value}"
-            elif item.lower() in self.risky_keywords:
-                self.disp.log_warning(
-                    f"Escaping risky column name '{item}'.",
-                    "_escape_risky_column_names"
-                )
-                data[index] = f"`{item}`"
-            else:
-                continue
-        self.disp.log_debug("Escaped risky column names.", title)
-        if isinstance(columns, str):
-            return data[0]
-        return columns
-
-    def _protect_value(self, value: str) -> str:
-        """Ensures the value is safely passed as a string in an SQL query.
-        It wraps the value in single quotes and escapes any single quotes within the value.
+            Wrap a table or column name in backticks (the name must have been checked with is_safe_identifier).
 
         Args:
-            value (str): The value that needs to be protected.
+            name (str): : The identifier to quote.
 
         Returns:
-            str: The value with protection applied, safe for SQL queries.
+            str: : The quoted identifier.
         """
-        title = "_protect_value"
-        self.disp.log_debug(f"protecting value: {value}", title)
-        if value is None:
-            self.disp.log_debug("Value is none, thus returning NULL", title)
-            return "NULL"
-
-        if isinstance(value, str) is False:
-            self.disp.log_debug("Value is not a string, converting", title)
-            value = str(value)
-
-        if len(value) == 0:
-            self.disp.log_debug("Value is empty, returning ''", title)
-            return "''"
+        if name == "*":
+            return name
+        parts = name.replace("`", "").split(".")
+        return ".".join(f"`{part}`" for part in parts)
 
-        if value[0] == '`' and value[-1] == '`':
-            self.disp.log_debug(
-                "string has special backtics, skipping.", title
-            )
-            return value
-
-        if value[0] == "'":
-            self.disp.log_debug(
-                "Value already has a single quote at the start, removing", title
-            )
-            value = value[1:]
-        if value[-1] == "'":
-            self.disp.log_debug(
-                "Value already has a single quote at the end, removing", title
-            )
-            value = value[:-1]
-
-        self.disp.log_debug(
-            f"Value before quote escaping: {value}", title
-        )
-        protected_value = value.replace("'", "''")
-        self.disp.log_debug(
-            f"Value after quote escaping: {protected_value}", title
-        )
-
-        protected_value = f"'{protected_value}'"
-        self.disp.log_debug(
-            f"Value after being converted to a string: {protected_value}.",
-            title
-        )
-        return protected_value
-
-    def escape_risky_column_names_where_mode(self, columns: Union[List[str], str]) -> Union[List[str], str]:
+    def prepare_sql_value(self, cell: Any) -> Any:
         """
-        Escape the risky column names in where mode, except for those in keyword_logic_gates.
+            Convert a cell into the value bound to a placeholder (the now and current_date keywords are resolved).
 
         Args:
-            columns (Union[str, List[str]]): Column names to be processed.
+            cell (Any): : The value provided by the caller.
 
         Returns:
-            Union[List[str], str]: Processed column names with risky ones escaped.
+            Any: : The value to bind.
         """
-        title = "_escape_risky_column_names_where_mode"
-        self.disp.log_debug(
-            "Escaping risky column names in where mode.", title
-        )
-
-        if isinstance(columns, str):
-            data = [columns]
-        else:
-            data = columns
-
-        for index, item in enumerate(data):
-            if "=" in item:
-                key, value = item.split("=", maxsplit=1)
-                self.disp.log_debug(f"key = {key}, value = {value}", title)
-
-                protected_value = self._protect_value(value)
-                if key.lower() not in self.keyword_logic_gates and key.lower() in self.risky_keywords:
-                    self.disp.log_warning(
-                        f"Escaping risky column name '{key}'.", title
-                    )
-                    data[index] = f"`{key}`={protected_value}"
-                else:
-                    data[index] = f"{key}={protected_value}"
-
-            elif item.lower() not in self.keyword_logic_gates and item.lower() in self.risky_keywords:
-                self.disp.log_warning(
-                    f"Escaping risky column name '{item}'.",
-                    title
-                )
-                protected_value = self._protect_value(item)
-                data[index] = protected_value
-
-        self.disp.log_debug("Escaped risky column names in where mode.", title)
-
-        if isinstance(columns, str):
-            return data[0]
-        return data
+        if isinstance(cell, str) is False:
+            return cell
+        tmp = cell.lower()
+        if tmp in ("now", "now()"):
+            return self.sql_time_manipulation.get_correct_now_value()
+        if tmp in ("current_date", "current_date()"):
+            return self.sql_time_manipulation.get_correct_current_date_value()
+        return cell
 
-    def check_sql_cell(self, cell: str) -> str:
+    def _parse_where_value(self, value: str) -> Union[Tuple[str, bool], None]:
         """
-            Check if the cell is a string or a number.
+            Read the value written in a where condition (a quoted literal, a `column` or a single word).
 
         Args:
-            cell (str): 
+            value (str): : The raw value.
 
         Returns:
-            str: 
+            Union[Tuple[str, bool], None]: : The value (unescaped) and True if it is a column, None if it is not a single value.
         """
-        if isinstance(cell, (str, float)) is True:
-            cell = str(cell)
-        if isinstance(cell, str) is False:
-            msg = "The expected type of the input is a string,"
-            msg += f"but got {type(cell)}"
-            self.disp.log_error(msg, "_check_sql_cell")
-            return cell
-        cell = self.protect_sql_cell(cell)
-        tmp = cell.lower()
-        if tmp in ("now", "now()"):
-            tmp = self.sql_time_manipulation.get_correct_now_value()
-        elif tmp in ("current_date", "current_date()"):
-            tmp = self.sql_time_manipulation.get_correct_current_date_value()
-        else:
-            tmp = str(cell)
-        if ";base" not in tmp:
-            self.disp.log_debug(f"result = {tmp}", "_check_sql_cell")
-        return f"\"{str(tmp)}\""
+        match = self.where_value_pattern.match(value)
+        if match is None:
+            return None
+        single, double, column, word = match.groups()
+        if single is not None:
+            return single.replace("''", "'"), False
+        if double is not None:
+            return double.replace('""', '"'), False
+        if column is not None:
+            return column, True
+        return word, False
 
-    def beautify_table(self, column_names: List[str], table_content: List[List[Any]]) -> Union[List[Dict[str, Any]], int]:
+    def _split_where_conditions(self, where: str) -> List[str]:
         """
-            Convert the table to an easier version for navigating.
+            Split a where string on the AND keywords that are not inside a quoted value.
 
         Args:
-            column_names (List[str]): 
-            table_content (List[List[Any]]): 
+            where (str): : The where string.
 
         Returns:
-            Union[List[Dict[str, Any]], int]: : the formated content or self.error if an error occured.
+            List[str]: : The conditions.
         """
-        data: List[Dict[str, Any]] = []
-        v_index: int = 0
-        if len(column_names) == 0:
-            self.disp.log_error(
-                "There are not provided table column names.",
-                "_beautify_table"
-            )
-            return table_content
-        if len(table_content) == 0:
-            self.disp.log_error(
-                "There is no table content.",
-                "_beautify_table"
-            )
-            return self.error
-        column_length = len(column_names)
-        for i in table_content:
-            cell_length = len(i)
-            if cell_length != column_length:
-                self.disp.log_warning(
-                    "Table content and column lengths do not correspond.",
-                    "_beautify_table"
-                )
-            data.append({})
-            for index, items in enumerate(column_names):
-                if index == cell_length:
-                    self.disp.log_warning(
-                        "Skipping the rest of the tuple because it is shorter than the column names.",
-                        "_beautify_table"
-                    )
-                    break
-                data[v_index][items[0]] = i[index]
-            v_index += 1
-        self.disp.log_debug(f"beautified_table = {data}", "_beautify_table")
-        return data
+        conditions: List[str] = []
+        start = 0
+        for match in self.where_and_split_pattern.finditer(where):
+            if where.count("'", start, match.start()) % 2 == 1:
+                continue
+            conditions.append(where[start:match.start()])
+            start = match.end()
+        conditions.append(where[start:])
+        return conditions
 
-    def compile_update_line(self, line: List, column: List, column_length: int) -> str:
+    def _build_where_condition(self, column: str, operator: str, value: Any, value_is_column: bool = False) -> Union[Tuple[str, List[Any]], int]:
         """
-            Compile the line required for an sql update to work.
+            Build a single placeholder based condition.
 
         Args:
-            line (List): 
-            column (List): 
-            column_length (int): 
+            column (str): : The column that is compared.
+            operator (str): : The comparison operator (one of SCONST.WHERE_OPERATORS).
+            value (Any): : The value bound to the placeholder.
+            value_is_column (bool, optional): . Defaults to False.: Compare with another column instead of binding the value.
 
         Returns:
-            str: 
+            Union[Tuple[str, List[Any]], int]: : The condition and its parameters, self.error if the column or the operator is invalid.
         """
-        title = "compile_update_line"
-        final_line = ""
-        self.disp.log_debug("Compiling update line.", title)
-        for i in range(0, column_length):
-            cell_content = self.check_sql_cell(line[i])
-            final_line += f"{column[i]} = {cell_content}"
-            if i < column_length - 1:
-                final_line += ", "
-            if i == column_length:
-                break
-        self.disp.log_debug(f"line = {final_line}", title)
-        return final_line
+        if self.is_safe_identifier(column) is False or operator not in SCONST.WHERE_OPERATORS:
+            return self.error
+        key = self.quote_identifier(column)
+        if value_is_column is True:
+            if self.is_safe_identifier(value) is False:
+                return self.error
+            return f"{key} {operator} {self.quote_identifier(value)}", []
+        return f"{key} {operator} {SCONST.PLACEHOLDER}", [value]
 
-    def process_sql_line(self, line: List[str], column: List[str], column_length: int = (-1)) -> str:
+    def build_where_clause(self, where: Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]) -> Union[Tuple[str, List[Any]], int]:
         """
-            Convert a List of strings to an sql line so that it can be inserted into a table.
+            Convert where conditions into a placeholder based clause.
+            A condition is either a (column, operator, value) tuple, the value being bound as is,
+            or a string in the column<operator>value form (the value being a quoted literal, a `column` or a single word).
+            Any other string is refused, it is never sent to the database as is.
 
         Args:
-            line (List[str]): 
+            where (Union[str, Tuple[str, str, Any], List[Union[str, Tuple[str, str, Any]]]]): : The conditions, joined with AND.
 
         Returns:
-            str: 
+            Union[Tuple[str, List[Any]], int]: : The clause (without the WHERE keyword) and its parameters, self.error if a condition is invalid.
         """
-        if column_length == -1:
-            column_length = len(column)
-        line_length = len(line)
-
-        line_final = "("
-        if self.debug is True and ";base" not in str(line):
-            msg = f"line = {line}"
-            self.disp.log_debug(msg, "_process_sql_line")
-        for i in range(0, column_length):
-            line_final += self.check_sql_cell(line[i])
-            if i < column_length - 1:
-                line_final += ", "
-            if i == column_length:
-                if i < line_length:
-                    msg = "The line is longer than the number of columns, truncating."
-                    self.disp.log_warning(msg, "_process_sql_line")
-                break
-        line_final += ")"
-        if ";base" not in str(line_final):
-            msg = f"line_final = '{line_final}'"
-            msg += f", type(line_final) = '{type(line_final)}'"
-            self.disp.log_debug(msg, "_process_sql_line")
-        return line_final
+        title = "build_where_clause"
+        if isinstance(where, (str, tuple)) is True:
+            where = [where]
+        if isinstance(where, list) is False:
+            self.disp.log_error(
+                f"Where must be a string or a list, got {type(where)}.", title
+            )
+            return self.error
+        conditions: List[str] = []
+        params: List[Any] = []
+        for item in where:
+            if isinstance(item, tuple) is True:
+                if len(item) != 3:
+                    self.disp.log_error(
+                        "Where tuples must be (column, operator, value).", title
+                    )
+                    return self.error
+                built = self._build_where_condition(*item)
+                if isinstance(built, int) is True:
+                    self.disp.log_error(
+                        "Invalid column or operator in a where condition.", title
+                    )
+                    return self.error
+                conditions.append(built[0])
+                params.extend(built[1])
+                continue
+            if isinstance(item, str) is False:
+                self.disp.log_error(
+                    f"Where conditions must be strings or tuples, got {type(item)}.", title
+                )
+                return self.error
+            if item.strip() == "":
+                continue
+            for condition in self._split_where_conditions(item):
+                match = self.where_condition_pattern.match(condition)
+                value = None
+                if match is not None:
+                    value = self._parse_where_value(match.group(3))
+                if value is None:
+                    self.disp.log_error(
+                        "Refusing a where condition that is not column<operator>value.", title
+                    )
+                    return self.error
+                built = self._build_where_condition(
+                    match.group(1), match.group(2), value[0], value[1]
+                )
+                if isinstance(built, int) is True:
+                    self.disp.log_error(
+                        "Invalid column or operator in a where condition.", title
+                    )
+                    return self.error
+                conditions.append(built[0])
+                params.extend(built[1])
+        return " AND ".join(conditions), params
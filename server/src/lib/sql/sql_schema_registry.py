@@ -0,0 +1,122 @@
+"""
+    File in charge of remembering the structure of the tables so that they do not need to be described for every query.
+"""
+
+import threading
+from typing import List, Dict, Union, Any
+
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
+
+
+class SQLSchemaRegistry:
+    """
+    The class in charge of storing the DESCRIBE results of the tables in memory.
+    """
+
+    def __init__(self, success: int = 0, error: int = 84, debug: bool = False) -> None:
+        """
+            The registry containing the column metadata of every table that was described.
+
+        Args:
+            success (int, optional): . Defaults to 0.
+            error (int, optional): . Defaults to 84.
+            debug (bool, optional): . Defaults to False.
+        """
+        # -------------------------- Inherited values --------------------------
+        self.error: int = error
+        self.debug: bool = debug
+        self.success: int = success
+        # --------------------------- logger section ---------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ------------------------- The schema content -------------------------
+        self._lock: threading.Lock = threading.Lock()
+        self._tables: Dict[str, List[Any]] = {}
+
+    def get_description(self, table: str) -> Union[List[Any], None]:
+        """
+            Get the stored description of a table.
+
+        Args:
+            table (str): : The name of the table.
+
+        Returns:
+            Union[List[Any], None]: : A copy of the DESCRIBE rows of the table, None if it was never described.
+        """
+        with self._lock:
+            description = self._tables.get(table)
+        if description is None:
+            return None
+        return list(description)
+
+    def get_column_names(self, table: str) -> Union[List[str], None]:
+        """
+            Get the stored column names of a table.
+
+        Args:
+            table (str): : The name of the table.
+
+        Returns:
+            Union[List[str], None]: : A new list containing the column names, None if the table was never described.
+        """
+        description = self.get_description(table)
+        if description is None:
+            return None
+        return [i[0] for i in description]
+
+    def set_description(self, table: str, description: List[Any]) -> int:
+        """
+            Store the description of a table.
+
+        Args:
+            table (str): : The name of the table.
+            description (List[Any]): : The rows returned by DESCRIBE.
+
+        Returns:
+            int: : self.success if it was stored, self.error otherwise.
+        """
+        if isinstance(description, int) is True or len(description) == 0:
+            return self.error
+        with self._lock:
+            self._tables[table] = list(description)
+        self.disp.log_debug(
+            "Stored the schema of '%s'.", "set_description", table
+        )
+        return self.success
+
+    def refresh(self, table: Union[str, None] = None) -> int:
+        """
+            Forget the stored schema so that it is described again on the next use (to be called after a migration).
+
+        Args:
+            table (Union[str, None], optional): . Defaults to None.: The table to forget, every table if None.
+
+        Returns:
+            int: : self.success
+        """
+        with self._lock:
+            if table is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table, None)
+        self.disp.log_debug(
+            "Schema refreshed for: %s.",
+            "refresh", table if table is not None else 'every table'
+        )
+        return self.success
+
+    def get_known_tables(self) -> List[str]:
+        """
+            Get the names of the tables whose schema is stored.
+
+        Returns:
+            List[str]: : The table names.
+        """
+        with self._lock:
+            return list(self._tables)
@@ -4,7 +4,8 @@
 
 from datetime import datetime
 
-from display_tty import Disp, TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
 
 from . import sql_constants as SCONST
 
@@ -26,7 +27,7 @@ class SQLTimeManipulation:
         self.date_only: str = SCONST.DATE_ONLY
         self.date_and_time: str = SCONST.DATE_AND_TIME
         # --------------------------- logger section ---------------------------
-        self.disp: Disp = Disp(
+        self.disp: LazyDisp = LazyDisp(
             TOML_CONF,
             SAVE_TO_FILE,
             FILE_NAME,
@@ -0,0 +1,248 @@
+"""
+    File in charge of containing the unit of work that runs several queries on a single connection and commits them once.
+"""
+
+import time
+from typing import Union, List, Any, Tuple
+
+import mysql
+import mysql.connector
+import mysql.connector.cursor
+from display_tty import TOML_CONF, SAVE_TO_FILE, FILE_NAME
+from ..lazy_logging import LazyDisp
+
+from . import sql_constants as SCONST
+
+
+class SQLTransaction:
+    """
+    The class holding a pooled connection for the duration of a transaction.
+    It exposes the same running functions as SQLManageConnections so that the query boilerplates can be bound to it.
+    """
+
+    def __init__(self, sql_pool: Any, success: int = 0, error: int = 84, debug: bool = False) -> None:
+        """
+            Check out a connection from the pool and start a transaction on it.
+
+        Args:
+            sql_pool (SQLManageConnections): : The pool the connection is taken from.
+            success (int, optional): . Defaults to 0.
+            error (int, optional): . Defaults to 84.
+            debug (bool, optional): . Defaults to False.
+        """
+        # -------------------------- Inherited values --------------------------
+        self.sql_pool: Any = sql_pool
+        self.error: int = error
+        self.debug: bool = debug
+        self.success: int = success
+        # --------------------------- logger section ---------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ----------------------- The transaction state  -----------------------
+        self.failed: bool = False
+        self.committed: bool = False
+        self.statements: int = 0
+        self.last_insert_id: Union[int, None] = None
+        self.connection: Union[
+            mysql.connector.pooling.PooledMySQLConnection, None
+        ] = self.sql_pool.get_connection()
+        if self.connection is None:
+            raise RuntimeError(SCONST.CONNECTION_FAILED)
+        self.connection.start_transaction()
+        self.disp.log_debug("Transaction started.", "__init__")
+
+    def is_active(self) -> bool:
+        """
+            Check if the transaction still holds its connection.
+
+        Returns:
+            bool: : True if queries can still be run, False otherwise.
+        """
+        return self.connection is not None
+
+    def is_committed(self) -> bool:
+        """
+            Check if the transaction ended with a successful commit (a failed COMMIT is rolled back).
+
+        Returns:
+            bool: : True once the changes are written, False while running or if they were rolled back.
+        """
+        return self.committed
+
+    def mark_failed(self) -> None:
+        """
+            Make sure the transaction is rolled back instead of committed when it ends.
+        """
+        self.failed = True
+
+    def get_last_insert_id(self) -> Union[int, None]:
+        """
+            Get the id generated for the last row inserted in the transaction (read from the cursor, no query is run).
+
+        Returns:
+            Union[int, None]: : The AUTO_INCREMENT id, None if no row was inserted.
+        """
+        return self.last_insert_id
+
+    def _execute(self, query: str, params: Union[List[Any], None] = None, row_mode: Union[str, None] = None, shape: Union[Tuple[str, str], None] = None) -> Any:
+        """
+            Run a query on the held connection without committing it.
+
+        Args:
+            query (str): : The query to execute.
+            params (Union[List[Any], None], optional): . Defaults to None.: The values bound to the placeholders.
+            row_mode (Union[str, None], optional): . Defaults to None.: The format of the fetched rows, nothing is fetched if None.
+            shape (Union[Tuple[str, str], None], optional): . Defaults to None.: The table and operation the query is timed under, read from the query if None.
+
+        Returns:
+            Any: : The fetched rows, self.success if nothing was fetched, self.error otherwise.
+        """
+        title = "_execute"
+        if self.is_active() is False:
+            self.disp.log_error("The transaction is already closed.", title)
+            return self.error
+        metrics = self.sql_pool.metrics
+        if shape is None and metrics.enabled is True:
+            shape = metrics.query_shape(query)
+        cursor = self.sql_pool.get_cursor(self.connection)
+        try:
+            self.disp.log_debug("Executing query: %s.", title, query)
+            start = time.perf_counter()
+            self.sql_pool._execute(cursor, query, params)
+            self.statements += 1
+            if row_mode is None:
+                metrics.observe_query(shape, time.perf_counter() - start)
+                if cursor.lastrowid:
+                    self.last_insert_id = int(cursor.lastrowid)
+                return self.success
+            if cursor.description is None:
+                self.disp.log_error(
+                    "Failed to gather data from the table, cursor is invalid.", title
+                )
+                metrics.observe_error(shape)
+                return self.error
+            raw_data = cursor.fetchall()
+            metrics.observe_query(
+                shape, time.perf_counter() - start, len(raw_data)
+            )
+            return self.sql_pool._format_rows(
+                cursor.description, raw_data, row_mode
+            )
+        except mysql.connector.Error as e:
+            self.failed = True
+            metrics.observe_error(shape)
+            msg = "MySQL Error: An error occurred during the transaction."
+            msg += f" Original error: {str(e)}"
+            self.disp.log_error(msg, title)
+            raise RuntimeError(msg) from e
+        finally:
+            self.sql_pool.close_cursor(cursor)
+
+    def run_and_commit(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None, params: Union[List[Any], None] = None, shape: Union[Tuple[str, str], None] = None) -> int:
+        """
+            Executes a query, the commit is delayed until the end of the transaction.
+
+        Args:
+            query (str): : The query to execute.
+            cursor (Union[mysql.connector.cursor.MySQLCursor, None], optional): . Defaults to None.: Ignored, the held connection is used.
+            params (Union[List[Any], None], optional): . Defaults to None.: The values bound to the placeholders.
+            shape (Union[Tuple[str, str], None], optional): . Defaults to None.: The table and operation the query is timed under.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise.
+        """
+        return self._execute(query, params, shape=shape)
+
+    def run_and_fetch_all(self, query: str, cursor: Union[mysql.connector.cursor.MySQLCursor, None] = None, row_mode: str = SCONST.ROW_MODE_TUPLE, params: Union[List[Any], None] = None) -> Union[int, Any]:
+        """
+            Executes a query and fetches all results (the uncommitted changes of the transaction are visible).
+
+        Args:
+            query (str): : The query to execute.
+            cursor (Union[mysql.connector.cursor.MySQLCursor, None], optional): . Defaults to None.: Ignored, the held connection is used.
+            row_mode (str, optional): . Defaults to SCONST.ROW_MODE_TUPLE.: The format of the rows.
+            params (Union[List[Any], None], optional): . Defaults to None.: The values bound to the placeholders.
+
+        Returns:
+            Union[int, Any]: : The fetched rows, self.error otherwise.
+        """
+        if row_mode not in SCONST.ROW_MODES:
+            self.disp.log_error(
+                f"Unknown row mode '{row_mode}'.", "run_and_fetch_all"
+            )
+            return self.error
+        return self._execute(query, params, row_mode)
+
+    def run_editing_command(self, sql_query: str, table: str, action_type: str = "update", params: Union[List[Any], None] = None) -> int:
+        """
+            Run an editing query as part of the transaction, a failure marks the transaction for a rollback.
+
+        Args:
+            sql_query (str): : The query to execute.
+            table (str): : The table that is edited.
+            action_type (str, optional): . Defaults to "update".: The kind of edition (used for the logs).
+            params (Union[List[Any], None], optional): . Defaults to None.: The values bound to the placeholders.
+
+        Returns:
+            int: : self.success if it succeeded, self.error otherwise.
+        """
+        title = "run_editing_command"
+        try:
+            resp = self.run_and_commit(
+                query=sql_query, params=params, shape=(table, action_type)
+            )
+        except RuntimeError as e:
+            self.disp.log_error(
+                f"Failed to {action_type} data in '{table}': {str(e)}", title
+            )
+            return self.error
+        if resp != self.success:
+            self.failed = True
+            self.disp.log_error(
+                f"Failed to {action_type} data in '{table}'.", title
+            )
+            return self.error
+        return self.success
+
+    def end(self, commit: bool = True) -> int:
+        """
+            Commit (or roll back) the transaction and give the connection back to the pool.
+
+        Args:
+            commit (bool, optional): . Defaults to True.: Commit the changes, they are rolled back if False or if a statement failed.
+
+        Returns:
+            int: : self.success if the changes were committed, self.error otherwise.
+        """
+        title = "end"
+        if self.is_active() is False:
+            return self.error
+        status = self.error
+        try:
+            if commit is True and self.failed is False:
+                self.connection.commit()
+                self.committed = True
+                self.disp.log_debug(
+                    "Transaction committed (%s statements).", title, self.statements
+                )
+                status = self.success
+            else:
+                self.connection.rollback()
+                self.disp.log_warning("Transaction rolled back.", title)
+        except mysql.connector.Error as e:
+            self.disp.log_error(
+                f"Failed to end the transaction: {str(e)}", title
+            )
+            try:
+                self.connection.rollback()
+            except mysql.connector.Error:
+                pass
+        finally:
+            self.sql_pool.return_connection(self.connection)
+            self.connection = None
+        return status
@@ -0,0 +1,167 @@
+"""
+    File containing the in-process cache used to avoid querying the database for every token check.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Union, Dict, Tuple
+
+from display_tty import TOML_CONF, FILE_DESCRIPTOR, SAVE_TO_FILE, FILE_NAME
+from .lazy_logging import LazyDisp
+
+
+class TokenCache:
+    """
+    The class in charge of remembering which user a token belongs to (size and time bounded LRU).
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: int = 60, error: int = 84, success: int = 0, debug: bool = False) -> None:
+        """
+            Constructor
+
+        Args:
+            max_size (int, optional): . Defaults to 1024.: The maximum amount of tokens to remember.
+            ttl (int, optional): . Defaults to 60.: The amount of seconds a token is trusted without checking the database again.
+            error (int, optional): . Defaults to 84.
+            success (int, optional): . Defaults to 0.
+            debug (bool, optional): . Defaults to False.
+        """
+        self.debug: bool = debug
+        self.success: int = success
+        self.error: int = error
+        self.max_size: int = max(0, int(max_size))
+        self.ttl: int = max(0, int(ttl))
+        # ------------------------ The logging function ------------------------
+        self.disp: LazyDisp = LazyDisp(
+            TOML_CONF,
+            FILE_DESCRIPTOR,
+            SAVE_TO_FILE,
+            FILE_NAME,
+            debug=self.debug,
+            logger=self.__class__.__name__
+        )
+        # ------------------------- The cache content  -------------------------
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def is_enabled(self) -> bool:
+        """
+            Check if the cache is allowed to store anything.
+
+        Returns:
+            bool: True if the cache is usable, False otherwise
+        """
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, token: str) -> Union[str, None]:
+        """
+            Get the user id linked to a token.
+
+        Args:
+            token (str): The token to look for
+
+        Returns:
+            Union[str, None]: The user id if the token is cached and not expired, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            user_id, expiry = entry
+            if expiry <= time.monotonic():
+                self._entries.pop(token, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return user_id
+
+    def set(self, token: str, user_id: str) -> int:
+        """
+            Remember the user id linked to a token.
+
+        Args:
+            token (str): The token of the user
+            user_id (str): The id of the user
+
+        Returns:
+            int: self.success if it was stored, self.error otherwise
+        """
+        if self.is_enabled() is False or not token:
+            return self.error
+        with self._lock:
+            self._entries[token] = (str(user_id), time.monotonic() + self.ttl)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return self.success
+
+    def invalidate(self, token: str) -> int:
+        """
+            Forget a token.
+
+        Args:
+            token (str): The token to forget
+
+        Returns:
+            int: self.success if the token was cached, self.error otherwise
+        """
+        with self._lock:
+            if self._entries.pop(token, None) is None:
+                return self.error
+        self.disp.log_debug("Token removed from the cache.", "invalidate")
+        return self.success
+
+    def invalidate_user(self, user_id: Union[str, int]) -> int:
+        """
+            Forget every token belonging to a user.
+
+        Args:
+            user_id (Union[str, int]): The id of the user
+
+        Returns:
+            int: The number of tokens that were removed
+        """
+        user_id = str(user_id)
+        with self._lock:
+            tokens = [
+                token for token, entry in self._entries.items()
+                if entry[0] == user_id
+            ]
+            for token in tokens:
+                self._entries.pop(token, None)
+        self.disp.log_debug(
+            "%s token(s) removed from the cache.", "invalidate_user", len(tokens)
+        )
+        return len(tokens)
+
+    def clear(self) -> int:
+        """
+            Forget every token.
+
+        Returns:
+            int: self.success
+        """
+        with self._lock:
+            self._entries.clear()
+        return self.success
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+            Get the usage counters of the cache.
+
+        Returns:
+            Dict[str, int]: The hits, misses, current size and maximum size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl
+            }
@@ -3,6 +3,9 @@ The file allowing the server to be run as a standalone.
 """
 
 import sys
+import time
+import cProfile
+import pstats
 from sys import argv
 
 try:
@@ -24,6 +27,8 @@ class Main:
         self.error: int = error
         self.app_name: str = "EpiTrello"
         self.debug: bool = False
+        self.check_indexes: bool = False
+        self.profile_startup: bool = False
 
     def process_args(self) -> None:
         """
@@ -50,47 +55,86 @@ class Main:
                 print(
                     "  --debug                                                             Enable debug mode"
                 )
+                print(
+                    "  --check-indexes                                                     Explain the hot queries, report the full table scans and exit"
+                )
+                print(
+                    "  --profile-startup                                                   Build the server without serving it and show where the start-up time goes"
+                )
                 print(
                     "  --help, -h                                                          Show this help message"
                 )
                 sys.exit(self.success)
-            elif "--host" in arg:
+            elif arg == "--check-indexes":
+                self.check_indexes = True
+            elif arg == "--profile-startup":
+                self.profile_startup = True
+            elif arg.startswith("--host"):
                 if '=' in arg:
                     self.host = arg.split("=")[1]
                 else:
                     self.host = argv[i + 1]
                     i += 1
-            elif "--port" in arg or '-p' in arg:
+            elif arg.startswith("--port") or arg == "-p":
                 if '=' in arg:
                     self.port = int(arg.split("=")[1])
                 else:
                     self.port = int(argv[i + 1])
                     i += 1
-            elif "--success" in arg or "-s" in arg:
+            elif arg.startswith("--success") or arg == "-s":
                 if '=' in arg:
                     self.success = int(arg.split("=")[1])
                 else:
                     self.success = int(argv[i + 1])
                     i += 1
-            elif "--error" in arg or "-e" in arg:
+            elif arg.startswith("--error") or arg == "-e":
                 if '=' in arg:
                     self.error = int(arg.split("=")[1])
                 else:
                     self.error = int(argv[i + 1])
                     i += 1
-            elif "--debug" in arg or "-d" in arg:
+            elif arg == "--debug" or arg == "-d":
                 self.debug = True
 
             else:
                 print(f"Unknown argument: {arg}")
             i += 1
 
+    def run_startup_profile(self) -> int:
+        """
+        Build the server and its routes without serving them, then print the slowest calls
+        (run it with python3 -X importtime to also get the import breakdown, see: make profile_startup)
+        """
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        SI = Server(
+            host=self.host,
+            port=self.port,
+            success=self.success,
+            error=self.error,
+            app_name=self.app_name,
+            debug=self.debug
+        )
+        built = time.perf_counter()
+        SI.build_app()
+        profiler.disable()
+        end = time.perf_counter()
+        print(f"Server construction: {built - start:.3f}s")
+        print(f"Application and routes: {end - built:.3f}s")
+        print(f"Total (imports excluded): {end - start:.3f}s")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+        del SI
+        return self.success
+
     def main(self) -> None:
         """
         This method is the entry point of the server.
         """
         if self.argc > 1:
             self.process_args()
+            if self.profile_startup is True:
+                sys.exit(self.run_startup_profile())
             SI = Server(
                 host=self.host,
                 port=self.port,
@@ -100,7 +144,10 @@ class Main:
                 debug=self.debug
             )
             try:
-                status = SI.main()
+                if self.check_indexes is True:
+                    status = SI.check_indexes()
+                else:
+                    status = SI.main()
             except KeyboardInterrupt:
                 print("\nCtrl+C caught! Exiting the program gracefully.")
                 del SI